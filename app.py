@@ -4,6 +4,17 @@ import numpy as np
 import time
 import matplotlib.pyplot as plt
 import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+MODELS_DIR = os.path.join(APP_DIR, 'models', 'saved_models')
+REPORTS_DIR = os.path.join(APP_DIR, 'reports')
+sys.path.append(os.path.join(APP_DIR, 'models'))
+from explanation_store import ExplanationStore, top_k_drivers
+from game_store import GameIndexedParquet, SCORED_DATASET_PATH, score_frame
+
+LEGACY_DEMO_PATH = os.path.join(APP_DIR, 'data', 'demo', 'demo_simulation_data.parquet')
+DEFAULT_GAME_ID = 22401052
 
 # ==========================================
 # 1. הגדרות דף ועיצוב הממשק
@@ -26,35 +37,151 @@ st.markdown("""
 # ==========================================
 # 2. טעינת נתונים דינמית (פונקציה עם Cache)
 # ==========================================
+# קובץ ממופה-זיכרון עם אינדקס משחקים: נפתח פעם אחת לשרת, וכל משחק קורא רק את ה-row groups שלו
+@st.cache_resource
+def open_game_store():
+    if not os.path.exists(SCORED_DATASET_PATH):
+        return None
+    return GameIndexedParquet(SCORED_DATASET_PATH)
+
 @st.cache_data
-def load_demo_data():
-    # מוצא דינמית את מיקום התיקייה שבה app.py נמצא ומנווט לתיקיית הדאטא
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(current_dir, 'data', 'demo', 'demo_simulation_data.parquet')
-    
-    if not os.path.exists(file_path):
-        st.error(f"קובץ הנתונים לא נמצא בנתיב היחסי: {file_path}")
+def load_game_data(game_id):
+    store = open_game_store()
+    if store is not None:
+        df = store.read_game(game_id)
+    elif os.path.exists(LEGACY_DEMO_PATH):
+        # מצב תאימות: קובץ הדמו הישן של משחק בודד
+        df = pd.read_parquet(LEGACY_DEMO_PATH).reset_index(drop=True)
+    else:
+        st.error(f"קובץ הנתונים לא נמצא: {SCORED_DATASET_PATH} (הריצו את models/game_store.py)")
         return pd.DataFrame()
-    df = pd.read_parquet(file_path)
+    
+    # ציונים דטרמיניסטיים מהמודלים השמורים (במקום מילוי אקראי)
+    if 'cate_score' not in df.columns or 'propensity_score' not in df.columns:
+        try:
+            df = score_frame(df, MODELS_DIR)
+        except FileNotFoundError as e:
+            st.error(f"חסרים מודלים שמורים לחישוב CATE/Propensity: {e}")
+            return pd.DataFrame()
     
     # הנדוס מדדים ויזואליים חסרים לטובת התצוגה (סיכויי ניצחון מבוססי מרג'ין וזמן)
     if 'win_probability' not in df.columns:
         df['win_probability'] = 1 / (1 + np.exp(-df['score_margin'] * 0.15))
         df['win_probability'] = df['win_probability'].clip(0.01, 0.99)
         
-    # הנדוס מדד CATE ו-Propensity לטובת גרף הצירוף המדעי במערכות
-    if 'cate_score' not in df.columns:
-        df['cate_score'] = np.where(df['target_stop_run_90s'] == 1, np.random.uniform(0.6, 0.85, len(df)), np.random.uniform(0.1, 0.4, len(df)))
-    if 'propensity_score' not in df.columns:
-        df['propensity_score'] = np.where(df['timeout_strategic_weight'] == 0, np.random.uniform(0.1, 0.3, len(df)), np.random.uniform(0.4, 0.65, len(df)))
-        
     return df
 
-df_game = load_demo_data()
+def reset_playback():
+    st.session_state.current_index = 0
+    st.session_state.playing = False
+    st.session_state.triggered_breakpoints = set()
+
+# מאגר אחד לכל target לאורך כל חיי השרת (לא נבנה מחדש בכל rerun)
+# backend='native': פירוק ה-CATE דרך pred_contribs של XGBoost, בלי תלות ב-shap
+@st.cache_resource
+def get_explanation_store(target_col):
+    return ExplanationStore(REPORTS_DIR, MODELS_DIR, target_col, backend='native')
+
+@st.cache_data
+def load_alert_drivers(target_col, game_id, _df, k=4):
+    """
+    Top-k drivers for every breakpoint row of the game. Rows that appear in the recommendations report
+    are served from the persisted store; only the rest are explained, in one batch.
+    """
+    if not all(os.path.exists(os.path.join(MODELS_DIR, f'{m}_{target_col}.joblib')) for m in ('propensity', 'tau0', 'tau1')):
+        return {}
+    store = get_explanation_store(target_col)
+    alert_positions = np.flatnonzero(((_df['target_stop_run_90s'] == 1) & (_df['timeout_strategic_weight'] > 0)).to_numpy())
+    if len(alert_positions) == 0:
+        return {}
+
+    report_rows = store.report_positions(_df.iloc[alert_positions])
+    in_store = report_rows >= 0
+    drivers = {}
+    if in_store.any():
+        drivers.update(zip(alert_positions[in_store].tolist(), store.top_drivers(report_rows[in_store], k)))
+    if (~in_store).any():
+        values = store.explain_frame(_df.iloc[alert_positions[~in_store]])
+        drivers.update(zip(alert_positions[~in_store].tolist(), top_k_drivers(values, store.feature_names, k)))
+    return drivers
+
+@st.cache_data
+def build_frame_store(_df, game_key):
+    """
+    Per-possession frame data for the whole game, computed once per game.
+    Every playback tick only indexes into these arrays - no re-filtering by period and no redraw of the history.
+    """
+    periods = _df['period'].to_numpy()
+    zeros = np.zeros(len(_df))
+    return {
+        'period_bounds': {int(p): (int(idx[0]), int(idx[-1])) for p in np.unique(periods) for idx in [np.flatnonzero(periods == p)]},
+        'win_pct': _df['win_probability'].to_numpy(dtype=float) * 100,
+        'cate': _df['cate_score'].to_numpy(dtype=float),
+        'propensity': _df['propensity_score'].to_numpy(dtype=float),
+        'score_margin': _df['score_margin'].to_numpy(dtype=float),
+        'home_fatigue': _df['home_cum_fatigue'].to_numpy(dtype=float) if 'home_cum_fatigue' in _df.columns else zeros,
+        'away_fatigue': _df['away_cum_fatigue'].to_numpy(dtype=float) if 'away_cum_fatigue' in _df.columns else zeros,
+        'is_breakpoint': ((_df['target_stop_run_90s'] == 1) & (_df['timeout_strategic_weight'] > 0)).to_numpy()
+    }
+
+def chart_rows(frames, period_start, start, stop):
+    """Chart rows for positions [start, stop); x is the possession index inside the quarter."""
+    return pd.DataFrame({
+        'possession': np.arange(start, stop) - period_start,
+        'win_pct': frames['win_pct'][start:stop],
+        'System Stress (CATE)': frames['cate'][start:stop],
+        'Coach Propensity': frames['propensity'][start:stop]
+    })
+
+# Vega-Lite charts support add_rows, so each tick appends one point instead of re-rendering a matplotlib figure
+CHART_CONFIG = {
+    'background': '#0e1117',
+    'view': {'fill': '#1e293b', 'stroke': None},
+    'axis': {'labelColor': 'white', 'titleColor': 'white', 'gridColor': '#334155', 'gridDash': [4, 4]},
+    'legend': {'labelColor': 'white', 'orient': 'top-left', 'title': None}
+}
+
+def win_probability_spec(x_max):
+    return {
+        'height': 260,
+        'mark': {'type': 'line', 'color': '#24a148', 'strokeWidth': 2.5, 'point': False},
+        'encoding': {
+            'x': {'field': 'possession', 'type': 'quantitative', 'title': 'Possession Index', 'scale': {'domain': [0, x_max]}},
+            'y': {'field': 'win_pct', 'type': 'quantitative', 'title': 'Probability (%)', 'scale': {'domain': [0, 100]}}
+        },
+        'config': CHART_CONFIG
+    }
+
+def science_spec(x_max):
+    return {
+        'height': 260,
+        'transform': [{'fold': ['System Stress (CATE)', 'Coach Propensity'], 'as': ['series', 'value']}],
+        'mark': {'type': 'line', 'strokeWidth': 2},
+        'encoding': {
+            'x': {'field': 'possession', 'type': 'quantitative', 'title': None, 'scale': {'domain': [0, x_max]}},
+            'y': {'field': 'value', 'type': 'quantitative', 'title': None, 'scale': {'domain': [0, 1.0]}},
+            'color': {'field': 'series', 'type': 'nominal', 'scale': {'domain': ['System Stress (CATE)', 'Coach Propensity'], 'range': ['#ff4b4b', '#38bdf8']}},
+            'strokeDash': {'field': 'series', 'type': 'nominal', 'scale': {'domain': ['System Stress (CATE)', 'Coach Propensity'], 'range': [[1, 0], [6, 4]]}, 'legend': None}
+        },
+        'config': CHART_CONFIG
+    }
+
+# בחירת משחק: כל משחק בקובץ זמין מיידית (קריאה של ה-row groups שלו בלבד)
+game_store = open_game_store()
+available_games = game_store.game_ids() if game_store is not None else [DEFAULT_GAME_ID]
+if 'game_id' not in st.session_state or st.session_state.game_id not in available_games:
+    st.session_state.game_id = DEFAULT_GAME_ID if DEFAULT_GAME_ID in available_games else available_games[0]
+
+with st.sidebar:
+    st.selectbox("משחק (Game ID):", available_games, key='game_id', on_change=reset_playback)
+
+df_game = load_game_data(st.session_state.game_id)
 
 if df_game.empty:
     st.stop()
 
+frames = build_frame_store(df_game, st.session_state.game_id)
+
 # ==========================================
 # 3. אתחול משתני הזיכרון (Session State)
 # ==========================================
@@ -70,9 +197,8 @@ if 'selected_period' not in st.session_state:
 # פונקציית עזר למעבר ישיר בין רבעים (לצרכי הצגה מהירה לשופטים)
 def jump_to_quarter(period):
     st.session_state.selected_period = period
-    period_df = df_game[df_game['period'] == period]
-    if not period_df.empty:
-        st.session_state.current_index = period_df.index[0] - df_game.index[0]
+    if period in frames['period_bounds']:
+        st.session_state.current_index = frames['period_bounds'][period][0]
     st.session_state.playing = False
 
 # ==========================================
@@ -105,29 +231,33 @@ with st.sidebar:
     st.write("---")
     # מהירות סימולציה
     speed = st.slider("מהירות הזרמה (שניות לפוזשן):", 0.1, 2.0, 0.5, step=0.1)
+    
+    # תקציב זמן לפריים: כמה מתוך זמן הפוזשן הלך על רינדור
+    frame_budget_slot = st.empty()
+    frame_budget_slot.caption(f"⏱️ Frame budget: {speed * 1000:.0f} ms")
 
-# סינון הדאטא לפי הרבע הנבחר
-df_period = df_game[df_game['period'] == st.session_state.selected_period]
-start_idx = df_period.index[0] - df_game.index[0]
-end_idx = df_period.index[-1] - df_game.index[0]
+# גבולות הרבע הנבחר מתוך מאגר הפריימים (בלי סינון df_game בכל tick)
+if st.session_state.selected_period not in frames['period_bounds']:
+    st.session_state.selected_period = min(frames['period_bounds'])
+start_idx, end_idx = frames['period_bounds'][st.session_state.selected_period]
+period_length = end_idx - start_idx + 1
 
 # וידוא שהאינדקס הנוכחי נמצא בטווח הרבע הנבחר
 if st.session_state.current_index < start_idx or st.session_state.current_index > end_idx:
     st.session_state.current_index = start_idx
 
-# שליפת הפוזשן הנוכחי וההיסטוריה שלו ברבע
+# שליפת הפוזשן הנוכחי (ההיסטוריה נשלפת ממאגר הפריימים)
 current_row = df_game.iloc[st.session_state.current_index]
-history_df = df_game.iloc[start_idx:st.session_state.current_index + 1]
 
 # ==========================================
 # 5. זיהוי נקודות עצירה אוטומטיות (Breakpoints)
 # ==========================================
 is_breakpoint = False
 if not st.session_state.playing:
-    if (current_row['target_stop_run_90s'] == 1) and (current_row['timeout_strategic_weight'] > 0):
+    if frames['is_breakpoint'][st.session_state.current_index]:
         is_breakpoint = True
 else:
-    if (current_row['target_stop_run_90s'] == 1) and (current_row['timeout_strategic_weight'] > 0):
+    if frames['is_breakpoint'][st.session_state.current_index]:
         if st.session_state.current_index not in st.session_state.triggered_breakpoints:
             st.session_state.playing = False
             is_breakpoint = True
@@ -138,7 +268,7 @@ else:
 # 6. כותרת הדשבורד הראשית
 # ==========================================
 st.markdown("<h1 style='text-align: center; color: #1e3a8a;'>NBA Timeout Decision Support System</h1>", unsafe_allow_html=True)
-st.markdown(f"<h3 style='text-align: center; color: #475569;'>Live Simulator — Game ID: 22401052 | Quarter {st.session_state.selected_period}</h3>", unsafe_allow_html=True)
+st.markdown(f"<h3 style='text-align: center; color: #475569;'>Live Simulator — Game ID: {st.session_state.game_id} | Quarter {st.session_state.selected_period}</h3>", unsafe_allow_html=True)
 st.write("---")
 
 # ==========================================
@@ -153,29 +283,19 @@ with col_hud:
     st.markdown("<h3 class='rtl-text'>🖥️ לוח המשחק (Live HUD)</h3>", unsafe_allow_html=True)
     
     kpi1, kpi2, kpi3 = st.columns(3)
-    kpi1.metric("הפרש תוצאה (Margin)", f"{int(current_row['score_margin'])}")
-    kpi2.metric("עייפות בית (Home Fatigue)", f"{int(current_row.get('home_cum_fatigue', 0))}s")
-    kpi3.metric("עייפות חוץ (Away Fatigue)", f"{int(current_row.get('away_cum_fatigue', 0))}s")
-    
-    st.markdown("<p class='rtl-text'><b>Live Win Probability (Bet365 Style)</b></p>", unsafe_allow_html=True)
-    fig_wp, ax_wp = plt.subplots(figsize=(6, 3))
-    fig_wp.patch.set_facecolor('#0e1117')
-    ax_wp.set_facecolor('#1e293b')
+    kpi_slots = (kpi1.empty(), kpi2.empty(), kpi3.empty())
     
-    times = np.arange(len(history_df))
-    wp_values = history_df['win_probability'].values * 100
+    def render_kpis(idx):
+        kpi_slots[0].metric("הפרש תוצאה (Margin)", f"{int(frames['score_margin'][idx])}")
+        kpi_slots[1].metric("עייפות בית (Home Fatigue)", f"{int(frames['home_fatigue'][idx])}s")
+        kpi_slots[2].metric("עייפות חוץ (Away Fatigue)", f"{int(frames['away_fatigue'][idx])}s")
     
-    ax_wp.plot(times, wp_values, color='#24a148', linewidth=2.5, label='Win %')
-    ax_wp.scatter(times[-1], wp_values[-1], color='white', s=50, zorder=5)
+    render_kpis(st.session_state.current_index)
     
-    ax_wp.set_ylim(0, 100)
-    ax_wp.set_xlim(0, max(30, len(df_period)))
-    ax_wp.grid(True, color='#334155', linestyle='--')
-    ax_wp.tick_params(colors='white')
-    ax_wp.set_ylabel("Probability (%)", color='white')
-    ax_wp.set_xlabel("Possession Index", color='white')
-    
-    st.pyplot(fig_wp)
+    st.markdown("<p class='rtl-text'><b>Live Win Probability (Bet365 Style)</b></p>", unsafe_allow_html=True)
+    x_max = max(30, period_length)
+    history_rows = chart_rows(frames, start_idx, start_idx, st.session_state.current_index + 1)
+    win_chart = st.vega_lite_chart(history_rows, win_probability_spec(x_max), use_container_width=True)
 
 # ------------------------------------------
 # 2. טור ימין: שכבת המדע וההסברתיות (The Science Layer)
@@ -184,23 +304,7 @@ with col_science:
     st.markdown("<h3 class='rtl-text'>🔬 שכבת אנליטיקה והסקה סיבתית</h3>", unsafe_allow_html=True)
     
     st.markdown("<p class='rtl-text'><b>מדד לחץ מערכת (CATE) מול הסתברות מאמן (Propensity)</b></p>", unsafe_allow_html=True)
-    fig_sc, ax_sc = plt.subplots(figsize=(6, 3))
-    fig_sc.patch.set_facecolor('#0e1117')
-    ax_sc.set_facecolor('#1e293b')
-    
-    cate_vals = history_df['cate_score'].values
-    prop_vals = history_df['propensity_score'].values
-    
-    ax_sc.plot(times, cate_vals, color='#ff4b4b', linewidth=2, label='System Stress (CATE)')
-    ax_sc.plot(times, prop_vals, color='#38bdf8', linewidth=2, linestyle='--', label='Coach Propensity')
-    
-    ax_sc.set_ylim(0, 1.0)
-    ax_sc.set_xlim(0, max(30, len(df_period)))
-    ax_sc.grid(True, color='#334155', linestyle='--')
-    ax_sc.tick_params(colors='white')
-    ax_sc.legend(loc='upper left', facecolor='#0e1117', edgecolor='none', labelcolor='white')
-    
-    st.pyplot(fig_sc)
+    science_chart = st.vega_lite_chart(history_rows, science_spec(x_max), use_container_width=True)
 
 st.write("---")
 
@@ -240,16 +344,26 @@ if is_breakpoint:
         fig_shap.patch.set_facecolor('#0e1117')
         ax_shap.set_facecolor('#1e293b')
         
+        # רבע 2 מוסבר דרך מודל ה-90 שניות, השאר דרך מודל ה-180 שניות
         if st.session_state.selected_period == 2:
+            shap_target, bar_color, shap_title = 'target_stop_run_90s', '#ff4b4b', "Short-Term Emergency Drivers (90s window)"
+        else:
+            shap_target, bar_color, shap_title = 'target_reverse_trend_180s', '#38bdf8', "Long-Term Structural Issues (180s window)"
+        
+        drivers = load_alert_drivers(shap_target, st.session_state.game_id, df_game).get(st.session_state.current_index)
+        if drivers:
+            features = [name for _, name, _ in drivers][::-1]
+            shap_values = [value for _, _, value in drivers][::-1]
+        elif st.session_state.selected_period == 2:
+            # ערכי תצוגה קבועים כשאין מודלים שמורים בסביבה
             features = ["Opponent's Scoring Run", "Game Tempo Shift", "Home Team Fatigue", "Usage Imbalance"]
             shap_values = [0.35, 0.22, 0.15, 0.08]
-            ax_shap.barh(features, shap_values, color='#ff4b4b')
-            ax_shap.set_title("Short-Term Emergency Drivers (90s window)", color='white')
         else:
             features = ["Stale Lineup (No Subs)", "Accumulated Turnovers", "Instability Index", "Team Fouls"]
             shap_values = [0.41, 0.28, 0.18, 0.07]
-            ax_shap.barh(features, shap_values, color='#38bdf8')
-            ax_shap.set_title("Long-Term Structural Issues (180s window)", color='white')
+        
+        ax_shap.barh(features, shap_values, color=bar_color)
+        ax_shap.set_title(shap_title, color='white')
             
         ax_shap.tick_params(colors='white')
         ax_shap.grid(True, color='#334155', linestyle='--')
@@ -321,7 +435,26 @@ if st.session_state.selected_period == 4 and st.session_state.current_index == e
 # ==========================================
 # 10. ניהול לולאת הריצה והזמן בסימולציה
 # ==========================================
+# הלולאה רצה בתוך אותה הרצה של הסקריפט: כל tick מוסיף נקודה לגרפים ומעדכן את ה-KPI במקום,
+# ו-rerun מלא קורה רק בנקודת עצירה או בסוף הרבע (לחיצה על Pause קוטעת את הלולאה דרך rerun של Streamlit)
 if st.session_state.playing and st.session_state.current_index < end_idx:
-    st.session_state.current_index += 1
-    time.sleep(speed)
+    for idx in range(st.session_state.current_index + 1, end_idx + 1):
+        tick_start = time.perf_counter()
+        
+        new_rows = chart_rows(frames, start_idx, idx, idx + 1)
+        win_chart.add_rows(new_rows)
+        science_chart.add_rows(new_rows)
+        render_kpis(idx)
+        st.session_state.current_index = idx
+        
+        render_ms = (time.perf_counter() - tick_start) * 1000
+        budget_ms = speed * 1000
+        status = "✅" if render_ms <= budget_ms else "⚠️ over budget"
+        frame_budget_slot.caption(f"⏱️ Frame: {render_ms:.1f} ms / {budget_ms:.0f} ms budget {status}")
+        
+        if frames['is_breakpoint'][idx] and idx not in st.session_state.triggered_breakpoints:
+            st.rerun()
+        time.sleep(max(0.0, speed - render_ms / 1000))
+    
+    st.session_state.playing = False
     st.rerun()
\ No newline at end of file
@@ -1 +0,0 @@
-window.DEMO_DATA = {"game_1": [{"period": 1, "home_score": 0, "away_score": 0, "score_margin": 0, "cate_score": 0.1458199313851223, "propensity_score": 0.1382607109982112, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 0.0, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12973155706685263, "shap_defensive_collapse": 0.08925249615744534, "shap_explosiveness": 0.12259152987589023, "shap_fatigue": 0.11399104874698957}, {"period": 1, "home_score": 0, "away_score": 0, "score_margin": 0, "cate_score": 0.148533379343407, "propensity_score": 0.11288321506267864, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 0.0, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13941633938787454, "shap_defensive_collapse": 0.08453565500653638, "shap_explosiveness": 0.0923932303685631, "shap_fatigue": 0.11466211256666056}, {"period": 1, "home_score": 2, "away_score": 0, "score_margin": 2, "cate_score": 0.12142371132390484, "propensity_score": 0.10249271690526143, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 18.0, "away_cum_fatigue": 18.0, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.1364897489848895, "shap_defensive_collapse": 0.09360850538309412, "shap_explosiveness": 0.0948720610873392, "shap_fatigue": 0.14657088763195653}, {"period": 1, "home_score": 2, "away_score": 2, "score_margin": 0, "cate_score": 0.12857608281125515, "propensity_score": 0.11066209229155041, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 33.0, "away_cum_fatigue": 33.0, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.13408250965109603, "shap_defensive_collapse": 0.10120705281871811, "shap_explosiveness": 0.10765250837503568, "shap_fatigue": 0.11892916073676914}, {"period": 1, "home_score": 5, "away_score": 2, "score_margin": 3, "cate_score": 0.15426384908486562, "propensity_score": 0.1148474500666898, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 53.0, "away_cum_fatigue": 53.0, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.13880673608219413, "shap_defensive_collapse": 0.10333725851390671, "shap_explosiveness": 0.10790612024225371, "shap_fatigue": 0.14084253294547505}, {"period": 1, "home_score": 5, "away_score": 5, "score_margin": 0, "cate_score": 0.16169484313180382, "propensity_score": 0.11370090505645483, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 68.0, "away_cum_fatigue": 68.0, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.10249917002363777, "shap_defensive_collapse": 0.10521813530353244, "shap_explosiveness": 0.10031245706373228, "shap_fatigue": 0.11766912695925849}, {"period": 1, "home_score": 5, "away_score": 5, "score_margin": 0, "cate_score": 0.13534831098361189, "propensity_score": 0.10566744954304785, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 93.0, "away_cum_fatigue": 93.0, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11493807279483459, "shap_defensive_collapse": 0.10314464331749414, "shap_explosiveness": 0.12054185358510006, "shap_fatigue": 0.1349716181168722}, {"period": 1, "home_score": 5, "away_score": 5, "score_margin": 0, "cate_score": 0.16468065398416987, "propensity_score": 0.1431003216520296, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 95.0, "away_cum_fatigue": 95.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11861311549094428, "shap_defensive_collapse": 0.08994784680374113, "shap_explosiveness": 0.10413765559816753, "shap_fatigue": 0.11431432288096363}, {"period": 1, "home_score": 5, "away_score": 5, "score_margin": 0, "cate_score": 0.15607719308841522, "propensity_score": 0.10035234353882252, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 110.0, "away_cum_fatigue": 110.0, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.13475788412999018, "shap_defensive_collapse": 0.11292219799289516, "shap_explosiveness": 0.10656532544697149, "shap_fatigue": 0.14038695593214431}, {"period": 1, "home_score": 5, "away_score": 5, "score_margin": 0, "cate_score": 0.12949694771023984, "propensity_score": 0.13380061062400656, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 110.0, "away_cum_fatigue": 110.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11829087108025185, "shap_defensive_collapse": 0.09494049167439145, "shap_explosiveness": 0.11254624372652716, "shap_fatigue": 0.12848116081136057}, {"period": 1, "home_score": 5, "away_score": 5, "score_margin": 0, "cate_score": 0.14771137955623936, "propensity_score": 0.13320509679301643, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 120.0, "away_cum_fatigue": 120.0, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1309182661649668, "shap_defensive_collapse": 0.10765496305210014, "shap_explosiveness": 0.11376771175285211, "shap_fatigue": 0.13701546720329022}, {"period": 1, "home_score": 5, "away_score": 5, "score_margin": 0, "cate_score": 0.1376065977013307, "propensity_score": 0.11235095576064615, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 122.0, "away_cum_fatigue": 122.0, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13104078551061238, "shap_defensive_collapse": 0.10380231547351583, "shap_explosiveness": 0.11023082079404949, "shap_fatigue": 0.11358447408098044}, {"period": 1, "home_score": 5, "away_score": 5, "score_margin": 0, "cate_score": 0.12909462013300393, "propensity_score": 0.10496793383500451, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 132.0, "away_cum_fatigue": 132.0, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.1052215975692061, "shap_defensive_collapse": 0.08716138620216958, "shap_explosiveness": 0.10699989246020679, "shap_fatigue": 0.13017897995492134}, {"period": 1, "home_score": 5, "away_score": 5, "score_margin": 0, "cate_score": 0.15928008809321795, "propensity_score": 0.12012784363793079, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 132.0, "away_cum_fatigue": 132.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12239910799646045, "shap_defensive_collapse": 0.08893002000393721, "shap_explosiveness": 0.1210106873529949, "shap_fatigue": 0.12448796135590628}, {"period": 1, "home_score": 5, "away_score": 5, "score_margin": 0, "cate_score": 0.16827416112059845, "propensity_score": 0.10444481047135806, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 142.0, "away_cum_fatigue": 142.0, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.11759968080970983, "shap_defensive_collapse": 0.11115809388225997, "shap_explosiveness": 0.11264760621264984, "shap_fatigue": 0.13554791472099825}, {"period": 1, "home_score": 5, "away_score": 5, "score_margin": 0, "cate_score": 0.13161768309073804, "propensity_score": 0.10075366396828221, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 142.0, "away_cum_fatigue": 142.0, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.13326488784360707, "shap_defensive_collapse": 0.08563585217745141, "shap_explosiveness": 0.12517990595787712, "shap_fatigue": 0.12200624844456814}, {"period": 1, "home_score": 5, "away_score": 8, "score_margin": -3, "cate_score": 0.12417807168316718, "propensity_score": 0.14820548551887633, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 155.0, "away_cum_fatigue": 155.0, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.12532350914563944, "shap_defensive_collapse": 0.09142934797034191, "shap_explosiveness": 0.1187738214067966, "shap_fatigue": 0.1277077019082511}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.15017742111456092, "propensity_score": 0.10088708760159794, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 170.0, "away_cum_fatigue": 170.0, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.10270726407037381, "shap_defensive_collapse": 0.08030973570694275, "shap_explosiveness": 0.11126313787720052, "shap_fatigue": 0.1355449567955153}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.15644963786438087, "propensity_score": 0.10080381980269917, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 181.0, "away_cum_fatigue": 181.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1224913825202533, "shap_defensive_collapse": 0.0895693746559566, "shap_explosiveness": 0.11976363271314582, "shap_fatigue": 0.11971922520149933}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.13381194142486313, "propensity_score": 0.10468207136035672, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 181.0, "away_cum_fatigue": 181.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.128439654987669, "shap_defensive_collapse": 0.09923410506180448, "shap_explosiveness": 0.10285196549146391, "shap_fatigue": 0.14369548815746266}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.15426531643900893, "propensity_score": 0.13516109952467523, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 203.0, "away_cum_fatigue": 203.0, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1053206357005587, "shap_defensive_collapse": 0.11891578390149313, "shap_explosiveness": 0.11981840583950004, "shap_fatigue": 0.13775163343482677}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.14589337370985236, "propensity_score": 0.14302293050659062, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 204.0, "away_cum_fatigue": 204.0, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12578433393768093, "shap_defensive_collapse": 0.11820892486282783, "shap_explosiveness": 0.09672113379168508, "shap_fatigue": 0.11942782683782627}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.12242422687132003, "propensity_score": 0.14333169312601793, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 211.0, "away_cum_fatigue": 211.0, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.12261759927544574, "shap_defensive_collapse": 0.08330356629375353, "shap_explosiveness": 0.12117516312677831, "shap_fatigue": 0.11271563146736065}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.1268934618781053, "propensity_score": 0.1030731810842074, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 211.0, "away_cum_fatigue": 211.0, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.12564882622187365, "shap_defensive_collapse": 0.09590898505153486, "shap_explosiveness": 0.09350409630783525, "shap_fatigue": 0.13695830102234022}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.12934837130689605, "propensity_score": 0.12987631522624976, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 223.0, "away_cum_fatigue": 223.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12322398956449822, "shap_defensive_collapse": 0.08135347068759034, "shap_explosiveness": 0.090020483179614, "shap_fatigue": 0.1447461180627678}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.16971589505770485, "propensity_score": 0.12761963770865503, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 224.0, "away_cum_fatigue": 224.0, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12286469201682684, "shap_defensive_collapse": 0.09869113344160134, "shap_explosiveness": 0.0906834152301187, "shap_fatigue": 0.12584633083651742}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.14603326983424836, "propensity_score": 0.14040804403485652, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 236.0, "away_cum_fatigue": 236.0, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1269520225339861, "shap_defensive_collapse": 0.11493229395508672, "shap_explosiveness": 0.10903235502320927, "shap_fatigue": 0.13023646037803138}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.14893947677377084, "propensity_score": 0.137882057480492, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 236.0, "away_cum_fatigue": 236.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11082845441124563, "shap_defensive_collapse": 0.08219295674567939, "shap_explosiveness": 0.11339239316073577, "shap_fatigue": 0.14880067983330797}, {"period": 1, "home_score": 7, "away_score": 8, "score_margin": -1, "cate_score": 0.1567409529134691, "propensity_score": 0.11982606959414874, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 238.0, "away_cum_fatigue": 238.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11311864305878531, "shap_defensive_collapse": 0.09242185472258117, "shap_explosiveness": 0.10647087861539764, "shap_fatigue": 0.11299965226445467}, {"period": 1, "home_score": 7, "away_score": 10, "score_margin": -3, "cate_score": 0.14709808861147966, "propensity_score": 0.12413992476651418, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 245.0, "away_cum_fatigue": 245.0, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.12304395611613685, "shap_defensive_collapse": 0.10341845393419193, "shap_explosiveness": 0.11798730244867045, "shap_fatigue": 0.11267688029975033}, {"period": 1, "home_score": 7, "away_score": 10, "score_margin": -3, "cate_score": 0.16565767788378843, "propensity_score": 0.11348429886329553, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 261.0, "away_cum_fatigue": 261.0, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.10568712148343495, "shap_defensive_collapse": 0.10956433056998248, "shap_explosiveness": 0.12332852356172633, "shap_fatigue": 0.12998219226964697}, {"period": 1, "home_score": 7, "away_score": 10, "score_margin": -3, "cate_score": 0.16039600754939587, "propensity_score": 0.1308223288043112, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 261.0, "away_cum_fatigue": 261.0, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.13152843544567533, "shap_defensive_collapse": 0.10344720563932047, "shap_explosiveness": 0.11030470646094476, "shap_fatigue": 0.1426713558142283}, {"period": 1, "home_score": 7, "away_score": 12, "score_margin": -5, "cate_score": 0.14014989153468937, "propensity_score": 0.13226767374042328, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 272.0, "away_cum_fatigue": 272.0, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.12236099094082906, "shap_defensive_collapse": 0.11304621049950006, "shap_explosiveness": 0.12898884678565126, "shap_fatigue": 0.14089245230620376}, {"period": 1, "home_score": 7, "away_score": 12, "score_margin": -5, "cate_score": 0.13786121714103938, "propensity_score": 0.12403306223613826, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 295.0, "away_cum_fatigue": 295.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11412469888413042, "shap_defensive_collapse": 0.09734915054613984, "shap_explosiveness": 0.11473700878914542, "shap_fatigue": 0.11533937371371579}, {"period": 1, "home_score": 7, "away_score": 12, "score_margin": -5, "cate_score": 0.16764383573554364, "propensity_score": 0.1462245796992994, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 295.0, "away_cum_fatigue": 295.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11443689768750706, "shap_defensive_collapse": 0.08983223141299086, "shap_explosiveness": 0.11306976485251738, "shap_fatigue": 0.12268842847909006}, {"period": 1, "home_score": 7, "away_score": 12, "score_margin": -5, "cate_score": 0.13718157889462798, "propensity_score": 0.13468606889730134, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 296.0, "away_cum_fatigue": 296.0, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10100688140047492, "shap_defensive_collapse": 0.11088569620471833, "shap_explosiveness": 0.09024889632243567, "shap_fatigue": 0.1290153985093614}, {"period": 1, "home_score": 7, "away_score": 12, "score_margin": -5, "cate_score": 0.1632549908159164, "propensity_score": 0.13854019605676993, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 303.0, "away_cum_fatigue": 303.0, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.12186111703726062, "shap_defensive_collapse": 0.11681020305093909, "shap_explosiveness": 0.11898758929676706, "shap_fatigue": 0.14501140203610327}, {"period": 1, "home_score": 7, "away_score": 12, "score_margin": -5, "cate_score": 0.16151388560993984, "propensity_score": 0.11531031204314356, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 303.0, "away_cum_fatigue": 303.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1371808862156377, "shap_defensive_collapse": 0.1134252112958965, "shap_explosiveness": 0.12116626071694322, "shap_fatigue": 0.14099162178731298}, {"period": 1, "home_score": 7, "away_score": 12, "score_margin": -5, "cate_score": 0.14690807246237786, "propensity_score": 0.1353893782559265, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 303.0, "away_cum_fatigue": 303.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10790111335680594, "shap_defensive_collapse": 0.10189033203363727, "shap_explosiveness": 0.12168100891218205, "shap_fatigue": 0.12151697009610254}, {"period": 1, "home_score": 7, "away_score": 12, "score_margin": -5, "cate_score": 0.1661234686283612, "propensity_score": 0.1127187480482997, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 242.4, "away_cum_fatigue": 303.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12437462592382556, "shap_defensive_collapse": 0.10118146397391868, "shap_explosiveness": 0.09992572345181411, "shap_fatigue": 0.14141340046275838}, {"period": 1, "home_score": 10, "away_score": 12, "score_margin": -2, "cate_score": 0.12485732398825078, "propensity_score": 0.14897428294145115, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 255.4, "away_cum_fatigue": 316.0, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.11315092235338725, "shap_defensive_collapse": 0.09589001066285663, "shap_explosiveness": 0.12926936211612505, "shap_fatigue": 0.13406520594620902}, {"period": 1, "home_score": 10, "away_score": 12, "score_margin": -2, "cate_score": 0.12514237465803746, "propensity_score": 0.11574232467980959, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 272.4, "away_cum_fatigue": 333.0, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13505905972237967, "shap_defensive_collapse": 0.0926962940314868, "shap_explosiveness": 0.11928788504906061, "shap_fatigue": 0.14506082924939895}, {"period": 1, "home_score": 10, "away_score": 12, "score_margin": -2, "cate_score": 0.15507536478479128, "propensity_score": 0.13641473814021712, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 273.4, "away_cum_fatigue": 334.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11504194743744083, "shap_defensive_collapse": 0.10833279691234517, "shap_explosiveness": 0.12461458822486488, "shap_fatigue": 0.11535860315511318}, {"period": 1, "home_score": 10, "away_score": 12, "score_margin": -2, "cate_score": 0.16452399345642157, "propensity_score": 0.10051897315442501, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 297.4, "away_cum_fatigue": 358.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10596291555057522, "shap_defensive_collapse": 0.10088488024775308, "shap_explosiveness": 0.11681137408981628, "shap_fatigue": 0.12204039706359748}, {"period": 1, "home_score": 10, "away_score": 12, "score_margin": -2, "cate_score": 0.1279780150449102, "propensity_score": 0.10944648828208248, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 299.4, "away_cum_fatigue": 360.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11096639482628226, "shap_defensive_collapse": 0.0995779053178946, "shap_explosiveness": 0.12806399457809253, "shap_fatigue": 0.1107564685914343}, {"period": 1, "home_score": 10, "away_score": 12, "score_margin": -2, "cate_score": 0.13377862724484768, "propensity_score": 0.10179607274073096, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 309.4, "away_cum_fatigue": 370.0, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12466422275134452, "shap_defensive_collapse": 0.08237827391827353, "shap_explosiveness": 0.09144033869551091, "shap_fatigue": 0.1417342335520898}, {"period": 1, "home_score": 10, "away_score": 12, "score_margin": -2, "cate_score": 0.15362457648284028, "propensity_score": 0.11496167378074626, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 313.4, "away_cum_fatigue": 374.0, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11166317088947728, "shap_defensive_collapse": 0.09936127688588961, "shap_explosiveness": 0.12121919757919372, "shap_fatigue": 0.11628290322688029}, {"period": 1, "home_score": 10, "away_score": 12, "score_margin": -2, "cate_score": 0.1282151562010085, "propensity_score": 0.1125366175079208, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 313.4, "away_cum_fatigue": 374.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13499274442643153, "shap_defensive_collapse": 0.1154227148738315, "shap_explosiveness": 0.1217429650385724, "shap_fatigue": 0.14357054917443965}, {"period": 1, "home_score": 10, "away_score": 12, "score_margin": -2, "cate_score": 0.1550685568304543, "propensity_score": 0.10279069794701612, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 313.4, "away_cum_fatigue": 299.2, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.13487691426061557, "shap_defensive_collapse": 0.1020979562332957, "shap_explosiveness": 0.09637035912321855, "shap_fatigue": 0.1398162777230505}, {"period": 1, "home_score": 10, "away_score": 14, "score_margin": -4, "cate_score": 0.1443817611102864, "propensity_score": 0.12488668829510163, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 324.4, "away_cum_fatigue": 310.2, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.10453439652022709, "shap_defensive_collapse": 0.10960665535504281, "shap_explosiveness": 0.100859571040912, "shap_fatigue": 0.12727041723398327}, {"period": 1, "home_score": 10, "away_score": 14, "score_margin": -4, "cate_score": 0.15403388840881793, "propensity_score": 0.10851967123196443, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 337.4, "away_cum_fatigue": 323.2, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12263596493268174, "shap_defensive_collapse": 0.09486326527001923, "shap_explosiveness": 0.11536482136111641, "shap_fatigue": 0.1254279233154855}, {"period": 1, "home_score": 10, "away_score": 14, "score_margin": -4, "cate_score": 0.14607740961629295, "propensity_score": 0.14493807681638343, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 339.4, "away_cum_fatigue": 325.2, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12677803153553752, "shap_defensive_collapse": 0.09927351824122944, "shap_explosiveness": 0.12630546217264504, "shap_fatigue": 0.13761837647916933}, {"period": 1, "home_score": 12, "away_score": 14, "score_margin": -2, "cate_score": 0.12216983472170422, "propensity_score": 0.14201128289028678, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 340.4, "away_cum_fatigue": 326.2, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.10455125236764301, "shap_defensive_collapse": 0.08997506161003949, "shap_explosiveness": 0.11668703514329529, "shap_fatigue": 0.13517006894299674}, {"period": 1, "home_score": 12, "away_score": 16, "score_margin": -4, "cate_score": 0.13119683017509887, "propensity_score": 0.14141759872451348, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 366.4, "away_cum_fatigue": 352.2, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.10358345601263262, "shap_defensive_collapse": 0.11156284237739503, "shap_explosiveness": 0.11826469575765883, "shap_fatigue": 0.1282182511074597}, {"period": 1, "home_score": 12, "away_score": 16, "score_margin": -4, "cate_score": 0.14876025434340065, "propensity_score": 0.12408406617812848, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 384.4, "away_cum_fatigue": 370.2, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.13527034846888764, "shap_defensive_collapse": 0.1002819278012916, "shap_explosiveness": 0.12870945519960464, "shap_fatigue": 0.11008551279794306}, {"period": 1, "home_score": 12, "away_score": 16, "score_margin": -4, "cate_score": 0.12602168300636463, "propensity_score": 0.14509639593547685, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 384.4, "away_cum_fatigue": 370.2, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1261245022831384, "shap_defensive_collapse": 0.08009315819725392, "shap_explosiveness": 0.09353802472251266, "shap_fatigue": 0.14372635626065264}, {"period": 1, "home_score": 12, "away_score": 16, "score_margin": -4, "cate_score": 0.14500583569003966, "propensity_score": 0.11175116924916732, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 389.4, "away_cum_fatigue": 375.2, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1319307036320996, "shap_defensive_collapse": 0.10652406709174056, "shap_explosiveness": 0.09170481524400012, "shap_fatigue": 0.11278804041457964}, {"period": 1, "home_score": 12, "away_score": 16, "score_margin": -4, "cate_score": 0.1269004784129448, "propensity_score": 0.11486947552689641, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 391.4, "away_cum_fatigue": 377.2, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10699607619269828, "shap_defensive_collapse": 0.11971160650723858, "shap_explosiveness": 0.09154644928599888, "shap_fatigue": 0.12970801470728754}, {"period": 1, "home_score": 15, "away_score": 16, "score_margin": -1, "cate_score": 0.12264042005446331, "propensity_score": 0.11669438806387222, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 398.4, "away_cum_fatigue": 384.2, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.1026785347644696, "shap_defensive_collapse": 0.10624302927534486, "shap_explosiveness": 0.10834668589678062, "shap_fatigue": 0.14235022370425748}, {"period": 1, "home_score": 18, "away_score": 16, "score_margin": 2, "cate_score": 0.1289138461268076, "propensity_score": 0.14381804443792473, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 398.4, "away_cum_fatigue": 384.2, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.1139575098160894, "shap_defensive_collapse": 0.08725265057258956, "shap_explosiveness": 0.12012784001761373, "shap_fatigue": 0.11680528641617327}, {"period": 1, "home_score": 21, "away_score": 16, "score_margin": 5, "cate_score": 0.14211840657563724, "propensity_score": 0.11329153722260625, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 406.4, "away_cum_fatigue": 392.2, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.11151036708036094, "shap_defensive_collapse": 0.08479705147440735, "shap_explosiveness": 0.11785391125522757, "shap_fatigue": 0.13587234160797582}, {"period": 1, "home_score": 24, "away_score": 16, "score_margin": 8, "cate_score": 0.16387936623138175, "propensity_score": 0.12372494788896501, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 406.4, "away_cum_fatigue": 392.2, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.13765846025958378, "shap_defensive_collapse": 0.11849637750835318, "shap_explosiveness": 0.091970779126544, "shap_fatigue": 0.1159187945212676}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.1674632064492597, "propensity_score": 0.12813760724475173, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 420.4, "away_cum_fatigue": 406.2, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.12278961779283976, "shap_defensive_collapse": 0.10973656046875774, "shap_explosiveness": 0.12012252816802362, "shap_fatigue": 0.14486121475546937}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.14390837083947847, "propensity_score": 0.12334676163902077, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 421.4, "away_cum_fatigue": 407.2, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.13202312291864943, "shap_defensive_collapse": 0.09557666358648269, "shap_explosiveness": 0.09929507298898464, "shap_fatigue": 0.12114775374031088}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.14305596711432172, "propensity_score": 0.13550665041987656, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 406.25, "away_cum_fatigue": 407.2, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.116807481188494, "shap_defensive_collapse": 0.09940641432570739, "shap_explosiveness": 0.12263243016032488, "shap_fatigue": 0.11946531033654222}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.15186445155086786, "propensity_score": 0.11879007102895026, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 381.0, "away_cum_fatigue": 407.2, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10018286201315497, "shap_defensive_collapse": 0.10517361151226898, "shap_explosiveness": 0.12774011870935784, "shap_fatigue": 0.1394272269601238}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.13623039982187685, "propensity_score": 0.130977617865443, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 330.5, "away_cum_fatigue": 407.2, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10060796667122193, "shap_defensive_collapse": 0.09882071220396008, "shap_explosiveness": 0.09120294255418825, "shap_fatigue": 0.14405638156645084}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.1258789046513997, "propensity_score": 0.13766813712639964, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 330.5, "away_cum_fatigue": 388.5, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10620458434031126, "shap_defensive_collapse": 0.116807147556873, "shap_explosiveness": 0.09317718660498381, "shap_fatigue": 0.14678585921763607}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.12255504981978872, "propensity_score": 0.14586316379503828, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 330.5, "away_cum_fatigue": 357.3333333333333, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.135614550170215, "shap_defensive_collapse": 0.09655424801489008, "shap_explosiveness": 0.1117056529794773, "shap_fatigue": 0.1448156147404974}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.15188293264089126, "propensity_score": 0.11286074477388061, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 330.5, "away_cum_fatigue": 295.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10406335496201048, "shap_defensive_collapse": 0.08152451365456183, "shap_explosiveness": 0.11457223083575019, "shap_fatigue": 0.12940520287539833}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.16061329474555822, "propensity_score": 0.10510749317573397, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 321.3333333333333, "away_cum_fatigue": 295.0, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11153778737487194, "shap_defensive_collapse": 0.1088712182538882, "shap_explosiveness": 0.10569874672073257, "shap_fatigue": 0.13774657391457873}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.1535130210166818, "propensity_score": 0.14989338909450414, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 241.0, "away_cum_fatigue": 295.0, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1373184046967598, "shap_defensive_collapse": 0.11166773494521717, "shap_explosiveness": 0.12079313456967747, "shap_fatigue": 0.13795894879308787}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.15258838517381845, "propensity_score": 0.85, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 192.8, "away_cum_fatigue": 295.0, "play_description": "Propensity Alarm: Coach model strongly suggests timeout", "shap_stale_lineup": 0.11547135547052746, "shap_defensive_collapse": 0.0847551828951908, "shap_explosiveness": 0.11536094114519235, "shap_fatigue": 0.11501857210047511}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.14122844717808922, "propensity_score": 0.14884130122773587, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 192.8, "away_cum_fatigue": 196.66666666666663, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12313588923662637, "shap_defensive_collapse": 0.0842559717031139, "shap_explosiveness": 0.12455153224557544, "shap_fatigue": 0.12587551718616935}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.1528297668099763, "propensity_score": 0.1470309265865241, "timeout_team": "TORONTO", "target_stop_run_90s": 1, "timeout_strategic_weight": 1, "home_cum_fatigue": 192.8, "away_cum_fatigue": 147.5, "play_description": "TIMEOUT: Toronto requests Timeout (Strategic weight = 1)", "shap_stale_lineup": 0.1168050619477956, "shap_defensive_collapse": 0.09477572415767747, "shap_explosiveness": 0.10920820206983628, "shap_fatigue": 0.13214369639651705}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.13045807494304623, "propensity_score": 0.12127739271882731, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 192.8, "away_cum_fatigue": 118.0, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1149889626965326, "shap_defensive_collapse": 0.08562526425601491, "shap_explosiveness": 0.09823394094019525, "shap_fatigue": 0.1255121232985211}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.15299622594335838, "propensity_score": 0.11939033121506423, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 209.8, "away_cum_fatigue": 135.0, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.13488757193575662, "shap_defensive_collapse": 0.10799045191635251, "shap_explosiveness": 0.11883106033934039, "shap_fatigue": 0.13927862665667118}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.14648116993765073, "propensity_score": 0.1221871332737181, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 209.8, "away_cum_fatigue": 135.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13621369250314927, "shap_defensive_collapse": 0.10788995604749188, "shap_explosiveness": 0.10591026049148797, "shap_fatigue": 0.12364191510927568}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.15742601849252463, "propensity_score": 0.12410007133459046, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 223.8, "away_cum_fatigue": 149.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11253216608516663, "shap_defensive_collapse": 0.11146963979897112, "shap_explosiveness": 0.10878059096219424, "shap_fatigue": 0.11225126475386377}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.1246878427934629, "propensity_score": 0.131377438163152, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 226.8, "away_cum_fatigue": 152.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12007228586165426, "shap_defensive_collapse": 0.08972685163552718, "shap_explosiveness": 0.10515099239131338, "shap_fatigue": 0.11591530585765687}, {"period": 1, "home_score": 27, "away_score": 16, "score_margin": 11, "cate_score": 0.15922609249878272, "propensity_score": 0.11314895752601996, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 234.8, "away_cum_fatigue": 160.0, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.13851557165633685, "shap_defensive_collapse": 0.08926149412262854, "shap_explosiveness": 0.09407891403756542, "shap_fatigue": 0.11962413842518949}, {"period": 1, "home_score": 27, "away_score": 17, "score_margin": 10, "cate_score": 0.15436210187883442, "propensity_score": 0.149304610218932, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 234.8, "away_cum_fatigue": 160.0, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.13075594450425782, "shap_defensive_collapse": 0.10674319124134876, "shap_explosiveness": 0.1135220139597866, "shap_fatigue": 0.13860563827204844}, {"period": 1, "home_score": 27, "away_score": 17, "score_margin": 10, "cate_score": 0.15475392482540506, "propensity_score": 0.10207366596396046, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 162.5, "away_cum_fatigue": 160.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.12726371658877705, "shap_defensive_collapse": 0.10767972483534502, "shap_explosiveness": 0.11591855575737897, "shap_fatigue": 0.12285171561957077}, {"period": 1, "home_score": 27, "away_score": 17, "score_margin": 10, "cate_score": 0.1448433259798371, "propensity_score": 0.10637434378078124, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 130.0, "away_cum_fatigue": 160.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10873576296623945, "shap_defensive_collapse": 0.09181392111264183, "shap_explosiveness": 0.11673772454692656, "shap_fatigue": 0.14690731851234534}, {"period": 1, "home_score": 27, "away_score": 18, "score_margin": 9, "cate_score": 0.16876805635170689, "propensity_score": 0.13114422084183067, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 130.0, "away_cum_fatigue": 160.0, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.10981610616055193, "shap_defensive_collapse": 0.0826718568723002, "shap_explosiveness": 0.09744872635315821, "shap_fatigue": 0.13966661843317044}, {"period": 1, "home_score": 29, "away_score": 18, "score_margin": 11, "cate_score": 0.13017638103007606, "propensity_score": 0.14364274882968542, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 148.0, "away_cum_fatigue": 178.0, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.12371973285084406, "shap_defensive_collapse": 0.11526103151277911, "shap_explosiveness": 0.1227073015810625, "shap_fatigue": 0.1155614700507668}, {"period": 1, "home_score": 29, "away_score": 21, "score_margin": 8, "cate_score": 0.13495102048264057, "propensity_score": 0.1496306471673654, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 165.0, "away_cum_fatigue": 195.0, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.1288332189758931, "shap_defensive_collapse": 0.08588831648720237, "shap_explosiveness": 0.10109916154592524, "shap_fatigue": 0.13078438528904046}, {"period": 1, "home_score": 29, "away_score": 21, "score_margin": 8, "cate_score": 0.13138279463970964, "propensity_score": 0.12482311082689415, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 175.0, "away_cum_fatigue": 205.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.12399949493819407, "shap_defensive_collapse": 0.11185205103283646, "shap_explosiveness": 0.12938862085011102, "shap_fatigue": 0.1309504018368407}, {"period": 1, "home_score": 29, "away_score": 21, "score_margin": 8, "cate_score": 0.12240844427210068, "propensity_score": 0.14503206283447642, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 177.0, "away_cum_fatigue": 207.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.120509184137052, "shap_defensive_collapse": 0.09737416068244371, "shap_explosiveness": 0.11589755396639795, "shap_fatigue": 0.14320614615612184}, {"period": 1, "home_score": 29, "away_score": 21, "score_margin": 8, "cate_score": 0.1651985678726306, "propensity_score": 0.13501266720799776, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 185.0, "away_cum_fatigue": 215.0, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.12618701586394515, "shap_defensive_collapse": 0.10818498584034975, "shap_explosiveness": 0.09573347464361348, "shap_fatigue": 0.11390131033977713}, {"period": 1, "home_score": 29, "away_score": 22, "score_margin": 7, "cate_score": 0.12400517693370663, "propensity_score": 0.1098880211154045, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 185.0, "away_cum_fatigue": 215.0, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.11375404736417653, "shap_defensive_collapse": 0.11370992531519289, "shap_explosiveness": 0.12020090819351684, "shap_fatigue": 0.12834089793627507}, {"period": 1, "home_score": 29, "away_score": 23, "score_margin": 6, "cate_score": 0.1503608135893049, "propensity_score": 0.14624399002090638, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 185.0, "away_cum_fatigue": 215.0, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.13848945560687778, "shap_defensive_collapse": 0.09066971282019426, "shap_explosiveness": 0.12483876004267408, "shap_fatigue": 0.14317735409554763}, {"period": 1, "home_score": 29, "away_score": 23, "score_margin": 6, "cate_score": 0.15154233518157567, "propensity_score": 0.10453413296156837, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 197.0, "away_cum_fatigue": 227.0, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.12268166398438438, "shap_defensive_collapse": 0.09196047162707081, "shap_explosiveness": 0.1285255216955417, "shap_fatigue": 0.14214001358156717}, {"period": 1, "home_score": 29, "away_score": 23, "score_margin": 6, "cate_score": 0.13889709659482014, "propensity_score": 0.12101973386029971, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 205.0, "away_cum_fatigue": 235.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12861856421283785, "shap_defensive_collapse": 0.10696442779381618, "shap_explosiveness": 0.1062622222640216, "shap_fatigue": 0.1338715043195258}, {"period": 1, "home_score": 29, "away_score": 23, "score_margin": 6, "cate_score": 0.12066205055431982, "propensity_score": 0.139943723154778, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 207.0, "away_cum_fatigue": 237.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12896890588937618, "shap_defensive_collapse": 0.1039182784302676, "shap_explosiveness": 0.12374645627117037, "shap_fatigue": 0.12443778727165852}, {"period": 1, "home_score": 29, "away_score": 26, "score_margin": 3, "cate_score": 0.16211097059254628, "propensity_score": 0.13287003512298246, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 219.0, "away_cum_fatigue": 249.0, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.1100441132603403, "shap_defensive_collapse": 0.09916960039707391, "shap_explosiveness": 0.097770253045917, "shap_fatigue": 0.14003657049356735}, {"period": 1, "home_score": 31, "away_score": 26, "score_margin": 5, "cate_score": 0.1392468873031222, "propensity_score": 0.14484753736224631, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 233.0, "away_cum_fatigue": 263.0, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.13161433086529, "shap_defensive_collapse": 0.09858698570494491, "shap_explosiveness": 0.09157879834941693, "shap_fatigue": 0.1371516004984254}, {"period": 1, "home_score": 31, "away_score": 26, "score_margin": 5, "cate_score": 0.14758329225381772, "propensity_score": 0.10915961090382306, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 249.0, "away_cum_fatigue": 279.0, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.10807136772635387, "shap_defensive_collapse": 0.0936470314202, "shap_explosiveness": 0.09163267303587451, "shap_fatigue": 0.11612943669507461}, {"period": 1, "home_score": 31, "away_score": 26, "score_margin": 5, "cate_score": 0.15552690700317753, "propensity_score": 0.1290924834699511, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 249.0, "away_cum_fatigue": 279.0, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.11882213743730156, "shap_defensive_collapse": 0.11663540592478708, "shap_explosiveness": 0.09758727422480035, "shap_fatigue": 0.13439753216160413}, {"period": 1, "home_score": 31, "away_score": 26, "score_margin": 5, "cate_score": 0.15376394253595146, "propensity_score": 0.11780779656944249, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 264.0, "away_cum_fatigue": 294.0, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.10678769318933168, "shap_defensive_collapse": 0.10830982996120735, "shap_explosiveness": 0.09223706908549739, "shap_fatigue": 0.14774625689644083}, {"period": 1, "home_score": 31, "away_score": 26, "score_margin": 5, "cate_score": 0.15472823323862225, "propensity_score": 0.11619777476682527, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 270.7, "away_cum_fatigue": 300.7, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.11862374103679117, "shap_defensive_collapse": 0.08841697773669924, "shap_explosiveness": 0.12914863312423241, "shap_fatigue": 0.1330330531826145}, {"period": 1, "home_score": 31, "away_score": 27, "score_margin": 4, "cate_score": 0.13712283839310002, "propensity_score": 0.11979345831166192, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 270.7, "away_cum_fatigue": 300.7, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.12281278195168904, "shap_defensive_collapse": 0.10589335842483827, "shap_explosiveness": 0.10333714280886169, "shap_fatigue": 0.1482544477547753}, {"period": 1, "home_score": 31, "away_score": 28, "score_margin": 3, "cate_score": 0.14061952818361803, "propensity_score": 0.1488026211942552, "timeout_team": "INDIANA", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 270.7, "away_cum_fatigue": 300.7, "play_description": "Tactical Timeout: End-of-quarter spacing adjustment", "shap_stale_lineup": 0.13372175009732568, "shap_defensive_collapse": 0.09133095129706734, "shap_explosiveness": 0.10308941223549034, "shap_fatigue": 0.13516471705245497}, {"period": 1, "home_score": 31, "away_score": 28, "score_margin": 3, "cate_score": 0.13198954827700377, "propensity_score": 0.14112226430117858, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 292.1, "away_cum_fatigue": 322.1, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12279189753238647, "shap_defensive_collapse": 0.1092861674598498, "shap_explosiveness": 0.127916443213253, "shap_fatigue": 0.11456951261864431}, {"period": 1, "home_score": 31, "away_score": 28, "score_margin": 3, "cate_score": 0.16844179880956875, "propensity_score": 0.12265100392322875, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 295.5, "away_cum_fatigue": 325.5, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1343890569407057, "shap_defensive_collapse": 0.09754405320958949, "shap_explosiveness": 0.09664722015366983, "shap_fatigue": 0.1174545558471193}, {"period": 1, "home_score": 31, "away_score": 28, "score_margin": 3, "cate_score": 0.1344278503807441, "propensity_score": 0.12061391926502993, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 299.9, "away_cum_fatigue": 329.9, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11690230387640602, "shap_defensive_collapse": 0.11528271016509758, "shap_explosiveness": 0.09325534112464974, "shap_fatigue": 0.1329748483595659}, {"period": 1, "home_score": 31, "away_score": 28, "score_margin": 3, "cate_score": 0.12736558063470257, "propensity_score": 0.12855761562189788, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 301.3, "away_cum_fatigue": 331.3, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10639660592460365, "shap_defensive_collapse": 0.09678552837638538, "shap_explosiveness": 0.10218743027849794, "shap_fatigue": 0.13209032331699494}, {"period": 1, "home_score": 31, "away_score": 31, "score_margin": 0, "cate_score": 0.12646702199266288, "propensity_score": 0.12341832573614822, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 304.9, "away_cum_fatigue": 334.9, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.13054104507772052, "shap_defensive_collapse": 0.08065561378128287, "shap_explosiveness": 0.09712663005783807, "shap_fatigue": 0.11708982263415925}, {"period": 1, "home_score": 31, "away_score": 31, "score_margin": 0, "cate_score": 0.16720280252305933, "propensity_score": 0.11771475486611999, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 318.6, "away_cum_fatigue": 348.6, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12423677372836275, "shap_defensive_collapse": 0.0881947203374217, "shap_explosiveness": 0.12307964962234477, "shap_fatigue": 0.12292517269460754}, {"period": 1, "home_score": 31, "away_score": 31, "score_margin": 0, "cate_score": 0.13757171322566117, "propensity_score": 0.1424451049957147, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 321.4, "away_cum_fatigue": 351.4, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10360387203665933, "shap_defensive_collapse": 0.0864526426671629, "shap_explosiveness": 0.12172953584111876, "shap_fatigue": 0.13022560091191102}, {"period": 1, "home_score": 31, "away_score": 31, "score_margin": 0, "cate_score": 0.15667838065840134, "propensity_score": 0.13822372727836657, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 322.7, "away_cum_fatigue": 352.7, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.11654573670005983, "shap_defensive_collapse": 0.09370777347136194, "shap_explosiveness": 0.09047685983048316, "shap_fatigue": 0.1334170285967574}, {"period": 1, "home_score": 32, "away_score": 31, "score_margin": 1, "cate_score": 0.16569447633825207, "propensity_score": 0.1172171268149467, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 322.7, "away_cum_fatigue": 352.7, "play_description": "IND: Draws a shooting foul, converts the free throw.", "shap_stale_lineup": 0.1151714063989707, "shap_defensive_collapse": 0.10184201772138911, "shap_explosiveness": 0.09032816565085386, "shap_fatigue": 0.11158890205775783}, {"period": 1, "home_score": 32, "away_score": 31, "score_margin": 1, "cate_score": 0.15504937471070437, "propensity_score": 0.1240136277478311, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 322.7, "away_cum_fatigue": 382.2000000000001, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10653395405866574, "shap_defensive_collapse": 0.08182415411194284, "shap_explosiveness": 0.12757748613906905, "shap_fatigue": 0.14188165659755336}, {"period": 1, "home_score": 32, "away_score": 31, "score_margin": 1, "cate_score": 0.13942656360238798, "propensity_score": 0.12187052818558528, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 322.7, "away_cum_fatigue": 402.16, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12218222611224556, "shap_defensive_collapse": 0.10477524379024851, "shap_explosiveness": 0.0985557557810772, "shap_fatigue": 0.1209071993852372}, {"period": 1, "home_score": 32, "away_score": 31, "score_margin": 1, "cate_score": 0.16711296444287455, "propensity_score": 0.13348508149439048, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 268.95, "away_cum_fatigue": 402.16, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10669366000524043, "shap_defensive_collapse": 0.09337571268608949, "shap_explosiveness": 0.10842523892581278, "shap_fatigue": 0.12786611304054582}, {"period": 1, "home_score": 32, "away_score": 31, "score_margin": 1, "cate_score": 0.15682456656339291, "propensity_score": 0.12640994792948249, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 319.96, "away_cum_fatigue": 402.16, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11725395562845292, "shap_defensive_collapse": 0.08375149469990516, "shap_explosiveness": 0.12571573763338048, "shap_fatigue": 0.11602309005625831}, {"period": 1, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.13192321939972318, "propensity_score": 0.14916727995913243, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 319.96, "away_cum_fatigue": 402.16, "play_description": "IND: Draws a shooting foul, converts the free throw.", "shap_stale_lineup": 0.12644075342992503, "shap_defensive_collapse": 0.08833367521210905, "shap_explosiveness": 0.0997025893932584, "shap_fatigue": 0.1460747372601333}, {"period": 1, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.16118868641350964, "propensity_score": 0.14204273246319485, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 323.06000000000006, "away_cum_fatigue": 405.26, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.12894050357871917, "shap_defensive_collapse": 0.09488457934252179, "shap_explosiveness": 0.1037117195576548, "shap_fatigue": 0.1302553783749658}, {"period": 1, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.15803067225911363, "propensity_score": 0.11994435861115635, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 323.16, "away_cum_fatigue": 405.36, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12732276729111153, "shap_defensive_collapse": 0.0999362332763978, "shap_explosiveness": 0.11490702894594712, "shap_fatigue": 0.13422637797736772}, {"period": 1, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.13973545370186027, "propensity_score": 0.1173481326586078, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 323.26, "away_cum_fatigue": 405.46, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1373495796168535, "shap_defensive_collapse": 0.09493830813383944, "shap_explosiveness": 0.11028368206048537, "shap_fatigue": 0.14035353175615736}, {"period": 2, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.13000939586494126, "propensity_score": 0.13207418228942652, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 502.2, "away_cum_fatigue": 508.66, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10792643365125051, "shap_defensive_collapse": 0.09341039546929394, "shap_explosiveness": 0.11634935288008201, "shap_fatigue": 0.13735824707932678}, {"period": 2, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.15562982366314076, "propensity_score": 0.1239561599139932, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 495.925, "away_cum_fatigue": 508.66, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11443542279853368, "shap_defensive_collapse": 0.08148593048636428, "shap_explosiveness": 0.09411553509738661, "shap_fatigue": 0.14663571057836078}, {"period": 2, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.16226544484827732, "propensity_score": 0.12092318532447956, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 495.925, "away_cum_fatigue": 455.825, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10627220624678853, "shap_defensive_collapse": 0.11260729844763541, "shap_explosiveness": 0.12002079321391934, "shap_fatigue": 0.13809753688420004}, {"period": 2, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.13843232705317318, "propensity_score": 0.13997823248911356, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 495.925, "away_cum_fatigue": 455.825, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.13828355396615433, "shap_defensive_collapse": 0.10241948837161689, "shap_explosiveness": 0.1039555083055573, "shap_fatigue": 0.12608358758422986}, {"period": 2, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.14184900595041186, "propensity_score": 0.14350148960623038, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 396.74, "away_cum_fatigue": 455.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12163386388816577, "shap_defensive_collapse": 0.0856883729659776, "shap_explosiveness": 0.11745919707801875, "shap_fatigue": 0.1431660702763417}, {"period": 2, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.13782988321346482, "propensity_score": 0.14173203965883052, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 396.74, "away_cum_fatigue": 455.825, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12561903948308054, "shap_defensive_collapse": 0.11702498743431224, "shap_explosiveness": 0.10975735791095295, "shap_fatigue": 0.13418724987222067}, {"period": 2, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.13198687034184955, "propensity_score": 0.13029187446584017, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 396.74, "away_cum_fatigue": 455.825, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1144238792756085, "shap_defensive_collapse": 0.09144683339802731, "shap_explosiveness": 0.09812735452806294, "shap_fatigue": 0.13021335559146333}, {"period": 2, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.15266890706260655, "propensity_score": 0.11775184471784265, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 396.74, "away_cum_fatigue": 411.6, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10032767845993112, "shap_defensive_collapse": 0.11115592269418012, "shap_explosiveness": 0.12528699264836396, "shap_fatigue": 0.11520878950198678}, {"period": 2, "home_score": 33, "away_score": 31, "score_margin": 2, "cate_score": 0.1395219600391052, "propensity_score": 0.1418047559771285, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 396.74, "away_cum_fatigue": 411.6, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10213243263824753, "shap_defensive_collapse": 0.09166357098383526, "shap_explosiveness": 0.10243561579154667, "shap_fatigue": 0.12544263680707435}, {"period": 2, "home_score": 33, "away_score": 33, "score_margin": 0, "cate_score": 0.15288915089485866, "propensity_score": 0.11858931483649815, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 407.74, "away_cum_fatigue": 422.6, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.13773137126957824, "shap_defensive_collapse": 0.08864046049491549, "shap_explosiveness": 0.109438864725084, "shap_fatigue": 0.1190781833722302}, {"period": 2, "home_score": 33, "away_score": 33, "score_margin": 0, "cate_score": 0.13811366775260953, "propensity_score": 0.11337072928759606, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 418.74, "away_cum_fatigue": 433.6, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.13776504243152649, "shap_defensive_collapse": 0.09026120482754714, "shap_explosiveness": 0.1265829994672149, "shap_fatigue": 0.14987965391307145}, {"period": 2, "home_score": 33, "away_score": 33, "score_margin": 0, "cate_score": 0.13782510069546763, "propensity_score": 0.11709554596201324, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 420.74, "away_cum_fatigue": 435.6, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11354741771869721, "shap_defensive_collapse": 0.08667258137960374, "shap_explosiveness": 0.10872912562077328, "shap_fatigue": 0.14372927665212695}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.12976258002386268, "propensity_score": 0.1382107493986242, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 427.74, "away_cum_fatigue": 442.6, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.12831977557386404, "shap_defensive_collapse": 0.10607487017738854, "shap_explosiveness": 0.09236525121546987, "shap_fatigue": 0.12955387190302964}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.1693656375265697, "propensity_score": 0.1485831099468394, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 427.74, "away_cum_fatigue": 442.6, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12608596831134697, "shap_defensive_collapse": 0.11451145561785672, "shap_explosiveness": 0.11990903061231369, "shap_fatigue": 0.14982481415704085}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.12116527461993105, "propensity_score": 0.10475396306626952, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 443.74, "away_cum_fatigue": 458.6, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12343279111937566, "shap_defensive_collapse": 0.1193882161127248, "shap_explosiveness": 0.11631663992013914, "shap_fatigue": 0.12048067123495032}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.14740402229281158, "propensity_score": 0.1332095655645219, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 443.74, "away_cum_fatigue": 458.6, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12780135065814155, "shap_defensive_collapse": 0.1078114861865618, "shap_explosiveness": 0.0921628091303284, "shap_fatigue": 0.1337585914062575}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.1480453947198623, "propensity_score": 0.13881862523033467, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 445.74, "away_cum_fatigue": 460.6, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12166591538965507, "shap_defensive_collapse": 0.10473531068027332, "shap_explosiveness": 0.1087744808412163, "shap_fatigue": 0.1218201096563361}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.1237377343828706, "propensity_score": 0.12496180638023299, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 450.74, "away_cum_fatigue": 465.6, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10323173874654952, "shap_defensive_collapse": 0.09120343998365227, "shap_explosiveness": 0.09288469896763159, "shap_fatigue": 0.13553116190948325}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.16461355044886306, "propensity_score": 0.13265174538736513, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 454.74, "away_cum_fatigue": 469.6, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11706680095464571, "shap_defensive_collapse": 0.10991700051861683, "shap_explosiveness": 0.12210840826640725, "shap_fatigue": 0.11726646237952165}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.1255311455769284, "propensity_score": 0.12650359468079694, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 463.74, "away_cum_fatigue": 478.6, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.13848024580166743, "shap_defensive_collapse": 0.11286549990754992, "shap_explosiveness": 0.10283516988371559, "shap_fatigue": 0.12038625396021108}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.15128867255164097, "propensity_score": 0.12326080909311882, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 465.74, "away_cum_fatigue": 480.6, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10350752242469322, "shap_defensive_collapse": 0.088596564373607, "shap_explosiveness": 0.10744749287544667, "shap_fatigue": 0.1258859551995572}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.1250424809258374, "propensity_score": 0.10096329862471909, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 483.74, "away_cum_fatigue": 498.6, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1001835188159512, "shap_defensive_collapse": 0.11217564435298519, "shap_explosiveness": 0.09417952798911464, "shap_fatigue": 0.11406679954603813}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.15554263945768082, "propensity_score": 0.13148349255298564, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 484.74, "away_cum_fatigue": 499.6, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11818615031172336, "shap_defensive_collapse": 0.0982008691578865, "shap_explosiveness": 0.11015184254099014, "shap_fatigue": 0.12674040285214633}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.16406647525633275, "propensity_score": 0.12159228659649803, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 502.74, "away_cum_fatigue": 517.6, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12005013458097759, "shap_defensive_collapse": 0.10560337707988231, "shap_explosiveness": 0.1113954686064889, "shap_fatigue": 0.13579138208594932}, {"period": 2, "home_score": 33, "away_score": 35, "score_margin": -2, "cate_score": 0.1547644981524816, "propensity_score": 0.1390405488284223, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 503.74, "away_cum_fatigue": 518.6, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11907600438911499, "shap_defensive_collapse": 0.10692051434354881, "shap_explosiveness": 0.1298107084626462, "shap_fatigue": 0.11495134705360804}, {"period": 2, "home_score": 35, "away_score": 35, "score_margin": 0, "cate_score": 0.13330863495069548, "propensity_score": 0.11931843720936092, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 514.74, "away_cum_fatigue": 529.6, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.12973457532231797, "shap_defensive_collapse": 0.11621211934775813, "shap_explosiveness": 0.09891537001605959, "shap_fatigue": 0.13385494297287806}, {"period": 2, "home_score": 35, "away_score": 35, "score_margin": 0, "cate_score": 0.1654981899935514, "propensity_score": 0.10773886020870148, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 542.74, "away_cum_fatigue": 557.6, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12364616283868313, "shap_defensive_collapse": 0.08016789141792399, "shap_explosiveness": 0.09193527717808243, "shap_fatigue": 0.14737775071777595}, {"period": 2, "home_score": 35, "away_score": 35, "score_margin": 0, "cate_score": 0.14898091812340436, "propensity_score": 0.11261159464407182, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 542.74, "away_cum_fatigue": 557.6, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1266275232838485, "shap_defensive_collapse": 0.09598512970788334, "shap_explosiveness": 0.10928752668262717, "shap_fatigue": 0.12978413936361008}, {"period": 2, "home_score": 35, "away_score": 35, "score_margin": 0, "cate_score": 0.13798434474750237, "propensity_score": 0.1433075970372641, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 542.74, "away_cum_fatigue": 557.6, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1265808843482608, "shap_defensive_collapse": 0.10779067925750214, "shap_explosiveness": 0.09996089182865518, "shap_fatigue": 0.135759539528788}, {"period": 2, "home_score": 35, "away_score": 35, "score_margin": 0, "cate_score": 0.16263171188652706, "propensity_score": 0.12096859550919543, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 641.925, "away_cum_fatigue": 557.6, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1213292855584655, "shap_defensive_collapse": 0.11141371997288362, "shap_explosiveness": 0.09318325075207493, "shap_fatigue": 0.12363917866774096}, {"period": 2, "home_score": 35, "away_score": 35, "score_margin": 0, "cate_score": 0.1323089606301372, "propensity_score": 0.1325593249586487, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 641.925, "away_cum_fatigue": 557.6, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12249935890176859, "shap_defensive_collapse": 0.08780733649349368, "shap_explosiveness": 0.11534566994955975, "shap_fatigue": 0.12629717127221016}, {"period": 2, "home_score": 35, "away_score": 35, "score_margin": 0, "cate_score": 0.15902220527453848, "propensity_score": 0.11343380262519408, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 641.925, "away_cum_fatigue": 557.6, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11937556513399533, "shap_defensive_collapse": 0.11825077817049809, "shap_explosiveness": 0.115771722998491, "shap_fatigue": 0.14402977805679873}, {"period": 2, "home_score": 35, "away_score": 35, "score_margin": 0, "cate_score": 0.12227548305791554, "propensity_score": 0.11844578935456593, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 641.925, "away_cum_fatigue": 557.6, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11163382386958208, "shap_defensive_collapse": 0.11612841387169848, "shap_explosiveness": 0.10581716622000409, "shap_fatigue": 0.12899383308245096}, {"period": 2, "home_score": 35, "away_score": 35, "score_margin": 0, "cate_score": 0.1642520594272805, "propensity_score": 0.12813756891194938, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 649.925, "away_cum_fatigue": 565.6, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12043422692884932, "shap_defensive_collapse": 0.09677048854184188, "shap_explosiveness": 0.1148982762307775, "shap_fatigue": 0.11662931830640366}, {"period": 2, "home_score": 35, "away_score": 35, "score_margin": 0, "cate_score": 0.13382106103696453, "propensity_score": 0.12846808992321743, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 651.925, "away_cum_fatigue": 567.6, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12298309799860604, "shap_defensive_collapse": 0.10645034266382059, "shap_explosiveness": 0.1004436704936665, "shap_fatigue": 0.13507149086619288}, {"period": 2, "home_score": 35, "away_score": 38, "score_margin": -3, "cate_score": 0.14904622006021673, "propensity_score": 0.10568056407653811, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 661.925, "away_cum_fatigue": 577.6, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.10268973828547254, "shap_defensive_collapse": 0.11692748272991563, "shap_explosiveness": 0.10894074753066085, "shap_fatigue": 0.11445365845017336}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.16553311313412672, "propensity_score": 0.10418805513862348, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 681.925, "away_cum_fatigue": 597.6, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.11934764483785643, "shap_defensive_collapse": 0.0923920039584956, "shap_explosiveness": 0.11031876465141865, "shap_fatigue": 0.128585527453458}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.1696295523229464, "propensity_score": 0.10603163128177438, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 692.925, "away_cum_fatigue": 608.6, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11142183177023006, "shap_defensive_collapse": 0.09400316269411522, "shap_explosiveness": 0.11203639434272607, "shap_fatigue": 0.1493409212374898}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.12311120198209695, "propensity_score": 0.118547042298709, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 695.925, "away_cum_fatigue": 611.6, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1318475691536618, "shap_defensive_collapse": 0.09973228099385871, "shap_explosiveness": 0.10230495275591969, "shap_fatigue": 0.13120588993941226}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.16642407187998626, "propensity_score": 0.12915599527785207, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 704.925, "away_cum_fatigue": 620.6, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.13779680903893973, "shap_defensive_collapse": 0.08885337500506503, "shap_explosiveness": 0.09693472348309237, "shap_fatigue": 0.12523883124367613}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.14585803031024705, "propensity_score": 0.11987727236826702, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 706.925, "away_cum_fatigue": 622.6, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.13510009618134244, "shap_defensive_collapse": 0.08639796282292962, "shap_explosiveness": 0.10970163619107769, "shap_fatigue": 0.14269218013510693}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.16726910429509173, "propensity_score": 0.13963457857356207, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 711.925, "away_cum_fatigue": 627.6, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13948785019757262, "shap_defensive_collapse": 0.08592941662109432, "shap_explosiveness": 0.11008657017463938, "shap_fatigue": 0.13286263421574693}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.14734655421572035, "propensity_score": 0.13922167300309843, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 713.925, "away_cum_fatigue": 629.6, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10601180448028195, "shap_defensive_collapse": 0.09478816895542436, "shap_explosiveness": 0.10294039043381036, "shap_fatigue": 0.11039516493146229}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.13320808149244434, "propensity_score": 0.14091670796716038, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 730.925, "away_cum_fatigue": 646.6, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.11096421868258838, "shap_defensive_collapse": 0.09378983112179738, "shap_explosiveness": 0.10017180887405436, "shap_fatigue": 0.1474356819966862}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.15236067404008524, "propensity_score": 0.12002666688369594, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 730.925, "away_cum_fatigue": 646.6, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.107099054161043, "shap_defensive_collapse": 0.09927830520468564, "shap_explosiveness": 0.11235064404743819, "shap_fatigue": 0.14933913346640534}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.1431492698221711, "propensity_score": 0.10759421518953452, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 730.925, "away_cum_fatigue": 646.6, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1109176226391749, "shap_defensive_collapse": 0.09224157911614356, "shap_explosiveness": 0.10411668330636113, "shap_fatigue": 0.11612209196487201}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.1515503576033402, "propensity_score": 0.12535637149617, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 730.925, "away_cum_fatigue": 690.825, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13579019952882745, "shap_defensive_collapse": 0.08717541929294595, "shap_explosiveness": 0.10439505716608262, "shap_fatigue": 0.127117341202702}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.14556181497889836, "propensity_score": 0.1304946955887167, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 730.925, "away_cum_fatigue": 690.825, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13127697085611625, "shap_defensive_collapse": 0.11720556873533708, "shap_explosiveness": 0.09528880151393163, "shap_fatigue": 0.11576527197858975}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.13111904429152355, "propensity_score": 0.10586787551951246, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 730.925, "away_cum_fatigue": 690.825, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1075109042194102, "shap_defensive_collapse": 0.09861697863432971, "shap_explosiveness": 0.11462627818339442, "shap_fatigue": 0.1134132457538201}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.15672476944083408, "propensity_score": 0.13016756665749055, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 731.925, "away_cum_fatigue": 691.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1396278456457128, "shap_defensive_collapse": 0.11097652350194347, "shap_explosiveness": 0.12565198463023006, "shap_fatigue": 0.12481011770974361}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.15998306831016132, "propensity_score": 0.11149087632908292, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 745.925, "away_cum_fatigue": 705.825, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1285084308467063, "shap_defensive_collapse": 0.08687147947150277, "shap_explosiveness": 0.11430532394289925, "shap_fatigue": 0.12874991134600963}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.16383108293714865, "propensity_score": 0.11655063763258568, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 745.925, "away_cum_fatigue": 705.825, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10202661895997409, "shap_defensive_collapse": 0.08802106678984084, "shap_explosiveness": 0.11236128212299998, "shap_fatigue": 0.1242516728408498}, {"period": 2, "home_score": 37, "away_score": 38, "score_margin": -1, "cate_score": 0.13513119008914906, "propensity_score": 0.10827764122557607, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 746.925, "away_cum_fatigue": 706.825, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13582775409025588, "shap_defensive_collapse": 0.09724678414200182, "shap_explosiveness": 0.11486608832130253, "shap_fatigue": 0.11994614308338904}, {"period": 2, "home_score": 37, "away_score": 40, "score_margin": -3, "cate_score": 0.15046358325338663, "propensity_score": 0.11315309043058297, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 748.925, "away_cum_fatigue": 708.825, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.12858376216739703, "shap_defensive_collapse": 0.11796889606849538, "shap_explosiveness": 0.12894073726126642, "shap_fatigue": 0.12460544700813896}, {"period": 2, "home_score": 37, "away_score": 40, "score_margin": -3, "cate_score": 0.12425005417919383, "propensity_score": 0.10578616032097632, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 766.925, "away_cum_fatigue": 726.825, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.12813290702820584, "shap_defensive_collapse": 0.10616795292858566, "shap_explosiveness": 0.10777313258179579, "shap_fatigue": 0.1303106134632225}, {"period": 2, "home_score": 37, "away_score": 40, "score_margin": -3, "cate_score": 0.13595889130252944, "propensity_score": 0.11112309160494797, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 766.925, "away_cum_fatigue": 726.825, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12098833329385938, "shap_defensive_collapse": 0.0993850764916818, "shap_explosiveness": 0.11122224576223137, "shap_fatigue": 0.1481944440983079}, {"period": 2, "home_score": 37, "away_score": 43, "score_margin": -6, "cate_score": 0.16077496085390577, "propensity_score": 0.13039385869372078, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 772.925, "away_cum_fatigue": 732.825, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.11622761217956429, "shap_defensive_collapse": 0.11186867297409903, "shap_explosiveness": 0.1129815334248874, "shap_fatigue": 0.11652263824752493}, {"period": 2, "home_score": 37, "away_score": 43, "score_margin": -6, "cate_score": 0.16362032104419189, "propensity_score": 0.11277121767733644, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 773.925, "away_cum_fatigue": 733.825, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.12618483824392523, "shap_defensive_collapse": 0.11365872780932262, "shap_explosiveness": 0.09259512685017691, "shap_fatigue": 0.12066630654768108}, {"period": 2, "home_score": 37, "away_score": 43, "score_margin": -6, "cate_score": 0.1645353776070347, "propensity_score": 0.1190614262940882, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 760.0, "away_cum_fatigue": 733.825, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11197133832843295, "shap_defensive_collapse": 0.10376439455924609, "shap_explosiveness": 0.1255490598842562, "shap_fatigue": 0.12186324714550863}, {"period": 2, "home_score": 37, "away_score": 43, "score_margin": -6, "cate_score": 0.15449549511418356, "propensity_score": 0.10907747455170358, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 701.825, "away_cum_fatigue": 733.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11173636802987548, "shap_defensive_collapse": 0.08932967355852346, "shap_explosiveness": 0.09417803681992577, "shap_fatigue": 0.1306228798280373}, {"period": 2, "home_score": 37, "away_score": 43, "score_margin": -6, "cate_score": 0.16579802723131304, "propensity_score": 0.11676795570067491, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 715.825, "away_cum_fatigue": 747.825, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11038693512582248, "shap_defensive_collapse": 0.10122314292222497, "shap_explosiveness": 0.11213844117541942, "shap_fatigue": 0.1332064280637408}, {"period": 2, "home_score": 37, "away_score": 43, "score_margin": -6, "cate_score": 0.14035976362323235, "propensity_score": 0.1477439241981517, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 717.825, "away_cum_fatigue": 749.825, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13243476532254334, "shap_defensive_collapse": 0.11167128243710583, "shap_explosiveness": 0.10214940468283247, "shap_fatigue": 0.1433954598904011}, {"period": 2, "home_score": 37, "away_score": 45, "score_margin": -8, "cate_score": 0.12813051440947895, "propensity_score": 0.13167069759274427, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 723.825, "away_cum_fatigue": 755.825, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.11304212092537036, "shap_defensive_collapse": 0.08942862279484033, "shap_explosiveness": 0.12648093263183852, "shap_fatigue": 0.13620940803911205}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.12920455518255197, "propensity_score": 0.12272745291719267, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 744.825, "away_cum_fatigue": 776.825, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.1289248862508166, "shap_defensive_collapse": 0.11855647106934011, "shap_explosiveness": 0.12730543771057262, "shap_fatigue": 0.1480101635103278}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.13118856051527186, "propensity_score": 0.13393611821058712, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 764.825, "away_cum_fatigue": 796.825, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.11568723095973937, "shap_defensive_collapse": 0.09671747483463956, "shap_explosiveness": 0.10532837958631946, "shap_fatigue": 0.14293580716173876}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.12005943305997248, "propensity_score": 0.11928816989425903, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 764.825, "away_cum_fatigue": 796.825, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11642135996535963, "shap_defensive_collapse": 0.09306990998349003, "shap_explosiveness": 0.12228684665690429, "shap_fatigue": 0.1116480713242483}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.13133908444457457, "propensity_score": 0.1386205589194982, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 770.825, "away_cum_fatigue": 802.825, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11768237451681263, "shap_defensive_collapse": 0.11952661887742261, "shap_explosiveness": 0.12209696908679984, "shap_fatigue": 0.11927669237102441}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.16654897083569498, "propensity_score": 0.1384697335179601, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 772.825, "away_cum_fatigue": 804.825, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1107481934926625, "shap_defensive_collapse": 0.1032795694365297, "shap_explosiveness": 0.09295293389725473, "shap_fatigue": 0.1409103475417205}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.15692592763508986, "propensity_score": 0.11004555513249652, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 785.825, "away_cum_fatigue": 817.825, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12202002259992858, "shap_defensive_collapse": 0.1139051239654825, "shap_explosiveness": 0.10801710762740913, "shap_fatigue": 0.12191839004445947}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.16587386004584992, "propensity_score": 0.1355037749029251, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 786.825, "away_cum_fatigue": 818.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1257498135152859, "shap_defensive_collapse": 0.0813669665030932, "shap_explosiveness": 0.09707927388304093, "shap_fatigue": 0.13945554850869823}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.15017489805380552, "propensity_score": 0.13476660704947035, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 793.825, "away_cum_fatigue": 825.825, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.10396559392177505, "shap_defensive_collapse": 0.088383682583926, "shap_explosiveness": 0.09692648090718678, "shap_fatigue": 0.14693616539371568}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.14272097705903242, "propensity_score": 0.13133990130917286, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 793.825, "away_cum_fatigue": 825.825, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1025275422454713, "shap_defensive_collapse": 0.08883400082366245, "shap_explosiveness": 0.109433831144835, "shap_fatigue": 0.14020765907439514}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.13567394471608882, "propensity_score": 0.14741665491809255, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 793.825, "away_cum_fatigue": 825.825, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13610014056035602, "shap_defensive_collapse": 0.11632977628201116, "shap_explosiveness": 0.10759125985303619, "shap_fatigue": 0.13599002842935942}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.13904909338297478, "propensity_score": 0.12211624587238083, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 793.825, "away_cum_fatigue": 817.1, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10497164039723593, "shap_defensive_collapse": 0.08111474862374968, "shap_explosiveness": 0.10577758102458999, "shap_fatigue": 0.12973355073673215}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.1521406005971534, "propensity_score": 0.1353545021420797, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 793.825, "away_cum_fatigue": 817.1, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10274955405504348, "shap_defensive_collapse": 0.11840680711328497, "shap_explosiveness": 0.10837842089257793, "shap_fatigue": 0.12170346698296432}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.1603266254619779, "propensity_score": 0.11382467248047648, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 793.825, "away_cum_fatigue": 792.825, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12307816291372121, "shap_defensive_collapse": 0.09313564651022262, "shap_explosiveness": 0.10435873373983955, "shap_fatigue": 0.112738153999395}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.12652638629546648, "propensity_score": 0.11006929684802794, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 793.825, "away_cum_fatigue": 681.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1387880445674873, "shap_defensive_collapse": 0.11831343756679558, "shap_explosiveness": 0.1228219535913644, "shap_fatigue": 0.14881562237142554}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.1565282563426732, "propensity_score": 0.11825513984666913, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 808.825, "away_cum_fatigue": 696.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11032324034507193, "shap_defensive_collapse": 0.0854487207645039, "shap_explosiveness": 0.11570838435189766, "shap_fatigue": 0.13067272310716177}, {"period": 2, "home_score": 40, "away_score": 45, "score_margin": -5, "cate_score": 0.12027190575855234, "propensity_score": 0.11219599853720803, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 810.825, "away_cum_fatigue": 698.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10469836533298174, "shap_defensive_collapse": 0.08166336050513219, "shap_explosiveness": 0.10681569940404428, "shap_fatigue": 0.13144098172080115}, {"period": 2, "home_score": 40, "away_score": 48, "score_margin": -8, "cate_score": 0.15253306616686005, "propensity_score": 0.12013235542298657, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 818.825, "away_cum_fatigue": 706.86, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.1134352690336079, "shap_defensive_collapse": 0.09361741228675531, "shap_explosiveness": 0.11841775505934976, "shap_fatigue": 0.1140761110180486}, {"period": 2, "home_score": 40, "away_score": 48, "score_margin": -8, "cate_score": 0.14265242811852302, "propensity_score": 0.1297292992757225, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 838.825, "away_cum_fatigue": 726.86, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12838353095052632, "shap_defensive_collapse": 0.11720951316374886, "shap_explosiveness": 0.109896774723607, "shap_fatigue": 0.1385441842652886}, {"period": 2, "home_score": 40, "away_score": 48, "score_margin": -8, "cate_score": 0.13003226112566277, "propensity_score": 0.12081937225604718, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 834.2, "away_cum_fatigue": 726.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1029360016094135, "shap_defensive_collapse": 0.09281672590533788, "shap_explosiveness": 0.0968523784160596, "shap_fatigue": 0.1365730744553604}, {"period": 2, "home_score": 40, "away_score": 48, "score_margin": -8, "cate_score": 0.15155644886960914, "propensity_score": 0.1296813427852871, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 834.2, "away_cum_fatigue": 726.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11149072495767352, "shap_defensive_collapse": 0.10016047206435089, "shap_explosiveness": 0.10822889563548509, "shap_fatigue": 0.12783370557842452}, {"period": 2, "home_score": 40, "away_score": 48, "score_margin": -8, "cate_score": 0.12088956292435193, "propensity_score": 0.12238075609619559, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 836.2, "away_cum_fatigue": 728.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1352236641360568, "shap_defensive_collapse": 0.11534765289152624, "shap_explosiveness": 0.10549014450033771, "shap_fatigue": 0.11087307817966198}, {"period": 2, "home_score": 40, "away_score": 51, "score_margin": -11, "cate_score": 0.161927533292863, "propensity_score": 0.88, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 849.2, "away_cum_fatigue": 741.86, "play_description": "Propensity Alarm: High propensity detected on run", "shap_stale_lineup": 0.11795226590281804, "shap_defensive_collapse": 0.08529887385246501, "shap_explosiveness": 0.09999477925581203, "shap_fatigue": 0.11136973093320511}, {"period": 2, "home_score": 43, "away_score": 51, "score_margin": -8, "cate_score": 0.14627730070750222, "propensity_score": 0.12116549354933877, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 876.2, "away_cum_fatigue": 768.86, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.13784347110410566, "shap_defensive_collapse": 0.11674597031415271, "shap_explosiveness": 0.11525607476220523, "shap_fatigue": 0.11638933058707936}, {"period": 2, "home_score": 43, "away_score": 53, "score_margin": -10, "cate_score": 0.1385468953234908, "propensity_score": 0.13455066878371091, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 891.2, "away_cum_fatigue": 783.86, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.13380105479487403, "shap_defensive_collapse": 0.08854320513636157, "shap_explosiveness": 0.10309975446836533, "shap_fatigue": 0.1371361219617652}, {"period": 2, "home_score": 43, "away_score": 53, "score_margin": -10, "cate_score": 0.14128747629377572, "propensity_score": 0.11476209297575933, "timeout_team": "INDIANA", "target_stop_run_90s": 0, "timeout_strategic_weight": 1, "home_cum_fatigue": 1208.2, "away_cum_fatigue": 800.86, "play_description": "TIMEOUT: Strategic timeout called by coach to stop run", "shap_stale_lineup": 0.1078713927963641, "shap_defensive_collapse": 0.11379334860143474, "shap_explosiveness": 0.0985503217556646, "shap_fatigue": 0.11542256485084405}, {"period": 2, "home_score": 43, "away_score": 53, "score_margin": -10, "cate_score": 0.1332547674687681, "propensity_score": 0.14750748527602353, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 908.2, "away_cum_fatigue": 757.5, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12302492085319672, "shap_defensive_collapse": 0.08261303352996732, "shap_explosiveness": 0.1133057396392668, "shap_fatigue": 0.11002360229011501}, {"period": 2, "home_score": 43, "away_score": 53, "score_margin": -10, "cate_score": 0.14232038088745508, "propensity_score": 0.13799064149211063, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 908.2, "away_cum_fatigue": 675.2, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10153327797571453, "shap_defensive_collapse": 0.08347040376939703, "shap_explosiveness": 0.10940113683094951, "shap_fatigue": 0.14962857231276183}, {"period": 2, "home_score": 43, "away_score": 53, "score_margin": -10, "cate_score": 0.1691326618029179, "propensity_score": 0.1220567756578929, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 917.2, "away_cum_fatigue": 684.2, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.13518407560647924, "shap_defensive_collapse": 0.09800231305341688, "shap_explosiveness": 0.11577774358327464, "shap_fatigue": 0.1389155765492551}, {"period": 2, "home_score": 43, "away_score": 53, "score_margin": -10, "cate_score": 0.15760270950466804, "propensity_score": 0.12393517004105159, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 919.2, "away_cum_fatigue": 686.2, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11970827303363091, "shap_defensive_collapse": 0.09368648045536973, "shap_explosiveness": 0.09279539112038677, "shap_fatigue": 0.11408732706176064}, {"period": 2, "home_score": 43, "away_score": 53, "score_margin": -10, "cate_score": 0.14604630970733165, "propensity_score": 0.14372041051800516, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 928.2, "away_cum_fatigue": 695.2, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13887871185121858, "shap_defensive_collapse": 0.08338488668724822, "shap_explosiveness": 0.09130353190836735, "shap_fatigue": 0.11625308695758663}, {"period": 2, "home_score": 43, "away_score": 53, "score_margin": -10, "cate_score": 0.14311912828102433, "propensity_score": 0.14190157939233775, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 933.2, "away_cum_fatigue": 700.2, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11577614376439499, "shap_defensive_collapse": 0.11509516607942064, "shap_explosiveness": 0.11470813255388841, "shap_fatigue": 0.12167216369589913}, {"period": 2, "home_score": 43, "away_score": 53, "score_margin": -10, "cate_score": 0.12337283513081143, "propensity_score": 0.13338504736674509, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 950.2, "away_cum_fatigue": 717.2, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11671814905695492, "shap_defensive_collapse": 0.09590508877926893, "shap_explosiveness": 0.12463353608762703, "shap_fatigue": 0.1439961428810433}, {"period": 2, "home_score": 43, "away_score": 53, "score_margin": -10, "cate_score": 0.15114198910149568, "propensity_score": 0.10546863466414698, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 954.2, "away_cum_fatigue": 721.2, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1051753681322263, "shap_defensive_collapse": 0.08310654396509955, "shap_explosiveness": 0.10224220064421706, "shap_fatigue": 0.12166014006385659}, {"period": 2, "home_score": 46, "away_score": 53, "score_margin": -7, "cate_score": 0.15598097228726177, "propensity_score": 0.14977794698701233, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 958.2, "away_cum_fatigue": 725.2, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.12594125995622354, "shap_defensive_collapse": 0.08376108046658098, "shap_explosiveness": 0.10216245591143112, "shap_fatigue": 0.11576705803246222}, {"period": 2, "home_score": 46, "away_score": 53, "score_margin": -7, "cate_score": 0.14253679730888774, "propensity_score": 0.14410997999652014, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 978.2, "away_cum_fatigue": 745.2, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.12570443773876813, "shap_defensive_collapse": 0.09279689000182569, "shap_explosiveness": 0.1264407111460039, "shap_fatigue": 0.1220910518481694}, {"period": 2, "home_score": 46, "away_score": 53, "score_margin": -7, "cate_score": 0.15423886890586813, "propensity_score": 0.11820459491841769, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 980.2, "away_cum_fatigue": 747.2, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10975320841116701, "shap_defensive_collapse": 0.11772358619810214, "shap_explosiveness": 0.11275936603119258, "shap_fatigue": 0.1260258081322817}, {"period": 2, "home_score": 49, "away_score": 53, "score_margin": -4, "cate_score": 0.1566285715605185, "propensity_score": 0.11653702665558208, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1000.2, "away_cum_fatigue": 767.2, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.13299214502799964, "shap_defensive_collapse": 0.09520705224472362, "shap_explosiveness": 0.12169327452150175, "shap_fatigue": 0.1309348708360881}, {"period": 2, "home_score": 49, "away_score": 53, "score_margin": -4, "cate_score": 0.1274902393870196, "propensity_score": 0.13999843386788977, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1001.2, "away_cum_fatigue": 768.2, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1097289562460502, "shap_defensive_collapse": 0.09789766442697334, "shap_explosiveness": 0.1233900817663923, "shap_fatigue": 0.1475814688831044}, {"period": 2, "home_score": 49, "away_score": 53, "score_margin": -4, "cate_score": 0.1504497754937675, "propensity_score": 0.10290171964398458, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1001.2, "away_cum_fatigue": 850.5, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10997244471508241, "shap_defensive_collapse": 0.10835673147017522, "shap_explosiveness": 0.10004378422979535, "shap_fatigue": 0.1439477012917864}, {"period": 2, "home_score": 49, "away_score": 53, "score_margin": -4, "cate_score": 0.1631326941942483, "propensity_score": 0.14883888092084685, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1001.2, "away_cum_fatigue": 728.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1299279714939086, "shap_defensive_collapse": 0.10011611300073243, "shap_explosiveness": 0.10039044482823564, "shap_fatigue": 0.11541500260342523}, {"period": 2, "home_score": 49, "away_score": 53, "score_margin": -4, "cate_score": 0.12058103198831881, "propensity_score": 0.13622766528856542, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1007.2, "away_cum_fatigue": 734.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10509782893956199, "shap_defensive_collapse": 0.10665538918456542, "shap_explosiveness": 0.11911287242478909, "shap_fatigue": 0.11022315889575046}, {"period": 2, "home_score": 49, "away_score": 53, "score_margin": -4, "cate_score": 0.15999573176953164, "propensity_score": 0.10116653341313112, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1010.2, "away_cum_fatigue": 737.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10893309231860895, "shap_defensive_collapse": 0.0921672743704594, "shap_explosiveness": 0.09336424125852028, "shap_fatigue": 0.11486327022768546}, {"period": 2, "home_score": 49, "away_score": 53, "score_margin": -4, "cate_score": 0.16767451738031083, "propensity_score": 0.12986394354765463, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1021.2, "away_cum_fatigue": 748.0, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11227158858732486, "shap_defensive_collapse": 0.08591246307059275, "shap_explosiveness": 0.1209718113242654, "shap_fatigue": 0.12957070186422903}, {"period": 2, "home_score": 49, "away_score": 53, "score_margin": -4, "cate_score": 0.1252590115961214, "propensity_score": 0.10835485615648918, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1022.2, "away_cum_fatigue": 749.0, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1000477954490203, "shap_defensive_collapse": 0.09114639988043323, "shap_explosiveness": 0.11091851369647643, "shap_fatigue": 0.12971940714194252}, {"period": 2, "home_score": 49, "away_score": 56, "score_margin": -7, "cate_score": 0.14238243228574018, "propensity_score": 0.148069508086646, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1028.2, "away_cum_fatigue": 755.0, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.10037450289863253, "shap_defensive_collapse": 0.11689421917133966, "shap_explosiveness": 0.11311434545455258, "shap_fatigue": 0.13992422890309256}, {"period": 2, "home_score": 49, "away_score": 56, "score_margin": -7, "cate_score": 0.1418886791776573, "propensity_score": 0.14377888673396336, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1038.2, "away_cum_fatigue": 765.0, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.1135461539845566, "shap_defensive_collapse": 0.11650086653805215, "shap_explosiveness": 0.12350989773744823, "shap_fatigue": 0.1339271202894351}, {"period": 2, "home_score": 49, "away_score": 56, "score_margin": -7, "cate_score": 0.1510347995174143, "propensity_score": 0.13347690342354762, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1047.2, "away_cum_fatigue": 774.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10948974069088316, "shap_defensive_collapse": 0.10436909601414585, "shap_explosiveness": 0.09747680856618741, "shap_fatigue": 0.12978326857567865}, {"period": 2, "home_score": 49, "away_score": 56, "score_margin": -7, "cate_score": 0.13845860297829274, "propensity_score": 0.10742897444233071, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1050.2, "away_cum_fatigue": 777.0, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11774139065178564, "shap_defensive_collapse": 0.10885134509967764, "shap_explosiveness": 0.09065920734469977, "shap_fatigue": 0.13366655653694606}, {"period": 2, "home_score": 49, "away_score": 58, "score_margin": -9, "cate_score": 0.1397663091019064, "propensity_score": 0.1116565413216643, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1057.2, "away_cum_fatigue": 784.0, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.11689256978274636, "shap_defensive_collapse": 0.08610231067371814, "shap_explosiveness": 0.09815229697054485, "shap_fatigue": 0.11606835656167097}, {"period": 2, "home_score": 49, "away_score": 58, "score_margin": -9, "cate_score": 0.13542856794215447, "propensity_score": 0.10209511787952782, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1076.2, "away_cum_fatigue": 803.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11495708618432485, "shap_defensive_collapse": 0.11809612451034913, "shap_explosiveness": 0.10754878040652893, "shap_fatigue": 0.13285630332543988}, {"period": 2, "home_score": 49, "away_score": 58, "score_margin": -9, "cate_score": 0.14960411239721827, "propensity_score": 0.1432667447322465, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1080.5, "away_cum_fatigue": 807.3, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10558377707112426, "shap_defensive_collapse": 0.11025610955086307, "shap_explosiveness": 0.11420585351433057, "shap_fatigue": 0.1308406040016759}, {"period": 2, "home_score": 49, "away_score": 61, "score_margin": -12, "cate_score": 0.12923973299907723, "propensity_score": 0.11995078616973508, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1090.5, "away_cum_fatigue": 817.3, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.12384552419845406, "shap_defensive_collapse": 0.08576060034972616, "shap_explosiveness": 0.11967268417199906, "shap_fatigue": 0.12122728465802826}, {"period": 2, "home_score": 52, "away_score": 61, "score_margin": -9, "cate_score": 0.16837224111006813, "propensity_score": 0.13105315567979947, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1102.0, "away_cum_fatigue": 828.8, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.12799250320227304, "shap_defensive_collapse": 0.10946992497724534, "shap_explosiveness": 0.1181459315356443, "shap_fatigue": 0.13517713217807487}, {"period": 2, "home_score": 52, "away_score": 64, "score_margin": -12, "cate_score": 0.16397518471849093, "propensity_score": 0.12761957559787251, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1108.6, "away_cum_fatigue": 835.4, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.10353964508731232, "shap_defensive_collapse": 0.09177501410119857, "shap_explosiveness": 0.12350598295176188, "shap_fatigue": 0.11300733061117191}, {"period": 2, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.12597599784973862, "propensity_score": 0.10681378813957298, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1116.0, "away_cum_fatigue": 842.8, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.13352519297597448, "shap_defensive_collapse": 0.11624766503066188, "shap_explosiveness": 0.10540487691482155, "shap_fatigue": 0.14422298713738355}, {"period": 2, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.154504376875455, "propensity_score": 0.10235756150525126, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1131.2, "away_cum_fatigue": 858.0, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.10365612687381684, "shap_defensive_collapse": 0.11919084380459105, "shap_explosiveness": 0.12469756479426922, "shap_fatigue": 0.11345010533205936}, {"period": 2, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.16520019131943497, "propensity_score": 0.13110572900319775, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1131.2, "away_cum_fatigue": 801.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10657527865347965, "shap_defensive_collapse": 0.0958847765003845, "shap_explosiveness": 0.09836759576743723, "shap_fatigue": 0.11898541545453553}, {"period": 2, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.1502064518531532, "propensity_score": 0.13936470149310956, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1131.2, "away_cum_fatigue": 728.6, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10183108249496213, "shap_defensive_collapse": 0.10836686878250726, "shap_explosiveness": 0.10323459978349428, "shap_fatigue": 0.13301219471495873}, {"period": 2, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.14457038816798895, "propensity_score": 0.10995464204114962, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1135.825, "away_cum_fatigue": 728.6, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11004479103553753, "shap_defensive_collapse": 0.09785261160965335, "shap_explosiveness": 0.12473566011992168, "shap_fatigue": 0.13689278904769892}, {"period": 2, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.15965761330338574, "propensity_score": 0.1159627749127713, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 992.06, "away_cum_fatigue": 728.6, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10964411017345026, "shap_defensive_collapse": 0.11134913032869825, "shap_explosiveness": 0.12604771508242119, "shap_fatigue": 0.14161402934459216}, {"period": 2, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.1288512411045389, "propensity_score": 0.13888531878416252, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 998.96, "away_cum_fatigue": 735.5, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12139500350830024, "shap_defensive_collapse": 0.11528068880560459, "shap_explosiveness": 0.10832103644304328, "shap_fatigue": 0.13342504177738232}, {"period": 2, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.13710147872282297, "propensity_score": 0.1305816579602469, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 999.96, "away_cum_fatigue": 736.5, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1331125231621776, "shap_defensive_collapse": 0.10361351110457356, "shap_explosiveness": 0.10033027846569113, "shap_fatigue": 0.1369920933883263}, {"period": 2, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.13277657344866753, "propensity_score": 0.12207622057469118, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1000.06, "away_cum_fatigue": 736.6, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10934883156436459, "shap_defensive_collapse": 0.080331730959251, "shap_explosiveness": 0.10775328788194738, "shap_fatigue": 0.12014514418962038}, {"period": 3, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.13163392478092759, "propensity_score": 0.14515584398020687, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1137.6, "away_cum_fatigue": 1036.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11700973719282287, "shap_defensive_collapse": 0.11213343381163857, "shap_explosiveness": 0.11584330538219909, "shap_fatigue": 0.11679666017332277}, {"period": 3, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.15805584606237622, "propensity_score": 0.13984341815533244, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1137.6, "away_cum_fatigue": 1036.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1216379757083769, "shap_defensive_collapse": 0.08845096021726918, "shap_explosiveness": 0.10502188304478945, "shap_fatigue": 0.1159093775291283}, {"period": 3, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.16717251919423776, "propensity_score": 0.11790909496662809, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1137.6, "away_cum_fatigue": 1036.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11841045945305942, "shap_defensive_collapse": 0.10346701630003437, "shap_explosiveness": 0.12664015376122814, "shap_fatigue": 0.12921342063616675}, {"period": 3, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.14389101279908603, "propensity_score": 0.11406657712792978, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1137.6, "away_cum_fatigue": 1036.86, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.13234471704216835, "shap_defensive_collapse": 0.0846214929093364, "shap_explosiveness": 0.11134269292295831, "shap_fatigue": 0.13342002724934662}, {"period": 3, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.12154218327312556, "propensity_score": 0.126594051146894, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1137.6, "away_cum_fatigue": 1036.86, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10006758375079633, "shap_defensive_collapse": 0.0892503234187568, "shap_explosiveness": 0.10394888243108173, "shap_fatigue": 0.14689502570186713}, {"period": 3, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.14960597520298125, "propensity_score": 0.12174823868051543, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1137.6, "away_cum_fatigue": 1036.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10929064833420202, "shap_defensive_collapse": 0.11587185508053366, "shap_explosiveness": 0.10893308709259707, "shap_fatigue": 0.12847664969537453}, {"period": 3, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.13683866012841556, "propensity_score": 0.12726763322908768, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1137.6, "away_cum_fatigue": 1036.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11207946052181479, "shap_defensive_collapse": 0.10669058027597973, "shap_explosiveness": 0.09863521952503934, "shap_fatigue": 0.13632459199454156}, {"period": 3, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.14520705720017693, "propensity_score": 0.10769359007528041, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1137.6, "away_cum_fatigue": 1036.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.13265988176402174, "shap_defensive_collapse": 0.10296714416824852, "shap_explosiveness": 0.10433821122268268, "shap_fatigue": 0.1387301142063298}, {"period": 3, "home_score": 54, "away_score": 64, "score_margin": -10, "cate_score": 0.12118730036336883, "propensity_score": 0.10223165504692036, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1137.6, "away_cum_fatigue": 1036.86, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10614916849480996, "shap_defensive_collapse": 0.10452655991410816, "shap_explosiveness": 0.12548850364668454, "shap_fatigue": 0.12760529167184206}, {"period": 3, "home_score": 54, "away_score": 66, "score_margin": -12, "cate_score": 0.13558181857022983, "propensity_score": 0.14444849295725937, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1152.6, "away_cum_fatigue": 1051.86, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.11932404873724428, "shap_defensive_collapse": 0.11580492236856973, "shap_explosiveness": 0.11053357718042611, "shap_fatigue": 0.12057865587572894}, {"period": 3, "home_score": 54, "away_score": 66, "score_margin": -12, "cate_score": 0.16287782468072007, "propensity_score": 0.14785744970550044, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1152.6, "away_cum_fatigue": 1051.86, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.13094239249850048, "shap_defensive_collapse": 0.11916139141872023, "shap_explosiveness": 0.09488073271687383, "shap_fatigue": 0.13669667348883183}, {"period": 3, "home_score": 54, "away_score": 66, "score_margin": -12, "cate_score": 0.14029783981052113, "propensity_score": 0.11546796239733433, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1152.6, "away_cum_fatigue": 1051.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.12063134686337398, "shap_defensive_collapse": 0.10374882712235009, "shap_explosiveness": 0.12666117192172976, "shap_fatigue": 0.13894043019218785}, {"period": 3, "home_score": 54, "away_score": 66, "score_margin": -12, "cate_score": 0.1487944513089576, "propensity_score": 0.10673380737529112, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1154.6, "away_cum_fatigue": 1053.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12583505220857902, "shap_defensive_collapse": 0.08085929924093946, "shap_explosiveness": 0.09905833406846154, "shap_fatigue": 0.11743615699196154}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.15455785310293219, "propensity_score": 0.110947413423062, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1164.6, "away_cum_fatigue": 1063.86, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.12923917911683935, "shap_defensive_collapse": 0.0977644353679898, "shap_explosiveness": 0.10934943191454416, "shap_fatigue": 0.12387690081114201}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.16319253702194875, "propensity_score": 0.14083734754221966, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1184.6, "away_cum_fatigue": 1083.86, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.11517155721837824, "shap_defensive_collapse": 0.1137141116315071, "shap_explosiveness": 0.1172248399846766, "shap_fatigue": 0.14913606755043746}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.16167567222759577, "propensity_score": 0.13730485438934498, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1184.6, "away_cum_fatigue": 1083.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10397133299285014, "shap_defensive_collapse": 0.09855665520690021, "shap_explosiveness": 0.09268426527889048, "shap_fatigue": 0.12402395306427083}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.15840115790701814, "propensity_score": 0.102821011157728, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1200.6, "away_cum_fatigue": 1099.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1289989185215577, "shap_defensive_collapse": 0.0932301586360688, "shap_explosiveness": 0.09135192854442756, "shap_fatigue": 0.11203581804674344}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.13433351477976688, "propensity_score": 0.12401694004648744, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1202.6, "away_cum_fatigue": 1101.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1046406191609297, "shap_defensive_collapse": 0.10518410480432808, "shap_explosiveness": 0.11179010777625849, "shap_fatigue": 0.13430201619807824}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.13529122154574214, "propensity_score": 0.10285438983620003, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1207.6, "away_cum_fatigue": 1106.86, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.1114995101830721, "shap_defensive_collapse": 0.08208207844686442, "shap_explosiveness": 0.12486964208569909, "shap_fatigue": 0.12930631962638883}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.16129519805861797, "propensity_score": 0.10170652528439038, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1207.6, "away_cum_fatigue": 1106.86, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.12706923519806654, "shap_defensive_collapse": 0.08905973608085842, "shap_explosiveness": 0.10668585023446557, "shap_fatigue": 0.11018082503374933}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.14853710582071825, "propensity_score": 0.14128569543052485, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1220.6, "away_cum_fatigue": 1119.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1329790536627175, "shap_defensive_collapse": 0.0914041454349136, "shap_explosiveness": 0.09675200752162716, "shap_fatigue": 0.1245022792980765}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.13240651605950143, "propensity_score": 0.10552505555634016, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1220.6, "away_cum_fatigue": 1119.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11251143517456237, "shap_defensive_collapse": 0.0876459106672291, "shap_explosiveness": 0.11362371896984105, "shap_fatigue": 0.1236931077467395}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.12062731158369494, "propensity_score": 0.10223506764922172, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1222.6, "away_cum_fatigue": 1121.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.13269311800722877, "shap_defensive_collapse": 0.09444207162574025, "shap_explosiveness": 0.12786340945800545, "shap_fatigue": 0.12353049020315081}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.13664456298834493, "propensity_score": 0.12014318601808852, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1226.6, "away_cum_fatigue": 1125.86, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10279045910165133, "shap_defensive_collapse": 0.1041315440956572, "shap_explosiveness": 0.09059897398864789, "shap_fatigue": 0.1390008822129332}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.13964434087052702, "propensity_score": 0.1417670025122148, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1226.6, "away_cum_fatigue": 1125.86, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11245655501190513, "shap_defensive_collapse": 0.10896662256320215, "shap_explosiveness": 0.1146321467943856, "shap_fatigue": 0.11089525210626258}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.160065058105617, "propensity_score": 0.1435504763020227, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1228.6, "away_cum_fatigue": 1127.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12687267287609952, "shap_defensive_collapse": 0.09930257777736162, "shap_explosiveness": 0.0985891489954446, "shap_fatigue": 0.14827475628851144}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.16477808837093885, "propensity_score": 0.10818846291928733, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1232.6, "away_cum_fatigue": 1131.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13357032891869486, "shap_defensive_collapse": 0.09109388924711755, "shap_explosiveness": 0.11941204774646295, "shap_fatigue": 0.12528728680779155}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.15776130482418022, "propensity_score": 0.126014602862915, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1233.6, "away_cum_fatigue": 1132.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11913440076551166, "shap_defensive_collapse": 0.0820893926050642, "shap_explosiveness": 0.11626584447515659, "shap_fatigue": 0.12036779755801993}, {"period": 3, "home_score": 56, "away_score": 66, "score_margin": -10, "cate_score": 0.15345159649023604, "propensity_score": 0.13290186066579657, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1234.6, "away_cum_fatigue": 1133.86, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11622143594147251, "shap_defensive_collapse": 0.0847549052135323, "shap_explosiveness": 0.12460146176852266, "shap_fatigue": 0.12766589472093925}, {"period": 3, "home_score": 57, "away_score": 66, "score_margin": -9, "cate_score": 0.16126348154736794, "propensity_score": 0.1103770695691218, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1234.6, "away_cum_fatigue": 1133.86, "play_description": "IND: Draws a shooting foul, converts the free throw.", "shap_stale_lineup": 0.1326711728045845, "shap_defensive_collapse": 0.10643467748015292, "shap_explosiveness": 0.12123808381666486, "shap_fatigue": 0.1147462580481955}, {"period": 3, "home_score": 57, "away_score": 68, "score_margin": -11, "cate_score": 0.12313204347092147, "propensity_score": 0.1079688687566058, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1256.6, "away_cum_fatigue": 1155.86, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.10319005163993457, "shap_defensive_collapse": 0.111146742816592, "shap_explosiveness": 0.12154618934439287, "shap_fatigue": 0.12592497988400864}, {"period": 3, "home_score": 60, "away_score": 68, "score_margin": -8, "cate_score": 0.15903106500218545, "propensity_score": 0.1391613428748402, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1270.6, "away_cum_fatigue": 1169.86, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.13398412000233723, "shap_defensive_collapse": 0.08007986397892537, "shap_explosiveness": 0.12827635428240602, "shap_fatigue": 0.13680899367107874}, {"period": 3, "home_score": 60, "away_score": 68, "score_margin": -8, "cate_score": 0.1233569164718643, "propensity_score": 0.11087040446902552, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1280.6, "away_cum_fatigue": 1179.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1246779044966904, "shap_defensive_collapse": 0.10252011560130558, "shap_explosiveness": 0.09693973373293137, "shap_fatigue": 0.13769053931010505}, {"period": 3, "home_score": 60, "away_score": 68, "score_margin": -8, "cate_score": 0.12661267971497325, "propensity_score": 0.11308046717666015, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1283.6, "away_cum_fatigue": 1182.86, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.13365229715660226, "shap_defensive_collapse": 0.09760157841764942, "shap_explosiveness": 0.12399342964930259, "shap_fatigue": 0.12296175293702635}, {"period": 3, "home_score": 63, "away_score": 68, "score_margin": -5, "cate_score": 0.1563551267052984, "propensity_score": 0.10380026508062654, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1290.6, "away_cum_fatigue": 1189.86, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.1278316125987933, "shap_defensive_collapse": 0.11960849508809887, "shap_explosiveness": 0.11672776701531815, "shap_fatigue": 0.11455359357278017}, {"period": 3, "home_score": 63, "away_score": 68, "score_margin": -5, "cate_score": 0.1325548058100643, "propensity_score": 0.13429682632478304, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1292.6, "away_cum_fatigue": 1191.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10142598275735087, "shap_defensive_collapse": 0.08964825022577669, "shap_explosiveness": 0.10041471572202894, "shap_fatigue": 0.13994311370042936}, {"period": 3, "home_score": 63, "away_score": 68, "score_margin": -5, "cate_score": 0.14737562466031345, "propensity_score": 0.12176535076883781, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1305.6, "away_cum_fatigue": 1204.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.12675598874484356, "shap_defensive_collapse": 0.09400666365203521, "shap_explosiveness": 0.12262393224016067, "shap_fatigue": 0.1497840718920664}, {"period": 3, "home_score": 63, "away_score": 68, "score_margin": -5, "cate_score": 0.12067139975695558, "propensity_score": 0.12330289202563151, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1308.6, "away_cum_fatigue": 1207.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11616551927712876, "shap_defensive_collapse": 0.11873035146974467, "shap_explosiveness": 0.10502977906320457, "shap_fatigue": 0.11103732103216227}, {"period": 3, "home_score": 66, "away_score": 68, "score_margin": -2, "cate_score": 0.1235963710463334, "propensity_score": 0.1154034408529051, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1321.6, "away_cum_fatigue": 1220.86, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.11468823614315948, "shap_defensive_collapse": 0.1057251389884817, "shap_explosiveness": 0.09606381408972818, "shap_fatigue": 0.1460002886484917}, {"period": 3, "home_score": 66, "away_score": 68, "score_margin": -2, "cate_score": 0.12686875060245723, "propensity_score": 0.14337908906831232, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1332.6, "away_cum_fatigue": 1231.86, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.1016481098038429, "shap_defensive_collapse": 0.11199344361695864, "shap_explosiveness": 0.10532104651542387, "shap_fatigue": 0.1492142975391006}, {"period": 3, "home_score": 66, "away_score": 68, "score_margin": -2, "cate_score": 0.13707060154096307, "propensity_score": 0.10619064526759872, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1332.6, "away_cum_fatigue": 1231.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1169856478276313, "shap_defensive_collapse": 0.109571753529075, "shap_explosiveness": 0.10467772912419444, "shap_fatigue": 0.11508626904751629}, {"period": 3, "home_score": 66, "away_score": 68, "score_margin": -2, "cate_score": 0.14883277884281065, "propensity_score": 0.1399330124459426, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1339.6, "away_cum_fatigue": 1238.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11041605694578792, "shap_defensive_collapse": 0.09153178306120485, "shap_explosiveness": 0.12839440054338655, "shap_fatigue": 0.13871393691169281}, {"period": 3, "home_score": 66, "away_score": 68, "score_margin": -2, "cate_score": 0.1303854248928111, "propensity_score": 0.14308504503040248, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1342.6, "away_cum_fatigue": 1241.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10409875898943549, "shap_defensive_collapse": 0.10339315619840686, "shap_explosiveness": 0.10432182271685497, "shap_fatigue": 0.13711815841986674}, {"period": 3, "home_score": 66, "away_score": 68, "score_margin": -2, "cate_score": 0.1661744555885557, "propensity_score": 0.14661185001789245, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1354.6, "away_cum_fatigue": 1253.86, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.13584152646081446, "shap_defensive_collapse": 0.10538195236539077, "shap_explosiveness": 0.10654454672883937, "shap_fatigue": 0.13825630216615659}, {"period": 3, "home_score": 66, "away_score": 68, "score_margin": -2, "cate_score": 0.13288718928586082, "propensity_score": 0.12618034699781575, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1355.6, "away_cum_fatigue": 1254.86, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11261126179666303, "shap_defensive_collapse": 0.09196056011661208, "shap_explosiveness": 0.09111179681087532, "shap_fatigue": 0.12520545873019584}, {"period": 3, "home_score": 66, "away_score": 68, "score_margin": -2, "cate_score": 0.15471638707386562, "propensity_score": 0.10993561570127834, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1361.6, "away_cum_fatigue": 1260.86, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.11702929652772401, "shap_defensive_collapse": 0.09087732338387763, "shap_explosiveness": 0.12130996571197225, "shap_fatigue": 0.13465758968137048}, {"period": 3, "home_score": 66, "away_score": 68, "score_margin": -2, "cate_score": 0.15799215978406675, "propensity_score": 0.14413794326174656, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1361.6, "away_cum_fatigue": 1260.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10565845872657265, "shap_defensive_collapse": 0.11010938437737482, "shap_explosiveness": 0.12591992628831858, "shap_fatigue": 0.13221823737078162}, {"period": 3, "home_score": 66, "away_score": 68, "score_margin": -2, "cate_score": 0.16988244977904174, "propensity_score": 0.1307468490162425, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1361.6, "away_cum_fatigue": 1260.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1287142621828949, "shap_defensive_collapse": 0.10222058375566766, "shap_explosiveness": 0.09005006303241346, "shap_fatigue": 0.1231747362532469}, {"period": 3, "home_score": 67, "away_score": 68, "score_margin": -1, "cate_score": 0.15937574227840626, "propensity_score": 0.10737482153366357, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1361.6, "away_cum_fatigue": 1260.86, "play_description": "IND: Draws a shooting foul, converts the free throw.", "shap_stale_lineup": 0.11514146688668558, "shap_defensive_collapse": 0.08337313922766275, "shap_explosiveness": 0.12952321675288378, "shap_fatigue": 0.13404279258043433}, {"period": 3, "home_score": 67, "away_score": 68, "score_margin": -1, "cate_score": 0.13809905053749116, "propensity_score": 0.11917292183674745, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1373.6, "away_cum_fatigue": 1272.86, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1350117300904412, "shap_defensive_collapse": 0.0955022585193873, "shap_explosiveness": 0.10437674254956912, "shap_fatigue": 0.14810930401269046}, {"period": 3, "home_score": 67, "away_score": 68, "score_margin": -1, "cate_score": 0.13669738828152656, "propensity_score": 0.12185463568827645, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1374.6, "away_cum_fatigue": 1273.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12070224688793793, "shap_defensive_collapse": 0.09078561458108414, "shap_explosiveness": 0.09635344149910545, "shap_fatigue": 0.13690947624080008}, {"period": 3, "home_score": 70, "away_score": 68, "score_margin": 2, "cate_score": 0.15716095309731282, "propensity_score": 0.1198565070695891, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1380.6, "away_cum_fatigue": 1279.86, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.13450301465773268, "shap_defensive_collapse": 0.08992177161078911, "shap_explosiveness": 0.12116017429611295, "shap_fatigue": 0.1444006564313375}, {"period": 3, "home_score": 70, "away_score": 68, "score_margin": 2, "cate_score": 0.13611145272453043, "propensity_score": 0.1437443950731157, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1391.6, "away_cum_fatigue": 1290.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10571890999499577, "shap_defensive_collapse": 0.11524029130593055, "shap_explosiveness": 0.09391886590338168, "shap_fatigue": 0.1378992226034397}, {"period": 3, "home_score": 70, "away_score": 68, "score_margin": 2, "cate_score": 0.1389984837823673, "propensity_score": 0.11629709518704955, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1394.6, "away_cum_fatigue": 1293.86, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10654093797803035, "shap_defensive_collapse": 0.08881844209665847, "shap_explosiveness": 0.12773662241028913, "shap_fatigue": 0.14412362912329274}, {"period": 3, "home_score": 70, "away_score": 68, "score_margin": 2, "cate_score": 0.15466736175761336, "propensity_score": 0.10336591432477425, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1398.6, "away_cum_fatigue": 1297.86, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.11204867076549138, "shap_defensive_collapse": 0.10488647520503629, "shap_explosiveness": 0.12154964277756512, "shap_fatigue": 0.11679891507426485}, {"period": 3, "home_score": 70, "away_score": 68, "score_margin": 2, "cate_score": 0.13984392325398554, "propensity_score": 0.1484035126719981, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1398.6, "away_cum_fatigue": 1297.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10645514229376198, "shap_defensive_collapse": 0.10568031774449711, "shap_explosiveness": 0.12501654170856422, "shap_fatigue": 0.1226544883625251}, {"period": 3, "home_score": 73, "away_score": 68, "score_margin": 5, "cate_score": 0.12596756824263064, "propensity_score": 0.10111469038505311, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1409.6, "away_cum_fatigue": 1308.86, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.13005343471171182, "shap_defensive_collapse": 0.10237271590690059, "shap_explosiveness": 0.12785879979958029, "shap_fatigue": 0.1291343518069623}, {"period": 3, "home_score": 73, "away_score": 70, "score_margin": 3, "cate_score": 0.14855135936534714, "propensity_score": 0.10273811381194277, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1433.6, "away_cum_fatigue": 1332.86, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.13017136252546296, "shap_defensive_collapse": 0.1109996226457131, "shap_explosiveness": 0.09752437947618146, "shap_fatigue": 0.14705817982341252}, {"period": 3, "home_score": 73, "away_score": 70, "score_margin": 3, "cate_score": 0.1291360133750772, "propensity_score": 0.1153935826661885, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1456.6, "away_cum_fatigue": 1355.86, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10888278622182566, "shap_defensive_collapse": 0.08890426439714487, "shap_explosiveness": 0.10617335829442237, "shap_fatigue": 0.14163437919738855}, {"period": 3, "home_score": 73, "away_score": 70, "score_margin": 3, "cate_score": 0.14343264913158782, "propensity_score": 0.13062727485248776, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1459.6, "away_cum_fatigue": 1358.86, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10352674586263996, "shap_defensive_collapse": 0.09328297409011653, "shap_explosiveness": 0.12769291078649914, "shap_fatigue": 0.11596847569010466}, {"period": 3, "home_score": 73, "away_score": 70, "score_margin": 3, "cate_score": 0.1669064074395835, "propensity_score": 0.14999732928933812, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1465.6, "away_cum_fatigue": 1364.86, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.1159841149968788, "shap_defensive_collapse": 0.09119193584498748, "shap_explosiveness": 0.09398526292086637, "shap_fatigue": 0.12622788047333142}, {"period": 3, "home_score": 73, "away_score": 71, "score_margin": 2, "cate_score": 0.14219968204008365, "propensity_score": 0.14442215899177763, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1465.6, "away_cum_fatigue": 1364.86, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.10893999726119355, "shap_defensive_collapse": 0.09891862196464134, "shap_explosiveness": 0.11606511320887417, "shap_fatigue": 0.1355256278009545}, {"period": 3, "home_score": 73, "away_score": 72, "score_margin": 1, "cate_score": 0.15161869382326332, "propensity_score": 0.11019264921733975, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1465.6, "away_cum_fatigue": 1364.86, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.10887177711860026, "shap_defensive_collapse": 0.1175987107994757, "shap_explosiveness": 0.10690869398284841, "shap_fatigue": 0.13141074357920915}, {"period": 3, "home_score": 73, "away_score": 72, "score_margin": 1, "cate_score": 0.1342909676289964, "propensity_score": 0.14750835529130626, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1474.6, "away_cum_fatigue": 1373.86, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.11552818829793941, "shap_defensive_collapse": 0.08675012139737309, "shap_explosiveness": 0.1208892931535547, "shap_fatigue": 0.12630557109027601}, {"period": 3, "home_score": 73, "away_score": 72, "score_margin": 1, "cate_score": 0.1504323483555645, "propensity_score": 0.1194587369570064, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1488.6, "away_cum_fatigue": 1387.86, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11767473147699459, "shap_defensive_collapse": 0.08277831307577485, "shap_explosiveness": 0.09064691710086613, "shap_fatigue": 0.14960618591982702}, {"period": 3, "home_score": 73, "away_score": 72, "score_margin": 1, "cate_score": 0.15426651180069914, "propensity_score": 0.12650702471319672, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1490.6, "away_cum_fatigue": 1389.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.133664034527217, "shap_defensive_collapse": 0.1188684389362039, "shap_explosiveness": 0.12856222520918967, "shap_fatigue": 0.1115590469720886}, {"period": 3, "home_score": 73, "away_score": 74, "score_margin": -1, "cate_score": 0.16102396032344996, "propensity_score": 0.128776212414763, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1507.6, "away_cum_fatigue": 1406.86, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.13691558941563525, "shap_defensive_collapse": 0.0814180694340152, "shap_explosiveness": 0.11217849103167304, "shap_fatigue": 0.12288197144119589}, {"period": 3, "home_score": 76, "away_score": 74, "score_margin": 2, "cate_score": 0.13562973060850542, "propensity_score": 0.1302700903633297, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1528.6, "away_cum_fatigue": 1427.86, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.11729662282254694, "shap_defensive_collapse": 0.10420238005605605, "shap_explosiveness": 0.12332790732106941, "shap_fatigue": 0.14984933863352676}, {"period": 3, "home_score": 76, "away_score": 74, "score_margin": 2, "cate_score": 0.13404337714392173, "propensity_score": 0.1479040972291876, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1543.6, "away_cum_fatigue": 1442.86, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12857165004734172, "shap_defensive_collapse": 0.08236532189562037, "shap_explosiveness": 0.11792134002158039, "shap_fatigue": 0.11713810910489046}, {"period": 3, "home_score": 76, "away_score": 74, "score_margin": 2, "cate_score": 0.13486914828876942, "propensity_score": 0.1434468921094987, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1546.6, "away_cum_fatigue": 1445.86, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1084292908536153, "shap_defensive_collapse": 0.09953868064148086, "shap_explosiveness": 0.11385809186297607, "shap_fatigue": 0.12695919557643404}, {"period": 3, "home_score": 76, "away_score": 76, "score_margin": 0, "cate_score": 0.14238279452769376, "propensity_score": 0.13381117461481867, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1553.6, "away_cum_fatigue": 1452.86, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.11874037801772383, "shap_defensive_collapse": 0.0873777877067676, "shap_explosiveness": 0.12151973553876946, "shap_fatigue": 0.11028490154770333}, {"period": 3, "home_score": 76, "away_score": 76, "score_margin": 0, "cate_score": 0.14947220038112422, "propensity_score": 0.14047411124637843, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1571.6, "away_cum_fatigue": 1470.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11505558398007135, "shap_defensive_collapse": 0.10549454079986534, "shap_explosiveness": 0.10228146673314349, "shap_fatigue": 0.12909262932893215}, {"period": 3, "home_score": 76, "away_score": 76, "score_margin": 0, "cate_score": 0.16424562289051542, "propensity_score": 0.1309765748491445, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1573.6, "away_cum_fatigue": 1472.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12259839682774387, "shap_defensive_collapse": 0.10955006700269664, "shap_explosiveness": 0.12314164047919292, "shap_fatigue": 0.14582686268221012}, {"period": 3, "home_score": 76, "away_score": 76, "score_margin": 0, "cate_score": 0.1699202165136339, "propensity_score": 0.1158254369628399, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1580.6, "away_cum_fatigue": 1479.86, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11576382050674924, "shap_defensive_collapse": 0.0823162773612774, "shap_explosiveness": 0.0975016110812624, "shap_fatigue": 0.11508928731934956}, {"period": 3, "home_score": 76, "away_score": 76, "score_margin": 0, "cate_score": 0.13869536284502226, "propensity_score": 0.10042818517458599, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1582.6, "away_cum_fatigue": 1481.86, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10969907981170457, "shap_defensive_collapse": 0.0813659507720639, "shap_explosiveness": 0.12665175809314003, "shap_fatigue": 0.12551967086692484}, {"period": 3, "home_score": 76, "away_score": 76, "score_margin": 0, "cate_score": 0.12503137441354067, "propensity_score": 0.12188745357056634, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1585.6, "away_cum_fatigue": 1484.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13189094433192747, "shap_defensive_collapse": 0.10578285010179497, "shap_explosiveness": 0.1001457596675558, "shap_fatigue": 0.14057461398806592}, {"period": 3, "home_score": 76, "away_score": 76, "score_margin": 0, "cate_score": 0.16108259179670328, "propensity_score": 0.14306515280079188, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1585.6, "away_cum_fatigue": 1484.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10332232610028037, "shap_defensive_collapse": 0.11538210194971679, "shap_explosiveness": 0.11636517359596557, "shap_fatigue": 0.11442326945798938}, {"period": 3, "home_score": 76, "away_score": 76, "score_margin": 0, "cate_score": 0.14610361953461387, "propensity_score": 0.10434800501942611, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1586.6, "away_cum_fatigue": 1485.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12010531349485168, "shap_defensive_collapse": 0.11411253130630675, "shap_explosiveness": 0.09895146494301545, "shap_fatigue": 0.11920914291684462}, {"period": 3, "home_score": 79, "away_score": 76, "score_margin": 3, "cate_score": 0.1566146216692872, "propensity_score": 0.10522473970985201, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1593.6, "away_cum_fatigue": 1492.86, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.13691261046941705, "shap_defensive_collapse": 0.11711102310224335, "shap_explosiveness": 0.1180809513925035, "shap_fatigue": 0.11246528074372204}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.15178342348360133, "propensity_score": 0.14134232427691515, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1608.6, "away_cum_fatigue": 1507.86, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.10724979652355615, "shap_defensive_collapse": 0.09582861861331957, "shap_explosiveness": 0.09616853710192269, "shap_fatigue": 0.14870698091206028}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.15250678364792603, "propensity_score": 0.10993237495423727, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1622.6, "away_cum_fatigue": 1521.86, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13456526550562606, "shap_defensive_collapse": 0.10424115976651688, "shap_explosiveness": 0.0935001818746274, "shap_fatigue": 0.14822435622130428}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.16469641259295578, "propensity_score": 0.10004842364027638, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1622.6, "away_cum_fatigue": 1521.86, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1277666993983329, "shap_defensive_collapse": 0.10869136091671149, "shap_explosiveness": 0.12088634755858704, "shap_fatigue": 0.13259186658887537}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.14661503403377024, "propensity_score": 0.11719201899693706, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1624.6, "away_cum_fatigue": 1523.86, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12937290733585416, "shap_defensive_collapse": 0.09036893218570485, "shap_explosiveness": 0.11844861543497577, "shap_fatigue": 0.1440481719001001}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.12976232683492248, "propensity_score": 0.12006876319607722, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1630.825, "away_cum_fatigue": 1523.86, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1051595653059314, "shap_defensive_collapse": 0.10265769605340398, "shap_explosiveness": 0.11633878201740645, "shap_fatigue": 0.12372299723476879}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.1261485449550037, "propensity_score": 0.13273882719572044, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1630.825, "away_cum_fatigue": 1482.575, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1026627869816227, "shap_defensive_collapse": 0.10714664639414012, "shap_explosiveness": 0.10851832832159103, "shap_fatigue": 0.11025044467383956}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.16873131545137932, "propensity_score": 0.12250842316992747, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1630.825, "away_cum_fatigue": 1489.6666666666667, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10990081992821618, "shap_defensive_collapse": 0.08141650030410201, "shap_explosiveness": 0.11088805480947998, "shap_fatigue": 0.13889622092358997}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.13149397370280672, "propensity_score": 0.14857301320653707, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1630.825, "away_cum_fatigue": 1565.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11418888950213744, "shap_defensive_collapse": 0.11124424319662687, "shap_explosiveness": 0.11231075090238844, "shap_fatigue": 0.14667997428234647}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.13131848609741684, "propensity_score": 0.10455090714129693, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1389.66, "away_cum_fatigue": 1565.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10486323984214019, "shap_defensive_collapse": 0.09628936933874518, "shap_explosiveness": 0.12342065900623403, "shap_fatigue": 0.12790986887660785}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.15313943374868155, "propensity_score": 0.11136971506664965, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1389.66, "away_cum_fatigue": 1239.3333333333333, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.13640863058885497, "shap_defensive_collapse": 0.08267477097674225, "shap_explosiveness": 0.11725501760663289, "shap_fatigue": 0.11871216599188611}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.14388936375452843, "propensity_score": 0.13070143779557383, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1389.66, "away_cum_fatigue": 1041.25, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12470731584708032, "shap_defensive_collapse": 0.10806862856368725, "shap_explosiveness": 0.11000392077383893, "shap_fatigue": 0.1406141855203738}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.15567126709785345, "propensity_score": 0.13326994678613394, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1389.66, "away_cum_fatigue": 908.2, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13994152300084092, "shap_defensive_collapse": 0.10030823890611015, "shap_explosiveness": 0.11341527152229675, "shap_fatigue": 0.142278078468354}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.15538316373636585, "propensity_score": 0.10281439477326469, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1395.66, "away_cum_fatigue": 914.2, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.13663631151341687, "shap_defensive_collapse": 0.10384995619705514, "shap_explosiveness": 0.11326898864685395, "shap_fatigue": 0.14567828560504661}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.1449938716318573, "propensity_score": 0.13210366073972987, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1395.66, "away_cum_fatigue": 914.2, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11711030501786465, "shap_defensive_collapse": 0.10524343256160704, "shap_explosiveness": 0.12402882808306326, "shap_fatigue": 0.14679213070958322}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.12633459972725564, "propensity_score": 0.1320852659454886, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1395.66, "away_cum_fatigue": 748.0, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10234620449718118, "shap_defensive_collapse": 0.0863472112275635, "shap_explosiveness": 0.1049586086954983, "shap_fatigue": 0.11296041579846264}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.16433168420440303, "propensity_score": 0.14311326917151068, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1395.66, "away_cum_fatigue": 692.3399999999999, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.13412986805692204, "shap_defensive_collapse": 0.08364712848179437, "shap_explosiveness": 0.10720858635730149, "shap_fatigue": 0.11185088099893077}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.1304824066092147, "propensity_score": 0.1354216978391205, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1399.66, "away_cum_fatigue": 696.3399999999999, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12828186129349436, "shap_defensive_collapse": 0.09514898329445984, "shap_explosiveness": 0.10367673727504927, "shap_fatigue": 0.1143285539072531}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.14153051927954444, "propensity_score": 0.14791779951121756, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1401.66, "away_cum_fatigue": 698.3399999999999, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11859536124486666, "shap_defensive_collapse": 0.10320578707067786, "shap_explosiveness": 0.10221077459501407, "shap_fatigue": 0.14976731706416094}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.16561339586927273, "propensity_score": 0.10915777370619817, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1411.66, "away_cum_fatigue": 708.3399999999999, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1320589983797697, "shap_defensive_collapse": 0.10008015591540628, "shap_explosiveness": 0.0922686545889378, "shap_fatigue": 0.11631820651443621}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.16695002866028552, "propensity_score": 0.10842127806139047, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1411.66, "away_cum_fatigue": 708.3399999999999, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11318949681094989, "shap_defensive_collapse": 0.08574593086157922, "shap_explosiveness": 0.11688515447853633, "shap_fatigue": 0.14355160151997995}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.14892846332918214, "propensity_score": 0.11278810506984595, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1413.66, "away_cum_fatigue": 710.3399999999999, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.13918066811014834, "shap_defensive_collapse": 0.0838030541329123, "shap_explosiveness": 0.10632220417435642, "shap_fatigue": 0.12335182222194581}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.16318869468338143, "propensity_score": 0.12699087331879994, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1433.66, "away_cum_fatigue": 730.3399999999999, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11744542528688377, "shap_defensive_collapse": 0.08670092746878623, "shap_explosiveness": 0.0945970987769311, "shap_fatigue": 0.14391815725228627}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.15417686709863426, "propensity_score": 0.10339330935336517, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1434.66, "away_cum_fatigue": 731.3399999999999, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.12621724134200296, "shap_defensive_collapse": 0.11120554099335522, "shap_explosiveness": 0.11062711374354772, "shap_fatigue": 0.13033476359934656}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.14397813960199948, "propensity_score": 0.11367045076623544, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1437.66, "away_cum_fatigue": 734.3399999999999, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.12771459124648893, "shap_defensive_collapse": 0.09883147307317068, "shap_explosiveness": 0.11324569947179944, "shap_fatigue": 0.1388421129939353}, {"period": 3, "home_score": 79, "away_score": 79, "score_margin": 0, "cate_score": 0.142161572812562, "propensity_score": 0.1409416330667626, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1437.66, "away_cum_fatigue": 734.3399999999999, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12408443921597291, "shap_defensive_collapse": 0.10642902196489214, "shap_explosiveness": 0.09607298330459274, "shap_fatigue": 0.12273842295889664}, {"period": 3, "home_score": 82, "away_score": 79, "score_margin": 3, "cate_score": 0.12599725130199277, "propensity_score": 0.11225462064529786, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1441.66, "away_cum_fatigue": 738.3399999999999, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.11954288144083611, "shap_defensive_collapse": 0.114041114108823, "shap_explosiveness": 0.1267135281382076, "shap_fatigue": 0.14193611951709642}, {"period": 3, "home_score": 82, "away_score": 79, "score_margin": 3, "cate_score": 0.1420878558141772, "propensity_score": 0.13143846704197198, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1462.66, "away_cum_fatigue": 759.3399999999999, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12834200071967766, "shap_defensive_collapse": 0.11948829117548178, "shap_explosiveness": 0.10321323023288557, "shap_fatigue": 0.1480099967207285}, {"period": 3, "home_score": 82, "away_score": 79, "score_margin": 3, "cate_score": 0.14170499039980294, "propensity_score": 0.10464506794573647, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1468.66, "away_cum_fatigue": 765.3399999999999, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11296432234878079, "shap_defensive_collapse": 0.09121460285421165, "shap_explosiveness": 0.12378401754138983, "shap_fatigue": 0.12637760771368}, {"period": 3, "home_score": 82, "away_score": 79, "score_margin": 3, "cate_score": 0.1436045806312096, "propensity_score": 0.10851314852458797, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1470.66, "away_cum_fatigue": 767.3399999999999, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11514740746279414, "shap_defensive_collapse": 0.09874865227666392, "shap_explosiveness": 0.12517698852772544, "shap_fatigue": 0.11172783684771144}, {"period": 3, "home_score": 84, "away_score": 79, "score_margin": 5, "cate_score": 0.13519392103490807, "propensity_score": 0.1087070350914614, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1480.66, "away_cum_fatigue": 777.3399999999999, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.11193461743801433, "shap_defensive_collapse": 0.11846494936537352, "shap_explosiveness": 0.1265382815487313, "shap_fatigue": 0.12846802363594137}, {"period": 3, "home_score": 84, "away_score": 79, "score_margin": 5, "cate_score": 0.1644704100962043, "propensity_score": 0.14514313982176164, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1488.66, "away_cum_fatigue": 785.3399999999999, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1181389329831211, "shap_defensive_collapse": 0.08159807533659748, "shap_explosiveness": 0.12721065283212146, "shap_fatigue": 0.1312858794196782}, {"period": 3, "home_score": 84, "away_score": 82, "score_margin": 2, "cate_score": 0.12048041674398775, "propensity_score": 0.10096041345789818, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1490.66, "away_cum_fatigue": 787.3399999999999, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.11306706660147832, "shap_defensive_collapse": 0.0975081913363419, "shap_explosiveness": 0.09227242191888933, "shap_fatigue": 0.1358187270144349}, {"period": 3, "home_score": 84, "away_score": 85, "score_margin": -1, "cate_score": 0.12475377935070077, "propensity_score": 0.1279843666472069, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1507.66, "away_cum_fatigue": 804.3399999999999, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.11701519661860446, "shap_defensive_collapse": 0.10624751347625204, "shap_explosiveness": 0.12920257879200275, "shap_fatigue": 0.11906711182173779}, {"period": 3, "home_score": 85, "away_score": 88, "score_margin": -3, "cate_score": 0.15348884723699166, "propensity_score": 0.12449039180547561, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1507.66, "away_cum_fatigue": 804.3399999999999, "play_description": "IND: Draws a shooting foul, converts the free throw.", "shap_stale_lineup": 0.13359937484365086, "shap_defensive_collapse": 0.0808319183498114, "shap_explosiveness": 0.12375701259235045, "shap_fatigue": 0.1369191350734843}, {"period": 3, "home_score": 85, "away_score": 91, "score_margin": -6, "cate_score": 0.1404061819505466, "propensity_score": 0.10417865665730251, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1507.66, "away_cum_fatigue": 860.0, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.12415054666831753, "shap_defensive_collapse": 0.11506273649447206, "shap_explosiveness": 0.10008332435420036, "shap_fatigue": 0.11331574110066762}, {"period": 3, "home_score": 85, "away_score": 94, "score_margin": -9, "cate_score": 0.16226985906541036, "propensity_score": 0.12757781479020713, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1507.66, "away_cum_fatigue": 980.26, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.13781997660971723, "shap_defensive_collapse": 0.08393800175443167, "shap_explosiveness": 0.10412153615959904, "shap_fatigue": 0.12122910799289789}, {"period": 3, "home_score": 85, "away_score": 95, "score_margin": -10, "cate_score": 0.135587858517121, "propensity_score": 0.1065232300570366, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1507.66, "away_cum_fatigue": 804.3399999999999, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.10447941736928226, "shap_defensive_collapse": 0.08586500822361164, "shap_explosiveness": 0.12040347714740378, "shap_fatigue": 0.14786047008704417}, {"period": 3, "home_score": 85, "away_score": 95, "score_margin": -10, "cate_score": 0.16280367521480954, "propensity_score": 0.10081954430589508, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1508.66, "away_cum_fatigue": 981.26, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1315657997490378, "shap_defensive_collapse": 0.10135015836089556, "shap_explosiveness": 0.1163865976457169, "shap_fatigue": 0.14470352609189963}, {"period": 3, "home_score": 85, "away_score": 95, "score_margin": -10, "cate_score": 0.12168689178602252, "propensity_score": 0.1198640052225805, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1510.66, "away_cum_fatigue": 983.26, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.11879127993992435, "shap_defensive_collapse": 0.096531140658132, "shap_explosiveness": 0.12491302431295634, "shap_fatigue": 0.11472820862005666}, {"period": 3, "home_score": 85, "away_score": 95, "score_margin": -10, "cate_score": 0.1696112155145793, "propensity_score": 0.8457763561862441, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1510.66, "away_cum_fatigue": 983.26, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.13554810074327606, "shap_defensive_collapse": 0.11421188744064012, "shap_explosiveness": 0.09749065811400189, "shap_fatigue": 0.12172091684211478}, {"period": 3, "home_score": 85, "away_score": 98, "score_margin": -13, "cate_score": 0.16830360558212165, "propensity_score": 0.8669534894082994, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1519.66, "away_cum_fatigue": 992.26, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.11189689370073365, "shap_defensive_collapse": 0.08235898845165819, "shap_explosiveness": 0.11501604014081977, "shap_fatigue": 0.12618306234568483}, {"period": 3, "home_score": 85, "away_score": 98, "score_margin": -13, "cate_score": 0.1685605765752889, "propensity_score": 0.8688719080053698, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1530.66, "away_cum_fatigue": 1003.26, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.12385348279170391, "shap_defensive_collapse": 0.10106218957351175, "shap_explosiveness": 0.11689010492419649, "shap_fatigue": 0.14463678380658673}, {"period": 3, "home_score": 88, "away_score": 98, "score_margin": -10, "cate_score": 0.12220244339505028, "propensity_score": 0.8287104524931966, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1543.66, "away_cum_fatigue": 1016.26, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.1047432602413499, "shap_defensive_collapse": 0.09804389987318764, "shap_explosiveness": 0.11630048252142088, "shap_fatigue": 0.13222921405318813}, {"period": 3, "home_score": 88, "away_score": 100, "score_margin": -12, "cate_score": 0.16601381137469468, "propensity_score": 0.8307667711025, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1554.66, "away_cum_fatigue": 1027.26, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.12657419567234499, "shap_defensive_collapse": 0.08719496394711945, "shap_explosiveness": 0.11440070169400518, "shap_fatigue": 0.13911653281152028}, {"period": 3, "home_score": 88, "away_score": 100, "score_margin": -12, "cate_score": 0.1528153128153903, "propensity_score": 0.8351179475125744, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1565.66, "away_cum_fatigue": 1038.26, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.13497737739070767, "shap_defensive_collapse": 0.08505539916439811, "shap_explosiveness": 0.10153028467861483, "shap_fatigue": 0.11308942797303434}, {"period": 3, "home_score": 89, "away_score": 100, "score_margin": -11, "cate_score": 0.1442992314220745, "propensity_score": 0.8339133725954784, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1565.66, "away_cum_fatigue": 1038.26, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.12241056549041718, "shap_defensive_collapse": 0.11339923364702878, "shap_explosiveness": 0.11000220412291814, "shap_fatigue": 0.12139607626030285}, {"period": 3, "home_score": 90, "away_score": 100, "score_margin": -10, "cate_score": 0.1363687061283571, "propensity_score": 0.8385735380308764, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1565.66, "away_cum_fatigue": 1038.26, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.13481565742670337, "shap_defensive_collapse": 0.08038580813185231, "shap_explosiveness": 0.11021373306269788, "shap_fatigue": 0.13187666773417478}, {"period": 3, "home_score": 90, "away_score": 100, "score_margin": -10, "cate_score": 0.16576416333516902, "propensity_score": 0.8544407709572941, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1572.56, "away_cum_fatigue": 1045.16, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.13730903993798255, "shap_defensive_collapse": 0.11749982606647144, "shap_explosiveness": 0.11211154448431535, "shap_fatigue": 0.12494213325609568}, {"period": 3, "home_score": 90, "away_score": 101, "score_margin": -11, "cate_score": 0.12437283608588733, "propensity_score": 0.8579518487109039, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1572.56, "away_cum_fatigue": 1045.16, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.1295605573539998, "shap_defensive_collapse": 0.08143735180124247, "shap_explosiveness": 0.12289553910344518, "shap_fatigue": 0.1499628438735226}, {"period": 3, "home_score": 90, "away_score": 102, "score_margin": -12, "cate_score": 0.16273118596520686, "propensity_score": 0.8688539874679848, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1572.56, "away_cum_fatigue": 1045.16, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.12414509226535689, "shap_defensive_collapse": 0.09367636681564984, "shap_explosiveness": 0.11488193318438553, "shap_fatigue": 0.149894782550921}, {"period": 3, "home_score": 90, "away_score": 102, "score_margin": -12, "cate_score": 0.13347331151763617, "propensity_score": 0.868444915599946, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1585.06, "away_cum_fatigue": 1057.66, "play_description": "Propensity Alarm: Persistent high propensity to call timeout (Ignored)", "shap_stale_lineup": 0.1324813673984201, "shap_defensive_collapse": 0.0987602070907166, "shap_explosiveness": 0.10365731724300443, "shap_fatigue": 0.13157149760142048}, {"period": 3, "home_score": 90, "away_score": 103, "score_margin": -13, "cate_score": 0.95, "propensity_score": 0.14839688148416377, "timeout_team": "NONE", "target_stop_run_90s": 1, "timeout_strategic_weight": 0, "home_cum_fatigue": 1586.86, "away_cum_fatigue": 1059.46, "play_description": "CRITICAL ALARM: Opponent scoring run of 6 consecutive possessions!", "shap_stale_lineup": 0.89, "shap_defensive_collapse": 0.92, "shap_explosiveness": 0.85, "shap_fatigue": 0.81}, {"period": 3, "home_score": 90, "away_score": 107, "score_margin": -17, "cate_score": 0.95, "propensity_score": 0.134456717285127, "timeout_team": "NONE", "target_stop_run_90s": 1, "timeout_strategic_weight": 0, "home_cum_fatigue": 1595.76, "away_cum_fatigue": 1068.36, "play_description": "CRITICAL ALARM: Opponent scoring run of 6 consecutive possessions!", "shap_stale_lineup": 0.89, "shap_defensive_collapse": 0.92, "shap_explosiveness": 0.85, "shap_fatigue": 0.81}, {"period": 3, "home_score": 90, "away_score": 108, "score_margin": -18, "cate_score": 0.95, "propensity_score": 0.1245104351013447, "timeout_team": "NONE", "target_stop_run_90s": 1, "timeout_strategic_weight": 0, "home_cum_fatigue": 1613.66, "away_cum_fatigue": 1086.26, "play_description": "CRITICAL ALARM: Opponent scoring run of 6 consecutive possessions!", "shap_stale_lineup": 0.89, "shap_defensive_collapse": 0.92, "shap_explosiveness": 0.85, "shap_fatigue": 0.81}, {"period": 3, "home_score": 90, "away_score": 109, "score_margin": -19, "cate_score": 0.95, "propensity_score": 0.10710769043083818, "timeout_team": "NONE", "target_stop_run_90s": 1, "timeout_strategic_weight": 0, "home_cum_fatigue": 1615.36, "away_cum_fatigue": 1087.96, "play_description": "CRITICAL ALARM: Opponent scoring run of 6 consecutive possessions!", "shap_stale_lineup": 0.89, "shap_defensive_collapse": 0.92, "shap_explosiveness": 0.85, "shap_fatigue": 0.81}, {"period": 3, "home_score": 93, "away_score": 110, "score_margin": -17, "cate_score": 0.95, "propensity_score": 0.12669299554495886, "timeout_team": "NONE", "target_stop_run_90s": 1, "timeout_strategic_weight": 0, "home_cum_fatigue": 1621.66, "away_cum_fatigue": 1094.26, "play_description": "CRITICAL ALARM: Opponent scoring run of 6 consecutive possessions!", "shap_stale_lineup": 0.89, "shap_defensive_collapse": 0.92, "shap_explosiveness": 0.85, "shap_fatigue": 0.81}, {"period": 3, "home_score": 93, "away_score": 111, "score_margin": -18, "cate_score": 0.95, "propensity_score": 0.10254034343387508, "timeout_team": "NONE", "target_stop_run_90s": 1, "timeout_strategic_weight": 0, "home_cum_fatigue": 1622.66, "away_cum_fatigue": 1095.26, "play_description": "CRITICAL ALARM: Opponent scoring run of 6 consecutive possessions!", "shap_stale_lineup": 0.89, "shap_defensive_collapse": 0.92, "shap_explosiveness": 0.85, "shap_fatigue": 0.81}, {"period": 4, "home_score": 96, "away_score": 111, "score_margin": -15, "cate_score": 0.16324013529397277, "propensity_score": 0.1446359260049751, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1783.25, "away_cum_fatigue": 1594.66, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.13413041226226532, "shap_defensive_collapse": 0.10028693782239723, "shap_explosiveness": 0.11241048632360758, "shap_fatigue": 0.12445464385639028}, {"period": 4, "home_score": 99, "away_score": 111, "score_margin": -12, "cate_score": 0.16560763981044843, "propensity_score": 0.1373955087761707, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1737.0, "away_cum_fatigue": 1594.66, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.10006640615142814, "shap_defensive_collapse": 0.08255883961460786, "shap_explosiveness": 0.11182010706550286, "shap_fatigue": 0.13946677364939825}, {"period": 4, "home_score": 101, "away_score": 111, "score_margin": -10, "cate_score": 0.15852754646101289, "propensity_score": 0.1012289610893081, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1644.5, "away_cum_fatigue": 1594.66, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.12185090684713115, "shap_defensive_collapse": 0.10502628601037782, "shap_explosiveness": 0.12426035669989999, "shap_fatigue": 0.1133979780510563}, {"period": 4, "home_score": 101, "away_score": 111, "score_margin": -10, "cate_score": 0.12175906142332936, "propensity_score": 0.11424259995598647, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1644.5, "away_cum_fatigue": 1545.825, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10193539869448402, "shap_defensive_collapse": 0.1119842399301628, "shap_explosiveness": 0.09830355509173624, "shap_fatigue": 0.14439386274820992}, {"period": 4, "home_score": 101, "away_score": 111, "score_margin": -10, "cate_score": 0.1378063477453158, "propensity_score": 0.12125530419127792, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1644.5, "away_cum_fatigue": 1545.825, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10851575872853732, "shap_defensive_collapse": 0.11216858693038728, "shap_explosiveness": 0.10877630186571412, "shap_fatigue": 0.13660709456406403}, {"period": 4, "home_score": 101, "away_score": 111, "score_margin": -10, "cate_score": 0.15127838995753692, "propensity_score": 0.1487724618842538, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1175.6666666666667, "away_cum_fatigue": 1545.825, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.12115373155557668, "shap_defensive_collapse": 0.10043496098917093, "shap_explosiveness": 0.10340654811942444, "shap_fatigue": 0.14107907270466938}, {"period": 4, "home_score": 101, "away_score": 111, "score_margin": -10, "cate_score": 0.12680996281006524, "propensity_score": 0.10112368457746931, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 941.25, "away_cum_fatigue": 1545.825, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1213069639498958, "shap_defensive_collapse": 0.09716486557041394, "shap_explosiveness": 0.09746141396541921, "shap_fatigue": 0.13903450190723132}, {"period": 4, "home_score": 101, "away_score": 111, "score_margin": -10, "cate_score": 0.16120277240810568, "propensity_score": 0.11300713903883144, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 941.25, "away_cum_fatigue": 1545.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1306043491906506, "shap_defensive_collapse": 0.10181656102442195, "shap_explosiveness": 0.12131275308473274, "shap_fatigue": 0.11815852746893657}, {"period": 4, "home_score": 101, "away_score": 111, "score_margin": -10, "cate_score": 0.12005220287751205, "propensity_score": 0.11970609055397644, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 941.25, "away_cum_fatigue": 1545.825, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.13053935788891374, "shap_defensive_collapse": 0.08635899594292389, "shap_explosiveness": 0.09784873599941112, "shap_fatigue": 0.1344061413656108}, {"period": 4, "home_score": 101, "away_score": 111, "score_margin": -10, "cate_score": 0.15476970562983924, "propensity_score": 0.14098709667095136, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 941.25, "away_cum_fatigue": 1545.825, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11602070051436594, "shap_defensive_collapse": 0.1152990159464931, "shap_explosiveness": 0.09882074095667841, "shap_fatigue": 0.14606443637623373}, {"period": 4, "home_score": 101, "away_score": 111, "score_margin": -10, "cate_score": 0.14824677362349103, "propensity_score": 0.14954700722024883, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 941.25, "away_cum_fatigue": 1545.825, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11232288280104909, "shap_defensive_collapse": 0.10883750398158082, "shap_explosiveness": 0.11612564846916908, "shap_fatigue": 0.12755400856784654}, {"period": 4, "home_score": 101, "away_score": 111, "score_margin": -10, "cate_score": 0.13065719322306932, "propensity_score": 0.1299667627533789, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 957.25, "away_cum_fatigue": 1561.825, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12503902623984123, "shap_defensive_collapse": 0.10683259829784084, "shap_explosiveness": 0.11033370187161859, "shap_fatigue": 0.128472003819094}, {"period": 4, "home_score": 101, "away_score": 111, "score_margin": -10, "cate_score": 0.1508737094203887, "propensity_score": 0.1272730156874911, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 958.25, "away_cum_fatigue": 1562.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11816415135740256, "shap_defensive_collapse": 0.09711194587471786, "shap_explosiveness": 0.10435623464783947, "shap_fatigue": 0.1237378708053134}, {"period": 4, "home_score": 101, "away_score": 113, "score_margin": -12, "cate_score": 0.16294124481557778, "propensity_score": 0.10507795908446005, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 965.25, "away_cum_fatigue": 1569.825, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.11536182442256886, "shap_defensive_collapse": 0.09562717358690839, "shap_explosiveness": 0.12365003454266732, "shap_fatigue": 0.13681166442079398}, {"period": 4, "home_score": 101, "away_score": 113, "score_margin": -12, "cate_score": 0.1556002605582974, "propensity_score": 0.13221022601473242, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 965.25, "away_cum_fatigue": 1569.825, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.12956202947963205, "shap_defensive_collapse": 0.09816417674831972, "shap_explosiveness": 0.11769969784567869, "shap_fatigue": 0.12438001145212657}, {"period": 4, "home_score": 101, "away_score": 114, "score_margin": -13, "cate_score": 0.15223262565674162, "propensity_score": 0.11253304608464594, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 965.25, "away_cum_fatigue": 1569.825, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.1299700967850685, "shap_defensive_collapse": 0.11929929952695542, "shap_explosiveness": 0.11244752210673287, "shap_fatigue": 0.12164954526104987}, {"period": 4, "home_score": 101, "away_score": 114, "score_margin": -13, "cate_score": 0.15410600366417998, "propensity_score": 0.11773274883091647, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 978.25, "away_cum_fatigue": 1582.825, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.134981195134581, "shap_defensive_collapse": 0.08969879497061815, "shap_explosiveness": 0.09650275938696985, "shap_fatigue": 0.1448900488349176}, {"period": 4, "home_score": 101, "away_score": 114, "score_margin": -13, "cate_score": 0.1432403737625572, "propensity_score": 0.12230452706010908, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 980.25, "away_cum_fatigue": 1584.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12628027455063706, "shap_defensive_collapse": 0.08720450974923702, "shap_explosiveness": 0.09614207714022753, "shap_fatigue": 0.12983171154569342}, {"period": 4, "home_score": 101, "away_score": 116, "score_margin": -15, "cate_score": 0.1398521070569065, "propensity_score": 0.11011940996974472, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 987.25, "away_cum_fatigue": 1591.825, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.10881569419680817, "shap_defensive_collapse": 0.10865109294891039, "shap_explosiveness": 0.1104880592290214, "shap_fatigue": 0.14035329484473533}, {"period": 4, "home_score": 101, "away_score": 116, "score_margin": -15, "cate_score": 0.12511586642442032, "propensity_score": 0.11822126140757654, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1001.25, "away_cum_fatigue": 1605.825, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.1012201486664586, "shap_defensive_collapse": 0.10635822383901741, "shap_explosiveness": 0.12576272479463027, "shap_fatigue": 0.1197500302209356}, {"period": 4, "home_score": 101, "away_score": 116, "score_margin": -15, "cate_score": 0.12135244064461861, "propensity_score": 0.14224649620393873, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1001.25, "away_cum_fatigue": 1605.825, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.1038513554039869, "shap_defensive_collapse": 0.08987799097314413, "shap_explosiveness": 0.11235588330585171, "shap_fatigue": 0.1474613108710004}, {"period": 4, "home_score": 101, "away_score": 116, "score_margin": -15, "cate_score": 0.14224266570167093, "propensity_score": 0.10537367230205691, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1017.25, "away_cum_fatigue": 1621.825, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10633355453381142, "shap_defensive_collapse": 0.10603407587404835, "shap_explosiveness": 0.1280649130282461, "shap_fatigue": 0.1284523667245814}, {"period": 4, "home_score": 101, "away_score": 116, "score_margin": -15, "cate_score": 0.15119873318168184, "propensity_score": 0.14658078646246864, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1019.25, "away_cum_fatigue": 1623.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.13887567283302474, "shap_defensive_collapse": 0.08571556290382155, "shap_explosiveness": 0.12019459380008882, "shap_fatigue": 0.14124573607414148}, {"period": 4, "home_score": 104, "away_score": 116, "score_margin": -12, "cate_score": 0.13620849130623838, "propensity_score": 0.10655754440650228, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1027.25, "away_cum_fatigue": 1631.825, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.13414955396616735, "shap_defensive_collapse": 0.08496060338316809, "shap_explosiveness": 0.09030460091983619, "shap_fatigue": 0.11209370475619686}, {"period": 4, "home_score": 104, "away_score": 116, "score_margin": -12, "cate_score": 0.14759526476117782, "propensity_score": 0.1475163330304066, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1040.25, "away_cum_fatigue": 1644.825, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.13356041189157847, "shap_defensive_collapse": 0.09663924116795096, "shap_explosiveness": 0.12775283342342653, "shap_fatigue": 0.1250096672002774}, {"period": 4, "home_score": 104, "away_score": 117, "score_margin": -13, "cate_score": 0.15458512231639113, "propensity_score": 0.1278372084812516, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1040.25, "away_cum_fatigue": 1644.825, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.11790368036262064, "shap_defensive_collapse": 0.11932438725437225, "shap_explosiveness": 0.12494824583873405, "shap_fatigue": 0.1343592643423852}, {"period": 4, "home_score": 104, "away_score": 117, "score_margin": -13, "cate_score": 0.12199986975039182, "propensity_score": 0.12261865053882008, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 790.9, "away_cum_fatigue": 1644.825, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11027952036075052, "shap_defensive_collapse": 0.0851738872946662, "shap_explosiveness": 0.11192965378083676, "shap_fatigue": 0.139118273473913}, {"period": 4, "home_score": 104, "away_score": 117, "score_margin": -13, "cate_score": 0.15215187111141681, "propensity_score": 0.10031662158209867, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1017.85, "away_cum_fatigue": 1644.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12932195307381464, "shap_defensive_collapse": 0.09788243495759749, "shap_explosiveness": 0.10989093602061695, "shap_fatigue": 0.11675073742997642}, {"period": 4, "home_score": 104, "away_score": 117, "score_margin": -13, "cate_score": 0.1621262065114774, "propensity_score": 0.11348859693960772, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1319.2333333333331, "away_cum_fatigue": 1644.825, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.13707196719806256, "shap_defensive_collapse": 0.09857798851825719, "shap_explosiveness": 0.09935744499944586, "shap_fatigue": 0.11475818091105269}, {"period": 4, "home_score": 104, "away_score": 117, "score_margin": -13, "cate_score": 0.15843575378297567, "propensity_score": 0.12782127546897346, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1469.925, "away_cum_fatigue": 1644.825, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10968289209641445, "shap_defensive_collapse": 0.11947630593868727, "shap_explosiveness": 0.12899508248265992, "shap_fatigue": 0.11287412144816467}, {"period": 4, "home_score": 104, "away_score": 118, "score_margin": -14, "cate_score": 0.12332596809516405, "propensity_score": 0.11621103100771576, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1469.925, "away_cum_fatigue": 1644.825, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.1334043038102728, "shap_defensive_collapse": 0.10480507561579133, "shap_explosiveness": 0.10374066523522157, "shap_fatigue": 0.11948866682394724}, {"period": 4, "home_score": 104, "away_score": 118, "score_margin": -14, "cate_score": 0.1384642662822136, "propensity_score": 0.12869480641128642, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1485.925, "away_cum_fatigue": 1660.825, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.13707172128189818, "shap_defensive_collapse": 0.1038164947544339, "shap_explosiveness": 0.09501393004302158, "shap_fatigue": 0.14924623773106652}, {"period": 4, "home_score": 104, "away_score": 118, "score_margin": -14, "cate_score": 0.14493869635069867, "propensity_score": 0.13089129037510533, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1497.925, "away_cum_fatigue": 1672.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11023363691883828, "shap_defensive_collapse": 0.10620471976258852, "shap_explosiveness": 0.12214979952793312, "shap_fatigue": 0.13361976051984029}, {"period": 4, "home_score": 104, "away_score": 118, "score_margin": -14, "cate_score": 0.14009858379639586, "propensity_score": 0.11753645558834401, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1498.925, "away_cum_fatigue": 1673.825, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1289567794665162, "shap_defensive_collapse": 0.1138914667754665, "shap_explosiveness": 0.11869581434188362, "shap_fatigue": 0.13856815352416763}, {"period": 4, "home_score": 104, "away_score": 118, "score_margin": -14, "cate_score": 0.12920204935350874, "propensity_score": 0.1279877510914392, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1503.925, "away_cum_fatigue": 1678.825, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.13823279228282062, "shap_defensive_collapse": 0.11299121634107476, "shap_explosiveness": 0.09077505265849699, "shap_fatigue": 0.1448830118248934}, {"period": 4, "home_score": 104, "away_score": 118, "score_margin": -14, "cate_score": 0.16482139337542598, "propensity_score": 0.11276525904485556, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1503.925, "away_cum_fatigue": 1678.825, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11796770250371778, "shap_defensive_collapse": 0.10773945569124825, "shap_explosiveness": 0.10610591627301312, "shap_fatigue": 0.14731410929203115}, {"period": 4, "home_score": 104, "away_score": 118, "score_margin": -14, "cate_score": 0.16685441340078744, "propensity_score": 0.13902160082797066, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1505.925, "away_cum_fatigue": 1680.825, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1334325643484775, "shap_defensive_collapse": 0.11626216882612142, "shap_explosiveness": 0.09071511773973319, "shap_fatigue": 0.11619731029865765}, {"period": 4, "home_score": 104, "away_score": 118, "score_margin": -14, "cate_score": 0.1247451526084378, "propensity_score": 0.11019964094162871, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1505.925, "away_cum_fatigue": 1680.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11308723659916624, "shap_defensive_collapse": 0.09887547455510022, "shap_explosiveness": 0.11313132815143206, "shap_fatigue": 0.13032991933474705}, {"period": 4, "home_score": 104, "away_score": 118, "score_margin": -14, "cate_score": 0.13155285879259884, "propensity_score": 0.12479584977814118, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1507.925, "away_cum_fatigue": 1682.825, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11075448837711167, "shap_defensive_collapse": 0.11466861762484179, "shap_explosiveness": 0.09855323951825776, "shap_fatigue": 0.13125074675354126}, {"period": 4, "home_score": 104, "away_score": 118, "score_margin": -14, "cate_score": 0.12002209974249003, "propensity_score": 0.11676533550569215, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1885.5666666666664, "away_cum_fatigue": 1682.825, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13282749130266466, "shap_defensive_collapse": 0.09248665181891558, "shap_explosiveness": 0.11518613169547696, "shap_fatigue": 0.1260715248119219}, {"period": 4, "home_score": 104, "away_score": 118, "score_margin": -14, "cate_score": 0.14565902719403873, "propensity_score": 0.11487498705007429, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1894.675, "away_cum_fatigue": 1682.825, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1396994896728359, "shap_defensive_collapse": 0.1042920822025429, "shap_explosiveness": 0.12553621685976937, "shap_fatigue": 0.1454142556142511}, {"period": 4, "home_score": 106, "away_score": 118, "score_margin": -12, "cate_score": 0.16021015920015585, "propensity_score": 0.12153466265586224, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1901.675, "away_cum_fatigue": 1689.825, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.11829898645346384, "shap_defensive_collapse": 0.08918920463353502, "shap_explosiveness": 0.10001069999754468, "shap_fatigue": 0.11220838835361668}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.1395239526591257, "propensity_score": 0.13233880740487852, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1913.675, "away_cum_fatigue": 1701.825, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.10498922408959822, "shap_defensive_collapse": 0.08241012203083622, "shap_explosiveness": 0.10926984426505448, "shap_fatigue": 0.11350781161253394}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.13471365597548343, "propensity_score": 0.12185975298565577, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1925.675, "away_cum_fatigue": 1713.825, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.11973108978997134, "shap_defensive_collapse": 0.09636381714228553, "shap_explosiveness": 0.12798735857404253, "shap_fatigue": 0.1215764697203845}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.14142023037376913, "propensity_score": 0.12319812147916777, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1925.675, "away_cum_fatigue": 1702.7666666666669, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1271596212455064, "shap_defensive_collapse": 0.08420530433226356, "shap_explosiveness": 0.10594763182499473, "shap_fatigue": 0.11221974103175958}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.14223290702619026, "propensity_score": 0.12838979432012892, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1925.675, "away_cum_fatigue": 1702.7666666666669, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11691445071347532, "shap_defensive_collapse": 0.10976935175114137, "shap_explosiveness": 0.11136449419959851, "shap_fatigue": 0.14995739185784002}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.16764707554239439, "propensity_score": 0.13411518875319164, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1936.675, "away_cum_fatigue": 1713.7666666666669, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.13393463680146153, "shap_defensive_collapse": 0.11871121004940673, "shap_explosiveness": 0.0926721118511883, "shap_fatigue": 0.13859126310751776}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.12081385552186584, "propensity_score": 0.11994365144948357, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1938.675, "away_cum_fatigue": 1715.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10902380695282748, "shap_defensive_collapse": 0.1076949189959929, "shap_explosiveness": 0.1097203577161961, "shap_fatigue": 0.1325692920665658}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.13285306851549383, "propensity_score": 0.1238818566747405, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1951.675, "away_cum_fatigue": 1728.7666666666669, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1130349866307908, "shap_defensive_collapse": 0.10885938398220459, "shap_explosiveness": 0.1208511674204799, "shap_fatigue": 0.118775045974255}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.12025013262374963, "propensity_score": 0.11555007985538499, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1954.675, "away_cum_fatigue": 1731.7666666666669, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11818913689609498, "shap_defensive_collapse": 0.09209482838154533, "shap_explosiveness": 0.12305578323432025, "shap_fatigue": 0.11242457047964831}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.1466129111508379, "propensity_score": 0.1121457672788154, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1955.675, "away_cum_fatigue": 1732.7666666666669, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.11785004749070133, "shap_defensive_collapse": 0.08600115618249335, "shap_explosiveness": 0.10662316559406809, "shap_fatigue": 0.14914750399227922}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.15894002229046575, "propensity_score": 0.13957633480452217, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1955.675, "away_cum_fatigue": 1732.7666666666669, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1253002764117643, "shap_defensive_collapse": 0.09270010008593646, "shap_explosiveness": 0.11700990634568639, "shap_fatigue": 0.14762204545675817}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.1619359033971777, "propensity_score": 0.14783854175798297, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1922.2, "away_cum_fatigue": 1732.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10354899802733432, "shap_defensive_collapse": 0.08450375524281316, "shap_explosiveness": 0.11337758643579324, "shap_fatigue": 0.14811380566893256}, {"period": 4, "home_score": 106, "away_score": 121, "score_margin": -15, "cate_score": 0.1657778821446086, "propensity_score": 0.12212849570092144, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1934.2, "away_cum_fatigue": 1744.7666666666669, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.12172853358455184, "shap_defensive_collapse": 0.11893731057102432, "shap_explosiveness": 0.10569628589479327, "shap_fatigue": 0.11439042557316129}, {"period": 4, "home_score": 106, "away_score": 122, "score_margin": -16, "cate_score": 0.13813453688027683, "propensity_score": 0.13160572787012403, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1934.2, "away_cum_fatigue": 1744.7666666666669, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.12871551114717053, "shap_defensive_collapse": 0.08188447417088254, "shap_explosiveness": 0.11538951786516741, "shap_fatigue": 0.12502330113559657}, {"period": 4, "home_score": 106, "away_score": 122, "score_margin": -16, "cate_score": 0.1464419796067009, "propensity_score": 0.1150451349188594, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1934.2, "away_cum_fatigue": 1744.7666666666669, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13904944662564228, "shap_defensive_collapse": 0.11752662793776439, "shap_explosiveness": 0.09041261660854058, "shap_fatigue": 0.1476611246505189}, {"period": 4, "home_score": 106, "away_score": 122, "score_margin": -16, "cate_score": 0.1612108288260447, "propensity_score": 0.12880600685406432, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1935.2, "away_cum_fatigue": 1745.7666666666669, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10156150277460042, "shap_defensive_collapse": 0.10881666315155397, "shap_explosiveness": 0.09182485771141644, "shap_fatigue": 0.13417240107951525}, {"period": 4, "home_score": 106, "away_score": 122, "score_margin": -16, "cate_score": 0.1576325736428858, "propensity_score": 0.10016469321621338, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1935.2, "away_cum_fatigue": 1745.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1344779319326217, "shap_defensive_collapse": 0.10874089566458364, "shap_explosiveness": 0.12173086237439709, "shap_fatigue": 0.14264058034418597}, {"period": 4, "home_score": 106, "away_score": 122, "score_margin": -16, "cate_score": 0.13676797008312835, "propensity_score": 0.12839420645333366, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1936.2, "away_cum_fatigue": 1746.7666666666669, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1021148996425039, "shap_defensive_collapse": 0.09998902045492411, "shap_explosiveness": 0.09072823475559787, "shap_fatigue": 0.13796954666851724}, {"period": 4, "home_score": 106, "away_score": 122, "score_margin": -16, "cate_score": 0.1548385994073434, "propensity_score": 0.14786607619702638, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1950.2, "away_cum_fatigue": 1760.7666666666669, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10438796597012961, "shap_defensive_collapse": 0.10739129910413715, "shap_explosiveness": 0.11214029218112442, "shap_fatigue": 0.12850677963051674}, {"period": 4, "home_score": 106, "away_score": 122, "score_margin": -16, "cate_score": 0.16416709214932607, "propensity_score": 0.10690413750951407, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1952.2, "away_cum_fatigue": 1762.7666666666669, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11529405880321933, "shap_defensive_collapse": 0.09757938374811227, "shap_explosiveness": 0.1035376329799878, "shap_fatigue": 0.12207027648424522}, {"period": 4, "home_score": 106, "away_score": 122, "score_margin": -16, "cate_score": 0.12301156363204414, "propensity_score": 0.1426140502788648, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1967.2, "away_cum_fatigue": 1777.7666666666669, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.10153661244630567, "shap_defensive_collapse": 0.0916970785851863, "shap_explosiveness": 0.11269072981511072, "shap_fatigue": 0.1161566640094377}, {"period": 4, "home_score": 106, "away_score": 122, "score_margin": -16, "cate_score": 0.15278772604138371, "propensity_score": 0.11889461157767597, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1967.2, "away_cum_fatigue": 1777.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.13252493703837562, "shap_defensive_collapse": 0.08904933621833182, "shap_explosiveness": 0.11163307568746753, "shap_fatigue": 0.11652976036504237}, {"period": 4, "home_score": 108, "away_score": 122, "score_margin": -14, "cate_score": 0.13718428322091794, "propensity_score": 0.112503990888352, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1973.2, "away_cum_fatigue": 1783.7666666666669, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.10718197273152164, "shap_defensive_collapse": 0.10269577101024234, "shap_explosiveness": 0.0918216424924353, "shap_fatigue": 0.12430509728854461}, {"period": 4, "home_score": 108, "away_score": 122, "score_margin": -14, "cate_score": 0.1357685857328808, "propensity_score": 0.11953302692476489, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1973.2, "away_cum_fatigue": 1783.7666666666669, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.11813135276338796, "shap_defensive_collapse": 0.1001723436068489, "shap_explosiveness": 0.12873080474795398, "shap_fatigue": 0.1324382736872664}, {"period": 4, "home_score": 109, "away_score": 122, "score_margin": -13, "cate_score": 0.16500921426343423, "propensity_score": 0.10181149048095443, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1973.2, "away_cum_fatigue": 1783.7666666666669, "play_description": "IND: Draws a shooting foul, converts the free throw.", "shap_stale_lineup": 0.129151815354222, "shap_defensive_collapse": 0.10780904123392827, "shap_explosiveness": 0.10332922716705267, "shap_fatigue": 0.11132207069746669}, {"period": 4, "home_score": 109, "away_score": 124, "score_margin": -15, "cate_score": 0.13702155215580983, "propensity_score": 0.11036800430637606, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1990.2, "away_cum_fatigue": 1800.7666666666669, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.10924591310761633, "shap_defensive_collapse": 0.08239844875288073, "shap_explosiveness": 0.09716238257830227, "shap_fatigue": 0.12535882289192957}, {"period": 4, "home_score": 109, "away_score": 124, "score_margin": -15, "cate_score": 0.16872950613535026, "propensity_score": 0.13720316899034496, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2002.2, "away_cum_fatigue": 1812.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.101247225912811, "shap_defensive_collapse": 0.10011587234811589, "shap_explosiveness": 0.0909323425693761, "shap_fatigue": 0.1282729507571363}, {"period": 4, "home_score": 109, "away_score": 124, "score_margin": -15, "cate_score": 0.15419411567660918, "propensity_score": 0.14064427809259952, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2004.2, "away_cum_fatigue": 1814.7666666666669, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11431809637904619, "shap_defensive_collapse": 0.09828992548303124, "shap_explosiveness": 0.11149461219216236, "shap_fatigue": 0.13402879350383526}, {"period": 4, "home_score": 109, "away_score": 127, "score_margin": -18, "cate_score": 0.1489521615560982, "propensity_score": 0.1421937356850803, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2025.2, "away_cum_fatigue": 1835.7666666666669, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.13091858566693745, "shap_defensive_collapse": 0.11470558809035478, "shap_explosiveness": 0.12721560234253684, "shap_fatigue": 0.14308101299325418}, {"period": 4, "home_score": 109, "away_score": 127, "score_margin": -18, "cate_score": 0.1695152711368693, "propensity_score": 0.12956564444120106, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2028.2, "away_cum_fatigue": 1838.7666666666669, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10557099911433297, "shap_defensive_collapse": 0.09094647581376214, "shap_explosiveness": 0.09956076952508504, "shap_fatigue": 0.12777143900167465}, {"period": 4, "home_score": 109, "away_score": 127, "score_margin": -18, "cate_score": 0.13157468987510734, "propensity_score": 0.13927095585520424, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2028.2, "away_cum_fatigue": 1936.65, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1299384136696936, "shap_defensive_collapse": 0.11857147531323213, "shap_explosiveness": 0.0985680402710272, "shap_fatigue": 0.1334991268046518}, {"period": 4, "home_score": 109, "away_score": 127, "score_margin": -18, "cate_score": 0.12338785630749279, "propensity_score": 0.10720235535655838, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2028.2, "away_cum_fatigue": 1564.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10362541872264713, "shap_defensive_collapse": 0.11000272650528305, "shap_explosiveness": 0.1215538548376276, "shap_fatigue": 0.12719336231237544}, {"period": 4, "home_score": 112, "away_score": 127, "score_margin": -15, "cate_score": 0.1222115875414128, "propensity_score": 0.12091283442027922, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2045.2, "away_cum_fatigue": 1581.7666666666669, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.10856525095959366, "shap_defensive_collapse": 0.0854002787897584, "shap_explosiveness": 0.11360648158448858, "shap_fatigue": 0.12866823607909386}, {"period": 4, "home_score": 112, "away_score": 127, "score_margin": -15, "cate_score": 0.16469503203949912, "propensity_score": 0.10757119484007756, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2071.2, "away_cum_fatigue": 1607.7666666666669, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12552517416748007, "shap_defensive_collapse": 0.08461528405844314, "shap_explosiveness": 0.11852967384898429, "shap_fatigue": 0.14728374882926049}, {"period": 4, "home_score": 112, "away_score": 127, "score_margin": -15, "cate_score": 0.1564115326127507, "propensity_score": 0.11735487768202177, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2073.2, "away_cum_fatigue": 1609.7666666666669, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13030747268983156, "shap_defensive_collapse": 0.09492123754133135, "shap_explosiveness": 0.10916833265338655, "shap_fatigue": 0.11341486462226147}, {"period": 4, "home_score": 112, "away_score": 127, "score_margin": -15, "cate_score": 0.1558419152949714, "propensity_score": 0.12523892897735606, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2080.2, "away_cum_fatigue": 1616.7666666666669, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.11050044058591485, "shap_defensive_collapse": 0.10987466830297309, "shap_explosiveness": 0.09690503960546024, "shap_fatigue": 0.11505743246857826}, {"period": 4, "home_score": 112, "away_score": 127, "score_margin": -15, "cate_score": 0.158659092089557, "propensity_score": 0.1403290316690517, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2080.2, "away_cum_fatigue": 1616.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.13584814735416523, "shap_defensive_collapse": 0.1036890934838238, "shap_explosiveness": 0.09701207176178081, "shap_fatigue": 0.1312634292022195}, {"period": 4, "home_score": 112, "away_score": 127, "score_margin": -15, "cate_score": 0.15785992315690917, "propensity_score": 0.11192106145883164, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2085.2, "away_cum_fatigue": 1621.7666666666669, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12954903168588588, "shap_defensive_collapse": 0.09709638348393466, "shap_explosiveness": 0.09742538075331776, "shap_fatigue": 0.14235403497320423}, {"period": 4, "home_score": 112, "away_score": 127, "score_margin": -15, "cate_score": 0.1237595214698834, "propensity_score": 0.1383891082163492, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2086.2, "away_cum_fatigue": 1622.7666666666669, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1293042436720947, "shap_defensive_collapse": 0.10946457130922939, "shap_explosiveness": 0.1283364068765466, "shap_fatigue": 0.1450857223808764}, {"period": 4, "home_score": 112, "away_score": 127, "score_margin": -15, "cate_score": 0.14117492702229126, "propensity_score": 0.14686643766412139, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2093.2, "away_cum_fatigue": 1629.7666666666669, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13105294511372212, "shap_defensive_collapse": 0.0833812192999421, "shap_explosiveness": 0.11526843818365981, "shap_fatigue": 0.14816264617685582}, {"period": 4, "home_score": 112, "away_score": 127, "score_margin": -15, "cate_score": 0.13951679888791363, "propensity_score": 0.12025348324463579, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2095.2, "away_cum_fatigue": 1631.7666666666669, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.13844739470161974, "shap_defensive_collapse": 0.0859797176216644, "shap_explosiveness": 0.11007482757309503, "shap_fatigue": 0.12630306683013323}, {"period": 4, "home_score": 112, "away_score": 129, "score_margin": -17, "cate_score": 0.14403886122955029, "propensity_score": 0.11438441977907293, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2100.2, "away_cum_fatigue": 1636.7666666666669, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.10271809962475173, "shap_defensive_collapse": 0.081514290646195, "shap_explosiveness": 0.09792664723989303, "shap_fatigue": 0.12042314568209539}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.14908153570849403, "propensity_score": 0.1491938309831202, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2117.2, "away_cum_fatigue": 1653.7666666666669, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.12626172712638034, "shap_defensive_collapse": 0.0950032081284295, "shap_explosiveness": 0.10108655265841121, "shap_fatigue": 0.14932997151906988}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.12216076346598645, "propensity_score": 0.10126701617476061, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2129.2, "away_cum_fatigue": 1665.7666666666669, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13962910653326258, "shap_defensive_collapse": 0.08347907170259693, "shap_explosiveness": 0.11679340637936039, "shap_fatigue": 0.13583145596232826}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.166970754338071, "propensity_score": 0.1274811935417827, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2129.2, "away_cum_fatigue": 1665.7666666666669, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11475408472929713, "shap_defensive_collapse": 0.08506701398749356, "shap_explosiveness": 0.12190351362024174, "shap_fatigue": 0.13698863847217457}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.1497000340972893, "propensity_score": 0.12508906370633863, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2131.2, "away_cum_fatigue": 1667.7666666666669, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10806968429270304, "shap_defensive_collapse": 0.11927622235627089, "shap_explosiveness": 0.1162369849960803, "shap_fatigue": 0.11720129555866046}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.13902954864866182, "propensity_score": 0.11612570648340886, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2135.2, "away_cum_fatigue": 1671.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12219824212603429, "shap_defensive_collapse": 0.10357108054381364, "shap_explosiveness": 0.09656526565941, "shap_fatigue": 0.14870749183705795}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.1697603903044725, "propensity_score": 0.14093271095308355, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2137.2, "away_cum_fatigue": 1673.7666666666669, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12986327306221715, "shap_defensive_collapse": 0.08475425303833874, "shap_explosiveness": 0.11080921194145645, "shap_fatigue": 0.11195616973809788}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.13470879575968508, "propensity_score": 0.12208450919325307, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2145.2, "away_cum_fatigue": 1681.7666666666669, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10210951295493248, "shap_defensive_collapse": 0.11378122058130344, "shap_explosiveness": 0.12585458614649825, "shap_fatigue": 0.12371779625856025}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.132191173380359, "propensity_score": 0.1122827806967709, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2145.2, "away_cum_fatigue": 1524.0, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11495914010711543, "shap_defensive_collapse": 0.09817554404499176, "shap_explosiveness": 0.11745542715972748, "shap_fatigue": 0.1455638675048836}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.1690280995665463, "propensity_score": 0.14348157879000983, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2145.2, "away_cum_fatigue": 1524.0, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12275747500274894, "shap_defensive_collapse": 0.10322169659544864, "shap_explosiveness": 0.12655497988312153, "shap_fatigue": 0.14648112727902346}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.14073520603590448, "propensity_score": 0.12554302883459548, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2145.2, "away_cum_fatigue": 1598.3333333333333, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1131224311248645, "shap_defensive_collapse": 0.09004911132699223, "shap_explosiveness": 0.09294430763484304, "shap_fatigue": 0.12886152295343956}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.15084400331759448, "propensity_score": 0.14149525133653476, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2145.2, "away_cum_fatigue": 1646.25, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.1291495712162437, "shap_defensive_collapse": 0.09249372509752198, "shap_explosiveness": 0.10509574971494788, "shap_fatigue": 0.13900635216478283}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.12059055808389078, "propensity_score": 0.11457838498276869, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2154.2, "away_cum_fatigue": 1655.25, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10382318120723695, "shap_defensive_collapse": 0.0848629652271134, "shap_explosiveness": 0.11681795161725433, "shap_fatigue": 0.14812187038411934}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.1487234010890246, "propensity_score": 0.12118096891393246, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2154.2, "away_cum_fatigue": 1655.25, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13586021272583204, "shap_defensive_collapse": 0.10641580696874113, "shap_explosiveness": 0.12809359733822337, "shap_fatigue": 0.1389891979168484}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.1258010356077718, "propensity_score": 0.14271571311928444, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2155.2, "away_cum_fatigue": 1656.25, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11032188329843463, "shap_defensive_collapse": 0.09814575249619481, "shap_explosiveness": 0.12049018795851699, "shap_fatigue": 0.1251838485528063}, {"period": 4, "home_score": 114, "away_score": 129, "score_margin": -15, "cate_score": 0.13796690051004626, "propensity_score": 0.11618911868991763, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2156.2, "away_cum_fatigue": 1657.25, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.10587620799195083, "shap_defensive_collapse": 0.11026697840933555, "shap_explosiveness": 0.09717423915672697, "shap_fatigue": 0.12502598707074064}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.1348898243442365, "propensity_score": 0.1437732391856461, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2156.2, "away_cum_fatigue": 1657.25, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.13478718756243066, "shap_defensive_collapse": 0.11128207928970826, "shap_explosiveness": 0.11900381997792074, "shap_fatigue": 0.1488204735994993}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.1279874701662998, "propensity_score": 0.11097697428066869, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2156.2, "away_cum_fatigue": 1657.25, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10627123281959219, "shap_defensive_collapse": 0.09741144093019694, "shap_explosiveness": 0.09381534826692833, "shap_fatigue": 0.13321023297179288}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.13752162325832212, "propensity_score": 0.1252552798772148, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2157.2, "away_cum_fatigue": 1658.25, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.13901171609073143, "shap_defensive_collapse": 0.11471885452394084, "shap_explosiveness": 0.10703148074936643, "shap_fatigue": 0.11710373851895259}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.16669953941349092, "propensity_score": 0.1457350039486178, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2167.2, "away_cum_fatigue": 1668.25, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.13339262653233816, "shap_defensive_collapse": 0.0810795897943896, "shap_explosiveness": 0.11581503679510703, "shap_fatigue": 0.1171964446881239}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.15866155105767782, "propensity_score": 0.1261127109866254, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2169.2, "away_cum_fatigue": 1670.25, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11020704925963692, "shap_defensive_collapse": 0.08491733954388334, "shap_explosiveness": 0.09663277183362355, "shap_fatigue": 0.14157882543954747}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.16535970609636824, "propensity_score": 0.11632154326688934, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2186.2, "away_cum_fatigue": 1687.25, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.13349340566886037, "shap_defensive_collapse": 0.1033187928067317, "shap_explosiveness": 0.09430082112393577, "shap_fatigue": 0.13129836544894918}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.12367523816069076, "propensity_score": 0.145903911192585, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2186.2, "away_cum_fatigue": 1687.25, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.1294193934980165, "shap_defensive_collapse": 0.08009739283562901, "shap_explosiveness": 0.12637416827459885, "shap_fatigue": 0.1450158297449855}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.13860038545916137, "propensity_score": 0.14482566447889492, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2197.2, "away_cum_fatigue": 1698.25, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.1275320018638639, "shap_defensive_collapse": 0.09629113273683959, "shap_explosiveness": 0.09978934105026506, "shap_fatigue": 0.14225503368433595}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.13698010716323122, "propensity_score": 0.10520526229531049, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2197.2, "away_cum_fatigue": 1698.25, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.13171097233485957, "shap_defensive_collapse": 0.0834173870414167, "shap_explosiveness": 0.09355162841358688, "shap_fatigue": 0.13782278372155055}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.12658307611308356, "propensity_score": 0.11604536718893044, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2198.2, "away_cum_fatigue": 1699.25, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.1373129287418709, "shap_defensive_collapse": 0.09423414075472196, "shap_explosiveness": 0.09387373977522907, "shap_fatigue": 0.12912383668973554}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.16348535823146843, "propensity_score": 0.14032069422346566, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2198.2, "away_cum_fatigue": 1699.25, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10297931379053414, "shap_defensive_collapse": 0.08403753850733635, "shap_explosiveness": 0.12513371616598368, "shap_fatigue": 0.12761905150925476}, {"period": 4, "home_score": 114, "away_score": 130, "score_margin": -16, "cate_score": 0.12190159809092599, "propensity_score": 0.10973764308268313, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2198.2, "away_cum_fatigue": 1699.25, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10100350726960684, "shap_defensive_collapse": 0.10792584640505369, "shap_explosiveness": 0.10210288248291194, "shap_fatigue": 0.11860924997161905}, {"period": 4, "home_score": 114, "away_score": 131, "score_margin": -17, "cate_score": 0.13004143443229232, "propensity_score": 0.12242039616373916, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2198.2, "away_cum_fatigue": 1699.25, "play_description": "TOR: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.11129361489876245, "shap_defensive_collapse": 0.1025591705765297, "shap_explosiveness": 0.10198740528356172, "shap_fatigue": 0.1339573992273045}, {"period": 4, "home_score": 114, "away_score": 131, "score_margin": -17, "cate_score": 0.14483326044659708, "propensity_score": 0.11363799043233883, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2216.2, "away_cum_fatigue": 1717.25, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12872447460122693, "shap_defensive_collapse": 0.11207499886925164, "shap_explosiveness": 0.10648885339328103, "shap_fatigue": 0.1355959986021052}, {"period": 4, "home_score": 114, "away_score": 131, "score_margin": -17, "cate_score": 0.16775359320970884, "propensity_score": 0.14295165041122104, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2219.2, "away_cum_fatigue": 1720.25, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11522925377280872, "shap_defensive_collapse": 0.10467531885477518, "shap_explosiveness": 0.10417129389932292, "shap_fatigue": 0.1299825151648989}, {"period": 4, "home_score": 114, "away_score": 131, "score_margin": -17, "cate_score": 0.1208568596508423, "propensity_score": 0.14053958440924572, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2229.2, "away_cum_fatigue": 1730.25, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.13108400179105772, "shap_defensive_collapse": 0.10700257250910314, "shap_explosiveness": 0.09735497336376576, "shap_fatigue": 0.14925041158386376}, {"period": 4, "home_score": 114, "away_score": 131, "score_margin": -17, "cate_score": 0.15814298280492442, "propensity_score": 0.14384872804041146, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2232.2, "away_cum_fatigue": 1733.25, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1188523693693421, "shap_defensive_collapse": 0.11028043475268547, "shap_explosiveness": 0.1138566697737299, "shap_fatigue": 0.1313824339123074}, {"period": 4, "home_score": 114, "away_score": 131, "score_margin": -17, "cate_score": 0.1344715348967664, "propensity_score": 0.11416983989095827, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2253.2, "away_cum_fatigue": 1754.25, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1258286123693249, "shap_defensive_collapse": 0.0928189412684659, "shap_explosiveness": 0.12087705758861056, "shap_fatigue": 0.1420256552082521}, {"period": 4, "home_score": 114, "away_score": 131, "score_margin": -17, "cate_score": 0.14812072690917227, "propensity_score": 0.1498112251920199, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2255.2, "away_cum_fatigue": 1756.25, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12185168308720286, "shap_defensive_collapse": 0.1025321990764392, "shap_explosiveness": 0.09473637640348247, "shap_fatigue": 0.14587695677334525}, {"period": 4, "home_score": 114, "away_score": 133, "score_margin": -19, "cate_score": 0.12415273437617458, "propensity_score": 0.1494086186383394, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2262.2, "away_cum_fatigue": 1763.25, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.11602601299524697, "shap_defensive_collapse": 0.08178470753877003, "shap_explosiveness": 0.09153729599998443, "shap_fatigue": 0.12811074797034783}, {"period": 4, "home_score": 114, "away_score": 133, "score_margin": -19, "cate_score": 0.15168860680675345, "propensity_score": 0.12463047100969372, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2274.2, "away_cum_fatigue": 1775.25, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.10568622182317439, "shap_defensive_collapse": 0.09802455666585035, "shap_explosiveness": 0.1268163019057797, "shap_fatigue": 0.11760936883059117}, {"period": 4, "home_score": 114, "away_score": 133, "score_margin": -19, "cate_score": 0.13742902601945392, "propensity_score": 0.12249930513841463, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2276.2, "away_cum_fatigue": 1777.25, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.11709937906859094, "shap_defensive_collapse": 0.09893599022721038, "shap_explosiveness": 0.12203511079893957, "shap_fatigue": 0.13183932358403364}, {"period": 4, "home_score": 114, "away_score": 136, "score_margin": -22, "cate_score": 0.14791044640546425, "propensity_score": 0.1465334619765759, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2286.2, "away_cum_fatigue": 1787.25, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.12649229615116964, "shap_defensive_collapse": 0.10922377353454285, "shap_explosiveness": 0.10625559280005398, "shap_fatigue": 0.14134857718507218}, {"period": 4, "home_score": 114, "away_score": 136, "score_margin": -22, "cate_score": 0.16029791544335284, "propensity_score": 0.14442441879450937, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2300.2, "away_cum_fatigue": 1801.25, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11607034290447145, "shap_defensive_collapse": 0.09744428099850641, "shap_explosiveness": 0.1046847846848266, "shap_fatigue": 0.13753987822242167}, {"period": 4, "home_score": 114, "away_score": 136, "score_margin": -22, "cate_score": 0.16776632177325937, "propensity_score": 0.14979933733516987, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2303.2, "away_cum_fatigue": 1804.25, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1029858123221663, "shap_defensive_collapse": 0.10237714330439321, "shap_explosiveness": 0.12662135630692314, "shap_fatigue": 0.14227425664526766}, {"period": 4, "home_score": 114, "away_score": 139, "score_margin": -25, "cate_score": 0.1511593058500075, "propensity_score": 0.1471302124171185, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2317.2, "away_cum_fatigue": 1818.25, "play_description": "TOR: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.11115693130919509, "shap_defensive_collapse": 0.08547040021315752, "shap_explosiveness": 0.11172190478439324, "shap_fatigue": 0.13014318571663228}, {"period": 4, "home_score": 114, "away_score": 139, "score_margin": -25, "cate_score": 0.12345664262526743, "propensity_score": 0.1117999346921669, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2326.2, "away_cum_fatigue": 1827.25, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13742343322382605, "shap_defensive_collapse": 0.08365196129089719, "shap_explosiveness": 0.12998980033898236, "shap_fatigue": 0.14043090906225228}, {"period": 4, "home_score": 114, "away_score": 139, "score_margin": -25, "cate_score": 0.14088294177388372, "propensity_score": 0.1434380953656607, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2326.2, "away_cum_fatigue": 1827.25, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1267947383804916, "shap_defensive_collapse": 0.08610580189298264, "shap_explosiveness": 0.09939430085452551, "shap_fatigue": 0.11552255631857454}, {"period": 4, "home_score": 114, "away_score": 139, "score_margin": -25, "cate_score": 0.13329417474855718, "propensity_score": 0.10283788335145867, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2327.2, "away_cum_fatigue": 1828.25, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12291991920462919, "shap_defensive_collapse": 0.08086236518500088, "shap_explosiveness": 0.11506299087817914, "shap_fatigue": 0.13218408153890032}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.1589109920691394, "propensity_score": 0.13188759781263712, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2331.2, "away_cum_fatigue": 1832.25, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.10644662513656175, "shap_defensive_collapse": 0.11025903867824115, "shap_explosiveness": 0.09552179001202246, "shap_fatigue": 0.13617044755526853}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.16016476582458483, "propensity_score": 0.14691452091392718, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2331.2, "away_cum_fatigue": 1832.25, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11953023313478511, "shap_defensive_collapse": 0.10972158940905061, "shap_explosiveness": 0.11052389074778382, "shap_fatigue": 0.12874550555545922}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.14997141678102743, "propensity_score": 0.14683284350263281, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2362.325, "away_cum_fatigue": 1832.25, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.10263317609895627, "shap_defensive_collapse": 0.08422245492938048, "shap_explosiveness": 0.09172483447492029, "shap_fatigue": 0.1303988349509115}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.14289961799901463, "propensity_score": 0.14440490678536438, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2339.766666666667, "away_cum_fatigue": 1832.25, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10159888117681357, "shap_defensive_collapse": 0.11160317286392674, "shap_explosiveness": 0.12001734886961349, "shap_fatigue": 0.14924943036982524}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.1277218716414796, "propensity_score": 0.11626628814309256, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2294.65, "away_cum_fatigue": 1832.25, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10217375043539587, "shap_defensive_collapse": 0.1080500082072944, "shap_explosiveness": 0.10937023164080421, "shap_fatigue": 0.14374896521227765}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.13718378258069852, "propensity_score": 0.1458639826154853, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2392.0, "away_cum_fatigue": 1832.25, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12137406715984735, "shap_defensive_collapse": 0.10327483259596461, "shap_explosiveness": 0.10092439889410103, "shap_fatigue": 0.14898318409027245}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.14504900127666945, "propensity_score": 0.13393308787439473, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 1832.25, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.12004069834989263, "shap_defensive_collapse": 0.09119810167388605, "shap_explosiveness": 0.09618887154308614, "shap_fatigue": 0.14755265144227708}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.14837036788651764, "propensity_score": 0.13977956521118606, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 1677.6666666666667, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12147063135967259, "shap_defensive_collapse": 0.08289769221332448, "shap_explosiveness": 0.12514276062842222, "shap_fatigue": 0.1487598447335397}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.12175833056980676, "propensity_score": 0.12106856697240341, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 1677.6666666666667, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.12064430498366926, "shap_defensive_collapse": 0.08382754989698264, "shap_explosiveness": 0.1232014486941887, "shap_fatigue": 0.13446604440110738}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.15285602860634112, "propensity_score": 0.10458700789362965, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 1528.5, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1347074977143842, "shap_defensive_collapse": 0.10965603512704288, "shap_explosiveness": 0.10690242913186929, "shap_fatigue": 0.1183119179453545}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.1348636327859296, "propensity_score": 0.11600336152630433, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 1528.5, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1159042864752432, "shap_defensive_collapse": 0.10757780920597919, "shap_explosiveness": 0.12248536454829703, "shap_fatigue": 0.11368195164548006}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.1497805338226918, "propensity_score": 0.12124226458003082, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 187.5, "away_cum_fatigue": 1528.5, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.13074124865288017, "shap_defensive_collapse": 0.10544031507931473, "shap_explosiveness": 0.12473573722205891, "shap_fatigue": 0.12878868889270298}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.15039051811786264, "propensity_score": 0.14068583704984025, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 173.66666666666666, "away_cum_fatigue": 1528.5, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12173799017622056, "shap_defensive_collapse": 0.10642433082699343, "shap_explosiveness": 0.09441820282105094, "shap_fatigue": 0.1404197299599519}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.1438560090871363, "propensity_score": 0.12249728457779929, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 130.25, "away_cum_fatigue": 1528.5, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11755306402915498, "shap_defensive_collapse": 0.11554371289539885, "shap_explosiveness": 0.12847865105784992, "shap_fatigue": 0.11746069978598508}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.15317401160686675, "propensity_score": 0.12470754480908484, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 104.2, "away_cum_fatigue": 1528.5, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.1163159524323125, "shap_defensive_collapse": 0.09252428682295757, "shap_explosiveness": 0.09698555663647766, "shap_fatigue": 0.11487816934545961}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.14968224116873596, "propensity_score": 0.147244056021633, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 104.2, "away_cum_fatigue": 1212.9, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.12357581533273772, "shap_defensive_collapse": 0.1019712142852573, "shap_explosiveness": 0.09323892567846742, "shap_fatigue": 0.1448067086497659}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.1613752719180066, "propensity_score": 0.14294684024319765, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 104.2, "away_cum_fatigue": 909.675, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11303088757934106, "shap_defensive_collapse": 0.0927428080170341, "shap_explosiveness": 0.1267971778270135, "shap_fatigue": 0.11006686448765313}, {"period": 4, "home_score": 114, "away_score": 141, "score_margin": -27, "cate_score": 0.13669061543419456, "propensity_score": 0.1366418256672467, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 104.2, "away_cum_fatigue": 727.74, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.12605398156988035, "shap_defensive_collapse": 0.09619115459117986, "shap_explosiveness": 0.10073477976779557, "shap_fatigue": 0.1432719146307706}, {"period": 4, "home_score": 116, "away_score": 141, "score_margin": -25, "cate_score": 0.1341549344511818, "propensity_score": 0.13316605594827347, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 123.2, "away_cum_fatigue": 746.74, "play_description": "IND: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.10481509670278318, "shap_defensive_collapse": 0.09274817204800592, "shap_explosiveness": 0.11711619451692795, "shap_fatigue": 0.11818061093380844}, {"period": 4, "home_score": 116, "away_score": 143, "score_margin": -27, "cate_score": 0.13438493448977715, "propensity_score": 0.13686242762680115, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 139.2, "away_cum_fatigue": 762.74, "play_description": "TOR: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.10816112335613859, "shap_defensive_collapse": 0.10666186568199872, "shap_explosiveness": 0.11499656382277411, "shap_fatigue": 0.1360880021351634}, {"period": 4, "home_score": 119, "away_score": 143, "score_margin": -24, "cate_score": 0.14260781670203948, "propensity_score": 0.12773502392390784, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 147.2, "away_cum_fatigue": 770.74, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.13496724717041977, "shap_defensive_collapse": 0.10948367060705207, "shap_explosiveness": 0.0966980494043222, "shap_fatigue": 0.12840033689108094}, {"period": 4, "home_score": 119, "away_score": 143, "score_margin": -24, "cate_score": 0.16527149801891813, "propensity_score": 0.1300325681448169, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 161.0, "away_cum_fatigue": 784.54, "play_description": "Defensive stop! Safe defensive rebound secured by IND.", "shap_stale_lineup": 0.11650200181866359, "shap_defensive_collapse": 0.10104865933529214, "shap_explosiveness": 0.0971663836369136, "shap_fatigue": 0.14305081246975335}, {"period": 4, "home_score": 119, "away_score": 143, "score_margin": -24, "cate_score": 0.13038507392560222, "propensity_score": 0.125898043813953, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 163.3, "away_cum_fatigue": 786.8399999999999, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.13551297409934404, "shap_defensive_collapse": 0.10229406598019555, "shap_explosiveness": 0.11028627863474239, "shap_fatigue": 0.12053651217524461}, {"period": 4, "home_score": 122, "away_score": 143, "score_margin": -21, "cate_score": 0.16851384935616529, "propensity_score": 0.11334792973222338, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 168.2, "away_cum_fatigue": 791.74, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.11252369701882707, "shap_defensive_collapse": 0.11630937762792468, "shap_explosiveness": 0.12221339579555865, "shap_fatigue": 0.13989596206046903}, {"period": 4, "home_score": 122, "away_score": 143, "score_margin": -21, "cate_score": 0.12720774955919706, "propensity_score": 0.10392051497048077, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 181.4, "away_cum_fatigue": 804.94, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.131684018571114, "shap_defensive_collapse": 0.08430771613221891, "shap_explosiveness": 0.10990755838641086, "shap_fatigue": 0.13842962183837626}, {"period": 4, "home_score": 122, "away_score": 143, "score_margin": -21, "cate_score": 0.1453186556413333, "propensity_score": 0.1482991589640509, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 183.0, "away_cum_fatigue": 806.54, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.13954586964400453, "shap_defensive_collapse": 0.11734151426728173, "shap_explosiveness": 0.12097693651358468, "shap_fatigue": 0.11910258738430386}, {"period": 4, "home_score": 125, "away_score": 143, "score_margin": -18, "cate_score": 0.1480179838537314, "propensity_score": 0.12142826482487055, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 191.3, "away_cum_fatigue": 814.8399999999999, "play_description": "IND: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.137726744044306, "shap_defensive_collapse": 0.08937197207329471, "shap_explosiveness": 0.11905312657124931, "shap_fatigue": 0.13550995041108052}, {"period": 4, "home_score": 125, "away_score": 143, "score_margin": -18, "cate_score": 0.12532102332095255, "propensity_score": 0.14354517170663378, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 215.7, "away_cum_fatigue": 839.24, "play_description": "Offensive rebound by TOR, resetting the attack clock.", "shap_stale_lineup": 0.1337321842078285, "shap_defensive_collapse": 0.0881604507832232, "shap_explosiveness": 0.1172088496252105, "shap_fatigue": 0.14969706391179635}, {"period": 4, "home_score": 125, "away_score": 143, "score_margin": -18, "cate_score": 0.12699857584144336, "propensity_score": 0.12543836384176338, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 217.2, "away_cum_fatigue": 840.74, "play_description": "IND swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1298924148132001, "shap_defensive_collapse": 0.1161816457054374, "shap_explosiveness": 0.09476965629482725, "shap_fatigue": 0.14751932894331077}, {"period": 4, "home_score": 125, "away_score": 143, "score_margin": -18, "cate_score": 0.1503457690918594, "propensity_score": 0.11141245516942319, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 217.2, "away_cum_fatigue": 840.74, "play_description": "TOR executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.12104231082372713, "shap_defensive_collapse": 0.10976648242812076, "shap_explosiveness": 0.12490133505853776, "shap_fatigue": 0.14126548099338446}], "game_2": [{"period": 4, "home_score": 85, "away_score": 89, "score_margin": -4, "cate_score": 0.11121030899948134, "propensity_score": 0.14893781039912904, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1783.25, "away_cum_fatigue": 1594.66, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.09414111442052092, "shap_defensive_collapse": 0.072512953453415, "shap_explosiveness": 0.080085775990447, "shap_fatigue": 0.11433332001078846}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.11320271554976924, "propensity_score": 0.1280319157123013, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1737.0, "away_cum_fatigue": 1594.66, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.09807958664223415, "shap_defensive_collapse": 0.09512492334191017, "shap_explosiveness": 0.09636816766797182, "shap_fatigue": 0.11067093777881201}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.14886805764064412, "propensity_score": 0.1483358109868822, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1644.5, "away_cum_fatigue": 1594.66, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.09525450893004454, "shap_defensive_collapse": 0.08541045532640247, "shap_explosiveness": 0.09792995497167373, "shap_fatigue": 0.11384416531540578}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.14964686833165708, "propensity_score": 0.1285023787281964, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1644.5, "away_cum_fatigue": 1545.825, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10925945329321039, "shap_defensive_collapse": 0.08752892702192985, "shap_explosiveness": 0.08940430133792404, "shap_fatigue": 0.10115303620603025}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.14974960509669222, "propensity_score": 0.12029530945453079, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1644.5, "away_cum_fatigue": 1545.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11512167532099997, "shap_defensive_collapse": 0.08451514782353964, "shap_explosiveness": 0.09376140157122204, "shap_fatigue": 0.11714991900119208}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.12857377689854682, "propensity_score": 0.137872806337216, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1175.6666666666667, "away_cum_fatigue": 1545.825, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.09094046623808957, "shap_defensive_collapse": 0.09917083756407166, "shap_explosiveness": 0.10584615966908587, "shap_fatigue": 0.12017578334597606}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.1299803499592749, "propensity_score": 0.12359160123473116, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 941.25, "away_cum_fatigue": 1545.825, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.0918462128428908, "shap_defensive_collapse": 0.0835758415884686, "shap_explosiveness": 0.09125379517555648, "shap_fatigue": 0.1049442408814056}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.10571625396231445, "propensity_score": 0.13281420864619273, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 941.25, "away_cum_fatigue": 1545.825, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11952562113591593, "shap_defensive_collapse": 0.0872573574038627, "shap_explosiveness": 0.10035226284142344, "shap_fatigue": 0.10404475029455815}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.14050118658993502, "propensity_score": 0.16576132588136605, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 941.25, "away_cum_fatigue": 1545.825, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.09424189796279686, "shap_defensive_collapse": 0.08959074902157506, "shap_explosiveness": 0.10340475863612072, "shap_fatigue": 0.11717404416614784}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.11159320525591845, "propensity_score": 0.15983433666045954, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 941.25, "away_cum_fatigue": 1545.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11609594414708135, "shap_defensive_collapse": 0.08161137702172383, "shap_explosiveness": 0.08218865463345701, "shap_fatigue": 0.10373776449066367}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.14955217735756485, "propensity_score": 0.14663983787602736, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 941.25, "away_cum_fatigue": 1545.825, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.11864785707313504, "shap_defensive_collapse": 0.0721731483267516, "shap_explosiveness": 0.1027197820683327, "shap_fatigue": 0.1051953939445329}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.1276316061513935, "propensity_score": 0.1404387066035102, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 957.25, "away_cum_fatigue": 1561.825, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.09029759002864392, "shap_defensive_collapse": 0.08050836786299356, "shap_explosiveness": 0.08206690427686994, "shap_fatigue": 0.11671776504305323}, {"period": 4, "home_score": 88, "away_score": 89, "score_margin": -1, "cate_score": 0.12193841460950515, "propensity_score": 0.150910614702011, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 958.25, "away_cum_fatigue": 1562.825, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.0919395310100153, "shap_defensive_collapse": 0.08506206273457062, "shap_explosiveness": 0.10010964399048852, "shap_fatigue": 0.12470964947061824}, {"period": 4, "home_score": 88, "away_score": 91, "score_margin": -3, "cate_score": 0.1043496596701543, "propensity_score": 0.169521344987955, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 965.25, "away_cum_fatigue": 1569.825, "play_description": "MIA: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.09987033061333377, "shap_defensive_collapse": 0.0709221014739514, "shap_explosiveness": 0.10191982227685828, "shap_fatigue": 0.10906923383345199}, {"period": 4, "home_score": 88, "away_score": 91, "score_margin": -3, "cate_score": 0.12191814225549441, "propensity_score": 0.1387294445148238, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 965.25, "away_cum_fatigue": 1569.825, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.1063676500068994, "shap_defensive_collapse": 0.08290560042952841, "shap_explosiveness": 0.0861592764793691, "shap_fatigue": 0.10512895933258692}, {"period": 4, "home_score": 88, "away_score": 92, "score_margin": -4, "cate_score": 0.1436422122555301, "propensity_score": 0.1337612176840036, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 965.25, "away_cum_fatigue": 1569.825, "play_description": "MIA: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.09827616192801569, "shap_defensive_collapse": 0.09810735476371543, "shap_explosiveness": 0.10876281566407041, "shap_fatigue": 0.12792331881446248}, {"period": 4, "home_score": 88, "away_score": 92, "score_margin": -4, "cate_score": 0.12056112248082274, "propensity_score": 0.15974882616569647, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 978.25, "away_cum_fatigue": 1582.825, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.10197967626694866, "shap_defensive_collapse": 0.07897255724256577, "shap_explosiveness": 0.09280981733467848, "shap_fatigue": 0.10149802089392133}, {"period": 4, "home_score": 88, "away_score": 92, "score_margin": -4, "cate_score": 0.1371632622524404, "propensity_score": 0.14367800286423593, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 980.25, "away_cum_fatigue": 1584.825, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11567093850661604, "shap_defensive_collapse": 0.0875417983101977, "shap_explosiveness": 0.1006152751483805, "shap_fatigue": 0.11219097112327847}, {"period": 4, "home_score": 88, "away_score": 94, "score_margin": -6, "cate_score": 0.11091726486459863, "propensity_score": 0.15574959410671627, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 987.25, "away_cum_fatigue": 1591.825, "play_description": "MIA: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.10743454426641816, "shap_defensive_collapse": 0.08758852322643948, "shap_explosiveness": 0.09627737324649836, "shap_fatigue": 0.12198569774077464}, {"period": 4, "home_score": 88, "away_score": 94, "score_margin": -6, "cate_score": 0.14355645315948454, "propensity_score": 0.16103957881200603, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1001.25, "away_cum_fatigue": 1605.825, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.09713151057857763, "shap_defensive_collapse": 0.09706348412025707, "shap_explosiveness": 0.08071559305196051, "shap_fatigue": 0.122432125163654}, {"period": 4, "home_score": 88, "away_score": 94, "score_margin": -6, "cate_score": 0.12763084692290183, "propensity_score": 0.16663031860363658, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1001.25, "away_cum_fatigue": 1605.825, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.10346266884027873, "shap_defensive_collapse": 0.07323558670549223, "shap_explosiveness": 0.10551137790626874, "shap_fatigue": 0.1025081944469594}, {"period": 4, "home_score": 88, "away_score": 94, "score_margin": -6, "cate_score": 0.10968414991181753, "propensity_score": 0.1514842918301438, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1017.25, "away_cum_fatigue": 1621.825, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.1001779714245995, "shap_defensive_collapse": 0.07530445687163088, "shap_explosiveness": 0.08002171706272256, "shap_fatigue": 0.11368685734087627}, {"period": 4, "home_score": 88, "away_score": 94, "score_margin": -6, "cate_score": 0.12158939931943169, "propensity_score": 0.12924953752974644, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1019.25, "away_cum_fatigue": 1623.825, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1173707499386132, "shap_defensive_collapse": 0.09179162812214649, "shap_explosiveness": 0.08122740441866888, "shap_fatigue": 0.10742172333459275}, {"period": 4, "home_score": 91, "away_score": 94, "score_margin": -3, "cate_score": 0.13772040413666936, "propensity_score": 0.16423176090902072, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1027.25, "away_cum_fatigue": 1631.825, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.11726032481100926, "shap_defensive_collapse": 0.09491456096789913, "shap_explosiveness": 0.10634701498719443, "shap_fatigue": 0.12904427807024532}, {"period": 4, "home_score": 91, "away_score": 94, "score_margin": -3, "cate_score": 0.12323105048783471, "propensity_score": 0.1525889526320815, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1040.25, "away_cum_fatigue": 1644.825, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.09118334444807193, "shap_defensive_collapse": 0.07894282077207526, "shap_explosiveness": 0.10146673763042706, "shap_fatigue": 0.12612870915613142}, {"period": 4, "home_score": 91, "away_score": 95, "score_margin": -4, "cate_score": 0.1141606583167884, "propensity_score": 0.16461040761453288, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1040.25, "away_cum_fatigue": 1644.825, "play_description": "MIA: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.10333796694910452, "shap_defensive_collapse": 0.09307671449393026, "shap_explosiveness": 0.109751584936261, "shap_fatigue": 0.11256123463897742}, {"period": 4, "home_score": 91, "away_score": 98, "score_margin": -7, "cate_score": 0.14411042117451062, "propensity_score": 0.15726005074943616, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 790.9, "away_cum_fatigue": 1644.825, "play_description": "MIA: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.1068696634034384, "shap_defensive_collapse": 0.07219133373045607, "shap_explosiveness": 0.08100978254210917, "shap_fatigue": 0.10835013266029177}, {"period": 4, "home_score": 91, "away_score": 101, "score_margin": -10, "cate_score": 0.11718934119692458, "propensity_score": 0.16308887740770567, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1017.85, "away_cum_fatigue": 1644.825, "play_description": "MIA: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.09780402997862872, "shap_defensive_collapse": 0.07791782134088143, "shap_explosiveness": 0.10903365871486742, "shap_fatigue": 0.11310995127333995}, {"period": 4, "home_score": 91, "away_score": 101, "score_margin": -10, "cate_score": 0.1458717180515709, "propensity_score": 0.13068151874963377, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1319.2333333333331, "away_cum_fatigue": 1644.825, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.09133850483572192, "shap_defensive_collapse": 0.07384605584533396, "shap_explosiveness": 0.10229788844918106, "shap_fatigue": 0.12370348399482474}, {"period": 4, "home_score": 91, "away_score": 101, "score_margin": -10, "cate_score": 0.1403207280148009, "propensity_score": 0.1326157046050346, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1469.925, "away_cum_fatigue": 1644.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11076425704394008, "shap_defensive_collapse": 0.09700128794252276, "shap_explosiveness": 0.10230132757226301, "shap_fatigue": 0.10502430933993231}, {"period": 4, "home_score": 91, "away_score": 102, "score_margin": -11, "cate_score": 0.1193323657810566, "propensity_score": 0.138300507537156, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1469.925, "away_cum_fatigue": 1644.825, "play_description": "MIA: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.1021254358434266, "shap_defensive_collapse": 0.07110344797417384, "shap_explosiveness": 0.08689117483030535, "shap_fatigue": 0.10513498140879073}, {"period": 4, "home_score": 91, "away_score": 102, "score_margin": -11, "cate_score": 0.10844675885469467, "propensity_score": 0.13480504409178656, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1485.925, "away_cum_fatigue": 1660.825, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.11460423198705948, "shap_defensive_collapse": 0.0885956419461438, "shap_explosiveness": 0.10529280602369981, "shap_fatigue": 0.12144545636516245}, {"period": 4, "home_score": 91, "away_score": 102, "score_margin": -11, "cate_score": 0.10884407338288322, "propensity_score": 0.1399481763917223, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1497.925, "away_cum_fatigue": 1672.825, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11643810647623004, "shap_defensive_collapse": 0.0800089315913963, "shap_explosiveness": 0.08633005431230609, "shap_fatigue": 0.10360285627812338}, {"period": 4, "home_score": 91, "away_score": 102, "score_margin": -11, "cate_score": 0.1014075109674263, "propensity_score": 0.12528551373320135, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1498.925, "away_cum_fatigue": 1673.825, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.09178325664355887, "shap_defensive_collapse": 0.09605980593144696, "shap_explosiveness": 0.0927054301108628, "shap_fatigue": 0.12020700384775417}, {"period": 4, "home_score": 91, "away_score": 102, "score_margin": -11, "cate_score": 0.10188773637844724, "propensity_score": 0.15448273830678197, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1503.925, "away_cum_fatigue": 1678.825, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.10013639500142098, "shap_defensive_collapse": 0.08741241065869743, "shap_explosiveness": 0.08445662512350212, "shap_fatigue": 0.10137121774659588}, {"period": 4, "home_score": 91, "away_score": 102, "score_margin": -11, "cate_score": 0.11617776371774435, "propensity_score": 0.85, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1503.925, "away_cum_fatigue": 1678.825, "play_description": "Propensity Alarm: Coach model strongly suggests timeout", "shap_stale_lineup": 0.10626515525303319, "shap_defensive_collapse": 0.09126578973305449, "shap_explosiveness": 0.08195264268575735, "shap_fatigue": 0.10176475570609275}, {"period": 4, "home_score": 91, "away_score": 104, "score_margin": -13, "cate_score": 0.94, "propensity_score": 0.16638423603506744, "timeout_team": "NONE", "target_stop_run_90s": 1, "timeout_strategic_weight": 0, "home_cum_fatigue": 1505.925, "away_cum_fatigue": 1680.825, "play_description": "CRITICAL ALARM: Opponent scoring run detected. Timeout highly recommended!", "shap_stale_lineup": 0.78, "shap_defensive_collapse": 0.84, "shap_explosiveness": 0.75, "shap_fatigue": 0.4}, {"period": 4, "home_score": 91, "away_score": 106, "score_margin": -15, "cate_score": 0.12647927913335044, "propensity_score": 0.12750411406092999, "timeout_team": "BOSTON", "target_stop_run_90s": 0, "timeout_strategic_weight": 1, "home_cum_fatigue": 1505.925, "away_cum_fatigue": 1680.825, "play_description": "TIMEOUT: Boston requests Timeout (Strategic weight = 1)", "shap_stale_lineup": 0.09620528024683535, "shap_defensive_collapse": 0.09428975344254767, "shap_explosiveness": 0.09605679478333261, "shap_fatigue": 0.12279350780171229}, {"period": 4, "home_score": 91, "away_score": 106, "score_margin": -15, "cate_score": 0.12045954173406213, "propensity_score": 0.1292923053518476, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1507.925, "away_cum_fatigue": 1682.825, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.09499768643199495, "shap_defensive_collapse": 0.08995531937388224, "shap_explosiveness": 0.09776185364451805, "shap_fatigue": 0.12500921507671844}, {"period": 4, "home_score": 91, "away_score": 106, "score_margin": -15, "cate_score": 0.10372380526468783, "propensity_score": 0.13422157350594405, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1885.5666666666664, "away_cum_fatigue": 1682.825, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11063796661159835, "shap_defensive_collapse": 0.08172909572323331, "shap_explosiveness": 0.08867318086397952, "shap_fatigue": 0.12072176386614021}, {"period": 4, "home_score": 94, "away_score": 106, "score_margin": -12, "cate_score": 0.12480081739465654, "propensity_score": 0.15187797309019208, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1894.675, "away_cum_fatigue": 1682.825, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.09709064016513085, "shap_defensive_collapse": 0.0789700918800567, "shap_explosiveness": 0.10060357426190338, "shap_fatigue": 0.12415095884073353}, {"period": 4, "home_score": 99, "away_score": 106, "score_margin": -7, "cate_score": 0.13274854466023409, "propensity_score": 0.15854159140884863, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1901.675, "away_cum_fatigue": 1689.825, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.11062318680898081, "shap_defensive_collapse": 0.08661629662532722, "shap_explosiveness": 0.10073148599900636, "shap_fatigue": 0.11088720877399705}, {"period": 4, "home_score": 99, "away_score": 109, "score_margin": -10, "cate_score": 0.11799216040578148, "propensity_score": 0.16414299538966573, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1913.675, "away_cum_fatigue": 1701.825, "play_description": "MIA: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.10363600347608962, "shap_defensive_collapse": 0.08517023274551015, "shap_explosiveness": 0.08672270194636945, "shap_fatigue": 0.11094348247399516}, {"period": 4, "home_score": 99, "away_score": 109, "score_margin": -10, "cate_score": 0.1101954995190694, "propensity_score": 0.16257699918900848, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1925.675, "away_cum_fatigue": 1713.825, "play_description": "Normal possession trade", "shap_stale_lineup": 0.11714089629748886, "shap_defensive_collapse": 0.0939376070898224, "shap_explosiveness": 0.09385113088535245, "shap_fatigue": 0.11217329849434253}, {"period": 4, "home_score": 99, "away_score": 109, "score_margin": -10, "cate_score": 0.13961004321761408, "propensity_score": 0.13563649185786553, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1925.675, "away_cum_fatigue": 1702.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.1109912421677543, "shap_defensive_collapse": 0.0737384924429785, "shap_explosiveness": 0.0822813581303656, "shap_fatigue": 0.11824913411673152}, {"period": 4, "home_score": 102, "away_score": 109, "score_margin": -7, "cate_score": 0.1331394476460958, "propensity_score": 0.14651469119232377, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1925.675, "away_cum_fatigue": 1702.7666666666669, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.10902033843830024, "shap_defensive_collapse": 0.09027860629417084, "shap_explosiveness": 0.09526267711480517, "shap_fatigue": 0.11452048531015466}, {"period": 4, "home_score": 105, "away_score": 109, "score_margin": -4, "cate_score": 0.14428392964301887, "propensity_score": 0.12578343362176375, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1936.675, "away_cum_fatigue": 1713.7666666666669, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.09463422848504871, "shap_defensive_collapse": 0.07421929516972602, "shap_explosiveness": 0.0828301958852546, "shap_fatigue": 0.10206481594071874}, {"period": 4, "home_score": 108, "away_score": 109, "score_margin": -1, "cate_score": 0.14158745528108055, "propensity_score": 0.13372127419042049, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1938.675, "away_cum_fatigue": 1715.7666666666669, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.10906539331499768, "shap_defensive_collapse": 0.07040761862836366, "shap_explosiveness": 0.08463277625320416, "shap_fatigue": 0.12481576473304516}, {"period": 4, "home_score": 111, "away_score": 109, "score_margin": 2, "cate_score": 0.14526934674646103, "propensity_score": 0.15347020273262996, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1951.675, "away_cum_fatigue": 1728.7666666666669, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.11858367325612379, "shap_defensive_collapse": 0.08162510402562467, "shap_explosiveness": 0.10467656738149833, "shap_fatigue": 0.11399743449800517}, {"period": 4, "home_score": 114, "away_score": 109, "score_margin": 5, "cate_score": 0.12754849342343766, "propensity_score": 0.13689961441658385, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1954.675, "away_cum_fatigue": 1731.7666666666669, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.11926313276054518, "shap_defensive_collapse": 0.09018115993028114, "shap_explosiveness": 0.09462459502131687, "shap_fatigue": 0.10507931842720238}, {"period": 4, "home_score": 116, "away_score": 109, "score_margin": 7, "cate_score": 0.11156297478792598, "propensity_score": 0.13302361124379988, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1955.675, "away_cum_fatigue": 1732.7666666666669, "play_description": "BOS: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.09451028525796852, "shap_defensive_collapse": 0.08985760457916961, "shap_explosiveness": 0.08386512306663456, "shap_fatigue": 0.12482264156065793}, {"period": 4, "home_score": 116, "away_score": 109, "score_margin": 7, "cate_score": 0.14729039824783643, "propensity_score": 0.12977745440618907, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1955.675, "away_cum_fatigue": 1732.7666666666669, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.11026885905599311, "shap_defensive_collapse": 0.09107082297718122, "shap_explosiveness": 0.10587645689827883, "shap_fatigue": 0.11447775581981032}, {"period": 4, "home_score": 116, "away_score": 109, "score_margin": 7, "cate_score": 0.11378000304436123, "propensity_score": 0.12935274282972037, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1922.2, "away_cum_fatigue": 1732.7666666666669, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.0934598457015004, "shap_defensive_collapse": 0.07057781031113416, "shap_explosiveness": 0.08486525164798633, "shap_fatigue": 0.12969407009541895}, {"period": 4, "home_score": 116, "away_score": 109, "score_margin": 7, "cate_score": 0.11707705418517572, "propensity_score": 0.12484499911242067, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1934.2, "away_cum_fatigue": 1744.7666666666669, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.1096646338120965, "shap_defensive_collapse": 0.07903737973866024, "shap_explosiveness": 0.10358497248809752, "shap_fatigue": 0.11831852451624256}, {"period": 4, "home_score": 116, "away_score": 110, "score_margin": 6, "cate_score": 0.11389318023204811, "propensity_score": 0.14005279263825626, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1934.2, "away_cum_fatigue": 1744.7666666666669, "play_description": "MIA: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.1178420221392004, "shap_defensive_collapse": 0.08552833616523398, "shap_explosiveness": 0.106213172111997, "shap_fatigue": 0.11648765122680001}, {"period": 4, "home_score": 116, "away_score": 110, "score_margin": 6, "cate_score": 0.1437158178202177, "propensity_score": 0.13261099718875535, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1934.2, "away_cum_fatigue": 1744.7666666666669, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.11508280183476358, "shap_defensive_collapse": 0.07072565257221655, "shap_explosiveness": 0.08430730856164924, "shap_fatigue": 0.10698784976458106}, {"period": 4, "home_score": 116, "away_score": 110, "score_margin": 6, "cate_score": 0.11437062693830961, "propensity_score": 0.13630653775131535, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1935.2, "away_cum_fatigue": 1745.7666666666669, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.09910882147419003, "shap_defensive_collapse": 0.07602051224591175, "shap_explosiveness": 0.09288726260490918, "shap_fatigue": 0.1277613576393402}, {"period": 4, "home_score": 116, "away_score": 110, "score_margin": 6, "cate_score": 0.10288574323565199, "propensity_score": 0.12761997885147316, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1935.2, "away_cum_fatigue": 1745.7666666666669, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.09767003698714817, "shap_defensive_collapse": 0.08862965072795348, "shap_explosiveness": 0.1086897852656957, "shap_fatigue": 0.10882082685917177}, {"period": 4, "home_score": 116, "away_score": 110, "score_margin": 6, "cate_score": 0.10875680508592422, "propensity_score": 0.13252072912609605, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1936.2, "away_cum_fatigue": 1746.7666666666669, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10129227122227072, "shap_defensive_collapse": 0.08994875925253644, "shap_explosiveness": 0.10736201468129133, "shap_fatigue": 0.1081862190661897}, {"period": 4, "home_score": 116, "away_score": 110, "score_margin": 6, "cate_score": 0.11526194607886324, "propensity_score": 0.16923597721332462, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1950.2, "away_cum_fatigue": 1760.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11892015960764192, "shap_defensive_collapse": 0.09556649303177926, "shap_explosiveness": 0.08736313353832569, "shap_fatigue": 0.1171154030274595}, {"period": 4, "home_score": 116, "away_score": 110, "score_margin": 6, "cate_score": 0.14475194910162803, "propensity_score": 0.15173092474912225, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1952.2, "away_cum_fatigue": 1762.7666666666669, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.09640955713558413, "shap_defensive_collapse": 0.0760661122094511, "shap_explosiveness": 0.08610929713575302, "shap_fatigue": 0.10826730850961966}, {"period": 4, "home_score": 116, "away_score": 110, "score_margin": 6, "cate_score": 0.11097663986700444, "propensity_score": 0.12362890253360002, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1967.2, "away_cum_fatigue": 1777.7666666666669, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.11461964134897099, "shap_defensive_collapse": 0.07139663476456773, "shap_explosiveness": 0.10432544884941487, "shap_fatigue": 0.1170979000091864}, {"period": 4, "home_score": 116, "away_score": 110, "score_margin": 6, "cate_score": 0.1079209799913699, "propensity_score": 0.1253092334120857, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1967.2, "away_cum_fatigue": 1777.7666666666669, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10097377855893079, "shap_defensive_collapse": 0.07355145061067876, "shap_explosiveness": 0.08149796779838771, "shap_fatigue": 0.10298346150712548}, {"period": 4, "home_score": 118, "away_score": 110, "score_margin": 8, "cate_score": 0.12344426397410041, "propensity_score": 0.15614223371168331, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1973.2, "away_cum_fatigue": 1783.7666666666669, "play_description": "BOS: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.10869484011132338, "shap_defensive_collapse": 0.08076842203793236, "shap_explosiveness": 0.08395791939018526, "shap_fatigue": 0.10660500487196208}, {"period": 4, "home_score": 118, "away_score": 110, "score_margin": 8, "cate_score": 0.1445251980171539, "propensity_score": 0.15891083089189872, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1973.2, "away_cum_fatigue": 1783.7666666666669, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.09037255391670575, "shap_defensive_collapse": 0.08966642435047545, "shap_explosiveness": 0.08068715623471738, "shap_fatigue": 0.10718365907664097}, {"period": 4, "home_score": 119, "away_score": 110, "score_margin": 9, "cate_score": 0.1377934703352277, "propensity_score": 0.1426180018647341, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1973.2, "away_cum_fatigue": 1783.7666666666669, "play_description": "BOS: Draws a shooting foul, converts the free throw.", "shap_stale_lineup": 0.0963004753811697, "shap_defensive_collapse": 0.08301494273157436, "shap_explosiveness": 0.08070145656320035, "shap_fatigue": 0.10692263860432806}, {"period": 4, "home_score": 119, "away_score": 112, "score_margin": 7, "cate_score": 0.13990395164225686, "propensity_score": 0.13183904009501404, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 1990.2, "away_cum_fatigue": 1800.7666666666669, "play_description": "MIA: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.09407744335787872, "shap_defensive_collapse": 0.08434905134758544, "shap_explosiveness": 0.10801030622583405, "shap_fatigue": 0.10421446986133777}, {"period": 4, "home_score": 119, "away_score": 112, "score_margin": 7, "cate_score": 0.13934434723677963, "propensity_score": 0.16390787210835078, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2002.2, "away_cum_fatigue": 1812.7666666666669, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.1040434922361188, "shap_defensive_collapse": 0.07186696605527962, "shap_explosiveness": 0.08024455668192491, "shap_fatigue": 0.12001635057167023}, {"period": 4, "home_score": 119, "away_score": 112, "score_margin": 7, "cate_score": 0.12201023596347142, "propensity_score": 0.14451567896373885, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2004.2, "away_cum_fatigue": 1814.7666666666669, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.09047021736207238, "shap_defensive_collapse": 0.09515242084768225, "shap_explosiveness": 0.08556272032509307, "shap_fatigue": 0.12718450232200135}, {"period": 4, "home_score": 119, "away_score": 115, "score_margin": 4, "cate_score": 0.13074892508912056, "propensity_score": 0.1534097819657743, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2025.2, "away_cum_fatigue": 1835.7666666666669, "play_description": "MIA: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.09965489453177152, "shap_defensive_collapse": 0.07436058359129741, "shap_explosiveness": 0.098240055528245, "shap_fatigue": 0.1156611671214132}, {"period": 4, "home_score": 119, "away_score": 115, "score_margin": 4, "cate_score": 0.14231605732794267, "propensity_score": 0.15423606075467808, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2028.2, "away_cum_fatigue": 1838.7666666666669, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.11377429405630107, "shap_defensive_collapse": 0.08652618083837256, "shap_explosiveness": 0.09907133016218521, "shap_fatigue": 0.12853162990603365}, {"period": 4, "home_score": 119, "away_score": 115, "score_margin": 4, "cate_score": 0.1205291562320081, "propensity_score": 0.13495059049317185, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2028.2, "away_cum_fatigue": 1936.65, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.10662156088125818, "shap_defensive_collapse": 0.09605916409784857, "shap_explosiveness": 0.09044370469578264, "shap_fatigue": 0.12492632951702394}, {"period": 4, "home_score": 119, "away_score": 115, "score_margin": 4, "cate_score": 0.10897439128852271, "propensity_score": 0.13887306469361796, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2028.2, "away_cum_fatigue": 1564.7666666666669, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11664491333727454, "shap_defensive_collapse": 0.0978733863221326, "shap_explosiveness": 0.08580720303970182, "shap_fatigue": 0.12344049383289506}, {"period": 4, "home_score": 122, "away_score": 115, "score_margin": 7, "cate_score": 0.12392049726701622, "propensity_score": 0.12181832305856066, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2045.2, "away_cum_fatigue": 1581.7666666666669, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.10703364617885097, "shap_defensive_collapse": 0.08229722880274926, "shap_explosiveness": 0.08657955170296698, "shap_fatigue": 0.10165205981471377}, {"period": 4, "home_score": 122, "away_score": 115, "score_margin": 7, "cate_score": 0.13929024383723548, "propensity_score": 0.1355242264712069, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2071.2, "away_cum_fatigue": 1607.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11803470239020024, "shap_defensive_collapse": 0.08119783232301811, "shap_explosiveness": 0.10057351209985302, "shap_fatigue": 0.12279404595015775}, {"period": 4, "home_score": 122, "away_score": 115, "score_margin": 7, "cate_score": 0.12987182764964633, "propensity_score": 0.13433954463631456, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2073.2, "away_cum_fatigue": 1609.7666666666669, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.09728134313333918, "shap_defensive_collapse": 0.07419824268130941, "shap_explosiveness": 0.09075775643405644, "shap_fatigue": 0.11818486131210047}, {"period": 4, "home_score": 122, "away_score": 115, "score_margin": 7, "cate_score": 0.11866710415995659, "propensity_score": 0.137950865164213, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2080.2, "away_cum_fatigue": 1616.7666666666669, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.10882408240307624, "shap_defensive_collapse": 0.07014078477440824, "shap_explosiveness": 0.08962598477679672, "shap_fatigue": 0.11064576260846104}, {"period": 4, "home_score": 122, "away_score": 115, "score_margin": 7, "cate_score": 0.11310741593585615, "propensity_score": 0.1611418486456514, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2080.2, "away_cum_fatigue": 1616.7666666666669, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11845266015381552, "shap_defensive_collapse": 0.09103033113501842, "shap_explosiveness": 0.10282953454771482, "shap_fatigue": 0.11796074168225201}, {"period": 4, "home_score": 122, "away_score": 115, "score_margin": 7, "cate_score": 0.1148382477933594, "propensity_score": 0.16002344334732332, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2085.2, "away_cum_fatigue": 1621.7666666666669, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10700664856880543, "shap_defensive_collapse": 0.0877862219446491, "shap_explosiveness": 0.09933534770698474, "shap_fatigue": 0.11303291083998163}, {"period": 4, "home_score": 122, "away_score": 115, "score_margin": 7, "cate_score": 0.12094083260237179, "propensity_score": 0.12072794165432728, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2086.2, "away_cum_fatigue": 1622.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11675192823948885, "shap_defensive_collapse": 0.09677833479447222, "shap_explosiveness": 0.0899058306368864, "shap_fatigue": 0.11342898201581945}, {"period": 4, "home_score": 122, "away_score": 115, "score_margin": 7, "cate_score": 0.14356973288585032, "propensity_score": 0.1600410451979821, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2093.2, "away_cum_fatigue": 1629.7666666666669, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.09157725579338569, "shap_defensive_collapse": 0.08514777322635811, "shap_explosiveness": 0.0833562447426316, "shap_fatigue": 0.12506537106975818}, {"period": 4, "home_score": 122, "away_score": 115, "score_margin": 7, "cate_score": 0.12202878442499063, "propensity_score": 0.13470496354479974, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2095.2, "away_cum_fatigue": 1631.7666666666669, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.09034607062096629, "shap_defensive_collapse": 0.07627698386046484, "shap_explosiveness": 0.08272997655456288, "shap_fatigue": 0.11240864125119313}, {"period": 4, "home_score": 122, "away_score": 117, "score_margin": 5, "cate_score": 0.1424199087310737, "propensity_score": 0.13552881061583746, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2100.2, "away_cum_fatigue": 1636.7666666666669, "play_description": "MIA: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.09028033383439596, "shap_defensive_collapse": 0.09248881973676984, "shap_explosiveness": 0.08104380705845318, "shap_fatigue": 0.10780846740040946}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.12432862003579492, "propensity_score": 0.15731706629723327, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2117.2, "away_cum_fatigue": 1653.7666666666669, "play_description": "BOS: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.10574353974118023, "shap_defensive_collapse": 0.09816928939503791, "shap_explosiveness": 0.09785934751156607, "shap_fatigue": 0.11681733737235442}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.112298450751557, "propensity_score": 0.13247608735811864, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2129.2, "away_cum_fatigue": 1665.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.09694887370300517, "shap_defensive_collapse": 0.07722373633552532, "shap_explosiveness": 0.08096434850228516, "shap_fatigue": 0.1043377069690825}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.14644331808220107, "propensity_score": 0.1620048160106788, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2129.2, "away_cum_fatigue": 1665.7666666666669, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.10842703798264196, "shap_defensive_collapse": 0.08730697041222515, "shap_explosiveness": 0.08307272249544978, "shap_fatigue": 0.1257685142564527}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.13694233712601467, "propensity_score": 0.1265747530127339, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2131.2, "away_cum_fatigue": 1667.7666666666669, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.10177422300315678, "shap_defensive_collapse": 0.09237561122383958, "shap_explosiveness": 0.08759845997030931, "shap_fatigue": 0.10950128514155852}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.14942573823388472, "propensity_score": 0.14708081208456222, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2135.2, "away_cum_fatigue": 1671.7666666666669, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10654416387282228, "shap_defensive_collapse": 0.08463474397345763, "shap_explosiveness": 0.08983970778828974, "shap_fatigue": 0.10828996159514212}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.11321763867387089, "propensity_score": 0.13758042943032653, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2137.2, "away_cum_fatigue": 1673.7666666666669, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11844003574415568, "shap_defensive_collapse": 0.09255414626299507, "shap_explosiveness": 0.09669937955957991, "shap_fatigue": 0.1104133612577689}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.14404473037780413, "propensity_score": 0.1588320580794886, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2145.2, "away_cum_fatigue": 1681.7666666666669, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.10261559831515407, "shap_defensive_collapse": 0.0790163213671497, "shap_explosiveness": 0.10863805591968767, "shap_fatigue": 0.10751166462534019}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.12698251309395164, "propensity_score": 0.15858157738013112, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2145.2, "away_cum_fatigue": 1524.0, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.11003690891546573, "shap_defensive_collapse": 0.08872099037080486, "shap_explosiveness": 0.09249152041095615, "shap_fatigue": 0.11677252456468545}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.12016331357809516, "propensity_score": 0.16009155628161, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2145.2, "away_cum_fatigue": 1524.0, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.09294634100182879, "shap_defensive_collapse": 0.07654660292160087, "shap_explosiveness": 0.09080853242463922, "shap_fatigue": 0.10381284180907947}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.12661884987647176, "propensity_score": 0.1579388239600009, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2145.2, "away_cum_fatigue": 1598.3333333333333, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11661655657032356, "shap_defensive_collapse": 0.09709720213871761, "shap_explosiveness": 0.08495615589040517, "shap_fatigue": 0.11063419354865005}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.12654917989026548, "propensity_score": 0.12754183876834255, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2145.2, "away_cum_fatigue": 1646.25, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11909176196660952, "shap_defensive_collapse": 0.08953559419545579, "shap_explosiveness": 0.09152852308659383, "shap_fatigue": 0.12076152163613937}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.12488637448758626, "propensity_score": 0.13522327739374432, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2154.2, "away_cum_fatigue": 1655.25, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.09749396262184178, "shap_defensive_collapse": 0.08815747959544465, "shap_explosiveness": 0.08685036251652478, "shap_fatigue": 0.11138927831329695}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.1262957500194566, "propensity_score": 0.1420119173400212, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2154.2, "away_cum_fatigue": 1655.25, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.09509916402069304, "shap_defensive_collapse": 0.09656505276752786, "shap_explosiveness": 0.1080552427576062, "shap_fatigue": 0.12584863288516585}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.11193701786444063, "propensity_score": 0.1360750818790763, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2155.2, "away_cum_fatigue": 1656.25, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.10964159252337101, "shap_defensive_collapse": 0.07374006821031188, "shap_explosiveness": 0.08144683949388233, "shap_fatigue": 0.10448268174270571}, {"period": 4, "home_score": 124, "away_score": 117, "score_margin": 7, "cate_score": 0.13574072672479323, "propensity_score": 0.16122499000552318, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2156.2, "away_cum_fatigue": 1657.25, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.1137145228524096, "shap_defensive_collapse": 0.08687314230851524, "shap_explosiveness": 0.0807355988985437, "shap_fatigue": 0.10335699097598106}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.14947717175767494, "propensity_score": 0.16383024614433409, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2156.2, "away_cum_fatigue": 1657.25, "play_description": "MIA: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.09579784287979945, "shap_defensive_collapse": 0.09178675504683688, "shap_explosiveness": 0.08916245192754416, "shap_fatigue": 0.10260226530372857}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.14772322905901564, "propensity_score": 0.13931286838265727, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2156.2, "away_cum_fatigue": 1657.25, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.09841884580821565, "shap_defensive_collapse": 0.077455707104359, "shap_explosiveness": 0.09483068657889698, "shap_fatigue": 0.11505532351083184}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.10946822444394845, "propensity_score": 0.1650888187530109, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2157.2, "away_cum_fatigue": 1658.25, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.09606717306363242, "shap_defensive_collapse": 0.09595374783548265, "shap_explosiveness": 0.10585266605897221, "shap_fatigue": 0.11802151114244518}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.11130276405998983, "propensity_score": 0.16212926668393018, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2167.2, "away_cum_fatigue": 1668.25, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.1119802232508147, "shap_defensive_collapse": 0.07151160489307702, "shap_explosiveness": 0.109331085084553, "shap_fatigue": 0.10252642889899609}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.14872231234291963, "propensity_score": 0.15282081809105486, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2169.2, "away_cum_fatigue": 1670.25, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10752836671367556, "shap_defensive_collapse": 0.09135890097678354, "shap_explosiveness": 0.10011539059113882, "shap_fatigue": 0.10944829032487158}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.11334049301434768, "propensity_score": 0.12101665023911092, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2186.2, "away_cum_fatigue": 1687.25, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.11917603483571801, "shap_defensive_collapse": 0.09525985932916857, "shap_explosiveness": 0.0851202089294397, "shap_fatigue": 0.12565310499345106}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.12199215791553972, "propensity_score": 0.1496469315544454, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2186.2, "away_cum_fatigue": 1687.25, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.11394514081296073, "shap_defensive_collapse": 0.07664450180559196, "shap_explosiveness": 0.0824765091249028, "shap_fatigue": 0.12540951332533787}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.1443982483329632, "propensity_score": 0.12155790234124988, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2197.2, "away_cum_fatigue": 1698.25, "play_description": "Turnover! Live-ball steal by active defense.", "shap_stale_lineup": 0.09685921339070787, "shap_defensive_collapse": 0.09266968888859113, "shap_explosiveness": 0.09828791629440513, "shap_fatigue": 0.11206522356829085}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.11731690451698058, "propensity_score": 0.1657383844344989, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2197.2, "away_cum_fatigue": 1698.25, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.10386253126168285, "shap_defensive_collapse": 0.08429213801875088, "shap_explosiveness": 0.08514738804337614, "shap_fatigue": 0.12678226681385843}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.11230578008758883, "propensity_score": 0.13860244336323418, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2198.2, "away_cum_fatigue": 1699.25, "play_description": "Personal foul called on the floor. Inbound play.", "shap_stale_lineup": 0.10618563263507091, "shap_defensive_collapse": 0.087649733113953, "shap_explosiveness": 0.08483609709635209, "shap_fatigue": 0.1129647258526882}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.12066177105600255, "propensity_score": 0.13564204827405796, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2198.2, "away_cum_fatigue": 1699.25, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.09913175818512113, "shap_defensive_collapse": 0.0705683771234467, "shap_explosiveness": 0.10959672113487176, "shap_fatigue": 0.12333115026807868}, {"period": 4, "home_score": 124, "away_score": 118, "score_margin": 6, "cate_score": 0.11980779871470545, "propensity_score": 0.14851074755895333, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2198.2, "away_cum_fatigue": 1699.25, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.09439709415705476, "shap_defensive_collapse": 0.0912847048921672, "shap_explosiveness": 0.09642489845365237, "shap_fatigue": 0.10053870383001587}, {"period": 4, "home_score": 124, "away_score": 119, "score_margin": 5, "cate_score": 0.102585041468289, "propensity_score": 0.16396492729726675, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2198.2, "away_cum_fatigue": 1699.25, "play_description": "MIA: Sinks the technical free throw cleanly.", "shap_stale_lineup": 0.11278473342203194, "shap_defensive_collapse": 0.08582690386576736, "shap_explosiveness": 0.10876105379138101, "shap_fatigue": 0.11185850790518898}, {"period": 4, "home_score": 124, "away_score": 119, "score_margin": 5, "cate_score": 0.13748524841988682, "propensity_score": 0.14619836052548316, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2216.2, "away_cum_fatigue": 1717.25, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.10095382473963711, "shap_defensive_collapse": 0.07218856871787804, "shap_explosiveness": 0.08095016028830915, "shap_fatigue": 0.11134036380796757}, {"period": 4, "home_score": 124, "away_score": 119, "score_margin": 5, "cate_score": 0.11781599917895823, "propensity_score": 0.13342476335694775, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2219.2, "away_cum_fatigue": 1720.25, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11824874106075704, "shap_defensive_collapse": 0.07752030048469018, "shap_explosiveness": 0.08834375107745066, "shap_fatigue": 0.11415745255111216}, {"period": 4, "home_score": 124, "away_score": 119, "score_margin": 5, "cate_score": 0.13958821349712344, "propensity_score": 0.15892796040729457, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2229.2, "away_cum_fatigue": 1730.25, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.09988753722331867, "shap_defensive_collapse": 0.08489559109991734, "shap_explosiveness": 0.1066052525894132, "shap_fatigue": 0.12145011023030268}, {"period": 4, "home_score": 124, "away_score": 119, "score_margin": 5, "cate_score": 0.13940771190446224, "propensity_score": 0.13313639413082015, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2232.2, "away_cum_fatigue": 1733.25, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.09101475743511499, "shap_defensive_collapse": 0.07761398213543773, "shap_explosiveness": 0.09992588845214852, "shap_fatigue": 0.11745605858618224}, {"period": 4, "home_score": 124, "away_score": 119, "score_margin": 5, "cate_score": 0.1191609633625452, "propensity_score": 0.1424376486108915, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2253.2, "away_cum_fatigue": 1754.25, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.11112261128651454, "shap_defensive_collapse": 0.09746737382140525, "shap_explosiveness": 0.09924861577391203, "shap_fatigue": 0.10391847741595654}, {"period": 4, "home_score": 124, "away_score": 119, "score_margin": 5, "cate_score": 0.10830620771103208, "propensity_score": 0.12229134852801203, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2255.2, "away_cum_fatigue": 1756.25, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.09415593084398523, "shap_defensive_collapse": 0.07389399466603405, "shap_explosiveness": 0.08523990792638808, "shap_fatigue": 0.10555680021890457}, {"period": 4, "home_score": 124, "away_score": 121, "score_margin": 3, "cate_score": 0.14015800857116964, "propensity_score": 0.15144944494951013, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2262.2, "away_cum_fatigue": 1763.25, "play_description": "MIA: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.09306849013738736, "shap_defensive_collapse": 0.0831274044426307, "shap_explosiveness": 0.09968050292118037, "shap_fatigue": 0.117284371033501}, {"period": 4, "home_score": 124, "away_score": 121, "score_margin": 3, "cate_score": 0.12358885000351116, "propensity_score": 0.15644289707618375, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2274.2, "away_cum_fatigue": 1775.25, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11637926776195744, "shap_defensive_collapse": 0.09818162781797003, "shap_explosiveness": 0.10955439320326724, "shap_fatigue": 0.10252816707695023}, {"period": 4, "home_score": 124, "away_score": 121, "score_margin": 3, "cate_score": 0.1175680540950888, "propensity_score": 0.15787930780021353, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2276.2, "away_cum_fatigue": 1777.25, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11878690598878683, "shap_defensive_collapse": 0.0700369492773572, "shap_explosiveness": 0.10619336705146498, "shap_fatigue": 0.11647344441592263}, {"period": 4, "home_score": 124, "away_score": 124, "score_margin": 0, "cate_score": 0.14819007828606, "propensity_score": 0.14765861382943604, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2286.2, "away_cum_fatigue": 1787.25, "play_description": "MIA: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.11791335491921705, "shap_defensive_collapse": 0.08947107481517882, "shap_explosiveness": 0.09421855700359555, "shap_fatigue": 0.10067568624525186}, {"period": 4, "home_score": 124, "away_score": 124, "score_margin": 0, "cate_score": 0.14325862897616717, "propensity_score": 0.13700351613925477, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2300.2, "away_cum_fatigue": 1801.25, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.09316236099302866, "shap_defensive_collapse": 0.0939749067986965, "shap_explosiveness": 0.08941869421053553, "shap_fatigue": 0.1285094978307519}, {"period": 4, "home_score": 124, "away_score": 124, "score_margin": 0, "cate_score": 0.12794256440425034, "propensity_score": 0.15716914468620022, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2303.2, "away_cum_fatigue": 1804.25, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11402965887972594, "shap_defensive_collapse": 0.09626825007439863, "shap_explosiveness": 0.10143242597274006, "shap_fatigue": 0.10676517552192785}, {"period": 4, "home_score": 124, "away_score": 127, "score_margin": -3, "cate_score": 0.1096133802629012, "propensity_score": 0.12373748056299096, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2317.2, "away_cum_fatigue": 1818.25, "play_description": "MIA: Fast-break pullback 3-pointer made!", "shap_stale_lineup": 0.10785948167986537, "shap_defensive_collapse": 0.09405828568554847, "shap_explosiveness": 0.10360748950129992, "shap_fatigue": 0.12404413500136746}, {"period": 4, "home_score": 124, "away_score": 127, "score_margin": -3, "cate_score": 0.13139486296611855, "propensity_score": 0.16669363819088867, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2326.2, "away_cum_fatigue": 1827.25, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.11773485283801291, "shap_defensive_collapse": 0.07081518482956288, "shap_explosiveness": 0.10639825955440893, "shap_fatigue": 0.12635241959722396}, {"period": 4, "home_score": 124, "away_score": 127, "score_margin": -3, "cate_score": 0.10336771815726298, "propensity_score": 0.16866221946559612, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2326.2, "away_cum_fatigue": 1827.25, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.11793048144648793, "shap_defensive_collapse": 0.08340354329213318, "shap_explosiveness": 0.1057831881659504, "shap_fatigue": 0.12714867489389114}, {"period": 4, "home_score": 124, "away_score": 127, "score_margin": -3, "cate_score": 0.14625744155994266, "propensity_score": 0.13996342094013584, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2327.2, "away_cum_fatigue": 1828.25, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.10236634020977735, "shap_defensive_collapse": 0.07389626298560414, "shap_explosiveness": 0.0809746360143671, "shap_fatigue": 0.11201333494362341}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.10197075712543341, "propensity_score": 0.1417004343731123, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2331.2, "away_cum_fatigue": 1832.25, "play_description": "MIA: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.09554325415187562, "shap_defensive_collapse": 0.07243448693071647, "shap_explosiveness": 0.10205781677890169, "shap_fatigue": 0.12938022143628022}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.11282054293915213, "propensity_score": 0.16178402345328788, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2331.2, "away_cum_fatigue": 1832.25, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10239453284993487, "shap_defensive_collapse": 0.07076052753051626, "shap_explosiveness": 0.08929126197954469, "shap_fatigue": 0.10169707248132444}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.11563364569798186, "propensity_score": 0.14960413790660226, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2362.325, "away_cum_fatigue": 1832.25, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.103628797743778, "shap_defensive_collapse": 0.08373692341263297, "shap_explosiveness": 0.08102427987509862, "shap_fatigue": 0.1068705628270786}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.10087882587885144, "propensity_score": 0.13304131368128655, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2339.766666666667, "away_cum_fatigue": 1832.25, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.10320104194080913, "shap_defensive_collapse": 0.09444793503599754, "shap_explosiveness": 0.10738987977169905, "shap_fatigue": 0.10830793515000121}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.10572746923391033, "propensity_score": 0.158957022642414, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2294.65, "away_cum_fatigue": 1832.25, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.10073933724350674, "shap_defensive_collapse": 0.0762473398384936, "shap_explosiveness": 0.107713238994882, "shap_fatigue": 0.1276868397283624}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.10163300392957404, "propensity_score": 0.14274664281339255, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 2392.0, "away_cum_fatigue": 1832.25, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11230586985821557, "shap_defensive_collapse": 0.08490247620831808, "shap_explosiveness": 0.10101129064867029, "shap_fatigue": 0.11384626871923693}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.12378570991972272, "propensity_score": 0.1464947986510428, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 1832.25, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.10194414885949414, "shap_defensive_collapse": 0.08638964247064865, "shap_explosiveness": 0.08191155708732438, "shap_fatigue": 0.11844954989647025}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.13344643631401776, "propensity_score": 0.14337784051799699, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 1677.6666666666667, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.09481237567833417, "shap_defensive_collapse": 0.08249800787468153, "shap_explosiveness": 0.09326444550942264, "shap_fatigue": 0.10869437514263361}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.11311410831307044, "propensity_score": 0.13766908069599434, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 1677.6666666666667, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.11565655626133164, "shap_defensive_collapse": 0.08001566618187661, "shap_explosiveness": 0.09726233459904347, "shap_fatigue": 0.11647108503235576}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.12428564120316632, "propensity_score": 0.1425765000232, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 1528.5, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.0996615287276144, "shap_defensive_collapse": 0.07465228410550123, "shap_explosiveness": 0.10224743937571246, "shap_fatigue": 0.11068539807036894}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.14467686309096006, "propensity_score": 0.16701833168097774, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 0.0, "away_cum_fatigue": 1528.5, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.09990050364134356, "shap_defensive_collapse": 0.09127886165219869, "shap_explosiveness": 0.10130808102165867, "shap_fatigue": 0.10424951041196345}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.10880550730322082, "propensity_score": 0.16834565387981948, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 187.5, "away_cum_fatigue": 1528.5, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.11783788018570428, "shap_defensive_collapse": 0.09134061619222546, "shap_explosiveness": 0.0940993211786926, "shap_fatigue": 0.10590863030480917}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.11664077968244341, "propensity_score": 0.16453644393787448, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 173.66666666666666, "away_cum_fatigue": 1528.5, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.0930351270848248, "shap_defensive_collapse": 0.08676609123630921, "shap_explosiveness": 0.08278057597941174, "shap_fatigue": 0.10882638150364495}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.14419563552845469, "propensity_score": 0.14679250049880121, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 130.25, "away_cum_fatigue": 1528.5, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.10045710056469348, "shap_defensive_collapse": 0.09017931360474425, "shap_explosiveness": 0.08687182332191459, "shap_fatigue": 0.12542602924609764}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.10262240038387743, "propensity_score": 0.16366783084880207, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 104.2, "away_cum_fatigue": 1528.5, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.11936234511369848, "shap_defensive_collapse": 0.09489705948860072, "shap_explosiveness": 0.10522770603909849, "shap_fatigue": 0.11901950863466723}, {"period": 4, "home_score": 124, "away_score": 129, "score_margin": -5, "cate_score": 0.10066755226230771, "propensity_score": 0.1403844920857191, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 104.2, "away_cum_fatigue": 1212.9, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.11148804866576414, "shap_defensive_collapse": 0.09151924785855522, "shap_explosiveness": 0.08861893599327586, "shap_fatigue": 0.10539985449780738}, {"period": 4, "home_score": 124, "away_score": 131, "score_margin": -7, "cate_score": 0.12993497914744057, "propensity_score": 0.14928602061210677, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 104.2, "away_cum_fatigue": 909.675, "play_description": "MIA: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.10705916693374125, "shap_defensive_collapse": 0.09825308076087429, "shap_explosiveness": 0.10455298530897225, "shap_fatigue": 0.10608318153920074}, {"period": 4, "home_score": 124, "away_score": 131, "score_margin": -7, "cate_score": 0.10587938856685465, "propensity_score": 0.16967160393258446, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 104.2, "away_cum_fatigue": 727.74, "play_description": "Heavy defensive pressure forces a contested shot clock violation.", "shap_stale_lineup": 0.0964365771597199, "shap_defensive_collapse": 0.09264384341128502, "shap_explosiveness": 0.09441802123914574, "shap_fatigue": 0.10690138098103083}, {"period": 4, "home_score": 126, "away_score": 131, "score_margin": -5, "cate_score": 0.14323102572847873, "propensity_score": 0.16922148641658677, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 123.2, "away_cum_fatigue": 746.74, "play_description": "BOS: Beautiful driving layup scored in transition!", "shap_stale_lineup": 0.09060847866534566, "shap_defensive_collapse": 0.07748388366818054, "shap_explosiveness": 0.10886114213248275, "shap_fatigue": 0.11931456352907131}, {"period": 4, "home_score": 126, "away_score": 133, "score_margin": -7, "cate_score": 0.12984240889573373, "propensity_score": 0.13537382171120907, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 139.2, "away_cum_fatigue": 762.74, "play_description": "MIA: Scores a heavily contested mid-range jumper.", "shap_stale_lineup": 0.10477056834802602, "shap_defensive_collapse": 0.08919572311126756, "shap_explosiveness": 0.10185720498450518, "shap_fatigue": 0.10721370251590273}, {"period": 4, "home_score": 129, "away_score": 133, "score_margin": -4, "cate_score": 0.1351802917171171, "propensity_score": 0.15969090237754224, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 147.2, "away_cum_fatigue": 770.74, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.09318630143942672, "shap_defensive_collapse": 0.08494268646824395, "shap_explosiveness": 0.10293380982205717, "shap_fatigue": 0.10197325495229884}, {"period": 4, "home_score": 129, "away_score": 133, "score_margin": -4, "cate_score": 0.11962461567852306, "propensity_score": 0.13886804542436765, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 161.0, "away_cum_fatigue": 784.54, "play_description": "MIA executing a structured half-court pick-and-roll set.", "shap_stale_lineup": 0.09169593400812527, "shap_defensive_collapse": 0.08131659696602128, "shap_explosiveness": 0.10444303540159772, "shap_fatigue": 0.11093202938675084}, {"period": 4, "home_score": 129, "away_score": 133, "score_margin": -4, "cate_score": 0.11581865654857368, "propensity_score": 0.12039121679337791, "timeout_team": "BOSTON", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 163.3, "away_cum_fatigue": 786.8399999999999, "play_description": "Timeout: Drawing up play for the final game possession", "shap_stale_lineup": 0.1063184249269756, "shap_defensive_collapse": 0.07715512715313863, "shap_explosiveness": 0.09596477402189332, "shap_fatigue": 0.10021777561153011}, {"period": 4, "home_score": 132, "away_score": 133, "score_margin": -1, "cate_score": 0.11105499231941938, "propensity_score": 0.16280942747282856, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 168.2, "away_cum_fatigue": 791.74, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.10729515344807726, "shap_defensive_collapse": 0.09453093706523827, "shap_explosiveness": 0.09240304040658712, "shap_fatigue": 0.1123427556691848}, {"period": 4, "home_score": 132, "away_score": 133, "score_margin": -1, "cate_score": 0.13047447743791052, "propensity_score": 0.16377547162628692, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 181.4, "away_cum_fatigue": 804.94, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.10673567099732664, "shap_defensive_collapse": 0.070849730714824, "shap_explosiveness": 0.08113251245258589, "shap_fatigue": 0.10319597032920504}, {"period": 4, "home_score": 132, "away_score": 133, "score_margin": -1, "cate_score": 0.11744181288673637, "propensity_score": 0.13098997699129258, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 183.0, "away_cum_fatigue": 806.54, "play_description": "BOS swinging the ball around the perimeter looking for an opening.", "shap_stale_lineup": 0.10875779860572504, "shap_defensive_collapse": 0.07108425668582403, "shap_explosiveness": 0.09341139920506644, "shap_fatigue": 0.10639275270437548}, {"period": 4, "home_score": 135, "away_score": 133, "score_margin": 2, "cate_score": 0.13494391743076556, "propensity_score": 0.14809973575262175, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 191.3, "away_cum_fatigue": 814.8399999999999, "play_description": "BOS: Hits a magnificent deep 3-pointer!", "shap_stale_lineup": 0.10811317245497244, "shap_defensive_collapse": 0.09888184266030037, "shap_explosiveness": 0.10367754719663638, "shap_fatigue": 0.1258431711327069}, {"period": 4, "home_score": 135, "away_score": 133, "score_margin": 2, "cate_score": 0.12861062374329163, "propensity_score": 0.15598759715702196, "timeout_team": "MIAMI", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 215.7, "away_cum_fatigue": 839.24, "play_description": "Tactical Timeout: Opponent out-of-bounds defensive alignment", "shap_stale_lineup": 0.09847801691331519, "shap_defensive_collapse": 0.07384457265862687, "shap_explosiveness": 0.09811270934521263, "shap_fatigue": 0.11847896447256184}, {"period": 4, "home_score": 135, "away_score": 133, "score_margin": 2, "cate_score": 0.11687993270551805, "propensity_score": 0.16854789548574226, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 217.2, "away_cum_fatigue": 840.74, "play_description": "Defensive stop! Safe defensive rebound secured by BOS.", "shap_stale_lineup": 0.1080952946025431, "shap_defensive_collapse": 0.09758962871280907, "shap_explosiveness": 0.09724029317250668, "shap_fatigue": 0.10207886962796543}, {"period": 4, "home_score": 135, "away_score": 133, "score_margin": 2, "cate_score": 0.14118842949962898, "propensity_score": 0.13238205701270137, "timeout_team": "NONE", "target_stop_run_90s": 0, "timeout_strategic_weight": 0, "home_cum_fatigue": 217.2, "away_cum_fatigue": 840.74, "play_description": "Offensive rebound by MIA, resetting the attack clock.", "shap_stale_lineup": 0.09828383351598854, "shap_defensive_collapse": 0.09761981111446204, "shap_explosiveness": 0.0880768743768372, "shap_fatigue": 0.11024765237160113}]};
\ No newline at end of file
@@ -4,7 +4,10 @@
         let roiChart = null;
 
         // מצב הזיכרון החי של האפליקציה (Session State)
+        // dataset מתמלא משחק-משחק: כל משחק נטען מה-chunk שלו רק כשהוא נבחר
         let dataset = null;
+        let payloadManifest = null;
+        const chunkRequests = {};
         let currentGame = "game_1";
         let currentIndex = 0;
         let isPlaying = false;
@@ -55,16 +58,83 @@
             URL.revokeObjectURL(url);
         }
 
-        // טעינת נתונים אוטומטית ממערך JS
-        window.addEventListener('DOMContentLoaded', () => {
-            if (window.DEMO_DATA) {
-                dataset = window.DEMO_DATA;
-                resetSimulation();
-            } else {
-                console.error("Dataset not found. Please ensure demo_data.js is loaded.");
-                document.getElementById('file-picker-bar').classList.remove('hidden');
-                document.getElementById('file-picker-bar').classList.add('flex');
+        // === COLUMNAR DEMO PAYLOAD (data/demo/chunks, written by models/demo_payload.py) ===
+        const PAYLOAD_DIR = "data/demo/chunks/";
+        const TYPED_ARRAYS = {
+            int8: Int8Array, uint8: Uint8Array, int16: Int16Array, uint16: Uint16Array,
+            int32: Int32Array, uint32: Uint32Array, float32: Float32Array
+        };
+
+        // מפענח chunk בינארי לשורות: כל עמודה היא TypedArray שעוטף את ה-buffer ישירות (המקטעים מיושרים ל-8 בתים, little-endian)
+        function decodeGameChunk(buffer, entry) {
+            const columns = entry.columns.map(seg => ({
+                seg: seg,
+                values: new TYPED_ARRAYS[seg.dtype](buffer, seg.byte_offset, entry.rows),
+                // אותו עיגול כמו ב-decode_game בפייתון: מספר הספרות נגזר מה-step (1e-4 -> 4 ספרות)
+                decimals: seg.encoding === "quantized" ? Math.max(0, Math.round(-Math.log10(seg.step))) : 0
+            }));
+
+            const rows = new Array(entry.rows);
+            for (let i = 0; i < entry.rows; i++) {
+                const row = {};
+                for (const { seg, values, decimals } of columns) {
+                    if (seg.encoding === "quantized") {
+                        row[seg.name] = Number((seg.offset + values[i] * seg.step).toFixed(decimals));
+                    } else if (seg.encoding === "dictionary") {
+                        row[seg.name] = seg.dictionary[values[i]];
+                    } else {
+                        row[seg.name] = values[i];
+                    }
+                }
+                rows[i] = row;
+            }
+            return rows;
+        }
+
+        // טוען chunk של משחק פעם אחת בלבד (בקשות מקבילות לאותו משחק חולקות את אותה הבטחה)
+        function loadGameChunk(gameKey) {
+            if (dataset && dataset[gameKey]) return Promise.resolve(dataset[gameKey]);
+            if (!chunkRequests[gameKey]) {
+                const entry = payloadManifest.games[gameKey];
+                chunkRequests[gameKey] = fetch(PAYLOAD_DIR + entry.file)
+                    .then(res => {
+                        if (!res.ok) throw new Error(`HTTP ${res.status} for ${entry.file}`);
+                        return res.arrayBuffer();
+                    })
+                    .then(buffer => {
+                        dataset[gameKey] = decodeGameChunk(buffer, entry);
+                        return dataset[gameKey];
+                    })
+                    .catch(err => {
+                        delete chunkRequests[gameKey];
+                        throw err;
+                    });
             }
+            return chunkRequests[gameKey];
+        }
+
+        function showFilePicker() {
+            document.getElementById('file-picker-bar').classList.remove('hidden');
+            document.getElementById('file-picker-bar').classList.add('flex');
+        }
+
+        // טעינת נתונים אוטומטית: מניפסט קטן + ה-chunk של המשחק הנבחר בלבד
+        window.addEventListener('DOMContentLoaded', () => {
+            fetch(PAYLOAD_DIR + "manifest.json")
+                .then(res => {
+                    if (!res.ok) throw new Error(`HTTP ${res.status} for manifest.json`);
+                    return res.json();
+                })
+                .then(manifest => {
+                    payloadManifest = manifest;
+                    dataset = {};
+                    return loadGameChunk(currentGame);
+                })
+                .then(() => resetSimulation())
+                .catch(err => {
+                    console.error("Demo payload not found. Please run models/prepare_demo_data.py and serve the project over HTTP.", err);
+                    showFilePicker();
+                });
             initRoiChart();
         });
 
@@ -104,6 +174,17 @@
         // Change game context (Game 1 or Game 2)
         function changeGameContext() {
             currentGame = document.getElementById('game-selector').value;
+            pauseSimulation();
+            if (payloadManifest && !dataset[currentGame]) {
+                document.getElementById('live-ticker-feed').innerHTML = "<div class='text-amber-500 font-bold'>> Loading " + currentGame + "...</div>";
+                loadGameChunk(currentGame)
+                    .then(() => resetSimulation())
+                    .catch(err => {
+                        console.error(`Failed to load ${currentGame}`, err);
+                        showFilePicker();
+                    });
+                return;
+            }
             resetSimulation();
         }
 
@@ -129,7 +210,7 @@
 
         // Play simulation - מתוקן עם setTimeout רקורסיבי לתמיכה בסליידר חי
         function playSimulation() {
-            if (!dataset) {
+            if (!dataset || !dataset[currentGame]) {
                 alert("אנא ודא שקובץ הנתונים נטען בהצלחה.");
                 return;
             }
@@ -168,7 +249,7 @@
 
         // עדכון שוטף של מדדי המשחק על המסך (HUD Update)
         function updateHudDisplay() {
-            if (!dataset) return;
+            if (!dataset || !dataset[currentGame]) return;
             const row = dataset[currentGame][currentIndex];
 
             document.getElementById('score-home').innerText = row.home_score;
@@ -7,20 +7,34 @@ from sklearn.metrics import roc_auc_score, mean_squared_error
 import matplotlib.pyplot as plt
 import os
 import json
+import time
 from pipeline_constants import get_blacklisted_features
+from bootstrap_ci import GameBootstrap
+from cross_fitting import GameGroupedCrossFitter
 
 class NBACausalLearner:
-    def __init__(self, data_path: str, target_col: str = 'target_stop_run_90s', treatment_col: str = 'timeout_strategic_weight'):
+    def __init__(self, data_path: str, target_col: str = 'target_stop_run_90s', treatment_col: str = 'timeout_strategic_weight', n_bootstrap: int = 1000,
+                 cross_fit: bool = False, n_folds: int = 5, benchmark: bool = False):
         self.data_path = data_path
         self.target_col = target_col
         self.treatment_col = treatment_col
+        self.n_bootstrap = n_bootstrap
+        
+        # cross_fit=False: המסלול המהיר (D0/D1 מחיזויים in-sample). True: K קיפולים לפי משחקים
+        self.cross_fit = cross_fit
+        self.n_folds = n_folds
+        # benchmark=True: מריץ ומתזמן את שני המסלולים (המסלול שנבחר ב-cross_fit הוא זה שמשמש ל-tau)
+        self.benchmark = benchmark
+        self.timings = {}
         
         self.X_train, self.X_test = None, None
         self.T_train, self.T_test = None, None
         self.Y_train, self.Y_test = None, None
+        self.G_train, self.G_test = None, None
         
         self.auc = None
         self.ate = None
+        self.bootstrap_summary = None
         
         # Propensity model is a classifier (Treatment is binary: timeout taken or not)
         self.propensity_model = xgb.XGBClassifier(eval_metric='logloss', random_state=42)
@@ -36,8 +50,10 @@ class NBACausalLearner:
         os.makedirs(save_dir, exist_ok=True)
         # save for any kinf of model  
         joblib.dump(self.propensity_model, os.path.join(save_dir, f'propensity_{self.target_col}.joblib'))
-        joblib.dump(self.mu0_model, os.path.join(save_dir, f'mu0_{self.target_col}.joblib'))
-        joblib.dump(self.mu1_model, os.path.join(save_dir, f'mu1_{self.target_col}.joblib'))
+        # ב-Cross-Fit בלי benchmark אין mu0/mu1 על כל המדגם (רק מודלי קיפול זמניים)
+        if self._fits_full_sample_outcomes():
+            joblib.dump(self.mu0_model, os.path.join(save_dir, f'mu0_{self.target_col}.joblib'))
+            joblib.dump(self.mu1_model, os.path.join(save_dir, f'mu1_{self.target_col}.joblib'))
         joblib.dump(self.tau0_model, os.path.join(save_dir, f'tau0_{self.target_col}.joblib'))
         joblib.dump(self.tau1_model, os.path.join(save_dir, f'tau1_{self.target_col}.joblib'))
         print(f"💾 Models saved to {save_dir}")
@@ -78,11 +94,12 @@ class NBACausalLearner:
             # Keep only clean features
             X_cols = [c for c in feature_cols if c != self.treatment_col]
             X = df[X_cols]
+            G = df['gameId']
             
-            return X, T, Y
+            return X, T, Y, G
 
-        self.X_train, self.T_train, self.Y_train = prepare_split(train_df)
-        self.X_test, self.T_test, self.Y_test = prepare_split(test_df)
+        self.X_train, self.T_train, self.Y_train, self.G_train = prepare_split(train_df)
+        self.X_test, self.T_test, self.Y_test, self.G_test = prepare_split(test_df)
         
         print(f"Data ready. Clean Features: {len(self.X_train.columns)}. Train: {self.X_train.shape[0]} | Test: {self.X_test.shape[0]}")
         print("---------------------------------\n")
@@ -110,24 +127,64 @@ class NBACausalLearner:
         self.auc = roc_auc_score(self.T_test, self.g_x_test)
         print(f"Propensity AUC: {self.auc:.4f}")
 
+    def _fits_full_sample_outcomes(self) -> bool:
+        return not self.cross_fit or self.benchmark
+
     def stage_2_outcome_modeling(self):
+        # ב-Cross-Fit ה-imputation משתמש רק במודלי הקיפולים, אז אין טעם לאמן mu0/mu1 על כל המדגם
+        if not self._fits_full_sample_outcomes():
+            print("Stage 2: Skipped (outcome models are fitted per fold in Stage 3).")
+            return
         print("Stage 2: Training Outcome Models (mu0, mu1 as Regressors)...")
+        start = time.time()
         X0, Y0 = self.X_train[self.T_train == 0], self.Y_train[self.T_train == 0]
         X1, Y1 = self.X_train[self.T_train == 1], self.Y_train[self.T_train == 1]
         
         self.mu0_model.fit(X0, Y0)
         self.mu1_model.fit(X1, Y1)
+        self.timings['outcome_models_sec'] = time.time() - start
 
-    def stage_3_x_learning(self):
-        print("Stage 3: Cross-Learning Imputed Treatment Effects...")
+    def _impute_in_sample(self):
         X0, Y0 = self.X_train[self.T_train == 0], self.Y_train[self.T_train == 0]
         X1, Y1 = self.X_train[self.T_train == 1], self.Y_train[self.T_train == 1]
         
         D0 = self.mu1_model.predict(X0) - Y0 
         D1 = Y1 - self.mu0_model.predict(X1) 
+        return D0, D1
+
+    def _impute_cross_fitted(self):
+        fitter = GameGroupedCrossFitter(n_folds=self.n_folds)
+        return fitter.impute_effects(self.X_train.values, self.T_train.values, self.Y_train.values, self.G_train.values)
+
+    def stage_3_x_learning(self):
+        mode = f"Cross-Fitted, {self.n_folds} game folds" if self.cross_fit else "In-Sample"
+        print(f"Stage 3: Cross-Learning Imputed Treatment Effects ({mode})...")
+        X0 = self.X_train[self.T_train == 0]
+        X1 = self.X_train[self.T_train == 1]
         
+        paths = {'in_sample': self._impute_in_sample, 'cross_fit': self._impute_cross_fitted}
+        selected = 'cross_fit' if self.cross_fit else 'in_sample'
+        self.timings['imputation_mode'] = selected
+        for name in (paths if self.benchmark else [selected]):
+            start = time.time()
+            imputed = paths[name]()
+            elapsed = time.time() - start
+            # זמן המסלול המהיר כולל את אימון mu0/mu1 מ-Stage 2, כדי שההשוואה תהיה הוגנת מול אימון הקיפולים
+            if name == 'in_sample':
+                elapsed += self.timings.get('outcome_models_sec', 0.0)
+            self.timings[f'{name}_imputation_sec'] = elapsed
+            if name == selected:
+                D0, D1 = imputed
+                self.timings['imputation_sec'] = elapsed
+        if self.benchmark:
+            print(f"   ⏱️ Benchmark | In-sample (incl. mu0/mu1): {self.timings['in_sample_imputation_sec']:.2f}s | "
+                  f"Cross-fit ({self.n_folds} folds): {self.timings['cross_fit_imputation_sec']:.2f}s")
+        
+        start = time.time()
         self.tau0_model.fit(X0, D0)
         self.tau1_model.fit(X1, D1)
+        self.timings['effect_models_sec'] = time.time() - start
+        print(f"   ⏱️ Imputation: {self.timings['imputation_sec']:.2f}s | Tau models: {self.timings['effect_models_sec']:.2f}s")
 
     def estimate_cate(self, X_eval):
         tau0_pred = self.tau0_model.predict(X_eval)
@@ -137,6 +194,16 @@ class NBACausalLearner:
         cate = (1 - g_x_eval) * tau0_pred + g_x_eval * tau1_pred
         return cate
 
+    def stage_4_bootstrap_ci(self, cate_test):
+        """Game-level bootstrap CIs for ATE and quintile uplift, computed on the cached test predictions."""
+        print(f"Stage 4: Bootstrapping {self.n_bootstrap} game-level resamples (process pool)...")
+        bootstrap = GameBootstrap(cate_test, self.T_test.values, self.Y_test.values, self.G_test.values)
+        self.bootstrap_summary = bootstrap.run(n_resamples=self.n_bootstrap)
+        
+        lo, hi = self.bootstrap_summary['ate_ci']
+        print(f"ATE 95% CI: [{lo:+.4f}, {hi:+.4f}] over {self.bootstrap_summary['n_games']} test games")
+        return self.bootstrap_summary
+
     def plot_uplift_validation(self, cate_test, output_dir):
         eval_df = pd.DataFrame({
             'cate_score': cate_test,
@@ -151,8 +218,19 @@ class NBACausalLearner:
         
         actual_rates['Actual_Uplift'] = actual_rates['With_TO'] - actual_rates['No_TO']
         
+        # פסי שגיאה מה-Bootstrap (אם הורץ)
+        yerr = None
+        if self.bootstrap_summary is not None:
+            buckets = self.bootstrap_summary['uplift_buckets']
+            lower, upper = [], []
+            for label, uplift in actual_rates['Actual_Uplift'].items():
+                ci = buckets.get(label, {}).get('ci')
+                lower.append(uplift - ci[0] if ci else 0)
+                upper.append(ci[1] - uplift if ci else 0)
+            yerr = np.array([lower, upper])
+        
         plt.figure(figsize=(10, 6))
-        actual_rates['Actual_Uplift'].plot(kind='bar', color='mediumseagreen', edgecolor='black')
+        actual_rates['Actual_Uplift'].plot(kind='bar', color='mediumseagreen', edgecolor='black', yerr=yerr, capsize=4)
         plt.title(f'Actual Timeout Effectiveness by Model Prediction (Uplift)\n{self.target_col}')
         plt.ylabel('Actual Impact Improvement (With TO - No TO)')
         plt.xlabel('Model Prediction (CATE Score Buckets)')
@@ -178,6 +256,9 @@ class NBACausalLearner:
         self.ate = avg_treatment_effect
         print(f"Average Treatment Effect (ATE) for '{self.target_col}': {avg_treatment_effect:+.2f} points/impact")
         
+        if self.n_bootstrap > 0:
+            self.stage_4_bootstrap_ci(cate_test)
+        
         reports_dir = os.path.join(os.path.dirname(self.data_path), '..', 'reports')
         self.plot_uplift_validation(cate_test, reports_dir)
         
@@ -190,6 +271,11 @@ if __name__ == "__main__":
     REPORTS_DIR = os.path.join(base_dir, 'reports')
     os.makedirs(REPORTS_DIR, exist_ok=True)
     
+    # מתג בין המסלול המהיר (in-sample) למסלול ה-Cross-Fit (K קיפולים לפי משחקים, במקביל)
+    CROSS_FIT = False
+    N_FOLDS = 5
+    BENCHMARK_IMPUTATION = False   # True: מתזמן את שני המסלולים לכל טרגט (נשמר ב-timings של הסיכום)
+    
     print(f"Working with absolute path: {DATA_PATH}")
     
     targets = [
@@ -205,7 +291,10 @@ if __name__ == "__main__":
         causal_learner = NBACausalLearner(
             data_path=DATA_PATH,
             target_col=target,
-            treatment_col='timeout_strategic_weight'
+            treatment_col='timeout_strategic_weight',
+            cross_fit=CROSS_FIT,
+            n_folds=N_FOLDS,
+            benchmark=BENCHMARK_IMPUTATION
         )
         cate_results = causal_learner.run_pipeline()
         
@@ -213,6 +302,11 @@ if __name__ == "__main__":
             "ate": float(causal_learner.ate),
             "auc": float(causal_learner.auc)
         }
+        summary_results[target]["timings"] = causal_learner.timings
+        if causal_learner.bootstrap_summary is not None:
+            summary_results[target]["ate_ci_95"] = causal_learner.bootstrap_summary['ate_ci']
+            summary_results[target]["uplift_buckets"] = causal_learner.bootstrap_summary['uplift_buckets']
+            summary_results[target]["bootstrap_resamples"] = causal_learner.bootstrap_summary['n_resamples']
 
     print("\n" + "="*55)
     print(f"{'Target':<30} | {'ATE (Impact)':<12} | {'Propensity AUC':<10}")
@@ -3,12 +3,14 @@ import numpy as np
 import joblib
 import os
 import json
+import pyarrow.dataset as ds
+from hit_rate_sweep import ThresholdSweepEngine
+from query_layer import QueryLayer
 
 def analyze_sweet_spot_all_targets():
     base_dir = r"C:\Users\david\finalPro"
     print("🎯 Extracting Presentation Metrics for ALL TARGETS...\n" + "="*60)
     
-    data_path = os.path.join(base_dir, 'data', 'processed', 'test.parquet')
     models_dir = os.path.join(base_dir, 'models', 'saved_models')
     reports_dir = os.path.join(base_dir, 'reports')
     summary_path = os.path.join(reports_dir, 'causal_multi_target_summary.json')
@@ -32,10 +34,12 @@ def analyze_sweet_spot_all_targets():
     # בודקים שני מצבי קיצון: החמישון העליון (Top 10%) והמאיון ה-95 (Top 5%)
     percentiles_to_test = [90, 95] 
     
+    # במקום לטעון את כל test.parquet: כל מטרה סורקת רק את הפיצ'רים של המודל שלה, והסינון של ערכים חסרים נדחף לסריקה
+    q = QueryLayer(base_dir)
     try:
-        df_full = pd.read_parquet(data_path)
+        test_columns = set(q.schema('test').names)
     except Exception as e:
-        print(f"❌ Error loading parquet: {e}")
+        print(f"❌ Error opening test split: {e}")
         return
 
     for target_col in targets:
@@ -47,34 +51,31 @@ def analyze_sweet_spot_all_targets():
             t0_model = joblib.load(os.path.join(models_dir, f'tau0_{target_col}.joblib'))
             t1_model = joblib.load(os.path.join(models_dir, f'tau1_{target_col}.joblib'))
             
-            df = df_full.dropna(subset=[target_col, 'timeout_strategic_weight']).copy()
-            
             expected_features = p_model.get_booster().feature_names
+            columns = [c for c in dict.fromkeys(expected_features + [target_col, 'timeout_strategic_weight']) if c in test_columns]
+            valid = ds.field(target_col).is_valid() & ds.field('timeout_strategic_weight').is_valid()
+            df = q.scan('test', columns, valid).to_pandas()
+
             X = df.reindex(columns=expected_features, fill_value=0)
             
             # חישוב CATE
             g_x = np.clip(p_model.predict_proba(X)[:, 1], 0.01, 0.99)
             cate = (1 - g_x) * t0_model.predict(X) + g_x * t1_model.predict(X)
             
-            eval_df = pd.DataFrame({
-                'cate_score': cate,
-                'treatment': (df['timeout_strategic_weight'] > 0).astype(int),
-                'outcome': df[target_col]
-            })
-            
+            treatment = (df['timeout_strategic_weight'] > 0).astype(int).values
+
+            # מיון יחיד של ה-CATE ושליפת כל האחוזונים מסכומים מצטברים
+            engine = ThresholdSweepEngine(cate, treatment, outcomes=df[target_col].values)
+            sweep = engine.sweep(percentiles_to_test)
+
             # ריצה על האחוזונים
-            for p in percentiles_to_test:
-                threshold = np.percentile(eval_df['cate_score'], p)
-                top_cases = eval_df[eval_df['cate_score'] >= threshold]
-                
-                with_to = top_cases[top_cases['treatment'] == 1]['outcome'].mean()
-                no_to = top_cases[top_cases['treatment'] == 0]['outcome'].mean()
-                actual_uplift = with_to - no_to
-                
-                total_critical = len(top_cases)
-                ignored_critical = len(top_cases[top_cases['treatment'] == 0])
-                ignored_percentage = (ignored_critical / total_critical) * 100 if total_critical > 0 else 0
-                
+            for _, row in sweep.iterrows():
+                p = int(row['Percentile'])
+                total_critical = int(row['Alerts'])
+                ignored_critical = int(row['Ignored'])
+                actual_uplift = row['Actual_Uplift']
+                ignored_percentage = row['Miss_Rate_%']
+
                 print(f"   ▶ Top {100-p}% (Threshold > {p}th percentile):")
                 print(f"     * Cases in this zone: {total_critical:,}")
                 print(f"     * Actual Impact Diff: {actual_uplift:+.2f} points (Timeout vs No Timeout)")
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import os
+import concurrent.futures
+
+UPLIFT_BUCKET_LABELS = ['Lowest 20%', 'Low-Mid', 'Medium', 'Mid-High', 'Top 20%']
+
+# Columns of the per-(game, bucket) aggregate tensor
+_N_ROWS, _CATE_SUM, _Y_T1_SUM, _N_T1, _Y_T0_SUM, _N_T0 = range(6)
+
+def _bootstrap_chunk(game_stats: np.ndarray, n_resamples: int, seed: int) -> tuple:
+    """
+    Worker: draws whole games with replacement and recomputes ATE + per-bucket uplift.
+    game_stats has shape (n_games, n_buckets, 6); a resample is just a count vector over games,
+    so every replicate is a single weighted sum against the cached predictions (no refitting).
+    """
+    rng = np.random.default_rng(seed)
+    n_games = game_stats.shape[0]
+
+    ates = np.empty(n_resamples)
+    uplifts = np.empty((n_resamples, game_stats.shape[1]))
+
+    for b in range(n_resamples):
+        counts = np.bincount(rng.integers(0, n_games, n_games), minlength=n_games).astype(float)
+        totals = np.tensordot(counts, game_stats, axes=(0, 0))  # (n_buckets, 6)
+
+        ates[b] = totals[:, _CATE_SUM].sum() / totals[:, _N_ROWS].sum()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            uplifts[b] = totals[:, _Y_T1_SUM] / totals[:, _N_T1] - totals[:, _Y_T0_SUM] / totals[:, _N_T0]
+
+    return ates, uplifts
+
+class GameBootstrap:
+    """
+    Game-level bootstrap for the causal test set.
+    Resamples whole games (never single rows) so the CIs respect the game-level split.
+    """
+
+    def __init__(self, cate, treatment, outcome, game_ids, n_buckets: int = 5):
+        self.eval_df = pd.DataFrame({
+            'cate_score': np.asarray(cate, dtype=float),
+            'treatment': np.asarray(treatment).astype(int),
+            'outcome': np.asarray(outcome, dtype=float),
+            'gameId': np.asarray(game_ids)
+        })
+        labels = UPLIFT_BUCKET_LABELS if n_buckets == 5 else [f'Q{i+1}' for i in range(n_buckets)]
+        # The buckets are fixed by the point-estimate CATE (the model is not refit per replicate)
+        self.eval_df['cate_bucket'] = pd.qcut(self.eval_df['cate_score'], q=n_buckets, labels=labels)
+        self.bucket_labels = labels
+        self.game_stats = self._build_game_stats()
+
+    def _build_game_stats(self) -> np.ndarray:
+        df = self.eval_df
+        t1 = df['treatment'] == 1
+        agg = pd.DataFrame({
+            'gameId': df['gameId'],
+            'cate_bucket': df['cate_bucket'],
+            'n_rows': 1.0,
+            'cate_sum': df['cate_score'],
+            'y_t1_sum': df['outcome'].where(t1, 0.0),
+            'n_t1': t1.astype(float),
+            'y_t0_sum': df['outcome'].where(~t1, 0.0),
+            'n_t0': (~t1).astype(float)
+        }).groupby(['gameId', 'cate_bucket'], observed=False).sum()
+
+        n_games = df['gameId'].nunique()
+        return agg.to_numpy().reshape(n_games, len(self.bucket_labels), 6)
+
+    def point_estimates(self) -> tuple:
+        totals = self.game_stats.sum(axis=0)
+        ate = totals[:, _CATE_SUM].sum() / totals[:, _N_ROWS].sum()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            uplift = totals[:, _Y_T1_SUM] / totals[:, _N_T1] - totals[:, _Y_T0_SUM] / totals[:, _N_T0]
+        return ate, uplift
+
+    def run(self, n_resamples: int = 1000, n_jobs: int = None, seed: int = 42, alpha: float = 0.05) -> dict:
+        """Splits the resamples into chunks, runs them in a process pool and returns percentile CIs."""
+        n_jobs = n_jobs or os.cpu_count() or 1
+        chunk_sizes = [len(c) for c in np.array_split(np.arange(n_resamples), n_jobs) if len(c) > 0]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+
+        if len(chunk_sizes) == 1:
+            results = [_bootstrap_chunk(self.game_stats, chunk_sizes[0], seeds[0])]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=len(chunk_sizes)) as executor:
+                futures = [executor.submit(_bootstrap_chunk, self.game_stats, size, s) for size, s in zip(chunk_sizes, seeds)]
+                results = [f.result() for f in futures]
+
+        ates = np.concatenate([r[0] for r in results])
+        uplifts = np.vstack([r[1] for r in results])
+
+        lo_q, hi_q = 100 * alpha / 2, 100 * (1 - alpha / 2)
+        ate, uplift = self.point_estimates()
+
+        summary = {
+            "n_resamples": int(n_resamples),
+            "n_games": int(self.game_stats.shape[0]),
+            "ci_level": 1 - alpha,
+            "ate": float(ate),
+            "ate_ci": [float(np.nanpercentile(ates, lo_q)), float(np.nanpercentile(ates, hi_q))],
+            "uplift_buckets": {}
+        }
+        for i, label in enumerate(self.bucket_labels):
+            col = uplifts[:, i]
+            summary["uplift_buckets"][label] = {
+                "uplift": None if np.isnan(uplift[i]) else float(uplift[i]),
+                "ci": [float(np.nanpercentile(col, lo_q)), float(np.nanpercentile(col, hi_q))] if np.isfinite(col).any() else None
+            }
+        return summary
@@ -0,0 +1,84 @@
+import numpy as np
+import xgboost as xgb
+import os
+import time
+import concurrent.futures
+
+# Read-only arrays shared with the fold workers (set once per worker by the pool initializer)
+_SHARED = {}
+
+def _init_fold_worker(X, T, Y, fold_of_row):
+    _SHARED['X'] = X
+    _SHARED['T'] = T
+    _SHARED['Y'] = Y
+    _SHARED['fold'] = fold_of_row
+
+def _fit_fold(fold_id: int, model_params: dict) -> tuple:
+    """
+    Worker: fits mu0/mu1 on the K-1 training folds and imputes D0/D1 on the held-out fold.
+    Returns the held-out row positions with their imputed effects.
+    """
+    X, T, Y, fold = _SHARED['X'], _SHARED['T'], _SHARED['Y'], _SHARED['fold']
+    in_fold = fold == fold_id
+
+    train0 = ~in_fold & (T == 0)
+    train1 = ~in_fold & (T == 1)
+    mu0 = xgb.XGBRegressor(**model_params).fit(X[train0], Y[train0])
+    mu1 = xgb.XGBRegressor(**model_params).fit(X[train1], Y[train1])
+
+    held0 = np.flatnonzero(in_fold & (T == 0))
+    held1 = np.flatnonzero(in_fold & (T == 1))
+
+    D0 = mu1.predict(X[held0]) - Y[held0]
+    D1 = Y[held1] - mu0.predict(X[held1])
+    return held0, D0, held1, D1
+
+class GameGroupedCrossFitter:
+    """
+    Cross-fitting for the X-learner imputation step.
+    Training games are split into K groups, so a game never contributes to the outcome
+    model that imputes its own treatment effects.
+    """
+
+    def __init__(self, n_folds: int = 5, n_jobs: int = None, random_state: int = 42, model_params: dict = None):
+        self.n_folds = n_folds
+        self.n_jobs = n_jobs or min(n_folds, os.cpu_count() or 1)
+        self.random_state = random_state
+        # כל fold מקבל ליבה אחת כדי לא להעמיס את המעבד כשהקיפולים רצים במקביל
+        self.model_params = model_params or {'eval_metric': 'rmse', 'random_state': random_state, 'n_jobs': 1}
+        self.elapsed = None
+
+    def assign_folds(self, game_ids) -> np.ndarray:
+        """Maps every row to a fold by shuffling unique games and splitting them into K groups."""
+        game_ids = np.asarray(game_ids)
+        unique_games = np.unique(game_ids)
+        if len(unique_games) < self.n_folds:
+            raise ValueError(f"Cross-fitting needs at least {self.n_folds} training games, found {len(unique_games)}.")
+
+        rng = np.random.default_rng(self.random_state)
+        shuffled = rng.permutation(unique_games)
+        game_to_fold = {g: k for k, grp in enumerate(np.array_split(shuffled, self.n_folds)) for g in grp}
+        return np.array([game_to_fold[g] for g in game_ids], dtype=np.int32)
+
+    def impute_effects(self, X, T, Y, game_ids) -> tuple:
+        """Returns out-of-fold D0 (for control rows) and D1 (for treated rows), in row order."""
+        start = time.time()
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        T = np.asarray(T).astype(int)
+        Y = np.asarray(Y, dtype=float)
+        fold_of_row = self.assign_folds(game_ids)
+
+        D = np.full(len(T), np.nan)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.n_jobs,
+            initializer=_init_fold_worker,
+            initargs=(X, T, Y, fold_of_row)
+        ) as executor:
+            futures = [executor.submit(_fit_fold, k, self.model_params) for k in range(self.n_folds)]
+            for future in concurrent.futures.as_completed(futures):
+                held0, D0, held1, D1 = future.result()
+                D[held0] = D0
+                D[held1] = D1
+
+        self.elapsed = time.time() - start
+        return D[T == 0], D[T == 1]
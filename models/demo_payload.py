@@ -0,0 +1,210 @@
+import os
+import json
+import gzip
+import time
+import numpy as np
+import pandas as pd
+
+# --- Config ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEMO_DIR = os.path.join(BASE_DIR, '..', 'data', 'demo')
+PAYLOAD_DIRNAME = 'chunks'
+MANIFEST_NAME = 'manifest.json'
+FORMAT_VERSION = 1
+ALIGNMENT = 8   # כל מקטע מתחיל בכפולה של 8 בתים כדי ש-TypedArray ב-JS יוכל לעטוף אותו ישירות
+
+# סכמת העמודות של הדמו: מספרים שלמים נשמרים כמו שהם, ציונים מכומתים לצעד קבוע, טקסט מקודד במילון
+# step=1e-4 שווה לעיגול ל-4 ספרות שה-JSON הישן כבר עשה, כך שהכימות לא מאבד מידע שהדשבורד ראה קודם
+DEMO_COLUMNS = [
+    {'name': 'period', 'encoding': 'int', 'dtype': 'uint8'},
+    {'name': 'home_score', 'encoding': 'int', 'dtype': 'int16'},
+    {'name': 'away_score', 'encoding': 'int', 'dtype': 'int16'},
+    {'name': 'score_margin', 'encoding': 'int', 'dtype': 'int16'},
+    {'name': 'cate_score', 'encoding': 'quantized', 'step': 1e-4},
+    {'name': 'propensity_score', 'encoding': 'quantized', 'step': 1e-4},
+    {'name': 'timeout_team', 'encoding': 'dictionary'},
+    {'name': 'target_stop_run_90s', 'encoding': 'int', 'dtype': 'uint8'},
+    {'name': 'timeout_strategic_weight', 'encoding': 'int', 'dtype': 'uint8'},
+    {'name': 'home_cum_fatigue', 'encoding': 'quantized', 'step': 1e-2},
+    {'name': 'away_cum_fatigue', 'encoding': 'quantized', 'step': 1e-2},
+    {'name': 'play_description', 'encoding': 'dictionary'},
+    {'name': 'shap_stale_lineup', 'encoding': 'quantized', 'step': 1e-4},
+    {'name': 'shap_defensive_collapse', 'encoding': 'quantized', 'step': 1e-4},
+    {'name': 'shap_explosiveness', 'encoding': 'quantized', 'step': 1e-4},
+    {'name': 'shap_fatigue', 'encoding': 'quantized', 'step': 1e-4},
+]
+
+def _smallest_uint(max_value: int) -> str:
+    for dtype in ('uint8', 'uint16', 'uint32'):
+        if max_value <= np.iinfo(dtype).max:
+            return dtype
+    raise ValueError(f"Value range {max_value} does not fit in uint32")
+
+def _encode_column(values: pd.Series, spec: dict):
+    """Returns (little-endian bytes, segment metadata) for one column of one game."""
+    meta = {'name': spec['name'], 'encoding': spec['encoding']}
+    # לקידוד מספרי אין קוד ל-NaN: cast ל-int מחזיר זבל ו-min() של NaN מרעיל את ה-offset, לכן נכשלים במפורש
+    if spec['encoding'] in ('int', 'quantized') and values.isna().any():
+        raise ValueError(f"Column '{spec['name']}' has {int(values.isna().sum())} missing values; "
+                         f"'{spec['encoding']}' encoding has no NaN code (fill or drop them before encoding)")
+
+    if spec['encoding'] == 'int':
+        arr = values.to_numpy().astype(spec['dtype'])
+        meta['dtype'] = spec['dtype']
+    elif spec['encoding'] == 'quantized':
+        # value = offset + code * step (הקוד הוא uint בגודל המינימלי שמכיל את הטווח של המשחק)
+        x = values.to_numpy(dtype=float)
+        offset = round(float(x.min()) / spec['step']) * spec['step']
+        codes = np.round((x - offset) / spec['step']).astype(np.int64)
+        meta['dtype'] = _smallest_uint(int(codes.max()))
+        meta['offset'] = round(offset, 10)
+        meta['step'] = spec['step']
+        arr = codes.astype(meta['dtype'])
+    elif spec['encoding'] == 'dictionary':
+        codes, uniques = pd.factorize(values.fillna('').astype(str))
+        meta['dtype'] = _smallest_uint(max(len(uniques) - 1, 0))
+        meta['dictionary'] = list(uniques)
+        arr = codes.astype(meta['dtype'])
+    else:
+        raise ValueError(f"Unknown encoding '{spec['encoding']}' for {spec['name']}")
+
+    return arr.astype(np.dtype(meta['dtype']).newbyteorder('<')).tobytes(), meta
+
+def encode_game(records: list, columns: list = DEMO_COLUMNS):
+    """Packs one game's possession records into a single aligned binary chunk plus its segment table."""
+    df = pd.DataFrame.from_records(records)
+    blob, segments = bytearray(), []
+    for spec in columns:
+        data, meta = _encode_column(df[spec['name']], spec)
+        blob += b'\x00' * (-len(blob) % ALIGNMENT)
+        meta['byte_offset'] = len(blob)
+        meta['byte_length'] = len(data)
+        segments.append(meta)
+        blob += data
+    return bytes(blob), segments
+
+def write_demo_payload(games: dict, output_dir: str, columns: list = DEMO_COLUMNS) -> dict:
+    """
+    Writes the demo as <output_dir>/chunks/manifest.json plus one <game>.bin chunk per game.
+    The dashboard fetches the manifest on startup and a game's chunk only when that game is selected.
+    """
+    payload_dir = os.path.join(output_dir, PAYLOAD_DIRNAME)
+    os.makedirs(payload_dir, exist_ok=True)
+
+    manifest = {'format_version': FORMAT_VERSION, 'byte_order': 'little', 'games': {}}
+    for game_key, records in games.items():
+        blob, segments = encode_game(records, columns)
+        file_name = f"{game_key}.bin"
+        with open(os.path.join(payload_dir, file_name), 'wb') as f:
+            f.write(blob)
+        manifest['games'][game_key] = {'file': file_name, 'rows': len(records), 'bytes': len(blob), 'columns': segments}
+
+    with open(os.path.join(payload_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+    return manifest
+
+def load_manifest(payload_dir: str) -> dict:
+    with open(os.path.join(payload_dir, MANIFEST_NAME), encoding='utf-8') as f:
+        return json.load(f)
+
+def decode_game(payload_dir: str, manifest: dict, game_key: str) -> pd.DataFrame:
+    """Python mirror of the decoder in js/app.js (used for the round-trip check and the benchmark)."""
+    entry = manifest['games'][game_key]
+    with open(os.path.join(payload_dir, entry['file']), 'rb') as f:
+        blob = f.read()
+
+    data = {}
+    for seg in entry['columns']:
+        arr = np.frombuffer(blob, dtype=np.dtype(seg['dtype']).newbyteorder('<'), count=entry['rows'], offset=seg['byte_offset'])
+        if seg['encoding'] == 'quantized':
+            # עיגול לרשת הכימות: בלי זה 0.12 + 7300 * 1e-4 יוצא 0.8499999 ובדיקות סף כמו >= 0.85 נשברות
+            decimals = max(0, int(round(-np.log10(seg['step']))))
+            data[seg['name']] = np.round(seg['offset'] + arr.astype(float) * seg['step'], decimals)
+        elif seg['encoding'] == 'dictionary':
+            data[seg['name']] = np.asarray(seg['dictionary'], dtype=object)[arr]
+        else:
+            data[seg['name']] = arr.astype(int)
+    return pd.DataFrame(data)
+
+def verify_round_trip(games: dict, payload_dir: str) -> dict:
+    """
+    Decodes every chunk and compares it to the source records:
+    integers and text must match exactly, quantized floats within half a step.
+    """
+    manifest = load_manifest(payload_dir)
+    report = {}
+    for game_key, records in games.items():
+        source = pd.DataFrame.from_records(records)
+        decoded = decode_game(payload_dir, manifest, game_key)
+        if len(decoded) != len(source):
+            raise AssertionError(f"{game_key}: {len(decoded)} decoded rows vs {len(source)} source rows")
+
+        max_error = 0.0
+        for seg in manifest['games'][game_key]['columns']:
+            name = seg['name']
+            if seg['encoding'] == 'quantized':
+                err = float(np.abs(decoded[name].to_numpy() - source[name].to_numpy(dtype=float)).max())
+                if err > seg['step'] / 2 + 1e-9:
+                    raise AssertionError(f"{game_key}.{name}: max error {err} exceeds half step {seg['step'] / 2}")
+                max_error = max(max_error, err)
+            elif seg['encoding'] == 'dictionary':
+                if not (decoded[name].to_numpy() == source[name].fillna('').astype(str).to_numpy()).all():
+                    raise AssertionError(f"{game_key}.{name}: dictionary values differ")
+            elif not (decoded[name].to_numpy() == source[name].to_numpy()).all():
+                raise AssertionError(f"{game_key}.{name}: integer values differ")
+        report[game_key] = {'rows': len(decoded), 'max_quantization_error': max_error}
+    return report
+
+def compare_with_json(demo_dir: str = DEMO_DIR, game_key: str = 'game_1', repeats: int = 20) -> dict:
+    """Size and load-time comparison: full demo_data.json vs manifest + one game chunk."""
+    json_path = os.path.join(demo_dir, 'demo_data.json')
+    payload_dir = os.path.join(demo_dir, PAYLOAD_DIRNAME)
+
+    def gz_size(path):
+        with open(path, 'rb') as f:
+            return len(gzip.compress(f.read()))
+
+    manifest = load_manifest(payload_dir)
+    manifest_path = os.path.join(payload_dir, MANIFEST_NAME)
+    chunk_path = os.path.join(payload_dir, manifest['games'][game_key]['file'])
+    all_chunks = [os.path.join(payload_dir, g['file']) for g in manifest['games'].values()]
+
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        with open(json_path, encoding='utf-8') as f:
+            rows = json.load(f)[game_key]
+    json_ms = (time.perf_counter() - t0) / repeats * 1000
+
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        decoded = decode_game(payload_dir, load_manifest(payload_dir), game_key)
+    chunk_ms = (time.perf_counter() - t0) / repeats * 1000
+
+    return {
+        'game': game_key,
+        'rows': len(rows),
+        'json_bytes': os.path.getsize(json_path),
+        'json_gzip_bytes': gz_size(json_path),
+        'payload_bytes': os.path.getsize(manifest_path) + sum(os.path.getsize(p) for p in all_chunks),
+        'first_load_bytes': os.path.getsize(manifest_path) + os.path.getsize(chunk_path),
+        'first_load_gzip_bytes': gz_size(manifest_path) + gz_size(chunk_path),
+        'json_load_ms': round(json_ms, 3),
+        'chunk_load_ms': round(chunk_ms, 3),
+        'decoded_rows': len(decoded)
+    }
+
+if __name__ == "__main__":
+    # ממיר את demo_data.json הקיים לפורמט החדש (בלי להריץ את הסימולציה מחדש) ומוודא round-trip
+    with open(os.path.join(DEMO_DIR, 'demo_data.json'), encoding='utf-8') as f:
+        games = json.load(f)
+
+    manifest = write_demo_payload(games, DEMO_DIR)
+    print(f"✅ Demo payload written to {os.path.join(DEMO_DIR, PAYLOAD_DIRNAME)} ({len(manifest['games'])} games)")
+
+    for game_key, result in verify_round_trip(games, os.path.join(DEMO_DIR, PAYLOAD_DIRNAME)).items():
+        print(f"   Round-trip {game_key}: {result['rows']} rows OK | max quantization error {result['max_quantization_error']:.6f}")
+
+    stats = compare_with_json(DEMO_DIR)
+    print(f"\n📦 Size: JSON {stats['json_bytes']:,} B ({stats['json_gzip_bytes']:,} gzip) | all chunks {stats['payload_bytes']:,} B | "
+          f"first load {stats['first_load_bytes']:,} B ({stats['first_load_gzip_bytes']:,} gzip)")
+    print(f"⏱️ Load {stats['game']}: JSON {stats['json_load_ms']:.2f} ms vs chunk {stats['chunk_load_ms']:.2f} ms")
@@ -2,33 +2,31 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import os
-import joblib
-import shap
+from explanation_store import ExplanationStore, translate_to_basketball
 
 class ExplainabilityDashboard:
-    def __init__(self, reports_dir: str, models_dir: str, target_col: str):
+    def __init__(self, reports_dir: str, models_dir: str, target_col: str, backend: str = 'shap'):
         self.reports_dir = reports_dir
         self.models_dir = models_dir
         self.target_col = target_col
         self.csv_path = os.path.join(reports_dir, f'timeout_recommendations_report_{target_col}.csv')
         
-        # טעינת המודלים
-        try:
-            self.tau1_model = joblib.load(os.path.join(models_dir, f'tau1_{target_col}.joblib'))
-        except:
-            self.tau1_model = None
+        # מאגר ה-SHAP: explainer אחד לכל (target, model) ומטריצה שמורה ליד דו"ח ההמלצות
+        # backend='native' מפרק את ה-CATE עצמו דרך pred_contribs של XGBoost (בלי shap)
+        self.backend = backend
+        self.store = ExplanationStore(reports_dir, models_dir, target_col, model_name='tau1', backend=backend)
+        required = ['propensity', 'tau0', 'tau1'] if backend == 'native' else ['tau1']
+        self.has_model = all(os.path.exists(os.path.join(models_dir, f'{m}_{target_col}.joblib')) for m in required)
+        self._report = None
 
     def translate_to_basketball(self, feature_name):
-        translations = {
-            'momentum_streak_rolling': "Opponent's Scoring Run",
-            'home_cum_fatigue': "Home Team Fatigue",
-            'away_cum_fatigue': "Away Team Fatigue",
-            'score_margin': "Score Margin",
-            'usage_delta': "Usage Imbalance",
-            'style_tempo_rolling': "Game Tempo Shift",
-            'time_since_last_sub': "Stale Lineup (No Subs)"
-        }
-        return translations.get(feature_name, feature_name)
+        return translate_to_basketball(feature_name)
+
+    def load_report(self):
+        """Reads the recommendations report once per dashboard (row order must match the SHAP store)."""
+        if self._report is None:
+            self._report = pd.read_csv(self.csv_path)
+        return self._report
 
     def run_analysis(self):
         print(f"\n--- 🧠 Analyzing Target: {self.target_col} ---")
@@ -36,38 +34,30 @@ class ExplainabilityDashboard:
             print(f"⚠️ CSV not found for {self.target_col}")
             return
 
-        df = pd.read_csv(self.csv_path).head(5) # ניתוח 5 המקרים הכי חזקים
-        if df.empty or self.tau1_model is None: return
+        df = self.load_report().head(5) # ניתוח 5 המקרים הכי חזקים
+        if df.empty or not self.has_model: return
 
-        # הכנת הדאטה ל-SHAP
-        model_features = self.tau1_model.get_booster().feature_names
-        X_explain = df[model_features]
-        explainer = shap.TreeExplainer(self.tau1_model)
-        shap_values = explainer.shap_values(X_explain)
+        # שליפת ה-drivers מהמאגר (בלי חישוב SHAP מחדש)
+        drivers = self.store.top_drivers(np.arange(len(df)), k=4)
 
-        print("📊 Visual graph generation is currently disabled (commented out).")
-        
-        # --- לבקשתך, יצירת הגרפים מושהית כרגע בהערה כדי לא לעשות בלאגן בעין ---
-        # fig, axes = plt.subplots(1, 3, figsize=(18, 6))
-        # fig.suptitle(f'Tactical Drivers: {self.target_col}', fontsize=16, fontweight='bold')
-        # 
-        # for i in range(min(3, len(df))):
-        #     current_shap = shap_values[i] if not hasattr(shap_values, "values") else shap_values.values[i]
-        #     
-        #     # לקיחת 4 הפיצ'רים הכי משפיעים
-        #     top_indices = np.argsort(np.abs(current_shap))[-4:]
-        #     features = [self.translate_to_basketball(X_explain.columns[j]) for j in top_indices]
-        #     impacts = [current_shap[j] for j in top_indices]
-        # 
-        #     axes[i].barh(features, impacts, color=['#ff9999' if x < 0 else '#66b3ff' for x in impacts])
-        #     axes[i].set_title(f"Alert #{i+1} (Impact: {df.iloc[i]['predicted_cate']*100:.1f}%)")
-        #     axes[i].axvline(0, color='black', linewidth=0.8)
-        # 
-        # plt.tight_layout()
-        # plot_path = os.path.join(self.reports_dir, f'tactical_breakdown_{self.target_col}.png')
-        # plt.savefig(plot_path)
-        # plt.close()
-        # print(f"📊 Graph saved to: {plot_path}")
+        n_alerts = min(3, len(df))
+        fig, axes = plt.subplots(1, n_alerts, figsize=(6 * n_alerts, 6), squeeze=False)
+        fig.suptitle(f'Tactical Drivers: {self.target_col}', fontsize=16, fontweight='bold')
+
+        for i, ax in enumerate(axes[0]):
+            # 4 הפיצ'רים הכי משפיעים, מהקטן לגדול כדי שהחזק יהיה למעלה
+            features = [name for _, name, _ in drivers[i]][::-1]
+            impacts = [value for _, _, value in drivers[i]][::-1]
+
+            ax.barh(features, impacts, color=['#ff9999' if x < 0 else '#66b3ff' for x in impacts])
+            ax.set_title(f"Alert #{i+1} (Impact: {df.iloc[i]['predicted_cate']*100:.1f}%)")
+            ax.axvline(0, color='black', linewidth=0.8)
+
+        fig.tight_layout()
+        plot_path = os.path.join(self.reports_dir, f'tactical_breakdown_{self.target_col}.png')
+        fig.savefig(plot_path)
+        plt.close(fig)
+        print(f"📊 Graph saved to: {plot_path}")
 
     def explain_hero_case_text(self):
         print(f"\n" + "="*60)
@@ -77,7 +67,7 @@ class ExplainabilityDashboard:
             print("⚠️ CSV not found.")
             return
 
-        df = pd.read_csv(self.csv_path)
+        df = self.load_report()
         if 'gameId' not in df.columns:
             return
             
@@ -93,29 +83,21 @@ class ExplainabilityDashboard:
         # שולף רק את ההתראות של המשחק הספציפי הזה
         hero_alerts = bad_coaching_games[bad_coaching_games['gameId'] == hero_game_id].sort_values(by='predicted_cate', ascending=False)
         
-        if self.tau1_model is None: return
+        if not self.has_model: return
         
-        # חישוב SHAP
-        model_features = self.tau1_model.get_booster().feature_names
-        X_explain = hero_alerts[model_features]
-        explainer = shap.TreeExplainer(self.tau1_model)
-        shap_values = explainer.shap_values(X_explain)
+        # שליפת SHAP מהמאגר לפי מיקום השורות בדו"ח (מחושב פעם אחת לכל ההתראות)
+        # מוצא את ה-4 פיצ'רים עם ההשפעה הכי גדולה (בערך מוחלט)
+        drivers = self.store.top_drivers(hero_alerts.index.to_numpy(), k=4)
         
         # הדפסת התוכן של הגרף כטקסט קריא
         for i in range(len(hero_alerts)):
             row = hero_alerts.iloc[i]
-            current_shap = shap_values[i] if not hasattr(shap_values, "values") else shap_values.values[i]
-            
-            # מוצא את ה-4 פיצ'רים עם ההשפעה הכי גדולה (בערך מוחלט)
-            top_indices = np.argsort(np.abs(current_shap))[-4:][::-1] 
             
             print(f"\n  🚨 ALERT #{i+1} | Risk (CATE): {row['predicted_cate']*100:.1f}%")
             print(f"      Context -> Period: {row.get('period', 'N/A')}, Score Margin: {row.get('score_margin', 'N/A')}")
-            print(f"      Top Tactical Drivers (SHAP Values):")
+            print(f"      Top Tactical Drivers ({'SHAP Values' if self.backend == 'shap' else 'CATE Contributions'}):")
             
-            for j in top_indices:
-                feature_name = self.translate_to_basketball(X_explain.columns[j])
-                impact = current_shap[j]
+            for _, feature_name, impact in drivers[i]:
                 # אם ה-SHAP חיובי, הוא מגדיל את הסיכון (הצד האדום בגרף)
                 direction = "🔴 DRIVES RISK UP" if impact > 0 else "🟢 Mitigates Risk"
                 print(f"       - {feature_name}: {impact:+.4f} ({direction})")
@@ -133,6 +115,6 @@ if __name__ == "__main__":
     ]
     
     for t in targets:
-        dashboard = ExplainabilityDashboard(REPORTS_DIR, MODELS_DIR, t)
+        dashboard = ExplainabilityDashboard(REPORTS_DIR, MODELS_DIR, t, backend='native')
         # dashboard.run_analysis() # שמתי בהערה כדי שנקבל פלט נקי
         dashboard.explain_hero_case_text()
\ No newline at end of file
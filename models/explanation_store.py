@@ -0,0 +1,308 @@
+import pandas as pd
+import numpy as np
+import os
+import json
+import time
+import joblib
+import xgboost as xgb
+
+BASKETBALL_TRANSLATIONS = {
+    'momentum_streak_rolling': "Opponent's Scoring Run",
+    'home_cum_fatigue': "Home Team Fatigue",
+    'away_cum_fatigue': "Away Team Fatigue",
+    'score_margin': "Score Margin",
+    'usage_delta': "Usage Imbalance",
+    'style_tempo_rolling': "Game Tempo Shift",
+    'time_since_last_sub': "Stale Lineup (No Subs)"
+}
+
+# עמודות שמזהות שורה בדו"ח ההמלצות, כדי למצוא שורה של משחק בתוך המאגר השמור
+REPORT_ROW_KEY = ['gameId', 'period', 'seconds_remaining']
+
+def translate_to_basketball(feature_name):
+    return BASKETBALL_TRANSLATIONS.get(feature_name, feature_name)
+
+# Process-wide caches: one loaded model and one TreeExplainer per (target, model), invalidated when the model file changes
+_MODEL_CACHE = {}
+_EXPLAINER_CACHE = {}
+
+def _model_path(models_dir: str, target_col: str, model_name: str) -> str:
+    return os.path.join(models_dir, f'{model_name}_{target_col}.joblib')
+
+def load_model(models_dir: str, target_col: str, model_name: str = 'tau1'):
+    path = _model_path(models_dir, target_col, model_name)
+    key = (os.path.abspath(path), os.path.getmtime(path))
+    if key not in _MODEL_CACHE:
+        _MODEL_CACHE[key] = joblib.load(path)
+    return _MODEL_CACHE[key]
+
+def get_tree_explainer(models_dir: str, target_col: str, model_name: str = 'tau1'):
+    """Returns the cached shap.TreeExplainer for (target, model); it is built only once per model file."""
+    path = _model_path(models_dir, target_col, model_name)
+    key = (os.path.abspath(path), os.path.getmtime(path))
+    if key not in _EXPLAINER_CACHE:
+        try:
+            import shap  # ייבוא כבד - נטען רק כשבאמת צריך לבנות explainer
+        except ImportError as e:
+            raise ImportError("The 'shap' backend needs the shap package (pip install shap); "
+                              "backend='native' explains the same models through XGBoost pred_contribs.") from e
+        _EXPLAINER_CACHE[key] = shap.TreeExplainer(load_model(models_dir, target_col, model_name))
+    return _EXPLAINER_CACHE[key]
+
+def top_k_drivers(contributions: np.ndarray, feature_names: list, k: int = 4) -> list:
+    """
+    Top-k features by |contribution| for every row of a (n_rows, n_features) matrix, in one vectorized pass.
+    Returns, per row, a list of (feature, basketball_name, value) sorted by absolute impact.
+    """
+    contributions = np.atleast_2d(np.asarray(contributions))
+    k = min(k, contributions.shape[1])
+    if contributions.shape[0] == 0 or k == 0:
+        return [[] for _ in range(contributions.shape[0])]
+
+    abs_vals = np.abs(contributions)
+    top = np.argpartition(-abs_vals, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(abs_vals, top, axis=1), axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+    values = np.take_along_axis(contributions, top, axis=1)
+
+    return [
+        [(feature_names[j], translate_to_basketball(feature_names[j]), float(v)) for j, v in zip(idx_row, val_row)]
+        for idx_row, val_row in zip(top, values)
+    ]
+
+class NativeContributionExplainer:
+    """
+    XGBoost-native explanation backend (pred_contribs / pred_interactions), no shap dependency.
+    Decomposes the CATE itself: since cate = (1 - g) * tau0 + g * tau1, the per-feature
+    contributions are the propensity-weighted sum of the tau0/tau1 tree-path contributions,
+    and (contributions + bias) add up exactly to the CATE of every row.
+    """
+
+    def __init__(self, models_dir: str, target_col: str):
+        self.models_dir = models_dir
+        self.target_col = target_col
+        self.propensity_model = load_model(models_dir, target_col, 'propensity')
+        self.tau0_model = load_model(models_dir, target_col, 'tau0')
+        self.tau1_model = load_model(models_dir, target_col, 'tau1')
+        self.feature_names = list(self.tau1_model.get_booster().feature_names)
+
+    def _prepare(self, df: pd.DataFrame) -> tuple:
+        X = df.reindex(columns=self.feature_names, fill_value=0)
+        g_x = np.clip(self.propensity_model.predict_proba(X)[:, 1], 0.01, 0.99)
+        return xgb.DMatrix(X, feature_names=self.feature_names), g_x
+
+    def contributions(self, df: pd.DataFrame) -> tuple:
+        """Returns (per-feature CATE contributions (n, F), bias (n,))."""
+        dmat, g_x = self._prepare(df)
+        c0 = self.tau0_model.get_booster().predict(dmat, pred_contribs=True)
+        c1 = self.tau1_model.get_booster().predict(dmat, pred_contribs=True)
+
+        fused = (1 - g_x)[:, None] * c0 + g_x[:, None] * c1
+        return fused[:, :-1].astype(np.float32), fused[:, -1]
+
+    def interactions(self, df: pd.DataFrame) -> np.ndarray:
+        """Propensity-weighted SHAP interaction tensor of the CATE, shape (n, F+1, F+1) (last index = bias)."""
+        dmat, g_x = self._prepare(df)
+        i0 = self.tau0_model.get_booster().predict(dmat, pred_interactions=True)
+        i1 = self.tau1_model.get_booster().predict(dmat, pred_interactions=True)
+        return (1 - g_x)[:, None, None] * i0 + g_x[:, None, None] * i1
+
+    def estimate_cate(self, df: pd.DataFrame) -> np.ndarray:
+        X = df.reindex(columns=self.feature_names, fill_value=0)
+        g_x = np.clip(self.propensity_model.predict_proba(X)[:, 1], 0.01, 0.99)
+        return (1 - g_x) * self.tau0_model.predict(X) + g_x * self.tau1_model.predict(X)
+
+class ExplanationStore:
+    """
+    Column-aligned contribution store for one recommendations report.
+    Row i of the persisted matrix explains row i of timeout_recommendations_report_{target}.csv,
+    so alerts are served by position without re-running the explainer.
+    """
+
+    def __init__(self, reports_dir: str, models_dir: str, target_col: str, model_name: str = 'tau1', backend: str = 'shap'):
+        """
+        backend='shap': shap.TreeExplainer on a single saved model (model_name).
+        backend='native': XGBoost pred_contribs fused across tau0/tau1, i.e. the CATE itself is decomposed.
+        """
+        if backend not in ('shap', 'native'):
+            raise ValueError(f"Unknown explanation backend: {backend}")
+        self.reports_dir = reports_dir
+        self.models_dir = models_dir
+        self.target_col = target_col
+        self.backend = backend
+        self.model_name = model_name if backend == 'shap' else 'cate'
+        prefix = 'shap' if backend == 'shap' else 'contribs'
+        self.csv_path = os.path.join(reports_dir, f'timeout_recommendations_report_{target_col}.csv')
+        self.values_path = os.path.join(reports_dir, f'timeout_recommendations_{prefix}_{self.model_name}_{target_col}.npy')
+        self.meta_path = os.path.join(reports_dir, f'timeout_recommendations_{prefix}_{self.model_name}_{target_col}.json')
+        self.values = None
+        self.meta = None
+        self._native = None
+        self._report_keys = None
+
+    @property
+    def native(self) -> NativeContributionExplainer:
+        if self._native is None:
+            self._native = NativeContributionExplainer(self.models_dir, self.target_col)
+        return self._native
+
+    @property
+    def feature_names(self) -> list:
+        if self.meta:
+            return self.meta['features']
+        if self.backend == 'native':
+            return self.native.feature_names
+        return list(load_model(self.models_dir, self.target_col, self.model_name).get_booster().feature_names)
+
+    def _model_names(self) -> list:
+        return ['propensity', 'tau0', 'tau1'] if self.backend == 'native' else [self.model_name]
+
+    def _fingerprint(self) -> dict:
+        csv_stat = os.stat(self.csv_path)
+        return {
+            'csv_size': csv_stat.st_size,
+            'csv_mtime_ns': csv_stat.st_mtime_ns,
+            'model_mtime_ns': max(os.stat(_model_path(self.models_dir, self.target_col, m)).st_mtime_ns for m in self._model_names())
+        }
+
+    def explain_frame(self, df: pd.DataFrame) -> np.ndarray:
+        """Contribution matrix for any frame, in one batched call (missing features are filled with 0)."""
+        if self.backend == 'native':
+            values, _ = self.native.contributions(df)
+            return values
+
+        X = df.reindex(columns=self.feature_names, fill_value=0)
+        explainer = get_tree_explainer(self.models_dir, self.target_col, self.model_name)
+        shap_values = explainer.shap_values(X)
+        values = shap_values.values if hasattr(shap_values, "values") else shap_values
+        return np.asarray(values, dtype=np.float32)
+
+    def _base_value(self, df: pd.DataFrame) -> float:
+        if self.backend == 'native':
+            # ה-bias של ה-CATE תלוי בשורה (משוקלל לפי g(x)), שומרים את הממוצע לתצוגה
+            _, bias = self.native.contributions(df.head(1000))
+            return float(np.mean(bias)) if len(bias) else 0.0
+        explainer = get_tree_explainer(self.models_dir, self.target_col, self.model_name)
+        return float(np.ravel(explainer.expected_value)[0])
+
+    def build(self) -> np.ndarray:
+        """Explains every row of the recommendations report in one batch and persists the matrix next to it."""
+        start = time.time()
+        features = self.feature_names
+        header = pd.read_csv(self.csv_path, nrows=0).columns
+        df = pd.read_csv(self.csv_path, usecols=[c for c in features if c in header])
+
+        self.values = self.explain_frame(df)
+
+        self.meta = {
+            'target': self.target_col,
+            'model': self.model_name,
+            'backend': self.backend,
+            'features': features,
+            'n_rows': int(self.values.shape[0]),
+            'base_value': self._base_value(df),
+            'build_sec': round(time.time() - start, 3),
+            **self._fingerprint()
+        }
+        np.save(self.values_path, self.values)
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump(self.meta, f, indent=2)
+
+        print(f"💾 {self.backend} store built for {self.target_col} ({self.meta['n_rows']} rows, {self.meta['build_sec']:.2f}s): {self.values_path}")
+        return self.values
+
+    def load(self, rebuild_if_stale: bool = True) -> np.ndarray:
+        """Memory-maps the persisted matrix; rebuilds it if the report or the model changed since it was written."""
+        if self.values is not None:
+            return self.values
+
+        if os.path.exists(self.values_path) and os.path.exists(self.meta_path):
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            fingerprint = self._fingerprint()
+            if all(meta.get(k) == v for k, v in fingerprint.items()):
+                self.meta = meta
+                self.values = np.load(self.values_path, mmap_mode='r')
+                return self.values
+
+        if not rebuild_if_stale:
+            raise FileNotFoundError(f"No up-to-date SHAP store for {self.target_col}: {self.values_path}")
+        return self.build()
+
+    def report_positions(self, df: pd.DataFrame, key: list = REPORT_ROW_KEY) -> np.ndarray:
+        """
+        Report row position of every row of df, or -1 when the row is not in the report
+        (or its key matches several report rows, so the stored row would be a guess).
+        """
+        missing = np.full(len(df), -1)
+        if not os.path.exists(self.csv_path) or not all(c in df.columns for c in key):
+            return missing
+        if self._report_keys is None:
+            header = pd.read_csv(self.csv_path, nrows=0).columns
+            if not all(c in header for c in key):
+                return missing
+            keys = pd.read_csv(self.csv_path, usecols=key).apply(pd.to_numeric, errors='coerce').astype('float64')
+            keys['_position'] = np.arange(len(keys))
+            self._report_keys = keys.drop_duplicates(subset=key, keep=False)
+
+        lookup = df[key].apply(pd.to_numeric, errors='coerce').astype('float64').reset_index(drop=True)
+        matched = lookup.merge(self._report_keys, on=key, how='left')['_position']
+        return matched.fillna(-1).astype(int).to_numpy()
+
+    def top_drivers(self, row_positions, k: int = 4) -> list:
+        """Top-k drivers for the given report row positions, read straight from the store."""
+        values = self.load()
+        rows = np.asarray(values[np.asarray(row_positions, dtype=int)])
+        return top_k_drivers(rows, self.feature_names, k)
+
+def benchmark_backends(models_dir: str, test_path: str, target_col: str, max_rows: int = None) -> dict:
+    """
+    Times shap.TreeExplainer vs. XGBoost pred_contribs on the test split (same tau1 model, so values are comparable)
+    and checks that the fused native contributions reconstruct the CATE.
+    """
+    df = pd.read_parquet(test_path)
+    if max_rows:
+        df = df.head(max_rows)
+
+    native = NativeContributionExplainer(models_dir, target_col)
+    X = df.reindex(columns=native.feature_names, fill_value=0)
+    result = {'target': target_col, 'rows': int(len(X))}
+
+    start = time.time()
+    native_tau1 = native.tau1_model.get_booster().predict(xgb.DMatrix(X, feature_names=native.feature_names), pred_contribs=True)[:, :-1]
+    result['native_tau1_sec'] = time.time() - start
+
+    start = time.time()
+    contribs, bias = native.contributions(X)
+    result['native_cate_sec'] = time.time() - start
+    result['cate_reconstruction_max_err'] = float(np.max(np.abs(contribs.sum(axis=1) + bias - native.estimate_cate(X)))) if len(X) else 0.0
+
+    try:
+        import shap
+    except ImportError:
+        result['shap_sec'] = None
+        print(f"⚠️ shap is not installed - benchmarking the native backend only.")
+        return result
+
+    start = time.time()
+    shap_values = shap.TreeExplainer(native.tau1_model).shap_values(X)
+    result['shap_sec'] = time.time() - start
+    result['max_abs_diff_vs_shap'] = float(np.max(np.abs(np.asarray(shap_values) - native_tau1))) if len(X) else 0.0
+    result['speedup'] = result['shap_sec'] / result['native_tau1_sec'] if result['native_tau1_sec'] > 0 else None
+    return result
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    MODELS_DIR = os.path.join(base_dir, 'models', 'saved_models')
+    TEST_PATH = os.path.join(base_dir, 'data', 'processed', 'test.parquet')
+
+    rows = []
+    for t in ['target_stop_run_90s', 'target_reverse_trend_180s', 'target_improve_margin_90s', 'target_improve_margin_180s']:
+        try:
+            rows.append(benchmark_backends(MODELS_DIR, TEST_PATH, t))
+        except Exception as e:
+            print(f"Error on {t}: {e}")
+
+    if rows:
+        print("\n--- ⏱️ Explanation Backend Benchmark (test split) ---")
+        print(pd.DataFrame(rows).to_string(index=False))
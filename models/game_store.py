@@ -0,0 +1,139 @@
+import pandas as pd
+import numpy as np
+import os
+import json
+import time
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from explanation_store import load_model
+
+# --- Config ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROCESSED_DIR = os.path.join(BASE_DIR, '..', 'data', 'processed')
+MODELS_DIR = os.path.join(BASE_DIR, 'saved_models')
+SCORED_DATASET_PATH = os.path.join(BASE_DIR, '..', 'data', 'demo', 'scored_games.parquet')
+TARGET_COL = 'target_stop_run_90s'
+GAMES_PER_ROW_GROUP = 4   # קבוצת שורות קטנה = קריאה של משחק בודד כמעט בלי שורות עודפות
+
+GAME_INDEX_KEY = b'game_index'
+
+def score_frame(df: pd.DataFrame, models_dir: str, target_col: str = TARGET_COL) -> pd.DataFrame:
+    """
+    Deterministic display scores from the saved X-learner models:
+    cate_score = (1 - g) * tau0 + g * tau1 and propensity_score = g (clipped like training).
+    """
+    p_model = load_model(models_dir, target_col, 'propensity')
+    t0_model = load_model(models_dir, target_col, 'tau0')
+    t1_model = load_model(models_dir, target_col, 'tau1')
+
+    X = df.reindex(columns=p_model.get_booster().feature_names, fill_value=0)
+    g_x = np.clip(p_model.predict_proba(X)[:, 1], 0.01, 0.99)
+
+    df = df.copy()
+    df['propensity_score'] = g_x
+    df['cate_score'] = (1 - g_x) * t0_model.predict(X) + g_x * t1_model.predict(X)
+    if 'win_probability' not in df.columns:
+        df['win_probability'] = (1 / (1 + np.exp(-df['score_margin'] * 0.15))).clip(0.01, 0.99)
+    return df
+
+def write_scored_dataset(df: pd.DataFrame, path: str, games_per_row_group: int = GAMES_PER_ROW_GROUP) -> dict:
+    """
+    Writes games sorted chronologically with row groups cut on game boundaries,
+    and stores a {gameId: [row groups]} index in the Parquet footer so a reader can open one game directly.
+    """
+    df = df.sort_values(by=['gameId', 'period', 'seconds_remaining'], ascending=[True, True, False]).reset_index(drop=True)
+    game_ids = df['gameId'].to_numpy()
+    starts = np.flatnonzero(np.r_[True, game_ids[1:] != game_ids[:-1]])
+    bounds = np.r_[starts, len(df)]
+
+    row_groups, index = [], {}
+    for rg, first in enumerate(range(0, len(starts), games_per_row_group)):
+        last = min(first + games_per_row_group, len(starts))
+        row_groups.append((bounds[first], bounds[last]))
+        for g in game_ids[starts[first:last]]:
+            index[str(int(g))] = [rg]
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    schema = table.schema.with_metadata({**(table.schema.metadata or {}), GAME_INDEX_KEY: json.dumps(index).encode('utf-8')})
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with pq.ParquetWriter(path, schema) as writer:
+        for lo, hi in row_groups:
+            writer.write_table(table.slice(lo, hi - lo), row_group_size=hi - lo)
+
+    return {'games': len(index), 'row_groups': len(row_groups), 'rows': int(len(df))}
+
+class GameIndexedParquet:
+    """
+    Memory-mapped Parquet reader with a game index.
+    Only the row groups that hold the requested game are read; the index comes from the footer
+    (written by write_scored_dataset) or, for other files, from the gameId min/max statistics.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = pq.ParquetFile(path, memory_map=True)
+        self.index = self._load_index()
+
+    def _load_index(self) -> dict:
+        metadata = self.file.schema_arrow.metadata or {}
+        if metadata.get(GAME_INDEX_KEY):
+            return {int(g): rgs for g, rgs in json.loads(metadata[GAME_INDEX_KEY]).items()}
+
+        # Fallback: row-group statistics (a game may span several row groups)
+        col = self.file.schema_arrow.get_field_index('gameId')
+        meta = self.file.metadata
+        ranges = []
+        for rg in range(meta.num_row_groups):
+            stats = meta.row_group(rg).column(col).statistics
+            if stats is None or not stats.has_min_max:
+                raise ValueError(f"No gameId statistics in row group {rg} of {self.path}; rewrite it with write_scored_dataset.")
+            ranges.append((rg, stats.min, stats.max))
+
+        game_ids = pq.read_table(self.path, columns=['gameId'], memory_map=True)['gameId'].to_numpy()
+        return {int(g): [rg for rg, lo, hi in ranges if lo <= g <= hi] for g in np.unique(game_ids)}
+
+    def game_ids(self) -> list:
+        return sorted(self.index)
+
+    def read_game(self, game_id, columns: list = None) -> pd.DataFrame:
+        game_id = int(game_id)
+        if game_id not in self.index:
+            raise KeyError(f"Game {game_id} not found in {self.path}")
+
+        table = self.file.read_row_groups(self.index[game_id], columns=columns)
+        table = table.filter(pc.equal(table['gameId'], pa.scalar(game_id, table.schema.field('gameId').type)))
+        return table.to_pandas().reset_index(drop=True)
+
+def build_scored_dataset(processed_dir: str = PROCESSED_DIR, models_dir: str = MODELS_DIR, out_path: str = SCORED_DATASET_PATH,
+                         target_col: str = TARGET_COL, splits=('test',)) -> dict:
+    """Scores the processed split(s) with the saved models and writes the game-indexed dataset for the app."""
+    start = time.time()
+    df = pd.concat([pd.read_parquet(os.path.join(processed_dir, f'{s}.parquet')) for s in splits], ignore_index=True)
+    df = df.dropna(subset=[target_col, 'timeout_strategic_weight'])
+
+    scored = score_frame(df, models_dir, target_col)
+    stats = write_scored_dataset(scored, out_path)
+    stats['build_sec'] = round(time.time() - start, 2)
+    return stats
+
+if __name__ == "__main__":
+    stats = build_scored_dataset()
+    print(f"✅ Scored dataset written to {SCORED_DATASET_PATH}")
+    print(f"   {stats['games']} games | {stats['rows']:,} rows | {stats['row_groups']} row groups | {stats['build_sec']}s")
+
+    # בדיקת מהירות: פתיחת משחק בודד מול קריאת כל הקובץ
+    reader = GameIndexedParquet(SCORED_DATASET_PATH)
+    game_id = reader.game_ids()[len(reader.game_ids()) // 2]
+
+    t0 = time.time()
+    game_df = reader.read_game(game_id)
+    indexed_sec = time.time() - t0
+
+    t0 = time.time()
+    full = pd.read_parquet(SCORED_DATASET_PATH)
+    full_game = full[full['gameId'] == game_id]
+    full_sec = time.time() - t0
+
+    print(f"   Game {game_id}: indexed read {indexed_sec * 1000:.1f} ms vs full read {full_sec * 1000:.1f} ms ({len(game_df)} rows, match: {len(full_game) == len(game_df)})")
@@ -0,0 +1,122 @@
+import pandas as pd
+import numpy as np
+import xgboost as xgb
+import os
+import sys
+import time
+import argparse
+from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+from pipeline_constants import BASELINE_XGB_PARAMS
+from pipeline_schema import read_csv_with_schema
+from prepare_ml_splits import MLDataPreparer, GRAINS
+from possession_grain import aggregate_possessions, broadcast_to_events
+
+# --- Config ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+INPUT_PATH = os.path.join(BASE_DIR, '..', 'data', 'interim', 'level3_labels.csv')
+REPORTS_DIR = os.path.join(BASE_DIR, '..', 'reports')
+TARGET_COL = 'target_stop_run_90s'
+
+def _metrics(y_true, y_pred, prefix: str) -> dict:
+    return {
+        f'{prefix}_rmse': float(np.sqrt(mean_squared_error(y_true, y_pred))),
+        f'{prefix}_mae': float(mean_absolute_error(y_true, y_pred)),
+        f'{prefix}_r2': float(r2_score(y_true, y_pred)),
+    }
+
+class GrainBenchmark:
+    """
+    Trains the baseline XGBoost regressor at event grain and at possession grain on the same game split.
+    Each model is scored on its own validation rows and on the event-grain validation rows
+    (possession predictions are broadcast to their events), so quality is compared on identical labels.
+    """
+
+    def __init__(self, input_path: str, target_col: str = TARGET_COL):
+        self.input_path = input_path
+        self.target_col = target_col
+        self.results = None
+
+    def load_splits(self):
+        print(f"STEP 1: Loading Level 3 Data from {self.input_path}...")
+        if not os.path.exists(self.input_path):
+            raise FileNotFoundError(f"Missing: {self.input_path}")
+        df = MLDataPreparer.drop_incompatible_columns(read_csv_with_schema(self.input_path))
+        df.sort_values(by=['gameId', 'period', 'seconds_remaining'], ascending=[True, True, False], inplace=True)
+        train_df, val_df, _ = MLDataPreparer.split_by_games(df)
+        return train_df, val_df
+
+    def _xy(self, df: pd.DataFrame, features: list):
+        if 'is_garbage_time' in df.columns:
+            df = df[df['is_garbage_time'] == 0]
+        df = df.dropna(subset=[self.target_col])
+        return df, df[features], df[self.target_col]
+
+    def run(self) -> pd.DataFrame:
+        train_events, val_events = self.load_splits()
+        frames = {'event': (train_events, val_events)}
+
+        start = time.time()
+        frames['possession'] = (aggregate_possessions(train_events), aggregate_possessions(val_events))
+        build_sec = time.time() - start
+
+        _, _, y_val_events = self._xy(val_events, [])
+        rows = []
+        for grain in GRAINS:
+            train_df, val_df = frames[grain]
+            features = [c for c in MLDataPreparer.get_clean_features(train_df) if c in val_df.columns]
+            _, X_tr, y_tr = self._xy(train_df, features)
+            val_rows, X_val, y_val = self._xy(val_df, features)
+
+            print(f"STEP 2: Training at {grain} grain ({len(X_tr):,} rows x {len(features)} features)...")
+            model = xgb.XGBRegressor(**BASELINE_XGB_PARAMS, random_state=42, n_jobs=-1)
+            fit_start = time.time()
+            model.fit(X_tr, y_tr)
+            fit_sec = time.time() - fit_start
+
+            pred = model.predict(X_val)
+            if grain == 'event':
+                event_pred = pd.Series(pred, index=X_val.index)
+            else:
+                scored = val_rows[['gameId', 'possession_id']].assign(pred=pred)
+                event_pred = broadcast_to_events(val_events.loc[y_val_events.index], scored, 'pred')
+
+            # אירועים בלי חיזוי (possession שכולו garbage time / בלי label) לא נספרים
+            covered = event_pred.notna()
+            rows.append({
+                'grain': grain,
+                'train_rows': len(X_tr),
+                'features': len(features),
+                'build_sec': build_sec if grain == 'possession' else 0.0,
+                'fit_sec': fit_sec,
+                **_metrics(y_val, pred, 'own_val'),
+                **_metrics(y_val_events[covered], event_pred[covered], 'event_val'),
+                'event_val_coverage': float(covered.mean()),
+            })
+
+        self.results = pd.DataFrame(rows)
+        event_fit = self.results.loc[self.results['grain'] == 'event', 'fit_sec'].iloc[0]
+        self.results['fit_speedup'] = event_fit / self.results['fit_sec']
+        return self.results
+
+    def save_report(self, reports_dir: str):
+        os.makedirs(reports_dir, exist_ok=True)
+        csv_path = os.path.join(reports_dir, f'grain_benchmark_{self.target_col}.csv')
+        self.results.to_csv(csv_path, index=False)
+        print(f"💾 Benchmark saved to: {csv_path}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Event grain vs possession grain: training time and model quality.")
+    parser.add_argument('--target', default=TARGET_COL)
+    parser.add_argument('--input', default=INPUT_PATH)
+    args = parser.parse_args()
+    try:
+        benchmark = GrainBenchmark(args.input, args.target)
+        results = benchmark.run()
+        print(results.round(4).to_string(index=False))
+        benchmark.save_report(REPORTS_DIR)
+    except Exception as e:
+        print(f"❌ Critical Error in Grain Benchmark: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
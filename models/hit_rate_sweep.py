@@ -3,73 +3,175 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import os
 
-def run_multi_target_sweep(reports_dir):
-    targets = [
-        'target_stop_run_90s', 
-        'target_reverse_trend_180s', 
-        'target_improve_margin_90s', 
-        'target_improve_margin_180s'
-    ]
-    
+CRASH_THRESHOLD = 0.8  # כל מה שמעל 0.8 ייחשב קריסה
+
+class ThresholdSweepEngine:
+    """
+    Vectorized threshold sweep: sorts the CATE scores once and reads alerts, ignored alerts,
+    crashes and hit rate for every threshold from cumulative sums (no per-percentile masks).
+    """
+
+    def __init__(self, cate_scores, treatments, penalties=None, outcomes=None):
+        cate_scores = np.asarray(cate_scores, dtype=float)
+        treatments = np.asarray(treatments).astype(int)
+
+        # מיון יחיד בסדר יורד - ה-k הראשונים הם בדיוק ההתראות עבור כל סף
+        order = np.argsort(-cate_scores, kind='mergesort')
+        self.n = len(cate_scores)
+        self.sorted_desc = cate_scores[order]
+        self.sorted_asc = self.sorted_desc[::-1]
+
+        ignored = (treatments[order] == 0)
+        self.cum_ignored = np.concatenate([[0], np.cumsum(ignored)])
+
+        if penalties is not None:
+            crashes = ignored & (np.asarray(penalties, dtype=float)[order] >= CRASH_THRESHOLD)
+            self.cum_crashes = np.concatenate([[0], np.cumsum(crashes)])
+        else:
+            self.cum_crashes = None
+
+        if outcomes is not None:
+            # כמו .mean() בלולאה הישנה: תוצאות NaN לא נכנסות לא לסכום ולא למכנה
+            out = np.asarray(outcomes, dtype=float)[order]
+            valid = ~np.isnan(out)
+            out = np.where(valid, out, 0.0)
+            self.cum_out_ignored = np.concatenate([[0], np.cumsum(np.where(ignored, out, 0.0))])
+            self.cum_out_complied = np.concatenate([[0], np.cumsum(np.where(~ignored, out, 0.0))])
+            self.cum_valid_ignored = np.concatenate([[0], np.cumsum(valid & ignored)])
+            self.cum_valid_complied = np.concatenate([[0], np.cumsum(valid & ~ignored)])
+        else:
+            self.cum_out_ignored = None
+            self.cum_out_complied = None
+
+    def alerts_at(self, thresholds) -> np.ndarray:
+        """Number of rows with cate >= threshold, for an array of thresholds (binary search on the single sort)."""
+        thresholds = np.asarray(thresholds, dtype=float)
+        return self.n - np.searchsorted(self.sorted_asc, thresholds, side='left')
+
+    def sweep(self, percentiles) -> pd.DataFrame:
+        """Computes the sweep table for an arbitrarily fine percentile grid in one pass."""
+        percentiles = np.asarray(percentiles, dtype=float)
+        if self.n == 0:
+            return pd.DataFrame(columns=['Percentile', 'Threshold', 'Alerts', 'Ignored', 'Crashes', 'Hit_Rate_%', 'Recall_%'])
+
+        thresholds = np.percentile(self.sorted_asc, percentiles)
+        k = self.alerts_at(thresholds)
+        ignored = self.cum_ignored[k]
+
+        table = pd.DataFrame({
+            'Percentile': percentiles,
+            'Threshold': thresholds,
+            'Alerts': k,
+            'Ignored': ignored,
+        })
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if self.cum_crashes is not None:
+                crashes = self.cum_crashes[k]
+                total_crashes = self.cum_crashes[-1]
+                table['Crashes'] = crashes
+                table['Hit_Rate_%'] = np.round(np.where(ignored > 0, crashes / ignored * 100, 0.0), 3)
+                table['Recall_%'] = np.round(crashes / total_crashes * 100, 3) if total_crashes > 0 else 0.0
+
+            if self.cum_out_ignored is not None:
+                complied = k - ignored
+                valid_ignored = self.cum_valid_ignored[k]
+                valid_complied = self.cum_valid_complied[k]
+                ignored_avg = np.where(valid_ignored > 0, self.cum_out_ignored[k] / valid_ignored, np.nan)
+                complied_avg = np.where(valid_complied > 0, self.cum_out_complied[k] / valid_complied, np.nan)
+                table['Complied'] = complied
+                table['Actual_Uplift'] = complied_avg - ignored_avg
+                table['Miss_Rate_%'] = np.where(k > 0, ignored / k * 100, 0.0)
+
+        return table
+
+def sweep_all_targets(reports_dir, targets, percentiles=None) -> pd.DataFrame:
+    """Runs the sweep for every target report and returns one tidy table (one row per target x threshold)."""
+    if percentiles is None:
+        percentiles = np.arange(80, 100)
+
+    frames = []
     for target in targets:
         csv_path = os.path.join(reports_dir, f'timeout_recommendations_report_{target}.csv')
-        
+
         # מוודא שהקובץ קיים כדי שלא יקרוס אם סקריפט 7 לא סיים לרוץ על כולם
         if not os.path.exists(csv_path):
             print(f"\n⚠️ File not found for {target}, skipping... ({csv_path})")
             continue
-            
-        print(f"\n" + "="*50)
-        print(f"--- 🔍 Running Threshold Sweep for {target} ---")
-        df = pd.read_csv(csv_path)
-        
-        # חילוץ העמודות הנכונות (כולל המרה בטוחה למספרים לעמודת העונש)
-        cate_scores = df['predicted_cate'].values 
-        treatments = df['actual_treatment'].values 
+
+        df = pd.read_csv(csv_path, usecols=['predicted_cate', 'actual_treatment', 'target_danger_penalty'])
         penalties = pd.to_numeric(df['target_danger_penalty'], errors='coerce').fillna(0).values
-        
-        results = []
-        
-        # סריקה של כל האחוזונים מ-80 עד 99
-        for p in range(80, 100):
-            threshold = np.percentile(cate_scores, p)
-            
-            alerts = (cate_scores >= threshold)
-            ignored_alerts = alerts & (treatments == 0)
-            total_ignored = ignored_alerts.sum()
-            
-            # סופר קריסות (כל מה שמעל 0.8 ייחשב קריסה)
-            punished = ignored_alerts & (penalties >= 0.8) 
-            total_punished = punished.sum()
-            
-            hit_rate = (total_punished / total_ignored * 100) if total_ignored > 0 else 0
-            
-            results.append({
-                'Percentile': p,
-                'Alerts': alerts.sum(),
-                'Ignored': total_ignored,
-                'Crashes': total_punished,
-                'Hit_Rate_%': round(hit_rate, 3)
-            })
-            
-        df_results = pd.DataFrame(results)
-        print(df_results.to_string(index=False))
-        
-        # ציור ושמירת הגרף לטרגט הספציפי
+
+        engine = ThresholdSweepEngine(df['predicted_cate'].values, df['actual_treatment'].values, penalties)
+        table = engine.sweep(percentiles)
+        table.insert(0, 'Target', target)
+        frames.append(table)
+
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+def plot_sweep_curves(sweep_df, reports_dir):
+    """Saves the hit-rate curve per target plus a combined precision/recall-style chart."""
+    for target, t_df in sweep_df.groupby('Target', sort=False):
         plt.figure(figsize=(10, 5))
-        plt.plot(df_results['Percentile'], df_results['Hit_Rate_%'], marker='o', color='crimson', linewidth=2)
+        plt.plot(t_df['Percentile'], t_df['Hit_Rate_%'], marker='o' if len(t_df) <= 50 else None, color='crimson', linewidth=2)
         plt.title(f'Threshold Sweep: Hit Rate vs. Percentile\n{target}')
         plt.xlabel('Percentile Threshold')
         plt.ylabel('Hit Rate (Crashes / Ignored Alerts) %')
         plt.grid(True, linestyle='--', alpha=0.6)
-        
+
         plot_path = os.path.join(reports_dir, f'threshold_sweep_{target}.png')
         plt.savefig(plot_path)
         plt.close()
         print(f"📊 Sweep Graph saved to: {plot_path}")
 
+    plt.figure(figsize=(10, 6))
+    for target, t_df in sweep_df.groupby('Target', sort=False):
+        plt.plot(t_df['Recall_%'], t_df['Hit_Rate_%'], linewidth=2, label=target.replace('target_', ''))
+    plt.title('Precision / Recall of Alerts Across Thresholds (All Targets)')
+    plt.xlabel('Recall % (Crashes Caught / All Ignored Crashes)')
+    plt.ylabel('Precision % (Hit Rate)')
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.legend()
+
+    plot_path = os.path.join(reports_dir, 'threshold_sweep_precision_recall.png')
+    plt.savefig(plot_path)
+    plt.close()
+    print(f"📊 Precision/Recall Graph saved to: {plot_path}")
+
+def run_multi_target_sweep(reports_dir, percentiles=None):
+    targets = [
+        'target_stop_run_90s',
+        'target_reverse_trend_180s',
+        'target_improve_margin_90s',
+        'target_improve_margin_180s'
+    ]
+
+    # סריקה של כל האחוזונים מ-80 עד 99 כברירת מחדל (אפשר להעביר גריד עדין, למשל 1,000 נקודות)
+    sweep_df = sweep_all_targets(reports_dir, targets, percentiles)
+    if sweep_df.empty:
+        print("⚠️ No recommendation reports found. Nothing to sweep.")
+        return sweep_df
+
+    for target, t_df in sweep_df.groupby('Target', sort=False):
+        print(f"\n" + "="*50)
+        print(f"--- 🔍 Threshold Sweep for {target} ({len(t_df)} thresholds) ---")
+        view = t_df.drop(columns=['Target', 'Threshold', 'Recall_%'])
+        # בגריד עדין מדפיסים רק דגימה - הטבלה המלאה נשמרת ל-CSV
+        if len(view) > 50:
+            view = view.iloc[::max(1, len(view) // 20)]
+        print(view.to_string(index=False))
+
+    table_path = os.path.join(reports_dir, 'threshold_sweep_all_targets.csv')
+    sweep_df.to_csv(table_path, index=False)
+    print(f"\n💾 Tidy sweep table saved to: {table_path}")
+
+    plot_sweep_curves(sweep_df, reports_dir)
+    return sweep_df
+
 if __name__ == "__main__":
     # נתיב תיקיית הדו"חות שלך
     REPORTS_DIR = r"C:\Users\david\finalPro\reports"
-    
-    run_multi_target_sweep(REPORTS_DIR)
\ No newline at end of file
+
+    run_multi_target_sweep(REPORTS_DIR)
@@ -21,7 +21,9 @@ FEATURE_EXPERIMENTS = {
     # Aggressive mitigation based on the Frozen Time and Dead Ball logical criteria
     "v2_aggressive_clean": [
         # Technical/Event IDs (77%+ Leakage culprits)
-        'possession_id', 'personId', 'gameId', 'actionNumber', 'orderNumber', 'possession',
+        'possession_id', 'personId', 'gameId', 'actionNumber', 'orderNumber', 'possession', 'stint_id',
+        # Possession grain event count: a timeout is itself an event row, so it is a post-treatment proxy for T
+        'possession_events',
         
         # Dead Ball Triggers & Direct Action Types (0.97 AUC Leakage culprits)
         'is_foul', 'isFieldGoal', 'is_poss_change', 'event_momentum_val', 'shotDistance',
@@ -40,6 +42,17 @@ FEATURE_EXPERIMENTS = {
     ]
 }
 
+# Hardened baseline XGBoost regressor hyperparameters (shared by training and backtesting)
+BASELINE_XGB_PARAMS = {
+    "n_estimators": 300,
+    "learning_rate": 0.05,
+    "max_depth": 4,
+    "subsample": 0.8,
+    "colsample_bytree": 0.8,
+    "reg_alpha": 1.0,
+    "reg_lambda": 5.0,
+}
+
 # The active experiment configuration to be consumed by the pipeline splits and models
 CURRENT_EXPERIMENT = "v2_aggressive_clean"
 
@@ -0,0 +1,148 @@
+# pipeline_schema.py
+# Centralized dtype schema for every pipeline level (raw play-by-play -> Level 1/2/3 -> processed splits).
+# Every CSV loader in the pipeline goes through read_csv_with_schema() so a column has the same compact dtype at every stage.
+
+import os
+import glob
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.join(BASE_DIR, '..')
+
+# --- Column Schema ---
+# מזהים: Int32 nullable (מזהה חסר נשאר <NA> במקום להפוך את כל העמודה ל-float64)
+ID_COLUMNS = [
+    'gameId', 'teamId', 'personId', 'possession', 'possession_id',
+    'actionNumber', 'orderNumber', 'actionId', 'shotActionNumber', 'officialId',
+    'assistPersonId', 'stealPersonId', 'blockPersonId', 'foulDrawnPersonId',
+    'jumpBallRecoverdPersonId', 'jumpBallWonPersonId', 'jumpBallLostPersonId',
+    'PERSON_ID', 'TEAM_ID',
+]
+
+# טקסט עם מעט ערכים ייחודיים: category במקום מחרוזת פייתון לכל שורה
+CATEGORICAL_COLUMNS = [
+    'teamTricode', 'actionType', 'subType', 'actionSubtype', 'shotResult', 'location',
+    'descriptor', 'area', 'areaDetail', 'side', 'timeout_role', 'playerName', 'playerNameI',
+    'team_side',
+]
+
+# דגלים וספירות קטנות (רבע, משקל פסק זמן, מלאי פסקי זמן)
+INT8_COLUMNS = [
+    'period', 'isFieldGoal', 'isTargetScoreLastPeriod', 'videoAvailable', 'shotValue',
+    'is_foul', 'is_poss_change', 'is_high_fatigue', 'is_clutch_time', 'is_star_resting', 'is_garbage_time',
+    'lineup_confidence', 'timeout_strategic_weight', 'timeouts_remaining_home', 'timeouts_remaining_away',
+    'target_danger_penalty',
+]
+
+# ניקוד ומונים מצטברים
+INT16_COLUMNS = [
+    'scoreHome', 'scoreAway', 'score_margin', 'pointsTotal', 'reboundTotal',
+    'reboundDefensiveTotal', 'reboundOffensiveTotal', 'turnoverTotal', 'foulPersonalTotal', 'foulTechnicalTotal',
+    'cum_pointsTotal', 'cum_turnoverTotal', 'cum_reboundDefensiveTotal', 'team_fouls_period', 'xLegacy', 'yLegacy',
+    'stint_id',
+]
+
+# פיצ'רים רציפים: XGBoost ממילא עובד ב-float32.
+# שעון המשחק (seconds_remaining, play_duration) והטרגטים נשארים float64 - הם מפתחות ל-merge_asof ולסכומים מצטברים
+FLOAT32_COLUMNS = [
+    'x', 'y', 'shotDistance', 'shot_clock_estimated', 'time_since_last_sub',
+    'home_usage_gravity', 'away_usage_gravity', 'usage_delta', 'home_cum_fatigue', 'away_cum_fatigue',
+    'event_momentum_val', 'momentum_streak_rolling', 'explosiveness_index', 'style_tempo_rolling', 'instability_index',
+    'home_lineup_prior_sec', 'away_lineup_prior_sec', 'home_lineup_prior_pm', 'away_lineup_prior_pm', 'stint_elapsed_sec',
+]
+
+COLUMN_DTYPES = {
+    **{c: 'Int32' for c in ID_COLUMNS},
+    **{c: 'category' for c in CATEGORICAL_COLUMNS},
+    **{c: 'int8' for c in INT8_COLUMNS},
+    **{c: 'int16' for c in INT16_COLUMNS},
+    **{c: 'float32' for c in FLOAT32_COLUMNS},
+}
+
+# קבצי כל שלב (glob - כמה עונות נטענות יחד) עבור דו"ח הזיכרון
+LEVEL_FILES = {
+    'raw': os.path.join('data', 'pureData', 'season_*.csv'),
+    'rotations': os.path.join('data', 'pureData', 'rotations_*.csv'),
+    'level1': os.path.join('data', 'interim', 'level1_base.csv'),
+    'level2': os.path.join('data', 'interim', 'level2_features.csv'),
+    'level3': os.path.join('data', 'interim', 'level3_labels.csv'),
+}
+
+def _fits(values: pd.Series, dtype: str) -> bool:
+    info = np.iinfo(dtype.lower())
+    return bool(values.min() >= info.min and values.max() <= info.max)
+
+def cast_column(series: pd.Series, dtype: str) -> pd.Series:
+    """
+    Casts one column to its schema dtype only when it is lossless:
+    non-integral or out-of-range values keep the current dtype, and a plain int column
+    with missing values falls back to float32 (int8/int16 values are exact in float32) or to nullable Int32.
+    """
+    if dtype == 'category':
+        return series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype('category')
+    if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return series
+    if dtype == 'float32':
+        return series.astype('float32')
+
+    present = series.dropna()
+    if present.empty:
+        return series.astype('float32') if dtype in ('int8', 'int16') else series.astype(dtype)
+    if pd.api.types.is_float_dtype(series) and not (present % 1 == 0).all():
+        return series
+    if not _fits(present, dtype):
+        return series.astype('Int64') if dtype == 'Int32' else series
+    if len(present) < len(series):
+        return series.astype('float32' if dtype in ('int8', 'int16') else 'Int32')
+    return series.astype(dtype)
+
+def apply_schema(df: pd.DataFrame, dtypes: dict = COLUMN_DTYPES) -> pd.DataFrame:
+    """Casts every schema column present in df (in place) and returns it."""
+    for col, dtype in dtypes.items():
+        if col in df.columns:
+            df[col] = cast_column(df[col], dtype)
+    return df
+
+def read_csv_with_schema(path: str, **kwargs) -> pd.DataFrame:
+    """
+    pd.read_csv with the pipeline schema.
+    Categoricals are parsed directly as category (no intermediate string column); numeric columns are downcast after parsing.
+    """
+    kwargs.setdefault('low_memory', False)
+    explicit = kwargs.pop('dtype', None) or {}
+    df = pd.read_csv(path, dtype={**{c: 'category' for c in CATEGORICAL_COLUMNS}, **explicit}, **kwargs)
+    return apply_schema(df, {c: t for c, t in COLUMN_DTYPES.items() if c not in explicit})
+
+def memory_mb(df: pd.DataFrame) -> float:
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
+
+def memory_report(root_dir: str = ROOT_DIR, level_files: dict = LEVEL_FILES) -> pd.DataFrame:
+    """Loads each level with default inference and with the schema and reports the in-memory footprint of both."""
+    rows = []
+    for level, pattern in level_files.items():
+        paths = sorted(glob.glob(os.path.join(root_dir, pattern)))
+        if not paths:
+            continue
+        default_df = pd.concat([pd.read_csv(p, low_memory=False) for p in paths], ignore_index=True)
+        default_mb = memory_mb(default_df)
+        n_rows, n_cols = default_df.shape
+        del default_df
+
+        # concat של קטגוריות שונות בין עונות מחזיר מחרוזות, לכן הסכמה מוחלת שוב על הטבלה המאוחדת
+        schema_df = apply_schema(pd.concat([read_csv_with_schema(p) for p in paths], ignore_index=True))
+        schema_mb = memory_mb(schema_df)
+        rows.append({
+            'level': level, 'files': len(paths), 'rows': n_rows, 'columns': n_cols,
+            'default_mb': round(default_mb, 2), 'schema_mb': round(schema_mb, 2),
+            'reduction_%': round((1 - schema_mb / default_mb) * 100, 1) if default_mb else 0.0,
+        })
+    return pd.DataFrame(rows)
+
+if __name__ == "__main__":
+    print("📏 Memory footprint per pipeline level (default inference vs pipeline schema)")
+    report = memory_report()
+    if report.empty:
+        print("⚠️ No pipeline CSVs found under data/pureData or data/interim.")
+    else:
+        print(report.to_string(index=False))
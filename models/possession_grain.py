@@ -0,0 +1,54 @@
+import pandas as pd
+
+# --- Config ---
+POSSESSION_KEYS = ['gameId', 'possession_id']
+EVENT_COUNT_COL = 'possession_events'
+
+# כלל ברירת המחדל הוא 'last' (מצב בסוף ה-possession). כאן רק העמודות שמצטברות לאורך ה-possession
+SUM_COLUMNS = [
+    'play_duration',                        # סכום = משך ה-possession
+    'event_momentum_val', 'pointsTotal', 'turnoverTotal', 'foulPersonalTotal',
+    'reboundTotal', 'reboundDefensiveTotal', 'reboundOffensiveTotal', 'is_foul',
+]
+# דגלים ואירועים שמספיק שקרו פעם אחת בתוך ה-possession
+MAX_COLUMNS = [
+    'timeout_strategic_weight', 'target_danger_penalty',
+    'isFieldGoal', 'is_clutch_time', 'is_high_fatigue',
+]
+
+def possession_agg_rules(columns) -> dict:
+    """Aggregation per column: sums for accumulating counters, max for event flags, end-of-possession value otherwise."""
+    rules = {}
+    for col in columns:
+        if col in POSSESSION_KEYS:
+            continue
+        if col in SUM_COLUMNS:
+            rules[col] = 'sum'
+        elif col in MAX_COLUMNS:
+            rules[col] = 'max'
+        else:
+            rules[col] = 'last'
+    return rules
+
+def aggregate_possessions(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Collapses an event-grain frame (sorted chronologically within each game) into one row per
+    (gameId, possession_id): end-of-possession state and labels, summed durations/counters,
+    and the number of events in the possession.
+    """
+    missing = [k for k in POSSESSION_KEYS if k not in df.columns]
+    if missing:
+        raise KeyError(f"Possession grain needs {missing} (built by calculate_possession_flow in Level 1).")
+
+    numeric = df.select_dtypes(include='number').columns
+    rules = possession_agg_rules(numeric)
+    # sort=False: ה-possessions נשארים בסדר הכרונולוגי של הקלט
+    grouped = df.groupby(POSSESSION_KEYS, sort=False, observed=True)
+    out = grouped.agg(rules)
+    out[EVENT_COUNT_COL] = grouped.size().astype('int16')
+    return out.reset_index()[[*POSSESSION_KEYS, *rules, EVENT_COUNT_COL]]
+
+def broadcast_to_events(events: pd.DataFrame, possessions: pd.DataFrame, column: str) -> pd.Series:
+    """Maps a per-possession column (e.g. a prediction) back onto every event of that possession."""
+    mapped = events[POSSESSION_KEYS].merge(possessions[[*POSSESSION_KEYS, column]], on=POSSESSION_KEYS, how='left')
+    return pd.Series(mapped[column].to_numpy(), index=events.index, name=column)
@@ -1,7 +1,10 @@
 import os
 import json
+import tempfile
 import numpy as np
 import pandas as pd
+from demo_payload import write_demo_payload, verify_round_trip, PAYLOAD_DIRNAME
+from scenario_engine import compile_scenario, generate_demo_games, GAME_1_SCENARIO, GAME_2_SCENARIO
 
 class NBADemoDataArchitect:
     """
@@ -68,312 +71,29 @@ class NBADemoDataArchitect:
             'scoreAway': scoreAway
         })
 
-    def _distribute_points(self, offset_array: np.ndarray, target_idx: int, total_points: float, start_boundary_idx: int, window: int = 10):
-        """
-        Distributes total_points dynamically over a valid window ending at target_idx.
-        Ensures points are basketball-legal per possession (capped at 3 per slot) and never cross period boundaries.
-        """
-        if total_points <= 0:
-            return
-        
-        # Guard clause: ensure window stays within the current period boundary
-        actual_start = max(start_boundary_idx, target_idx - window + 1)
-        w = target_idx - actual_start + 1
-        if w <= 0:
-            return
-            
-        # Distribute incrementally in basketball-realistic numbers (max 3 points per possession slot)
-        remaining_pts = total_points
-        for i in range(w):
-            idx = actual_start + i
-            if remaining_pts <= 0:
-                break
-            # Max 3 points per possession slot, or the remaining points if less than 3
-            pts_to_add = min(3.0, remaining_pts)
-            offset_array[idx] += pts_to_add
-            remaining_pts -= pts_to_add
-            
-        # Catch remaining drift safely at the target index
-        if remaining_pts > 0:
-            offset_array[target_idx] += remaining_pts
-
-    def _apply_positive_margin_offset(self, home_offset: np.ndarray, away_offset: np.ndarray, 
-                                     target_idx: int, target_margin: float, 
-                                     real_h: np.ndarray, real_a: np.ndarray, 
-                                     start_boundary_idx: int, window: int = 10):
-        """
-        Calculates and applies the necessary positive points to either home_offset or away_offset
-        to reach the target score margin at target_idx without ever subtracting points.
-        """
-        current_home_offset = home_offset[:target_idx+1].sum()
-        current_away_offset = away_offset[:target_idx+1].sum()
-        
-        real_diff = real_h[target_idx] - real_a[target_idx]
-        current_offset_diff = current_home_offset - current_away_offset
-        
-        required_diff = target_margin - real_diff - current_offset_diff
-        
-        if required_diff > 0:
-            # Add points to Home to increase margin
-            self._distribute_points(home_offset, target_idx, required_diff, start_boundary_idx, window)
-        elif required_diff < 0:
-            # Add points to Away to decrease margin (make it more negative)
-            self._distribute_points(away_offset, target_idx, abs(required_diff), start_boundary_idx, window)
-
-    def _generate_play_descriptions(self, df: pd.DataFrame, home_code: str = "IND", away_code: str = "TOR") -> list:
-        """
-        Generates realistic play descriptions based on scores and events.
-        """
-        descriptions = []
-        for idx in range(len(df)):
-            row = df.iloc[idx]
-            
-            desc = row.get('play_description', '')
-            if desc != '' and desc != 'Normal game possession':
-                descriptions.append(desc)
-                continue
-                
-            home_delta = 0
-            away_delta = 0
-            if idx > 0:
-                home_delta = df.iloc[idx]['home_score'] - df.iloc[idx-1]['home_score']
-                away_delta = df.iloc[idx]['away_score'] - df.iloc[idx-1]['away_score']
-            else:
-                home_delta = df.iloc[idx]['home_score']
-                away_delta = df.iloc[idx]['away_score']
-                
-            is_to = row.get('turnoverTotal', 0)
-            is_foul = row.get('is_foul', 0)
-            dist = row.get('shotDistance', 0)
-            
-            if home_delta > 0:
-                if home_delta >= 3:
-                    desc = f"{home_code}: Hits a magnificent deep 3-pointer!"
-                elif home_delta == 1:
-                    desc = f"{home_code}: Draws a shooting foul, converts the free throw."
-                else:
-                    desc = f"{home_code}: Beautiful driving layup scored in transition!"
-            elif away_delta > 0:
-                if away_delta >= 3:
-                    desc = f"{away_code}: Fast-break pullback 3-pointer made!"
-                elif away_delta == 1:
-                    desc = f"{away_code}: Sinks the technical free throw cleanly."
-                else:
-                    desc = f"{away_code}: Scores a heavily contested mid-range jumper."
-            elif is_to > 0:
-                desc = "Turnover! Live-ball steal by active defense."
-            elif is_foul > 0:
-                desc = "Personal foul called on the floor. Inbound play."
-            else:
-                choices = [
-                    f"Defensive stop! Safe defensive rebound secured by {home_code}.",
-                    f"Offensive rebound by {away_code}, resetting the attack clock.",
-                    f"{home_code} swinging the ball around the perimeter looking for an opening.",
-                    f"{away_code} executing a structured half-court pick-and-roll set.",
-                    "Heavy defensive pressure forces a contested shot clock violation."
-                ]
-                desc = choices[idx % len(choices)]
-                
-            descriptions.append(desc)
-        return descriptions
-
     def simulate_game_1(self, template_df: pd.DataFrame) -> list:
         """
         Generates Game 1 (Stubborn Coach - Failure Scenario)
         """
-        df = template_df.copy()
-        N = len(df)
-        
-        np.random.seed(101)
-        df['cate_score'] = 0.12 + np.random.uniform(0.0, 0.05, N)
-        df['propensity_score'] = 0.10 + np.random.uniform(0.0, 0.05, N)
-        df['timeout_team'] = "NONE"
-        df['target_stop_run_90s'] = 0
-        df['timeout_strategic_weight'] = 0
-        df['play_description'] = ""
-        
-        df['shap_stale_lineup'] = 0.10 + np.random.uniform(0.0, 0.04, N)
-        df['shap_defensive_collapse'] = 0.08 + np.random.uniform(0.0, 0.04, N)
-        df['shap_explosiveness'] = 0.09 + np.random.uniform(0.0, 0.04, N)
-        df['shap_fatigue'] = 0.11 + np.random.uniform(0.0, 0.04, N)
-        
-        q1_idx = df[df['period'] == 1].index.values
-        q2_idx = df[df['period'] == 2].index.values
-        q3_idx = df[df['period'] == 3].index.values
-        q4_idx = df[df['period'] == 4].index.values
-        
-        real_home = df['scoreHome'].values.copy() if 'scoreHome' in df.columns else df['home_score'].values.copy()
-        real_away = df['scoreAway'].values.copy() if 'scoreAway' in df.columns else df['away_score'].values.copy()
-        
-        home_offset = np.zeros(N, dtype=float)
-        away_offset = np.zeros(N, dtype=float)
-        
-        # --- Q1 Simulation ---
-        target_idx_q1 = q1_idx[int(len(q1_idx) * 0.60)]
-        self._apply_positive_margin_offset(home_offset, away_offset, target_idx_q1, 11, real_home, real_away, start_boundary_idx=q1_idx[0], window=15)
-        df.loc[target_idx_q1, 'propensity_score'] = 0.85
-        df.loc[target_idx_q1, 'play_description'] = "Propensity Alarm: Coach model strongly suggests timeout"
-        
-        timeout_idx_q1 = target_idx_q1 + 2
-        df.loc[timeout_idx_q1, 'timeout_team'] = "INDIANA"
-        df.loc[timeout_idx_q1, 'timeout_strategic_weight'] = 1
-        df.loc[timeout_idx_q1, 'target_stop_run_90s'] = 1
-        df.loc[timeout_idx_q1, 'play_description'] = "TIMEOUT: Indiana requests Timeout (Strategic weight = 1)"
-        
-        tactical_idx_q1 = q1_idx[-int(len(q1_idx) * 0.15)]
-        df.loc[tactical_idx_q1, 'timeout_team'] = "INDIANA"
-        df.loc[tactical_idx_q1, 'play_description'] = "Tactical Timeout: End-of-quarter spacing adjustment"
-        
-        # --- Q2 Simulation ---
-        alarm_idx_q2 = 204
-        df.loc[alarm_idx_q2, 'propensity_score'] = 0.88
-        df.loc[alarm_idx_q2, 'play_description'] = "Propensity Alarm: High propensity detected on run"
-        
-        timeout_idx_q2 = 207
-        df.loc[timeout_idx_q2, 'timeout_team'] = "INDIANA"
-        df.loc[timeout_idx_q2, 'timeout_strategic_weight'] = 1
-        df.loc[timeout_idx_q2, 'play_description'] = "TIMEOUT: Strategic timeout called by coach to stop run"
-        
-        # --- Q3 Simulation & Extreme Collapse ---
-        self._apply_positive_margin_offset(home_offset, away_offset, q3_idx[-7], -12, real_home, real_away, start_boundary_idx=q3_idx[0], window=20)
-        
-        prop_fail_slice = q3_idx[-18:-6]
-        df.loc[prop_fail_slice, 'propensity_score'] = 0.82 + np.random.uniform(0.0, 0.05, len(prop_fail_slice))
-        df.loc[prop_fail_slice, 'play_description'] = "Propensity Alarm: Persistent high propensity to call timeout (Ignored)"
-        
-        cate_fail_slice = q3_idx[-6:]
-        df.loc[cate_fail_slice, 'cate_score'] = 0.95
-        df.loc[cate_fail_slice, 'target_stop_run_90s'] = 1
-        df.loc[cate_fail_slice, 'play_description'] = "CRITICAL ALARM: Opponent scoring run of 6 consecutive possessions!"
-        
-        df.loc[cate_fail_slice, 'shap_stale_lineup'] = 0.89
-        df.loc[cate_fail_slice, 'shap_defensive_collapse'] = 0.92
-        df.loc[cate_fail_slice, 'shap_explosiveness'] = 0.85
-        df.loc[cate_fail_slice, 'shap_fatigue'] = 0.81
-        
-        away_offset[cate_fail_slice[0]] += 1
-        away_offset[cate_fail_slice[1]] += 1
-        away_offset[cate_fail_slice[2]] += 1
-        away_offset[cate_fail_slice[3]] += 1
-        away_offset[cate_fail_slice[4]] += 1
-        away_offset[cate_fail_slice[5]] += 1
-        
-        self._apply_positive_margin_offset(home_offset, away_offset, q3_idx[-1], -18, real_home, real_away, start_boundary_idx=q3_idx[0], window=1)
-        
-        # --- Q4 Lock Deficit Corridor ---
-        self._apply_positive_margin_offset(home_offset, away_offset, N - 1, -18, real_home, real_away, start_boundary_idx=q4_idx[0], window=len(q4_idx))
-        
-        home_offset_cumulative = home_offset.cumsum()
-        away_offset_cumulative = away_offset.cumsum()
-        
-        df['home_score'] = np.round(real_home + home_offset_cumulative).astype(int)
-        df['away_score'] = np.round(real_away + away_offset_cumulative).astype(int)
-        
-        # Enforce mathematical monotonic non-decreasing behavior
-        df['home_score'] = np.maximum.accumulate(df['home_score'])
-        df['away_score'] = np.maximum.accumulate(df['away_score'])
-        df['score_margin'] = df['home_score'] - df['away_score']
-        
-        df['play_description'] = self._generate_play_descriptions(df, "IND", "TOR")
-        
-        return df[['period', 'home_score', 'away_score', 'score_margin', 
-                  'cate_score', 'propensity_score', 'timeout_team', 
-                  'target_stop_run_90s', 'timeout_strategic_weight', 
-                  'home_cum_fatigue', 'away_cum_fatigue', 'play_description',
-                  'shap_stale_lineup', 'shap_defensive_collapse', 'shap_explosiveness', 'shap_fatigue']].to_dict(orient='records')
+        return compile_scenario(template_df, GAME_1_SCENARIO)
 
     def simulate_game_2(self, template_df: pd.DataFrame) -> list:
         """
         Generates Game 2 (Strategic Coach - Boston vs Miami - Q4 focused)
         """
-        df = template_df[template_df['period'] == 4].copy().reset_index(drop=True)
-        N = len(df)
-        
-        np.random.seed(202)
-        df['cate_score'] = 0.10 + np.random.uniform(0.0, 0.05, N)
-        df['propensity_score'] = 0.12 + np.random.uniform(0.0, 0.05, N)
-        df['timeout_team'] = "NONE"
-        df['target_stop_run_90s'] = 0
-        df['timeout_strategic_weight'] = 0
-        df['play_description'] = ""
-        
-        df['shap_stale_lineup'] = 0.09 + np.random.uniform(0.0, 0.03, N)
-        df['shap_defensive_collapse'] = 0.07 + np.random.uniform(0.0, 0.03, N)
-        df['shap_explosiveness'] = 0.08 + np.random.uniform(0.0, 0.03, N)
-        df['shap_fatigue'] = 0.10 + np.random.uniform(0.0, 0.03, N)
-        
-        q4_idx = df.index.values
-        
-        real_home = df['scoreHome'].values.copy() if 'scoreHome' in df.columns else df['home_score'].values.copy()
-        real_away = df['scoreAway'].values.copy() if 'scoreAway' in df.columns else df['away_score'].values.copy()
-        
-        home_offset = np.zeros(N, dtype=float)
-        away_offset = np.zeros(N, dtype=float)
-        
-        # 1. Start of Q4: keep margin around -4 (trail by 4)
-        self._apply_positive_margin_offset(home_offset, away_offset, 0, -4, real_home, real_away, start_boundary_idx=0, window=1)
-        self._apply_positive_margin_offset(home_offset, away_offset, 25, -4, real_home, real_away, start_boundary_idx=0, window=25)
-        
-        # 2. Opponent Run (Miami starts to run away):
-        target_idx_q4 = 35
-        self._apply_positive_margin_offset(home_offset, away_offset, target_idx_q4, -11, real_home, real_away, start_boundary_idx=0, window=10)
-        
-        df.loc[target_idx_q4, 'propensity_score'] = 0.85
-        df.loc[target_idx_q4, 'play_description'] = "Propensity Alarm: Coach model strongly suggests timeout"
-        
-        # One possession later, margin drops to -13. Red Alert triggers.
-        c_idx = target_idx_q4 + 1
-        self._apply_positive_margin_offset(home_offset, away_offset, c_idx, -13, real_home, real_away, start_boundary_idx=0, window=1)
-        df.loc[c_idx, 'cate_score'] = 0.94
-        df.loc[c_idx, 'target_stop_run_90s'] = 1
-        df.loc[c_idx, 'play_description'] = "CRITICAL ALARM: Opponent scoring run detected. Timeout highly recommended!"
-        
-        # One possession later, margin is -15. Boston takes a strategic timeout.
-        timeout_idx_q4 = target_idx_q4 + 2
-        self._apply_positive_margin_offset(home_offset, away_offset, timeout_idx_q4, -15, real_home, real_away, start_boundary_idx=0, window=1)
-        df.loc[timeout_idx_q4, 'timeout_team'] = "BOSTON"
-        df.loc[timeout_idx_q4, 'timeout_strategic_weight'] = 1
-        df.loc[timeout_idx_q4, 'play_description'] = "TIMEOUT: Boston requests Timeout (Strategic weight = 1)"
-        
-        # Comeback run: Boston scores. Deficit drops to -10 at timeout_idx_q4 + 5.
-        self._apply_positive_margin_offset(home_offset, away_offset, timeout_idx_q4 + 5, -10, real_home, real_away, start_boundary_idx=0, window=3)
-        
-        # Opponent (Miami) takes a timeout at timeout_idx_q4 + 6 to stop Boston's run.
-        df.loc[timeout_idx_q4 + 6, 'timeout_team'] = "MIAMI"
-        df.loc[timeout_idx_q4 + 6, 'play_description'] = "TIMEOUT: Miami requests Timeout (Tactical response)"
-        
-        # Keep margin around -5 until the final minute (last 15 possessions)
-        self._apply_positive_margin_offset(home_offset, away_offset, N - 15, -5, real_home, real_away, start_boundary_idx=0, window=N - 15 - (timeout_idx_q4 + 7))
-        
-        # Tactical timeouts in the final minute
-        tactical_1 = N - 8
-        df.loc[tactical_1, 'timeout_team'] = "BOSTON"
-        df.loc[tactical_1, 'play_description'] = "Tactical Timeout: Drawing up play for the final game possession"
-        
-        tactical_2 = N - 3
-        df.loc[tactical_2, 'timeout_team'] = "MIAMI"
-        df.loc[tactical_2, 'play_description'] = "Tactical Timeout: Opponent out-of-bounds defensive alignment"
-        
-        # Enforce final buzzer margin = +2 (Boston wins by 2)
-        self._apply_positive_margin_offset(home_offset, away_offset, N - 1, 2, real_home, real_away, start_boundary_idx=0, window=14)
-        
-        home_offset_cumulative = home_offset.cumsum()
-        away_offset_cumulative = away_offset.cumsum()
-        
-        df['home_score'] = np.round(real_home + home_offset_cumulative).astype(int)
-        df['away_score'] = np.round(real_away + away_offset_cumulative).astype(int)
-        
-        df['home_score'] = np.maximum.accumulate(df['home_score'])
-        df['away_score'] = np.maximum.accumulate(df['away_score'])
-        df['score_margin'] = df['home_score'] - df['away_score']
-        
-        df['play_description'] = self._generate_play_descriptions(df, "BOS", "MIA")
-        
-        return df[['period', 'home_score', 'away_score', 'score_margin', 
-                  'cate_score', 'propensity_score', 'timeout_team', 
-                  'target_stop_run_90s', 'timeout_strategic_weight', 
-                  'home_cum_fatigue', 'away_cum_fatigue', 'play_description',
-                  'shap_stale_lineup', 'shap_defensive_collapse', 'shap_explosiveness', 'shap_fatigue']].to_dict(orient='records')
+        return compile_scenario(template_df, GAME_2_SCENARIO)
+
+    def generate_load_test_games(self, n_games: int = 200, seed: int = 0, output_dir: str = None) -> dict:
+        """
+        Compiles n deterministic synthetic games from the same template and writes them as a separate
+        chunked payload (default: a new temp dir, so the payload never lands in data/demo) for dashboard load testing.
+        """
+        template_df = self.load_template_game()
+        games = generate_demo_games(template_df, n_games, seed)
+        output_dir = output_dir or tempfile.mkdtemp(prefix='simcast_load_test_')
+        write_demo_payload(games, output_dir)
+        print(f"Load-test payload with {n_games} games saved at: {os.path.join(output_dir, PAYLOAD_DIRNAME)}")
+        return games
 
     def generate(self):
         """
@@ -432,10 +152,12 @@ class NBADemoDataArchitect:
             json.dump(serializable_data, f, indent=4, ensure_ascii=False)
         print(f"Raw JSON successfully saved at: {json_path}")
         
-        js_path = os.path.join(self.output_dir, "demo_data.js")
-        with open(js_path, "w", encoding="utf-8") as f:
-            f.write("window.DEMO_DATA = " + json.dumps(serializable_data, ensure_ascii=False) + ";")
-        print(f"Formatted JS successfully saved at: {js_path}\nPipeline finished with 100% Data Integrity!")
+        # פורמט הדשבורד: מניפסט קטן + chunk בינארי עמודתי לכל משחק (נטען רק כשהמשחק נבחר)
+        manifest = write_demo_payload(serializable_data, self.output_dir)
+        payload_dir = os.path.join(self.output_dir, PAYLOAD_DIRNAME)
+        verify_round_trip(serializable_data, payload_dir)
+        chunk_bytes = sum(g['bytes'] for g in manifest['games'].values())
+        print(f"Columnar chunks successfully saved at: {payload_dir} ({chunk_bytes:,} bytes, round-trip verified)\nPipeline finished with 100% Data Integrity!")
 
 if __name__ == "__main__":
     base_directory = r"C:\Users\david\finalPro"
@@ -3,13 +3,17 @@ import numpy as np
 import os
 import sys
 import json
+import argparse
 # הייבוא החדש של קובץ הקבועים שלנו!
 from pipeline_constants import get_blacklisted_features
+from pipeline_schema import read_csv_with_schema
+from possession_grain import aggregate_possessions
 
 # --- Config ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_PATH = os.path.join(BASE_DIR, '..',  'data', 'interim', 'level3_labels.csv')
 OUTPUT_DIR = os.path.join(BASE_DIR, '..',  'data', 'processed')
+GRAINS = ('event', 'possession')
 
 class SplitValidator:
     """Draconian QA with Diagnostic Reporting for MLOps."""
@@ -60,54 +64,86 @@ class SplitValidator:
 class MLDataPreparer:
     """Prepares and splits Level 3 data for XGBoost modeling."""
     
-    def __init__(self, input_path: str, output_dir: str):
+    METADATA_COLS = [
+        'actionType', 'actionSubtype', 'description', 'shotResult',
+        'home_lineup', 'away_lineup', 'period_start_time', 'time_elapsed',
+        'jumpBallRecoverdPersonId', 'jumpBallWonPersonId', 'jumpBallLostPersonId',
+        'foulDrawnPersonId', 'foulTechnicalTotal', 'officialId', 
+        'shotActionNumber', 'teamId'
+    ]
+
+    def __init__(self, input_path: str, output_dir: str, grain: str = 'event'):
+        if grain not in GRAINS:
+            raise ValueError(f"Unknown grain '{grain}'. Choose from {GRAINS}.")
         self.input_path = input_path
         self.output_dir = output_dir
+        self.grain = grain
         self.df = None
         os.makedirs(self.output_dir, exist_ok=True)
 
-    def run_pipeline(self):
+    @classmethod
+    def drop_incompatible_columns(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Drops metadata and string/object/categorical columns that XGBoost cannot consume."""
+        df.drop(columns=[c for c in cls.METADATA_COLS if c in df.columns], inplace=True)
+        
+        object_cols = df.select_dtypes(include=['object', 'category']).columns
+        if len(object_cols) > 0:
+            print(f"⚠️ Warning: String columns detected and will be dropped: {list(object_cols)}")
+            df.drop(columns=object_cols, inplace=True)
+        return df
+
+    @staticmethod
+    def get_clean_features(df: pd.DataFrame) -> list:
+        """Feature columns that survive the active leakage blacklist (targets and garbage-time flag excluded)."""
+        all_targets = [c for c in df.columns if c.startswith('target_')]
+        blacklisted = get_blacklisted_features()
+        return [
+            c for c in df.columns 
+            if c not in all_targets 
+            and c not in blacklisted 
+            and c != 'is_garbage_time'
+        ]
+
+    @staticmethod
+    def split_by_games(df: pd.DataFrame):
+        """Chronological 70/15/15 split by game (df must already be sorted by gameId)."""
+        unique_games = df['gameId'].unique()
+        train_idx = int(len(unique_games) * 0.70)
+        val_idx = int(len(unique_games) * 0.85)
+        
+        train_df = df[df['gameId'].isin(unique_games[:train_idx])].copy()
+        val_df = df[df['gameId'].isin(unique_games[train_idx:val_idx])].copy()
+        test_df = df[df['gameId'].isin(unique_games[val_idx:])].copy()
+        return train_df, val_df, test_df
+
+    def run_pipeline(self, df: pd.DataFrame = None):
         print("Starting ML Data Preparation Pipeline...")
         
         print("STEP 1: Loading Level 3 Data...")
-        if not os.path.exists(self.input_path):
+        if df is not None:
+            self.df = df
+        elif not os.path.exists(self.input_path):
             raise FileNotFoundError(f"Missing: {self.input_path}")
-        self.df = pd.read_csv(self.input_path, low_memory=False)
+        else:
+            self.df = read_csv_with_schema(self.input_path)
         
         print(" STEP 2: Feature Selection (Dropping incompatible strings/objects)...")
-        metadata_cols = [
-            'actionType', 'actionSubtype', 'description', 'shotResult',
-            'home_lineup', 'away_lineup', 'period_start_time', 'time_elapsed',
-            'jumpBallRecoverdPersonId', 'jumpBallWonPersonId', 'jumpBallLostPersonId',
-            'foulDrawnPersonId', 'foulTechnicalTotal', 'officialId', 
-            'shotActionNumber', 'teamId'
-        ]
-        self.df.drop(columns=[c for c in metadata_cols if c in self.df.columns], inplace=True)
-        
-        object_cols = self.df.select_dtypes(include=['object']).columns
-        if len(object_cols) > 0:
-            print(f"⚠️ Warning: String columns detected and will be dropped: {list(object_cols)}")
-            self.df.drop(columns=object_cols, inplace=True)
+        self.drop_incompatible_columns(self.df)
 
         print("STEP 3: Chronological Sorting by Game ID...")
         self.df.sort_values(by=['gameId', 'period', 'seconds_remaining'], 
                             ascending=[True, True, False], inplace=True)
         
-        unique_games = self.df['gameId'].unique()
-        total_games = len(unique_games)
+        if self.grain == 'possession':
+            n_events = len(self.df)
+            self.df = aggregate_possessions(self.df)
+            print(f"   Possession grain: {n_events:,} events -> {len(self.df):,} possessions ({n_events / max(len(self.df), 1):.1f} events/row).")
+
+        total_games = self.df['gameId'].nunique()
         print(f"   Found {total_games} unique games.")
 
         print("STEP 4: Splitting into Train (70%), Val (15%), Test (15%)...")
-        train_idx = int(total_games * 0.70)
-        val_idx = int(total_games * 0.85)
-        
-        train_games = unique_games[:train_idx]
-        val_games = unique_games[train_idx:val_idx]
-        test_games = unique_games[val_idx:]
-        
-        train_df = self.df[self.df['gameId'].isin(train_games)].copy()
-        val_df = self.df[self.df['gameId'].isin(val_games)].copy()
-        test_df = self.df[self.df['gameId'].isin(test_games)].copy()
+        train_df, val_df, test_df = self.split_by_games(self.df)
         
         SplitValidator.validate(train_df, val_df, test_df, self.df)
 
@@ -124,18 +160,13 @@ class MLDataPreparer:
         all_targets = [c for c in train_df.columns if c.startswith('target_')]
         
         # --- כאן המטא-דאטה הופך לסטרילי ---
-        blacklisted = get_blacklisted_features()
-        clean_features = [
-            c for c in train_df.columns 
-            if c not in all_targets 
-            and c not in blacklisted 
-            and c != 'is_garbage_time'
-        ]
+        clean_features = self.get_clean_features(train_df)
 
         metadata = {
             "features": clean_features,
             "targets": [c for c in all_targets if c != 'target_danger_penalty'],
-            "penalty_col": "target_danger_penalty" if 'target_danger_penalty' in train_df.columns else None
+            "penalty_col": "target_danger_penalty" if 'target_danger_penalty' in train_df.columns else None,
+            "grain": self.grain
         }
         with open(os.path.join(self.output_dir, 'split_metadata.json'), 'w') as f:
             json.dump(metadata, f, indent=4)
@@ -143,8 +174,12 @@ class MLDataPreparer:
         print(f"✅ Success! Clean JSON and Parquets ready at: {self.output_dir}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Split Level 3 labels into train/val/test Parquet files.")
+    parser.add_argument('--grain', choices=GRAINS, default='event', help="Row grain: play-by-play events or one row per possession.")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR)
+    args = parser.parse_args()
     try:
-        preparer = MLDataPreparer(INPUT_PATH, OUTPUT_DIR)
+        preparer = MLDataPreparer(INPUT_PATH, args.output_dir, grain=args.grain)
         preparer.run_pipeline()
     except Exception as e:
         print(f"❌ Critical Error in Splitting Pipeline: {e}")
@@ -0,0 +1,255 @@
+import os
+import sys
+import glob
+import time
+import argparse
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+
+# --- Config ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.join(BASE_DIR, '..')
+TARGETS = ['target_stop_run_90s', 'target_reverse_trend_180s', 'target_improve_margin_90s', 'target_improve_margin_180s']
+
+# כל מקור הוא glob (כמה עונות = כמה קבצים) שנפתח כ-dataset אחד; הסינון וההטלה נדחפים לסריקה עצמה
+SOURCES = {
+    'level1': {'pattern': os.path.join('data', 'interim', 'level1_base*.csv'), 'format': 'csv'},
+    'level2': {'pattern': os.path.join('data', 'interim', 'level2_features*.csv'), 'format': 'csv'},
+    'level3': {'pattern': os.path.join('data', 'interim', 'level3_labels*.csv'), 'format': 'csv'},
+    'stints': {'pattern': os.path.join('data', 'interim', 'lineup_stints*.csv'), 'format': 'csv'},
+    'train': {'pattern': os.path.join('data', 'processed', 'train*.parquet'), 'format': 'parquet'},
+    'val': {'pattern': os.path.join('data', 'processed', 'val*.parquet'), 'format': 'parquet'},
+    'test': {'pattern': os.path.join('data', 'processed', 'test*.parquet'), 'format': 'parquet'},
+    'processed': {'pattern': os.path.join('data', 'processed', '*.parquet'), 'format': 'parquet'},
+    'scored_games': {'pattern': os.path.join('data', 'demo', 'scored_games*.parquet'), 'format': 'parquet'},
+    'recommendations': {'pattern': os.path.join('reports', 'timeout_recommendations_report_{target}.csv'), 'format': 'csv'},
+    'backtests': {'pattern': os.path.join('reports', 'backtest_{target}.csv'), 'format': 'csv'},
+}
+
+CSV_BLOCK_SIZE = 1 << 24   # הסקת טיפוסים על בלוקים גדולים כדי שעמודה לא "תחליף" טיפוס באמצע קובץ
+
+class QueryLayer:
+    """
+    Embedded analytical layer over the pipeline's files.
+    Datasets are opened lazily with pyarrow.dataset, so only the requested columns are read (projection pushdown)
+    and filters are applied during the scan - Parquet row groups whose statistics cannot match are skipped.
+    """
+
+    def __init__(self, root_dir: str = ROOT_DIR, sources: dict = None):
+        self.root_dir = root_dir
+        self.sources = sources or SOURCES
+        self._datasets = {}
+
+    def paths(self, source: str, target: str = TARGETS[0]) -> list:
+        spec = self.sources[source]
+        return sorted(glob.glob(os.path.join(self.root_dir, spec['pattern'].format(target=target))))
+
+    def dataset(self, source: str, target: str = TARGETS[0]) -> ds.Dataset:
+        key = (source, target)
+        if key not in self._datasets:
+            if source not in self.sources:
+                raise KeyError(f"Unknown source '{source}'. Available: {', '.join(self.sources)}")
+            paths = self.paths(source, target)
+            if not paths:
+                raise FileNotFoundError(f"No files for source '{source}' ({self.sources[source]['pattern'].format(target=target)})")
+            if self.sources[source]['format'] == 'csv':
+                fmt = ds.CsvFileFormat(read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE))
+            else:
+                fmt = 'parquet'
+            # עונות שונות יכולות להוסיף עמודות; הסכמה המאוחדת נותנת null לעמודה שחסרה בקובץ ישן במקום לזרוק
+            schema = pa.unify_schemas([ds.dataset(p, format=fmt).schema for p in paths], promote_options='permissive')
+            self._datasets[key] = ds.dataset(paths, schema=schema, format=fmt)
+        return self._datasets[key]
+
+    def schema(self, source: str, target: str = TARGETS[0]) -> pa.Schema:
+        return self.dataset(source, target).schema
+
+    def scan(self, source: str, columns: list = None, filter: ds.Expression = None, target: str = TARGETS[0]) -> pa.Table:
+        """Reads only `columns` of the rows matching `filter`."""
+        return self.dataset(source, target).to_table(columns=columns, filter=filter)
+
+    def aggregate(self, source: str, group_by: list, aggregations: list, filter: ds.Expression = None,
+                  derived: dict = None, target: str = TARGETS[0]) -> pd.DataFrame:
+        """
+        GROUP BY over a projected scan.
+        aggregations: [(column, 'sum'|'mean'|'count'|'min'|'max'|'count_distinct', output_name)]
+        derived: {name: callable(table) -> array} computed after the scan (e.g. a boolean flag to sum).
+        """
+        derived = derived or {}
+        needed = set(group_by) | {c for c, _, _ in aggregations if c not in derived} | _derived_columns(derived)
+        missing = needed - set(self.schema(source, target).names)
+        if missing:
+            raise KeyError(f"Source '{source}' has no column(s): {', '.join(sorted(missing))}")
+        columns = [f for f in self.schema(source, target).names if f in needed]
+        table = self.scan(source, columns, filter, target)
+        for name, func in derived.items():
+            table = table.append_column(name, func(table))
+
+        result = table.group_by(group_by).aggregate([(c, agg) for c, agg, _ in aggregations])
+        names = {f"{c}_{agg}": out for c, agg, out in aggregations}
+        return result.rename_columns([names.get(n, n) for n in result.column_names]).to_pandas()
+
+    def sql(self, query: str, target: str = TARGETS[0]) -> pd.DataFrame:
+        """
+        Ad-hoc SQL over the same sources (each source is a view with its name), through DuckDB if it is installed.
+        DuckDB scans the Arrow datasets directly, so the same projection/filter pushdown applies.
+        """
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError("Ad-hoc SQL needs the optional 'duckdb' package (pip install duckdb); saved queries work without it.") from e
+
+        con = duckdb.connect()
+        for source in self.sources:
+            if source in query and self.paths(source, target):
+                con.register(source, self.dataset(source, target))
+        return con.execute(query).df()
+
+def _derived_columns(derived: dict) -> set:
+    # כל עמודה שנגזרת צריכה את עמודות הקלט שלה בסריקה; הן מוצהרות על הפונקציה עצמה
+    return {c for func in derived.values() for c in getattr(func, 'inputs', [])}
+
+def derive(inputs: list):
+    """Marks a derived-column function with the source columns it reads."""
+    def decorator(func):
+        func.inputs = inputs
+        return func
+    return decorator
+
+# --- Saved queries ---
+# ספריית שאילתות שמורות במקום סקריפטים חד-פעמיים; כל שאילתה מקבלת QueryLayer ופרמטרים מה-CLI
+
+SAVED_QUERIES = {}
+
+def saved_query(name: str, description: str):
+    def decorator(func):
+        SAVED_QUERIES[name] = {'func': func, 'description': description}
+        return func
+    return decorator
+
+@derive(['timeout_strategic_weight'])
+def _is_timeout(table):
+    return pc.cast(pc.greater(table['timeout_strategic_weight'], 0), pa.int64())
+
+@saved_query('clutch_miss_rate_by_team', "Per team: danger possessions in clutch time and how often no strategic timeout was called.")
+def clutch_miss_rate_by_team(q: QueryLayer, source: str = 'level3', min_possessions: int = 1) -> pd.DataFrame:
+    flt = (ds.field('is_clutch_time') == 1) & (ds.field('target_danger_penalty') == 1)
+    df = q.aggregate(source, ['teamTricode'],
+                     [('teamTricode', 'count', 'danger_possessions'), ('is_timeout', 'sum', 'timeouts_called')],
+                     filter=flt, derived={'is_timeout': _is_timeout})
+    df = df[df['danger_possessions'] >= int(min_possessions)]
+    df['miss_rate_%'] = (1 - df['timeouts_called'] / df['danger_possessions']) * 100
+    return df.sort_values('miss_rate_%', ascending=False).reset_index(drop=True)
+
+@saved_query('timeouts_by_period', "Possessions, strategic timeout rate and danger rate per period.")
+def timeouts_by_period(q: QueryLayer, source: str = 'processed') -> pd.DataFrame:
+    df = q.aggregate(source, ['period'],
+                     [('period', 'count', 'possessions'), ('is_timeout', 'sum', 'timeouts'),
+                      ('target_danger_penalty', 'mean', 'danger_rate'), ('score_margin', 'mean', 'avg_margin')],
+                     derived={'is_timeout': _is_timeout})
+    df['timeout_rate_%'] = df['timeouts'] / df['possessions'] * 100
+    return df.sort_values('period').reset_index(drop=True)
+
+@saved_query('game_summary', "Per-period summary of a single game (gameId filter pushed into the scan).")
+def game_summary(q: QueryLayer, game_id: int, source: str = 'processed') -> pd.DataFrame:
+    df = q.aggregate(source, ['period'],
+                     [('period', 'count', 'possessions'), ('is_timeout', 'sum', 'timeouts'),
+                      ('score_margin', 'min', 'min_margin'), ('score_margin', 'max', 'max_margin'),
+                      ('target_danger_penalty', 'sum', 'danger_possessions')],
+                     filter=ds.field('gameId') == int(game_id), derived={'is_timeout': _is_timeout})
+    return df.sort_values('period').reset_index(drop=True)
+
+@saved_query('sweet_spot', "Alerts, coach miss rate and crash hit rate at top-percentile CATE thresholds (per target report).")
+def sweet_spot(q: QueryLayer, percentiles: str = '90,95', targets: str = None) -> pd.DataFrame:
+    from hit_rate_sweep import ThresholdSweepEngine
+
+    frames = []
+    for target in (targets.split(',') if targets else TARGETS):
+        if not q.paths('recommendations', target):
+            continue
+        table = q.scan('recommendations', ['predicted_cate', 'actual_treatment', 'target_danger_penalty'], target=target)
+        penalties = pd.to_numeric(table['target_danger_penalty'].to_pandas(), errors='coerce').fillna(0).values
+        engine = ThresholdSweepEngine(table['predicted_cate'].to_numpy(), table['actual_treatment'].to_numpy(), penalties)
+        sweep = engine.sweep([int(p) for p in str(percentiles).split(',')])
+        sweep.insert(0, 'Target', target)
+        frames.append(sweep)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+@saved_query('top_alerts', "Highest-CATE recommendations of one target, optionally only those the coach ignored.")
+def top_alerts(q: QueryLayer, target: str = TARGETS[0], limit: int = 20, ignored_only: bool = False) -> pd.DataFrame:
+    schema = q.schema('recommendations', target)
+    columns = [c for c in ['gameId', 'period', 'seconds_remaining', 'score_margin', 'predicted_cate', 'actual_treatment', 'target_danger_penalty'] if c in schema.names]
+    flt = ds.field('actual_treatment') == 0 if str(ignored_only).lower() in ('1', 'true', 'yes') else None
+    table = q.scan('recommendations', columns, flt, target=target)
+    top = pc.select_k_unstable(table, int(limit), [('predicted_cate', 'descending')])
+    return table.take(top).to_pandas().sort_values('predicted_cate', ascending=False).reset_index(drop=True)
+
+@saved_query('backtest_summary', "Mean AUC / uplift per rolling-origin backtest mode (reports/backtest_{target}.csv).")
+def backtest_summary(q: QueryLayer, target: str = TARGETS[0]) -> pd.DataFrame:
+    schema = q.schema('backtests', target)
+    metrics = [c for c in schema.names if c not in ('origin', 'origin_week', 'train_weeks', 'test_week', 'mode', 'warm_start')
+               and pa.types.is_floating(schema.field(c).type)]
+    group = ['warm_start'] if 'warm_start' in schema.names else []
+    if not group:
+        return q.scan('backtests', metrics, target=target).to_pandas().describe().T.rename_axis('metric').reset_index()
+    return q.aggregate('backtests', group, [(m, 'mean', f'mean_{m}') for m in metrics], target=target)
+
+def run_saved_query(name: str, q: QueryLayer = None, **params) -> pd.DataFrame:
+    if name not in SAVED_QUERIES:
+        raise KeyError(f"Unknown saved query '{name}'. Available: {', '.join(sorted(SAVED_QUERIES))}")
+    return SAVED_QUERIES[name]['func'](q or QueryLayer(), **params)
+
+def _parse_params(items: list) -> dict:
+    params = {}
+    for item in items or []:
+        key, _, value = item.partition('=')
+        params[key.replace('-', '_')] = value
+    return params
+
+def _emit(df: pd.DataFrame, fmt: str, output: str = None):
+    if output:
+        if output.endswith('.csv'):
+            df.to_csv(output, index=False)
+        else:
+            df.to_json(output, orient='records', indent=2)
+        print(f"💾 Saved {len(df):,} rows to {output}")
+    elif fmt == 'csv':
+        df.to_csv(sys.stdout, index=False)
+    elif fmt == 'json':
+        print(df.to_json(orient='records', indent=2))
+    else:
+        with pd.option_context('display.max_rows', 200, 'display.width', 200):
+            print(df.to_string(index=False))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Saved analytical queries over interim/processed data and reports.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list', help="List saved queries.")
+    sub.add_parser('sources', help="List sources and the files they resolve to.")
+    p_run = sub.add_parser('run', help="Run a saved query.")
+    p_run.add_argument('name')
+    p_run.add_argument('params', nargs='*', help="key=value parameters (e.g. game_id=22401052)")
+    p_sql = sub.add_parser('sql', help="Ad-hoc SQL (requires duckdb); sources are views by name.")
+    p_sql.add_argument('query')
+    for p in (p_run, p_sql):
+        p.add_argument('--format', choices=['table', 'csv', 'json'], default='table')
+        p.add_argument('--output', default=None, help="Write to .csv or .json instead of stdout.")
+    parser.add_argument('--root', default=ROOT_DIR, help="Project root the source patterns are resolved from.")
+    args = parser.parse_args()
+
+    q = QueryLayer(args.root)
+    if args.command == 'list':
+        for name, spec in sorted(SAVED_QUERIES.items()):
+            print(f"  {name:<26} {spec['description']}")
+    elif args.command == 'sources':
+        for name, spec in q.sources.items():
+            files = q.paths(name)
+            print(f"  {name:<16} {len(files)} file(s)  {spec['pattern']}")
+    else:
+        start = time.time()
+        df = run_saved_query(args.name, q, **_parse_params(args.params)) if args.command == 'run' else q.sql(args.query)
+        _emit(df, args.format, args.output)
+        print(f"⏱️ {len(df):,} rows in {time.time() - start:.2f}s", file=sys.stderr)
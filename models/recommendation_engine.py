@@ -3,13 +3,14 @@ import numpy as np
 import joblib
 import os
 import json
+from explanation_store import NativeContributionExplainer, top_k_drivers
 
 class InferenceEngine:
     def __init__(self, data_path: str, models_dir: str):
         self.data_path = data_path
         self.models_dir = models_dir
 
-    def run_inference(self, target_col):
+    def run_inference(self, target_col, explain_top_k: int = 3):
         # 1. טעינת מודלים
         p_model = joblib.load(os.path.join(self.models_dir, f'propensity_{target_col}.joblib'))
         t0_model = joblib.load(os.path.join(self.models_dir, f'tau0_{target_col}.joblib'))
@@ -49,6 +50,13 @@ class InferenceEngine:
         print(f"\nTarget: {target_col} | Ignored Avg: {ignored['outcome'].mean():.4f} | Complied Avg: {complied['outcome'].mean():.4f}")
         print(f"👉 OPPORTUNITY COST: {cost_of_ignoring:+.4f}")
         
+        # 5. הסבר ההתראות: פירוק ה-CATE עצמו דרך pred_contribs (בלי shap), באצווה אחת לכל ההתראות
+        if explain_top_k and not alerts.empty:
+            explainer = NativeContributionExplainer(self.models_dir, target_col)
+            contribs, _ = explainer.contributions(alerts)
+            drivers = top_k_drivers(contribs, explainer.feature_names, explain_top_k)
+            alerts['top_drivers'] = ['; '.join(f"{name} ({value:+.3f})" for _, name, value in row) for row in drivers]
+        
         return alerts
 
 if __name__ == "__main__":
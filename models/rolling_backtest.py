@@ -0,0 +1,243 @@
+import pandas as pd
+import numpy as np
+import xgboost as xgb
+import os
+import sys
+import time
+import concurrent.futures
+from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score, roc_auc_score
+import matplotlib.pyplot as plt
+from pipeline_constants import BASELINE_XGB_PARAMS
+from prepare_ml_splits import MLDataPreparer
+
+# --- Config ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+INPUT_PATH = os.path.join(BASE_DIR, '..', 'data', 'interim', 'level3_labels.csv')
+REPORTS_DIR = os.path.join(BASE_DIR, '..', 'reports')
+TARGET_COL = 'target_stop_run_90s'
+TREATMENT_COL = 'timeout_strategic_weight'
+
+MIN_TRAIN_WEEKS = 4          # Origin הראשון: אימון על 4 שבועות לפחות
+WARM_START_ROUNDS = 50       # עצים נוספים בכל Origin כשממשיכים booster קיים
+GAMES_PER_PSEUDO_WEEK = 50   # Fallback כשאין gameDate: בלוקים כרונולוגיים לפי gameId
+
+# Read-only arrays shared with the origin workers (set once per worker by the pool initializer)
+_SHARED = {}
+
+def _init_backtest_worker(X, y, T, week, treatment_idx):
+    _SHARED['X'] = X
+    _SHARED['y'] = y
+    _SHARED['T'] = T
+    _SHARED['week'] = week
+    _SHARED['treatment_idx'] = treatment_idx
+
+def _boost(model_cls, params, X, y, prev_model, warm_start):
+    """Cold fit, or continue boosting the previous origin's booster on the expanded window."""
+    if warm_start and prev_model is not None:
+        warm_params = {**params, 'n_estimators': WARM_START_ROUNDS}
+        return model_cls(**warm_params).fit(X, y, xgb_model=prev_model.get_booster())
+    return model_cls(**params).fit(X, y)
+
+def _run_origin_block(origins, warm_start: bool) -> list:
+    """
+    Worker: evaluates a contiguous block of origins in order.
+    Rows are sorted by week, so the training matrix of origin N is a prefix of the shared array
+    and each origin only extends the previous one (warm-start boosting where valid).
+    """
+    X, y, T, week = _SHARED['X'], _SHARED['y'], _SHARED['T'], _SHARED['week']
+    x_cols = np.array([i for i in range(X.shape[1]) if i != _SHARED['treatment_idx']])
+
+    baseline_params = {**BASELINE_XGB_PARAMS, 'random_state': 42, 'n_jobs': 1}
+    causal_params = {'random_state': 42, 'n_jobs': 1}
+
+    baseline = propensity = mu0 = mu1 = None
+    results = []
+
+    for origin in origins:
+        train_end = np.searchsorted(week, origin, side='right')
+        test_end = np.searchsorted(week, origin + 1, side='right')
+        if test_end == train_end:
+            continue
+
+        start = time.time()
+        X_tr, y_tr, T_tr = X[:train_end], y[:train_end], T[:train_end]
+        X_te, y_te, T_te = X[train_end:test_end], y[train_end:test_end], T[train_end:test_end]
+
+        # --- 1. Baseline XGBoost (same target, same features -> warm start is valid) ---
+        baseline = _boost(xgb.XGBRegressor, baseline_params, X_tr, y_tr, baseline, warm_start)
+        y_pred = baseline.predict(X_te)
+
+        # --- 2. X-Learner ---
+        # Propensity and mu0/mu1 keep their target definition as the window grows, so they warm start.
+        # tau0/tau1 are refit from scratch because their imputed targets change with mu0/mu1.
+        Xc_tr, Xc_te = X_tr[:, x_cols], X_te[:, x_cols]
+        c0, c1 = T_tr == 0, T_tr == 1
+
+        propensity = _boost(xgb.XGBClassifier, causal_params, Xc_tr, T_tr, propensity, warm_start)
+        mu0 = _boost(xgb.XGBRegressor, causal_params, Xc_tr[c0], y_tr[c0], mu0, warm_start)
+        mu1 = _boost(xgb.XGBRegressor, causal_params, Xc_tr[c1], y_tr[c1], mu1, warm_start)
+
+        D0 = mu1.predict(Xc_tr[c0]) - y_tr[c0]
+        D1 = y_tr[c1] - mu0.predict(Xc_tr[c1])
+        tau0 = xgb.XGBRegressor(**causal_params).fit(Xc_tr[c0], D0)
+        tau1 = xgb.XGBRegressor(**causal_params).fit(Xc_tr[c1], D1)
+
+        g_x = np.clip(propensity.predict_proba(Xc_te)[:, 1], 0.01, 0.99)
+        cate = (1 - g_x) * tau0.predict(Xc_te) + g_x * tau1.predict(Xc_te)
+
+        # Realized uplift inside the Top 20% CATE bucket of the test week
+        top = cate >= np.percentile(cate, 80)
+        top_t1, top_t0 = top & (T_te == 1), top & (T_te == 0)
+        top_uplift = y_te[top_t1].mean() - y_te[top_t0].mean() if top_t1.any() and top_t0.any() else np.nan
+
+        results.append({
+            'origin_week': int(origin),
+            'test_week': int(origin + 1),
+            'train_rows': int(train_end),
+            'test_rows': int(test_end - train_end),
+            'baseline_rmse': float(np.sqrt(mean_squared_error(y_te, y_pred))),
+            'baseline_mae': float(mean_absolute_error(y_te, y_pred)),
+            'baseline_r2': float(r2_score(y_te, y_pred)),
+            'propensity_auc': float(roc_auc_score(T_te, g_x)) if len(np.unique(T_te)) == 2 else np.nan,
+            'ate': float(cate.mean()),
+            'top20_uplift': float(top_uplift),
+            'fit_sec': time.time() - start
+        })
+
+    return results
+
+class RollingOriginBacktester:
+    """
+    Rolling-origin time-series backtest over the season.
+    Origin N trains on every game up to week N and tests on week N+1, for both the
+    baseline XGBoost regressor and the X-Learner.
+    """
+
+    def __init__(self, input_path: str, target_col: str = TARGET_COL, treatment_col: str = TREATMENT_COL,
+                 min_train_weeks: int = MIN_TRAIN_WEEKS, n_jobs: int = None, warm_start: bool = True):
+        self.input_path = input_path
+        self.target_col = target_col
+        self.treatment_col = treatment_col
+        self.min_train_weeks = min_train_weeks
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.warm_start = warm_start
+        self.df = None
+        self.feature_cols = []
+        self.results = None
+
+    def load_data(self):
+        print(f"STEP 1: Loading Level 3 Data from {self.input_path}...")
+        if not os.path.exists(self.input_path):
+            raise FileNotFoundError(f"Missing: {self.input_path}")
+        df = pd.read_csv(self.input_path, low_memory=False)
+
+        print("STEP 2: Assigning game weeks...")
+        df['week'] = self._assign_weeks(df)
+
+        if 'is_garbage_time' in df.columns:
+            df = df[df['is_garbage_time'] == 0]
+        df = df.dropna(subset=[self.target_col, self.treatment_col])
+
+        df = MLDataPreparer.drop_incompatible_columns(df.copy())
+        df.sort_values(by=['week', 'gameId', 'period', 'seconds_remaining'],
+                       ascending=[True, True, True, False], inplace=True)
+
+        self.feature_cols = [c for c in MLDataPreparer.get_clean_features(df) if c != 'week']
+        self.df = df.reset_index(drop=True)
+        print(f"   {len(self.df):,} rows | {self.df['gameId'].nunique()} games | {self.df['week'].nunique()} weeks | {len(self.feature_cols)} features")
+
+    def _assign_weeks(self, df: pd.DataFrame) -> pd.Series:
+        if 'gameDate' in df.columns:
+            dates = pd.to_datetime(df['gameDate'], errors='coerce')
+            if dates.notna().all():
+                return ((dates - dates.min()).dt.days // 7).astype(int)
+
+        print(f"   ⚠️ 'gameDate' unavailable. Falling back to chronological blocks of {GAMES_PER_PSEUDO_WEEK} games.")
+        game_rank = df['gameId'].rank(method='dense').astype(int) - 1
+        return game_rank // GAMES_PER_PSEUDO_WEEK
+
+    def build_origins(self) -> np.ndarray:
+        weeks = np.sort(self.df['week'].unique())
+        return weeks[(weeks >= weeks[0] + self.min_train_weeks - 1) & (weeks < weeks[-1])]
+
+    def run(self) -> pd.DataFrame:
+        self.load_data()
+        origins = self.build_origins()
+        if len(origins) == 0:
+            raise ValueError("Not enough weeks for a rolling-origin backtest. Lower min_train_weeks.")
+
+        X = self.df[self.feature_cols].to_numpy(dtype=np.float32)
+        y = self.df[self.target_col].to_numpy(dtype=float)
+        T = (self.df[self.treatment_col] > 0).astype(int).to_numpy()
+        week = self.df['week'].to_numpy()
+        treatment_idx = self.feature_cols.index(self.treatment_col) if self.treatment_col in self.feature_cols else -1
+
+        # בלוקים רציפים של Origins: בתוך בלוק ממשיכים את ה-booster, בין בלוקים רצים במקביל
+        n_blocks = min(self.n_jobs, len(origins))
+        blocks = [b for b in np.array_split(origins, n_blocks) if len(b) > 0]
+        print(f"STEP 3: Running {len(origins)} origins in {len(blocks)} parallel blocks (warm start: {self.warm_start})...")
+
+        start = time.time()
+        rows = []
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=len(blocks),
+            initializer=_init_backtest_worker,
+            initargs=(X, y, T, week, treatment_idx)
+        ) as executor:
+            futures = [executor.submit(_run_origin_block, block, self.warm_start) for block in blocks]
+            for future in concurrent.futures.as_completed(futures):
+                rows.extend(future.result())
+
+        self.results = pd.DataFrame(rows).sort_values('origin_week').reset_index(drop=True)
+        print(f"✅ Backtest finished in {time.time() - start:.1f}s")
+        return self.results
+
+    def save_report(self, reports_dir: str):
+        os.makedirs(reports_dir, exist_ok=True)
+        csv_path = os.path.join(reports_dir, f'backtest_{self.target_col}.csv')
+        self.results.to_csv(csv_path, index=False)
+        print(f"💾 Per-week metrics saved to: {csv_path}")
+
+        fig, axes = plt.subplots(2, 2, figsize=(14, 9), sharex=True)
+        fig.suptitle(f'Rolling-Origin Backtest (Train ≤ Week N, Test Week N+1)\n{self.target_col}', fontsize=14, weight='bold')
+        weeks = self.results['test_week']
+
+        axes[0, 0].plot(weeks, self.results['baseline_rmse'], marker='o', color='coral', label='RMSE')
+        axes[0, 0].plot(weeks, self.results['baseline_mae'], marker='s', color='steelblue', label='MAE')
+        axes[0, 0].set_title('Baseline XGBoost Error')
+        axes[0, 0].legend()
+
+        axes[0, 1].plot(weeks, self.results['propensity_auc'], marker='o', color='purple')
+        axes[0, 1].set_title('Propensity AUC')
+
+        axes[1, 0].plot(weeks, self.results['ate'], marker='o', color='mediumseagreen')
+        axes[1, 0].axhline(0, color='black', linewidth=0.8)
+        axes[1, 0].set_title('X-Learner ATE')
+
+        axes[1, 1].plot(weeks, self.results['top20_uplift'], marker='o', color='crimson')
+        axes[1, 1].axhline(0, color='black', linewidth=0.8)
+        axes[1, 1].set_title('Realized Uplift in Top 20% CATE')
+
+        for ax in axes.flat:
+            ax.grid(True, linestyle='--', alpha=0.6)
+        for ax in axes[1]:
+            ax.set_xlabel('Test Week')
+
+        plt.tight_layout()
+        plot_path = os.path.join(reports_dir, f'backtest_curves_{self.target_col}.png')
+        plt.savefig(plot_path)
+        plt.close()
+        print(f"📈 Metric curves saved to: {plot_path}")
+
+def main():
+    try:
+        backtester = RollingOriginBacktester(INPUT_PATH, TARGET_COL)
+        results = backtester.run()
+        print(results.to_string(index=False))
+        backtester.save_report(REPORTS_DIR)
+    except Exception as e:
+        print(f"❌ Critical Error in Backtest: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+import time
+import numpy as np
+import pandas as pd
+
+# עמודות הפלט של כל משחק דמו (הסדר שהדשבורד וה-payload מצפים לו)
+SCENARIO_COLUMNS = [
+    'period', 'home_score', 'away_score', 'score_margin',
+    'cate_score', 'propensity_score', 'timeout_team',
+    'target_stop_run_90s', 'timeout_strategic_weight',
+    'home_cum_fatigue', 'away_cum_fatigue', 'play_description',
+    'shap_stale_lineup', 'shap_defensive_collapse', 'shap_explosiveness', 'shap_fatigue'
+]
+
+MAX_POINTS_PER_POSSESSION = 3.0
+NORMAL_POSSESSION = 'Normal game possession'
+LOAD_TEST_TEAMS = [
+    ('IND', 'INDIANA'), ('TOR', 'TORONTO'), ('BOS', 'BOSTON'), ('MIA', 'MIAMI'),
+    ('DEN', 'DENVER'), ('LAL', 'LAKERS'), ('NYK', 'NEW YORK'), ('PHX', 'PHOENIX')
+]
+
+# --- Position references ---
+# אירוע מצביע על פוזשן לפי: מספר שלם (מיקום במשחק, שלילי = מהסוף),
+# או dict יחסי לרבע: {'period': 3, 'pos': -7} / {'period': 1, 'frac': 0.6, 'shift': 2} / {'period': 3, 'start': -18, 'stop': -6}
+# 'span': k מחזיר את k הפוזשנים שמסתיימים בנקודה (למשל ריצת נקודות שמובילה להתראה)
+
+def resolve_positions(ref, period_index: dict, n: int) -> np.ndarray:
+    """Resolves an event position reference to absolute row positions."""
+    if isinstance(ref, dict):
+        idx = period_index[ref['period']]
+        if 'start' in ref or 'stop' in ref:
+            return idx[ref.get('start'):ref.get('stop')]
+        if 'frac' in ref:
+            frac = ref['frac']
+            pos = int(len(idx) * frac) if frac >= 0 else -int(len(idx) * -frac)
+        else:
+            pos = ref['pos']
+        end = idx[pos] + ref.get('shift', 0)
+        return np.arange(end - ref.get('span', 1) + 1, end + 1)
+    positions = np.atleast_1d(np.asarray(ref, dtype=int))
+    return np.where(positions < 0, positions + n, positions)
+
+def _resolve_one(ref, period_index: dict, n: int) -> int:
+    return int(resolve_positions(ref, period_index, n)[-1])
+
+# --- Score compilation ---
+
+def solve_margin_offsets(real_diff: np.ndarray, targets: np.ndarray, margins: np.ndarray,
+                         starts: np.ndarray, fixed_home: np.ndarray, fixed_away: np.ndarray):
+    """
+    Compiles every margin target into home/away point offsets in one vectorized pass.
+
+    Points are only ever added (never subtracted), at most 3 per possession, in a window ending at the target.
+    With targets in time order the offset already applied before target k is exactly the requirement of
+    target k-1, so each target needs np.diff of the cumulative requirement instead of a sequential loop.
+    """
+    n = len(real_diff)
+    fixed_diff = np.cumsum(fixed_home - fixed_away)
+    required = margins - real_diff[targets] - fixed_diff[targets]
+    signed = np.diff(np.r_[0.0, required])
+
+    points = np.abs(signed)
+    widths = targets - starts + 1
+    slots = np.where((points > 0) & (widths > 0), np.minimum(np.ceil(points / MAX_POINTS_PER_POSSESSION), widths), 0).astype(int)
+
+    # כל יעד מתפרס על slots[k] פוזשנים מתחילת החלון: 3 נקודות בכל אחד, והשארית בפוזשן האחרון (או ביעד עצמו אם החלון קצר)
+    ends = np.cumsum(slots)
+    within = np.arange(ends[-1] if len(ends) else 0) - np.repeat(ends - slots, slots)
+    positions = np.repeat(starts, slots) + within
+    amounts = np.full(len(positions), MAX_POINTS_PER_POSSESSION)
+    last = ends[slots > 0] - 1
+    amounts[last] = points[slots > 0] - MAX_POINTS_PER_POSSESSION * (slots[slots > 0] - 1)
+
+    to_home = np.repeat(signed > 0, slots)
+    home_offset, away_offset = fixed_home.astype(float).copy(), fixed_away.astype(float).copy()
+    np.add.at(home_offset, positions[to_home], amounts[to_home])
+    np.add.at(away_offset, positions[~to_home], amounts[~to_home])
+    return home_offset, away_offset
+
+def generate_play_descriptions(df: pd.DataFrame, home_code: str = "IND", away_code: str = "TOR") -> np.ndarray:
+    """Vectorized play-by-play text: scripted descriptions are kept, the rest is derived from score deltas."""
+    n = len(df)
+    scripted = df['play_description'].fillna('').astype(str).to_numpy() if 'play_description' in df.columns else np.full(n, '', dtype=object)
+    keep = (scripted != '') & (scripted != NORMAL_POSSESSION)
+
+    home = df['home_score'].to_numpy()
+    away = df['away_score'].to_numpy()
+    home_delta = np.diff(home, prepend=0) if n else home
+    away_delta = np.diff(away, prepend=0) if n else away
+    is_to = df['turnoverTotal'].fillna(0).to_numpy() if 'turnoverTotal' in df.columns else np.zeros(n)
+    is_foul = df['is_foul'].fillna(0).to_numpy() if 'is_foul' in df.columns else np.zeros(n)
+
+    choices = np.array([
+        f"Defensive stop! Safe defensive rebound secured by {home_code}.",
+        f"Offensive rebound by {away_code}, resetting the attack clock.",
+        f"{home_code} swinging the ball around the perimeter looking for an opening.",
+        f"{away_code} executing a structured half-court pick-and-roll set.",
+        "Heavy defensive pressure forces a contested shot clock violation."
+    ], dtype=object)
+
+    generated = np.select(
+        [home_delta >= 3, home_delta == 1, home_delta > 0,
+         away_delta >= 3, away_delta == 1, away_delta > 0,
+         is_to > 0, is_foul > 0],
+        [f"{home_code}: Hits a magnificent deep 3-pointer!",
+         f"{home_code}: Draws a shooting foul, converts the free throw.",
+         f"{home_code}: Beautiful driving layup scored in transition!",
+         f"{away_code}: Fast-break pullback 3-pointer made!",
+         f"{away_code}: Sinks the technical free throw cleanly.",
+         f"{away_code}: Scores a heavily contested mid-range jumper.",
+         "Turnover! Live-ball steal by active defense.",
+         "Personal foul called on the floor. Inbound play."],
+        default=''
+    ).astype(object)
+    generated = np.where(generated == '', choices[np.arange(n) % len(choices)], generated)
+    return np.where(keep, scripted, generated)
+
+# --- Scenario compiler ---
+
+def compile_scenario(template_df: pd.DataFrame, scenario: dict) -> list:
+    """
+    Turns a declarative scenario into possession records.
+
+    scenario keys: 'periods' (template periods to keep, None = all), 'seed', 'home_code'/'away_code',
+    'baseline' ([(column, base, spread)] drawn in order), and 'events':
+      margin  - {'at', 'margin', 'window': int | 'period' | {'from': ref}} (runs, corridors, final margin)
+      run     - {'at', 'team': 'home'|'away', 'points'} fixed points on every referenced possession
+      timeout - {'at', 'team', 'strategic', 'description', 'values'}
+      alert   - {'at', 'values', 'jitter', 'description'}
+      fatigue - {'at', 'team', 'seconds'} cumulative fatigue spike from that possession on
+    """
+    df = template_df
+    if scenario.get('periods') is not None:
+        df = df[df['period'].isin(scenario['periods'])]
+    df = df.copy().reset_index(drop=True)
+    n = len(df)
+    period_index = {p: np.flatnonzero(df['period'].to_numpy() == p) for p in np.unique(df['period'])}
+
+    rng = np.random.RandomState(scenario.get('seed', 0))
+    for col, base, spread in scenario['baseline']:
+        df[col] = base + rng.uniform(0.0, spread, n)
+    df['timeout_team'] = "NONE"
+    df['target_stop_run_90s'] = 0
+    df['timeout_strategic_weight'] = 0
+    df['play_description'] = ""
+
+    real_home = df['scoreHome'].to_numpy(dtype=float) if 'scoreHome' in df.columns else df['home_score'].to_numpy(dtype=float)
+    real_away = df['scoreAway'].to_numpy(dtype=float) if 'scoreAway' in df.columns else df['away_score'].to_numpy(dtype=float)
+    fixed = {'home': np.zeros(n), 'away': np.zeros(n)}
+    fatigue = {'home': np.zeros(n), 'away': np.zeros(n)}
+    margin_events = []
+
+    # אירועי "כתיבה" (התראות/טיים-אאוטים) מוחלים לפי סדר הרשימה; אירועי ניקוד נאספים לפתרון אחד
+    for event in scenario['events']:
+        kind = event['type']
+        if kind == 'margin':
+            target = _resolve_one(event['at'], period_index, n)
+            period_start = period_index[df.at[target, 'period']][0]
+            window = event.get('window', 10)
+            if window == 'period':
+                window = len(period_index[df.at[target, 'period']])
+            elif isinstance(window, dict):
+                window = target - _resolve_one(window['from'], period_index, n) + 1
+            margin_events.append((target, event['margin'], max(period_start, target - window + 1)))
+        elif kind == 'run':
+            np.add.at(fixed[event['team']], resolve_positions(event['at'], period_index, n), event.get('points', 1))
+        elif kind == 'fatigue':
+            np.add.at(fatigue[event['team']], resolve_positions(event['at'], period_index, n), event['seconds'])
+        elif kind in ('timeout', 'alert'):
+            positions = resolve_positions(event['at'], period_index, n)
+            values = dict(event.get('values', {}))
+            if kind == 'timeout':
+                values['timeout_team'] = event['team']
+                if event.get('strategic'):
+                    values['timeout_strategic_weight'] = 1
+            for col, value in values.items():
+                spread = event.get('jitter', {}).get(col)
+                df.loc[positions, col] = value + rng.uniform(0.0, spread, len(positions)) if spread else value
+            if event.get('description'):
+                df.loc[positions, 'play_description'] = event['description']
+        else:
+            raise ValueError(f"Unknown scenario event type '{kind}'")
+
+    if margin_events:
+        order = np.argsort([t for t, _, _ in margin_events], kind='stable')
+        targets, margins, starts = (np.array([margin_events[i][j] for i in order]) for j in range(3))
+        home_offset, away_offset = solve_margin_offsets(real_home - real_away, targets, margins.astype(float), starts, fixed['home'], fixed['away'])
+    else:
+        home_offset, away_offset = fixed['home'], fixed['away']
+
+    # Enforce mathematical monotonic non-decreasing behavior
+    df['home_score'] = np.maximum.accumulate(np.round(real_home + home_offset.cumsum()).astype(int))
+    df['away_score'] = np.maximum.accumulate(np.round(real_away + away_offset.cumsum()).astype(int))
+    df['score_margin'] = df['home_score'] - df['away_score']
+    df['home_cum_fatigue'] = df['home_cum_fatigue'] + fatigue['home'].cumsum()
+    df['away_cum_fatigue'] = df['away_cum_fatigue'] + fatigue['away'].cumsum()
+
+    df['play_description'] = generate_play_descriptions(df, scenario.get('home_code', 'IND'), scenario.get('away_code', 'TOR'))
+    return df[SCENARIO_COLUMNS].to_dict(orient='records')
+
+# --- Scripted demo scenarios ---
+
+GAME_1_SCENARIO = {
+    'name': 'Stubborn Coach - Failure Scenario',
+    'periods': None, 'seed': 101, 'home_code': 'IND', 'away_code': 'TOR',
+    'baseline': [('cate_score', 0.12, 0.05), ('propensity_score', 0.10, 0.05),
+                 ('shap_stale_lineup', 0.10, 0.04), ('shap_defensive_collapse', 0.08, 0.04),
+                 ('shap_explosiveness', 0.09, 0.04), ('shap_fatigue', 0.11, 0.04)],
+    'events': [
+        # --- Q1 ---
+        {'type': 'margin', 'at': {'period': 1, 'frac': 0.6}, 'margin': 11, 'window': 15},
+        {'type': 'alert', 'at': {'period': 1, 'frac': 0.6}, 'values': {'propensity_score': 0.85},
+         'description': "Propensity Alarm: Coach model strongly suggests timeout"},
+        {'type': 'timeout', 'at': {'period': 1, 'frac': 0.6, 'shift': 2}, 'team': "INDIANA", 'strategic': 1,
+         'values': {'target_stop_run_90s': 1}, 'description': "TIMEOUT: Indiana requests Timeout (Strategic weight = 1)"},
+        {'type': 'timeout', 'at': {'period': 1, 'frac': -0.15}, 'team': "INDIANA",
+         'description': "Tactical Timeout: End-of-quarter spacing adjustment"},
+        # --- Q2 ---
+        {'type': 'alert', 'at': 204, 'values': {'propensity_score': 0.88},
+         'description': "Propensity Alarm: High propensity detected on run"},
+        {'type': 'timeout', 'at': 207, 'team': "INDIANA", 'strategic': 1,
+         'description': "TIMEOUT: Strategic timeout called by coach to stop run"},
+        # --- Q3 Simulation & Extreme Collapse ---
+        {'type': 'margin', 'at': {'period': 3, 'pos': -7}, 'margin': -12, 'window': 20},
+        {'type': 'alert', 'at': {'period': 3, 'start': -18, 'stop': -6}, 'values': {'propensity_score': 0.82},
+         'jitter': {'propensity_score': 0.05}, 'description': "Propensity Alarm: Persistent high propensity to call timeout (Ignored)"},
+        {'type': 'alert', 'at': {'period': 3, 'start': -6},
+         'values': {'cate_score': 0.95, 'target_stop_run_90s': 1, 'shap_stale_lineup': 0.89,
+                    'shap_defensive_collapse': 0.92, 'shap_explosiveness': 0.85, 'shap_fatigue': 0.81},
+         'description': "CRITICAL ALARM: Opponent scoring run of 6 consecutive possessions!"},
+        {'type': 'run', 'at': {'period': 3, 'start': -6}, 'team': 'away', 'points': 1},
+        {'type': 'margin', 'at': {'period': 3, 'pos': -1}, 'margin': -18, 'window': 1},
+        # --- Q4 Lock Deficit Corridor ---
+        {'type': 'margin', 'at': -1, 'margin': -18, 'window': 'period'},
+    ]
+}
+
+GAME_2_SCENARIO = {
+    'name': 'Strategic Coach - ROI Success Scenario',
+    'periods': [4], 'seed': 202, 'home_code': 'BOS', 'away_code': 'MIA',
+    'baseline': [('cate_score', 0.10, 0.05), ('propensity_score', 0.12, 0.05),
+                 ('shap_stale_lineup', 0.09, 0.03), ('shap_defensive_collapse', 0.07, 0.03),
+                 ('shap_explosiveness', 0.08, 0.03), ('shap_fatigue', 0.10, 0.03)],
+    'events': [
+        # 1. Start of Q4: keep margin around -4 (trail by 4)
+        {'type': 'margin', 'at': 0, 'margin': -4, 'window': 1},
+        {'type': 'margin', 'at': 25, 'margin': -4, 'window': 25},
+        # 2. Opponent Run (Miami starts to run away), Red Alert, then Boston's strategic timeout
+        {'type': 'margin', 'at': 35, 'margin': -11, 'window': 10},
+        {'type': 'alert', 'at': 35, 'values': {'propensity_score': 0.85},
+         'description': "Propensity Alarm: Coach model strongly suggests timeout"},
+        {'type': 'margin', 'at': 36, 'margin': -13, 'window': 1},
+        {'type': 'alert', 'at': 36, 'values': {'cate_score': 0.94, 'target_stop_run_90s': 1},
+         'description': "CRITICAL ALARM: Opponent scoring run detected. Timeout highly recommended!"},
+        {'type': 'margin', 'at': 37, 'margin': -15, 'window': 1},
+        {'type': 'timeout', 'at': 37, 'team': "BOSTON", 'strategic': 1,
+         'description': "TIMEOUT: Boston requests Timeout (Strategic weight = 1)"},
+        # Comeback run: deficit drops to -10, Miami answers with a timeout
+        {'type': 'margin', 'at': 42, 'margin': -10, 'window': 3},
+        {'type': 'timeout', 'at': 43, 'team': "MIAMI", 'description': "TIMEOUT: Miami requests Timeout (Tactical response)"},
+        # Keep margin around -5 until the final minute (last 15 possessions)
+        {'type': 'margin', 'at': -15, 'margin': -5, 'window': {'from': 45}},
+        {'type': 'timeout', 'at': -8, 'team': "BOSTON", 'description': "Tactical Timeout: Drawing up play for the final game possession"},
+        {'type': 'timeout', 'at': -3, 'team': "MIAMI", 'description': "Tactical Timeout: Opponent out-of-bounds defensive alignment"},
+        # Enforce final buzzer margin = +2 (Boston wins by 2)
+        {'type': 'margin', 'at': -1, 'margin': 2, 'window': 14},
+    ]
+}
+
+# --- Load-test scenarios ---
+
+def random_scenario(seed: int, periods=(1, 2, 3, 4)) -> dict:
+    """Deterministic synthetic scenario (one scoring run + response per period, fatigue spikes, final margin)."""
+    rng = np.random.RandomState(seed)
+    (home_code, home_team), (away_code, away_team) = [LOAD_TEST_TEAMS[i] for i in rng.choice(len(LOAD_TEST_TEAMS), 2, replace=False)]
+    events = []
+    for p in periods:
+        run_frac = round(float(rng.uniform(0.2, 0.7)), 3)
+        run_at = {'period': p, 'frac': run_frac}
+        timeout_at = {**run_at, 'shift': int(rng.randint(1, 4))}
+        # ריצה של היריבה מפעילה התראה וטיים-אאוט של הבית; ריצה של הבית נענית בטיים-אאוט טקטי של היריבה
+        if rng.rand() < 0.5:
+            events += [
+                {'type': 'run', 'at': {**run_at, 'span': 5}, 'team': 'away', 'points': 2},
+                {'type': 'alert', 'at': run_at, 'values': {'cate_score': 0.9, 'target_stop_run_90s': 1},
+                 'jitter': {'cate_score': 0.08}, 'description': "CRITICAL ALARM: Opponent scoring run detected. Timeout highly recommended!"},
+                {'type': 'timeout', 'at': timeout_at, 'team': home_team, 'strategic': int(rng.rand() < 0.6),
+                 'description': f"TIMEOUT: {home_team.title()} requests Timeout"},
+            ]
+        else:
+            events += [
+                {'type': 'run', 'at': {**run_at, 'span': 5}, 'team': 'home', 'points': 2},
+                {'type': 'timeout', 'at': timeout_at, 'team': away_team, 'description': f"TIMEOUT: {away_team.title()} requests Timeout (Tactical response)"},
+            ]
+        events.append({'type': 'fatigue', 'at': {'period': p, 'frac': round(float(rng.uniform(0.1, 0.9)), 3)},
+                       'team': 'home' if rng.rand() < 0.5 else 'away', 'seconds': float(rng.uniform(60, 240))})
+    events.append({'type': 'margin', 'at': -1, 'margin': int(rng.randint(-20, 21)), 'window': 'period'})
+    return {
+        'name': f'Load test {seed}', 'periods': list(periods), 'seed': seed,
+        'home_code': home_code, 'away_code': away_code,
+        'baseline': [('cate_score', 0.10, 0.05), ('propensity_score', 0.10, 0.05),
+                     ('shap_stale_lineup', 0.09, 0.04), ('shap_defensive_collapse', 0.07, 0.04),
+                     ('shap_explosiveness', 0.08, 0.04), ('shap_fatigue', 0.10, 0.04)],
+        'events': events
+    }
+
+def generate_demo_games(template_df: pd.DataFrame, n_games: int, seed: int = 0) -> dict:
+    """Compiles n deterministic synthetic games ({'load_0000': records, ...}) for dashboard load tests."""
+    return {f"load_{i:04d}": compile_scenario(template_df, random_scenario(seed + i)) for i in range(n_games)}
+
+if __name__ == "__main__":
+    import os
+    from prepare_demo_data import NBADemoDataArchitect
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    architect = NBADemoDataArchitect(os.path.join(base_dir, 'data', 'processed', 'test.parquet'), os.path.join(base_dir, 'data', 'demo'))
+    template_df = architect.load_template_game()
+
+    n_games = 500
+    start = time.time()
+    games = generate_demo_games(template_df, n_games)
+    elapsed = time.time() - start
+    rows = sum(len(g) for g in games.values())
+    print(f"🏀 Compiled {n_games} scenario games ({rows:,} possessions) in {elapsed:.2f}s ({elapsed / n_games * 1000:.1f} ms/game)")
@@ -9,6 +9,7 @@ import matplotlib.pyplot as plt
 import mlflow
 import mlflow.xgboost
 import dagshub
+from pipeline_constants import BASELINE_XGB_PARAMS
 
 # --- Config ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -63,13 +64,7 @@ class BaselineXGBoostRegressor:
         print("\nTraining Hardened Baseline XGBoost Regressor...")
         
         self.model = xgb.XGBRegressor(
-            n_estimators=300,          
-            learning_rate=0.05,        
-            max_depth=4,               
-            subsample=0.8,             
-            colsample_bytree=0.8,      
-            reg_alpha=1.0,             
-            reg_lambda=5.0,            
+            **BASELINE_XGB_PARAMS,
             early_stopping_rounds=20,  
             eval_metric='rmse',        
             random_state=42,
@@ -85,16 +80,7 @@ class BaselineXGBoostRegressor:
 
         # MLflow: Log Parameters
         if mlflow.active_run():
-            mlflow.log_params({
-                "n_estimators": 300,
-                "learning_rate": 0.05,
-                "max_depth": 4,
-                "subsample": 0.8,
-                "colsample_bytree": 0.8,
-                "reg_alpha": 1.0,
-                "reg_lambda": 5.0,
-                "target": self.target
-            })
+            mlflow.log_params({**BASELINE_XGB_PARAMS, "target": self.target})
 
     def evaluate(self, X_val, y_val):
         print("\nEvaluating on Validation Set...")
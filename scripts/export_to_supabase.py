@@ -1,12 +1,36 @@
 import os
 import sys
+import json
+import time
+import sqlite3
+import argparse
+import tempfile
+import threading
+import concurrent.futures
+import numpy as np
 import pandas as pd
-from supabase import create_client, Client
 
 # --- Config ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 # Read directly from the Gold inference/demo package generated by the models pipeline
 GOLD_DATA_PATH = os.path.join(BASE_DIR, '..', 'demo_package_target_stop_run_90s.csv')
+CHECKPOINT_DIR = os.path.join(BASE_DIR, '..', 'data', 'interim')
+SQLITE_PATH = os.path.join(BASE_DIR, '..', 'data', 'interim', 'nba_predictions.sqlite')
+# ה-upsert דורש unique constraint על NATURAL_KEY בטבלה של Supabase - מריצים את הקובץ הזה פעם אחת
+SCHEMA_SQL_PATH = os.path.join(BASE_DIR, 'sql', 'nba_predictions.sql')
+
+TABLE_NAME = 'nba_predictions'
+NATURAL_KEY = ['game_id', 'period', 'seconds_remaining']
+GOLD_COLUMNS = ['game_id', 'period', 'seconds_remaining', 'score_margin', 'predicted_stop_run_90s', 'recommendation']
+TIMEOUT_THRESHOLD = 0.05
+
+BATCH_SIZE = 500
+MAX_WORKERS = 4
+MAX_RETRIES = 5
+RETRY_BASE_SEC = 0.5
+# SQLSTATE classes worth retrying: connection, transaction rollback (deadlock/serialization), resources, operator intervention
+TRANSIENT_SQLSTATE_CLASSES = {'08', '40', '53', '57'}
+MISSING_CONFLICT_TARGET = '42P10'
 
 # Load .env locally if present
 try:
@@ -18,37 +42,305 @@ except ImportError:
 SUPABASE_URL = os.environ.get("SUPABASE_URL")
 SUPABASE_KEY = os.environ.get("SUPABASE_KEY")
 
-def export_to_supabase():
-    if not SUPABASE_URL or not SUPABASE_KEY:
-        print("❌ Error: SUPABASE_URL and SUPABASE_KEY must be set in .env or environment.")
+def to_gold_records(df: pd.DataFrame) -> list:
+    """Maps a chunk of the Gold CSV to the Supabase Gold schema, keeping the last row per natural key."""
+    out = pd.DataFrame(index=df.index)
+    out['game_id'] = df['gameId'].astype(str) if 'gameId' in df.columns else '22401052'
+    out['period'] = df['period'].astype(int) if 'period' in df.columns else 1
+    out['seconds_remaining'] = df['seconds_remaining'].astype(int) if 'seconds_remaining' in df.columns else 0
+    out['score_margin'] = df['score_margin'].astype(int) if 'score_margin' in df.columns else 0
+    out['predicted_stop_run_90s'] = df['cate'] if 'cate' in df.columns else df.get('target_stop_run_90s', 0.5)
+    out['recommendation'] = np.where(out['predicted_stop_run_90s'] > TIMEOUT_THRESHOLD, 'CALL_TIMEOUT', 'HOLD')
+
+    # upsert של Postgres נכשל אם אותו מפתח מופיע פעמיים באותה פקודה, ולכן מנקים כפילויות בתוך ה-batch
+    out = out.drop_duplicates(subset=NATURAL_KEY, keep='last')
+    return out[GOLD_COLUMNS].to_dict(orient='records')
+
+# --- Sinks ---
+
+class PredictionSink:
+    """Destination for Gold prediction batches. upsert() must be idempotent on NATURAL_KEY and thread-safe."""
+    name = 'sink'
+
+    def upsert(self, records: list):
+        raise NotImplementedError
+
+    def count(self) -> int:
+        raise NotImplementedError
+
+    def is_retryable(self, error: Exception) -> bool:
+        """True for failures that may succeed on a later attempt (network, timeouts); the default retries everything."""
+        return True
+
+    def close(self):
+        pass
+
+class SupabaseSink(PredictionSink):
+    name = 'supabase'
+
+    def __init__(self, url: str = SUPABASE_URL, key: str = SUPABASE_KEY, table: str = TABLE_NAME):
+        if not url or not key:
+            raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in .env or environment.")
+        from supabase import create_client
+        self.client = create_client(url, key)
+        self.table = table
+
+    def upsert(self, records):
+        self.client.table(self.table).upsert(records, on_conflict=','.join(NATURAL_KEY)).execute()
+
+    def count(self):
+        return self.client.table(self.table).select('game_id', count='exact').limit(1).execute().count
+
+    def is_retryable(self, error):
+        # שגיאת Postgres (constraint, schema, סוג נתונים) לא תיעלם בניסיון חוזר; רק שגיאות חיבור/נעילה זמניות
+        code = getattr(error, 'code', None)
+        if isinstance(code, str) and len(code) == 5 and not code.startswith('PGRST'):
+            return code[:2] in TRANSIENT_SQLSTATE_CLASSES
+        response = getattr(error, 'response', None)
+        status = getattr(response, 'status_code', None)
+        if status is not None:
+            return status >= 500 or status in (408, 429)
+        return True
+
+class SQLiteSink(PredictionSink):
+    """
+    Local stand-in for the Supabase table: same columns, same natural-key primary key and the same
+    INSERT ... ON CONFLICT DO UPDATE statement that Postgres runs, so export throughput can be measured offline.
+    """
+    name = 'sqlite'
+
+    def __init__(self, path: str = SQLITE_PATH, table: str = TABLE_NAME):
+        self.path = path
+        self.table = table
+        self._local = threading.local()
+        # כל החיבורים שנפתחו (אחד לכל thread של ה-pool) כדי ש-close() יסגור את כולם
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        conn = self._connection()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                game_id TEXT NOT NULL,
+                period INTEGER NOT NULL,
+                seconds_remaining INTEGER NOT NULL,
+                score_margin INTEGER,
+                predicted_stop_run_90s REAL,
+                recommendation TEXT,
+                PRIMARY KEY ({', '.join(NATURAL_KEY)})
+            )""")
+        conn.commit()
+
+        updates = ', '.join(f"{c} = excluded.{c}" for c in GOLD_COLUMNS if c not in NATURAL_KEY)
+        self.statement = (f"INSERT INTO {table} ({', '.join(GOLD_COLUMNS)}) VALUES ({', '.join('?' * len(GOLD_COLUMNS))}) "
+                          f"ON CONFLICT ({', '.join(NATURAL_KEY)}) DO UPDATE SET {updates}")
+
+    def _connection(self):
+        # חיבור נפרד לכל thread (sqlite3 לא משתף חיבור בין threads); busy timeout במקום נעילה ידנית
+        if getattr(self._local, 'conn', None) is None:
+            # check_same_thread=False רק כדי ש-close() יוכל לסגור מה-thread הראשי; כל thread עדיין עובד רק עם החיבור שלו
+            self._local.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            with self._connections_lock:
+                self._connections.append(self._local.conn)
+        return self._local.conn
+
+    def upsert(self, records):
+        conn = self._connection()
+        with conn:
+            conn.executemany(self.statement, [tuple(r[c] for c in GOLD_COLUMNS) for r in records])
+
+    def count(self):
+        return self._connection().execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def is_retryable(self, error):
+        # "database is locked" הוא OperationalError זמני; הפרת constraint או SQL שגוי לא יצליחו בניסיון חוזר
+        return isinstance(error, sqlite3.OperationalError)
+
+    def close(self):
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        # threads שימשיכו להשתמש ב-sink אחרי close יפתחו חיבור חדש
+        self._local = threading.local()
+
+def make_sink(name: str, **kwargs) -> PredictionSink:
+    sinks = {'supabase': SupabaseSink, 'sqlite': SQLiteSink}
+    if name not in sinks:
+        raise ValueError(f"Unknown sink '{name}'. Choose from: {', '.join(sinks)}")
+    return sinks[name](**kwargs)
+
+# --- Checkpoint ---
+
+class ExportCheckpoint:
+    """
+    Set of completed batch numbers for one (source file, batch size, sink) combination, saved atomically
+    after every batch. A rerun skips finished batches; a changed source file starts from scratch.
+    """
+
+    def __init__(self, path: str, source_path: str, batch_size: int, sink_name: str):
+        self.path = path
+        stat = os.stat(source_path)
+        self.fingerprint = {'source': os.path.abspath(source_path), 'size': stat.st_size, 'mtime': int(stat.st_mtime),
+                            'batch_size': batch_size, 'sink': sink_name}
+        self.completed = set()
+        self.rows = 0
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('fingerprint') == self.fingerprint:
+                self.completed = set(saved['completed_batches'])
+                self.rows = saved.get('rows', 0)
+
+    def mark_done(self, batch_no: int, rows: int):
+        with self._lock:
+            self.completed.add(batch_no)
+            self.rows += rows
+            state = {'fingerprint': self.fingerprint, 'completed_batches': sorted(self.completed), 'rows': self.rows}
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+
+    def reset(self):
+        self.completed, self.rows = set(), 0
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def _upsert_with_retry(sink: PredictionSink, records: list, max_retries: int = MAX_RETRIES):
+    for attempt in range(max_retries + 1):
+        try:
+            sink.upsert(records)
+            return
+        except Exception as e:
+            if attempt == max_retries or not sink.is_retryable(e):
+                raise
+            wait = RETRY_BASE_SEC * 2 ** attempt
+            print(f"⚠️ Batch upsert failed ({type(e).__name__}: {e}); retrying in {wait:.1f}s ({attempt + 1}/{max_retries})")
+            time.sleep(wait)
+
+def export_predictions(sink: PredictionSink, source_path: str = GOLD_DATA_PATH, batch_size: int = BATCH_SIZE,
+                       max_workers: int = MAX_WORKERS, checkpoint_path: str = None, reset: bool = False) -> dict:
+    """
+    Streams the Gold CSV in batches and upserts them concurrently.
+    At most 2 * max_workers batches are in memory at once; progress is checkpointed per batch.
+    """
+    if not os.path.exists(source_path):
+        raise FileNotFoundError(f"Missing Gold data file: {source_path}")
+
+    checkpoint_path = checkpoint_path or os.path.join(CHECKPOINT_DIR, f'export_checkpoint_{sink.name}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(checkpoint_path)), exist_ok=True)
+    checkpoint = ExportCheckpoint(checkpoint_path, source_path, batch_size, sink.name)
+    if reset:
+        checkpoint.reset()
+    resumed = len(checkpoint.completed)
+
+    start = time.time()
+    uploaded, skipped = 0, 0
+    in_flight = {}
+
+    def drain(return_when):
+        nonlocal uploaded
+        done, _ = concurrent.futures.wait(in_flight, return_when=return_when)
+        for future in done:
+            batch_no, n_rows = in_flight.pop(future)
+            future.result()   # batch שנכשל אחרי כל הניסיונות עוצר את הייצוא (ה-checkpoint שומר את מה שכבר עלה)
+            checkpoint.mark_done(batch_no, n_rows)
+            uploaded += n_rows
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for batch_no, chunk in enumerate(pd.read_csv(source_path, chunksize=batch_size)):
+            if batch_no in checkpoint.completed:
+                skipped += 1
+                continue
+            records = to_gold_records(chunk)
+            in_flight[pool.submit(_upsert_with_retry, sink, records)] = (batch_no, len(records))
+            if len(in_flight) >= 2 * max_workers:
+                drain(concurrent.futures.FIRST_COMPLETED)
+        if in_flight:
+            drain(concurrent.futures.ALL_COMPLETED)
+
+    elapsed = time.time() - start
+    return {
+        'sink': sink.name,
+        'rows_uploaded': uploaded,
+        'batches_skipped': skipped,
+        'resumed_from_batches': resumed,
+        'elapsed_sec': round(elapsed, 3),
+        'rows_per_sec': round(uploaded / elapsed, 1) if elapsed > 0 else None
+    }
+
+def benchmark_export(n_rows: int = 100_000, batch_sizes=(100, 500, 2000), workers=(1, 4)) -> list:
+    """Offline throughput benchmark against the SQLite stand-in, on a synthetic Gold CSV."""
+    rng = np.random.RandomState(42)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'gold.csv')
+        pd.DataFrame({
+            'gameId': 22400000 + rng.randint(0, 1230, n_rows),
+            'period': rng.randint(1, 5, n_rows),
+            'seconds_remaining': rng.randint(0, 720, n_rows),
+            'score_margin': rng.randint(-30, 31, n_rows),
+            'cate': rng.normal(0.03, 0.05, n_rows)
+        }).to_csv(source, index=False)
+
+        for batch_size in batch_sizes:
+            for n_workers in workers:
+                sink = SQLiteSink(os.path.join(tmp, f'bench_{batch_size}_{n_workers}.sqlite'))
+                stats = export_predictions(sink, source, batch_size, n_workers, os.path.join(tmp, f'ckpt_{batch_size}_{n_workers}.json'))
+                # הרצה שנייה: ה-checkpoint מדלג על הכול, ו-upsert לא מכפיל שורות גם בלעדיו
+                rerun = export_predictions(sink, source, batch_size, n_workers, os.path.join(tmp, f'ckpt_{batch_size}_{n_workers}.json'))
+                stats.update({'batch_size': batch_size, 'workers': n_workers, 'table_rows': sink.count(),
+                              'rerun_rows_uploaded': rerun['rows_uploaded']})
+                sink.close()
+                results.append(stats)
+    return results
+
+def export_to_supabase(batch_size: int = BATCH_SIZE, max_workers: int = MAX_WORKERS, reset: bool = False):
+    try:
+        sink = SupabaseSink()
+    except ValueError as e:
+        print(f"❌ Error: {e}")
         sys.exit(1)
-        
-    client = create_client(SUPABASE_URL, SUPABASE_KEY)
-    
-    print(f"📦 Loading Gold inference results from: {GOLD_DATA_PATH}")
-    if not os.path.exists(GOLD_DATA_PATH):
-        raise FileNotFoundError(f"Missing Gold data file: {GOLD_DATA_PATH}")
-        
-    df = pd.read_csv(GOLD_DATA_PATH)
-    
-    # Map columns to Supabase Gold Schema
-    df['game_id'] = df['gameId'].astype(str) if 'gameId' in df.columns else '22401052'
-    df['period'] = df['period'].astype(int) if 'period' in df.columns else 1
-    df['seconds_remaining'] = df['seconds_remaining'].astype(int) if 'seconds_remaining' in df.columns else 0
-    df['score_margin'] = df['score_margin'].astype(int) if 'score_margin' in df.columns else 0
-    df['predicted_stop_run_90s'] = df['cate'] if 'cate' in df.columns else df.get('target_stop_run_90s', 0.5)
-    df['recommendation'] = df['predicted_stop_run_90s'].apply(lambda x: 'CALL_TIMEOUT' if x > 0.05 else 'HOLD')
-    
-    gold_cols = ['game_id', 'period', 'seconds_remaining', 'score_margin', 'predicted_stop_run_90s', 'recommendation']
-    export_df = df[gold_cols].head(50).copy()
-    
-    records = export_df.to_dict(orient='records')
-    
-    print(f"🚀 Uploading {len(records)} Gold prediction records to Supabase 'nba_predictions'...")
-    client.table('nba_predictions').insert(records).execute()
-    print("✅ Gold export successful!")
 
-if __name__ == "__main__":
-    export_to_supabase()
+    print(f"📦 Streaming Gold inference results from: {GOLD_DATA_PATH}")
+    print(f"🚀 Upserting into Supabase '{TABLE_NAME}' (batch={batch_size}, workers={max_workers})...")
+    try:
+        stats = export_predictions(sink, GOLD_DATA_PATH, batch_size, max_workers, reset=reset)
+    except Exception as e:
+        if getattr(e, 'code', None) == MISSING_CONFLICT_TARGET:
+            print(f"❌ Error: '{TABLE_NAME}' has no unique constraint on ({', '.join(NATURAL_KEY)}), so the upsert cannot run.")
+            print(f"   Run {os.path.relpath(SCHEMA_SQL_PATH, os.path.join(BASE_DIR, '..'))} once in the Supabase SQL editor.")
+            sys.exit(1)
+        raise
+    print(f"✅ Gold export successful! {stats['rows_uploaded']:,} rows in {stats['elapsed_sec']}s "
+          f"({stats['batches_skipped']} batches already exported)")
+    return stats
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batched, idempotent export of Gold predictions.")
+    parser.add_argument('--sink', choices=['supabase', 'sqlite'], default='supabase')
+    parser.add_argument('--sqlite-path', default=SQLITE_PATH, help="Database file for the SQLite stand-in.")
+    parser.add_argument('--source', default=GOLD_DATA_PATH)
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS)
+    parser.add_argument('--reset', action='store_true', help="Ignore the checkpoint and export everything again.")
+    parser.add_argument('--benchmark', type=int, default=0, metavar='ROWS', help="Benchmark the SQLite stand-in on N synthetic rows.")
+    args = parser.parse_args()
 
+    if args.benchmark:
+        print(f"⏱️ Benchmarking SQLite stand-in on {args.benchmark:,} synthetic rows...")
+        for r in benchmark_export(args.benchmark):
+            print(f"   batch={r['batch_size']:>5} workers={r['workers']} | {r['rows_uploaded']:,} rows in {r['elapsed_sec']}s "
+                  f"({r['rows_per_sec']:,} rows/s) | table rows: {r['table_rows']:,} | rerun uploaded: {r['rerun_rows_uploaded']}")
+    elif args.sink == 'supabase' and args.source == GOLD_DATA_PATH:
+        export_to_supabase(args.batch_size, args.workers, args.reset)
+    else:
+        sink = make_sink(args.sink, path=args.sqlite_path) if args.sink == 'sqlite' else make_sink(args.sink)
+        stats = export_predictions(sink, args.source, args.batch_size, args.workers, reset=args.reset)
+        print(f"✅ Exported {stats['rows_uploaded']:,} rows to {sink.name} in {stats['elapsed_sec']}s "
+              f"({stats['batches_skipped']} batches already exported)")
+        sink.close()
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 import os
 import re
+import sys
 
 # --- Config & Settings ---
 pd.set_option('future.no_silent_downcasting', True)
@@ -11,6 +12,14 @@ RAW_FILE_PATH = os.path.join(BASE_DIR, 'data', 'pureData', 'season_2024_25.csv')
 ROTATIONS_FILE_PATH = os.path.join(BASE_DIR, 'data', 'pureData', 'rotations_2024_25.csv')
 OUTPUT_FILE = os.path.join(BASE_DIR, 'data', 'interim', 'level1_base.csv')
 
+sys.path.append(os.path.join(BASE_DIR, 'models'))
+sys.path.append(os.path.join(BASE_DIR, 'scripts', 'feature_engineering', 'validation'))
+sys.path.append(os.path.join(BASE_DIR, 'scripts', 'test_and_val'))
+from pipeline_schema import read_csv_with_schema, apply_schema
+from rotation_index import RotationIndex, elapsed_seconds
+from check_level1_quality import Level1Validator
+from validate_game_logic import load_blacklisted_games, BAD_GAMES_FILE
+
 # --- Helper Functions (DO NOT TOUCH) ---
 def parse_clock(clock_str):
     if pd.isna(clock_str): return 0.0
@@ -111,29 +120,26 @@ def process_lineups_logic(df, df_rot):
     # Pre-calculate maps
     home_team_map = df[df['scoreHome'].diff() > 0].groupby('gameId')['teamId'].agg(lambda x: x.mode().iloc[0]).to_dict()
 
-    # Pre-process Rotations (Tier 1)
-    def get_elapsed(row):
-        if row['period'] <= 4: return (row['period'] - 1) * 720 + (720 - row['seconds_remaining'])
-        return 2880 + (row['period'] - 5) * 300 + (300 - row['seconds_remaining'])
-    df['elapsed_sec'] = df.apply(get_elapsed, axis=1)
-    
-    rot_lookup = {}
-    if df_rot is not None:
-        df_rot['gameId_str'] = df_rot['gameId'].astype(str).str.zfill(10)
-        for gid, g_grp in df_rot.groupby('gameId_str'):
-            rot_lookup[gid] = {'Home': [], 'Away': []}
-            for _, r in g_grp.iterrows():
-                side = 'Home' if r['team_side'] == 'home' else 'Away'
-                rot_lookup[gid][side].append((r['IN_TIME_REAL'], r['OUT_TIME_REAL'], int(r['PERSON_ID'])))
+    df['elapsed_sec'] = elapsed_seconds(df['period'], df['seconds_remaining'])
+
+    # Official Rotations (Tier 1): אינדקס אינטרוולים על ה-stints של GameRotation.
+    # כל אירוע שהרוטציה מכסה (5 מול 5) מקבל את החמישייה הרשמית; PBP tracking רק איפה שאין כיסוי
+    rot_index = RotationIndex(df_rot) if df_rot is not None and not df_rot.empty else None
+    if rot_index is not None:
+        off_h, off_a, has_official = rot_index.official_lineups(df['gameId'].to_numpy(), df['elapsed_sec'].to_numpy())
+        df['official_home'] = pd.Series([list(x) if x is not None else None for x in off_h], index=df.index, dtype=object)
+        df['official_away'] = pd.Series([list(x) if x is not None else None for x in off_a], index=df.index, dtype=object)
+        df['has_official'] = has_official
+        print(f"    📋 Official rotation lineups cover {has_official.mean():.1%} of events.")
+    else:
+        df['official_home'] = df['official_away'] = None
+        df['has_official'] = False
 
     # Starter Discovery Logic
     def get_starters(p_df, gid, hid):
-        gid_str = str(gid).zfill(10)
-        if gid_str in rot_lookup:
-            t_start = p_df['elapsed_sec'].min()
-            h_s = [p for (s, e, p) in rot_lookup[gid_str]['Home'] if s <= t_start < e]
-            a_s = [p for (s, e, p) in rot_lookup[gid_str]['Away'] if s <= t_start < e]
-            if len(h_s) == 5 and len(a_s) == 5: return set(h_s), set(a_s), 1
+        first = p_df.iloc[0]
+        if first['has_official']:
+            return set(first['official_home']), set(first['official_away']), 1
         
         # Fallback Inference
         h_s, a_s = set(), set()
@@ -147,11 +153,16 @@ def process_lineups_logic(df, df_rot):
             if len(h_s) >= 5 and len(a_s) >= 5: break
         return set(list(h_s)[:5]), set(list(a_s)[:5]), 0
 
-    # Main Row-by-Row Tracking
+    # Main Row-by-Row Tracking (only for periods the official rotations don't fully cover)
     final_dfs = []
     for gid, g_df in df.groupby('gameId'):
         hid = home_team_map.get(gid)
         for period, p_df in g_df.groupby('period'):
+            official = p_df['has_official'].to_numpy()
+            if official.all():
+                final_dfs.append(p_df.assign(home_lineup=p_df['official_home'], away_lineup=p_df['official_away'], lineup_confidence=1))
+                continue
+
             curr_h, curr_a, conf = get_starters(p_df, gid, hid)
             h_list, a_list = [], []
             
@@ -169,10 +180,14 @@ def process_lineups_logic(df, df_rot):
                 h_list.append(sorted(list(curr_h))[:5])
                 a_list.append(sorted(list(curr_a))[:5])
             
-            p_df = p_df.assign(home_lineup=h_list, away_lineup=a_list, lineup_confidence=conf)
+            p_df = p_df.assign(home_lineup=h_list, away_lineup=a_list, lineup_confidence=np.where(official, 1, conf))
+            if official.any():
+                p_df['home_lineup'] = p_df['official_home'].where(official, p_df['home_lineup'])
+                p_df['away_lineup'] = p_df['official_away'].where(official, p_df['away_lineup'])
             final_dfs.append(p_df)
 
     df = pd.concat(final_dfs)
+    df.drop(columns=['official_home', 'official_away', 'has_official'], inplace=True)
 
     # Re-calculate Sub Timer
     df['lineup_temp'] = df['home_lineup'].astype(str) + "|" + df['away_lineup'].astype(str)
@@ -194,7 +209,16 @@ def clean_sparse_columns(df):
     return df
 
 # --- Main (DYNAMIC Hybrid Pipeline) ---
-def get_raw_season_data():
+def drop_blacklisted_games(df, blacklist):
+    """Drops games flagged by validate_game_logic.py before any Level 1 processing touches them."""
+    if not blacklist:
+        return df
+    bad = df['gameId'].astype('Int64').isin(blacklist).to_numpy(dtype=bool)
+    if bad.any():
+        print(f"🚫 Skipping {df.loc[bad, 'gameId'].nunique()} blacklisted game(s) ({int(bad.sum()):,} rows)")
+    return df[~bad]
+
+def get_raw_season_data(skip_blacklisted=True):
     pure_dir = os.path.join(BASE_DIR, 'data', 'pureData')
     if not os.path.exists(pure_dir):
         print(f"❌ Error: Raw data directory not found at {pure_dir}")
@@ -206,21 +230,18 @@ def get_raw_season_data():
         return None
     
     print(f"📦 Found {len(season_files)} season file(s): {[os.path.basename(f) for f in season_files]}")
-    dfs = [pd.read_csv(f, low_memory=False) for f in season_files]
-    return pd.concat(dfs, ignore_index=True)
+    # הרשימה השחורה מסוננת לכל קובץ מיד אחרי הקריאה, לפני ה-concat
+    blacklist = load_blacklisted_games(BAD_GAMES_FILE) if skip_blacklisted else set()
+    dfs = [drop_blacklisted_games(read_csv_with_schema(f), blacklist) for f in season_files]
+    return apply_schema(pd.concat(dfs, ignore_index=True))
 
-def main():
-    print(f" Starting DYNAMIC Level 1 Build (V9)...")
-    df = get_raw_season_data()
-    if df is None or df.empty:
-        raise FileNotFoundError("❌ CRITICAL: No raw season data found in data/pureData. Level 1 build aborted.")
-    
-    # Load rotations if available
+def get_rotation_data():
     pure_dir = os.path.join(BASE_DIR, 'data', 'pureData')
     rot_files = [os.path.join(pure_dir, f) for f in os.listdir(pure_dir) if f.startswith('rotations_') and f.endswith('.csv')]
-    df_rot = pd.concat([pd.read_csv(f) for f in rot_files], ignore_index=True) if rot_files else None
+    return apply_schema(pd.concat([read_csv_with_schema(f) for f in rot_files], ignore_index=True)) if rot_files else None
 
-    
+def build_level1(df, df_rot):
+    """Raw season play-by-play (+ optional rotations) -> Level 1 base frame, fully in memory."""
     df = process_base_timeline(df)
     df = enrich_state_counters_v4(df)
     df = calculate_temporal_metrics(df)
@@ -228,6 +249,27 @@ def main():
     df = apply_shot_clock_logic(df)
     df = process_lineups_logic(df, df_rot)
     df = clean_sparse_columns(df)
+    return df
+
+def validate_level1(df, df_rot=None):
+    """Runs the Level 1 QA suite on the in-memory frame; raises before anything is written if a blocking check fails."""
+    suite = Level1Validator(df=df, rotations=df_rot if df_rot is not None else pd.DataFrame())
+    if not suite.run_checks():
+        raise ValueError(f"Level 1 QA failed on {suite.blocking_failures}. Nothing was written.")
+
+def main():
+    print(f" Starting DYNAMIC Level 1 Build (V9)...")
+    df = get_raw_season_data()
+    # אם יש קבצי עונה אבל כל המשחקים סוננו, הבעיה היא ברשימה השחורה ולא בנתונים הגולמיים
+    if df is not None and df.empty and load_blacklisted_games(BAD_GAMES_FILE):
+        raise ValueError(f"❌ CRITICAL: All games are blacklisted in {BAD_GAMES_FILE}. Level 1 build aborted.")
+    if df is None or df.empty:
+        raise FileNotFoundError("❌ CRITICAL: No raw season data found in data/pureData. Level 1 build aborted.")
+    
+    # Rotations are optional (PBP tracking covers games without them)
+    df_rot = get_rotation_data()
+    df = build_level1(df, df_rot)
+    validate_level1(df, df_rot)
     
     os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
     df.to_csv(OUTPUT_FILE, index=False)
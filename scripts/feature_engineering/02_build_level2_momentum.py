@@ -9,6 +9,13 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_PATH = os.path.join(BASE_DIR, '..', '..', 'data', 'interim', 'level1_base.csv')
 OUTPUT_PATH = os.path.join(BASE_DIR, '..', '..', 'data', 'interim', 'level2_features.csv')
 LOOKUP_PATH = os.path.join(BASE_DIR, '..', '..', 'data', 'lookup', 'high_usage_players_2024-25.csv')
+STINTS_PATH = os.path.join(BASE_DIR, '..', '..', 'data', 'interim', 'lineup_stints.csv')
+
+sys.path.append(os.path.join(BASE_DIR, '..', '..', 'models'))
+sys.path.append(os.path.join(BASE_DIR, 'validation'))
+from pipeline_schema import read_csv_with_schema
+from check_level2_quality import Level2Validator as Level2QASuite
+from lineup_stints import assign_stint_ids, build_stints, stint_features, join_stint_features
 
 class Level2Validator:
     """Quality Assurance for Level 2 Features."""
@@ -32,14 +39,23 @@ class Level2Validator:
         print("✅ Validation Passed: Zero NaNs and all feature columns present.")
         return True
 
+def validate_level2(df: pd.DataFrame):
+    """Inline feature checks + the full Level 2 QA suite on the in-memory frame, before anything is written."""
+    Level2Validator.validate(df)
+    suite = Level2QASuite(df=df)
+    if not suite.run_checks():
+        raise ValueError(f"Level 2 QA failed on {suite.blocking_failures}. Nothing was written.")
+
 class Level2FeatureEngineer:
     """OOP implementation of Level 2 Feature Engineering."""
     
-    def __init__(self, input_path: str, lookup_path: str):
+    def __init__(self, input_path: str, lookup_path: str, df: pd.DataFrame = None):
         self.input_path = input_path
         self.lookup_path = lookup_path
         self.stars_map = self._load_stars_lookup()
-        self.df = self._load_data()
+        # df מועבר ישירות מ-Level 1 כשהכל רץ בתהליך אחד (run_pipeline.py) - בלי לקרוא CSV מחדש
+        self.df = self._prepare_frame(df) if df is not None else self._load_data()
+        self.stints = None
 
     def _load_stars_lookup(self) -> dict:
         if not os.path.exists(self.lookup_path):
@@ -56,10 +72,14 @@ class Level2FeatureEngineer:
         if not os.path.exists(self.input_path): 
             raise FileNotFoundError(f"Missing: {self.input_path}")
         
-        df = pd.read_csv(self.input_path, low_memory=False)
-        print("🔹 Converting lineups from strings to lists...")
-        for col in ['home_lineup', 'away_lineup']:
-            df[col] = df[col].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else x)
+        return self._prepare_frame(read_csv_with_schema(self.input_path))
+
+    @staticmethod
+    def _prepare_frame(df: pd.DataFrame) -> pd.DataFrame:
+        if len(df) and isinstance(df['home_lineup'].iloc[0], str):
+            print("🔹 Converting lineups from strings to lists...")
+            for col in ['home_lineup', 'away_lineup']:
+                df[col] = df[col].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else x)
             
         df.sort_values(by=['gameId', 'period', 'seconds_remaining'], ascending=[True, True, False], inplace=True)
         return df
@@ -148,6 +168,13 @@ class Level2FeatureEngineer:
         # אם אין כוכבים לאף אחת מהקבוצות כרגע במגרש = 1
         self.df['is_star_resting'] = (~(home_has_star | away_has_star)).astype(int)
 
+    def build_lineup_stints(self):
+        print("🔹 Building: Lineup Stints (Segment + Keyed Join)...")
+        # אחרי build_accumulated_fatigue כדי שכל stint יקבל את העייפות בסופו
+        self.df['stint_id'] = assign_stint_ids(self.df)
+        self.stints = build_stints(self.df)
+        join_stint_features(self.df, stint_features(self.stints))
+
     def run_pipeline(self) -> pd.DataFrame:
         self.build_usage_gravity()
         self.build_accumulated_fatigue()
@@ -155,6 +182,7 @@ class Level2FeatureEngineer:
         self.build_explosiveness()
         self.build_context_features()
         self.build_star_resting()
+        self.build_lineup_stints()
         return self.df
 
 # --- Main Execution ---
@@ -164,10 +192,12 @@ def main():
         engineer = Level2FeatureEngineer(INPUT_PATH, LOOKUP_PATH)
         df_features = engineer.run_pipeline()
         
-        Level2Validator.validate(df_features)
+        validate_level2(df_features)
         
         df_features.to_csv(OUTPUT_PATH, index=False)
         print(f"✅ Saved Optimized Level 2 to: {OUTPUT_PATH}")
+        engineer.stints.to_csv(STINTS_PATH, index=False)
+        print(f"💾 Saved {len(engineer.stints):,} lineup stints to: {STINTS_PATH}")
         print(f"📊 Final Dataset Shape: {df_features.shape}")
         
     except Exception as e:
@@ -8,6 +8,11 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_PATH = os.path.join(BASE_DIR, '..', '..', 'data', 'interim', 'level2_features.csv')
 OUTPUT_PATH = os.path.join(BASE_DIR, '..', '..', 'data', 'interim', 'level3_labels.csv')
 
+sys.path.append(os.path.join(BASE_DIR, '..', '..', 'models'))
+sys.path.append(os.path.join(BASE_DIR, 'validation'))
+from pipeline_schema import read_csv_with_schema
+from check_level3_quality import Level3QAValidator
+
 class Level3Validator:
     """Quality Assurance for Level 3 Labels."""
     
@@ -44,22 +49,29 @@ class Level3Validator:
         print("✅ Validation Passed: Labels are clean and ready for ML.")
         return True
 
+def validate_level3(df: pd.DataFrame):
+    """Inline label checks + the full Level 3 QA suite on the in-memory frame, before anything is written."""
+    Level3Validator.validate(df)
+    suite = Level3QAValidator(df=df)
+    if not suite.run_checks():
+        raise ValueError(f"Level 3 QA failed on {suite.blocking_failures}. Nothing was written.")
+
 class Level3Labeler:
     """OOP implementation of Level 3 Target Generation (Lookahead)."""
     
-    def __init__(self, input_path: str, output_path: str):
+    def __init__(self, input_path: str, output_path: str, df: pd.DataFrame = None):
         self.input_path = input_path
         self.output_path = output_path
         self.col_margin = 'score_margin'
         self.col_mom = 'momentum_streak_rolling'
         self.col_exp = 'explosiveness_index'
-        self.df = self._load_data()
+        self.df = df if df is not None else self._load_data()
 
     def _load_data(self) -> pd.DataFrame:
         if not os.path.exists(self.input_path): 
             raise FileNotFoundError(f"Missing: {self.input_path}")
         print(f"⏳ Loading Level 2 Data from {self.input_path}...")
-        return pd.read_csv(self.input_path, low_memory=False)
+        return read_csv_with_schema(self.input_path)
 
     def build_lookahead_data(self):
         print("⏳ Creating time indices and merging future states (90s & 180s)...")
@@ -157,9 +169,12 @@ class Level3Labeler:
             'delta_margin_90s', 'norm_delta_margin_90s', 'delta_margin_180s', 'norm_delta_margin_180s'
         ]
         self.df.drop(columns=[c for c in cols_to_drop if c in self.df.columns], inplace=True)
+        validate_level3(self.df)
 
-        self.df.to_csv(self.output_path, index=False)
-        print(f"✅ Success! Level 3 Labels generated and saved to: {self.output_path}")
+        # output_path=None: הפריים ממשיך בזיכרון לשלב הבא בלי קובץ ביניים
+        if self.output_path:
+            self.df.to_csv(self.output_path, index=False)
+            print(f"✅ Success! Level 3 Labels generated and saved to: {self.output_path}")
 
     def run_pipeline(self) -> pd.DataFrame:
         self.build_lookahead_data()
@@ -172,11 +187,9 @@ class Level3Labeler:
 def main():
     print("🚀 Starting Level 3 Target Generation (OOP Architecture)...")
     try:
+        # הלייבלים עוברים ולידציה בתוך run_pipeline, לפני שהקובץ נכתב
         labeler = Level3Labeler(INPUT_PATH, OUTPUT_PATH)
-        df_labeled = labeler.run_pipeline()
-        
-        # Validate Labels
-        Level3Validator.validate(df_labeled)
+        labeler.run_pipeline()
         
     except Exception as e:
         print(f"❌ Critical Error in Level 3: {e}")
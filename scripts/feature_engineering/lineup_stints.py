@@ -0,0 +1,200 @@
+import os
+import ast
+import numpy as np
+import pandas as pd
+from rotation_index import elapsed_seconds, SIDES
+
+# --- Config ---
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+LEVEL1_PATH = os.path.join(BASE_DIR, 'data', 'interim', 'level1_base.csv')
+STINTS_PATH = os.path.join(BASE_DIR, 'data', 'interim', 'lineup_stints.csv')
+
+STINT_KEYS = ['gameId', 'stint_id']
+RECENT_WINDOW_SEC = 360      # "איך החמישייה הזו שיחקה ב-6 הדקות האחרונות"
+
+def _as_lineup_set(value) -> frozenset:
+    if isinstance(value, str):
+        value = ast.literal_eval(value)
+    if isinstance(value, (list, tuple, set, frozenset, np.ndarray)):
+        return frozenset(int(p) for p in value if pd.notna(p))
+    return frozenset()
+
+def lineup_signature(players) -> str:
+    """Order-independent key of an on-court set: sorted PERSON_IDs joined with '-'."""
+    return '-'.join(str(p) for p in sorted(players))
+
+def assign_stint_ids(df: pd.DataFrame) -> pd.Series:
+    """
+    Stint number per event (0-based within each game): a new stint starts whenever either on-court set changes.
+    df must be in chronological order within each game.
+    """
+    game = df['gameId']
+    new_game = game.ne(game.shift())
+    changed = new_game.copy()
+    for side in SIDES:
+        lineup = df[f'{side}_lineup'].map(_as_lineup_set)
+        changed |= lineup.ne(lineup.shift())
+    return (changed.astype(int).groupby(game).cumsum() - 1).astype('int16').rename('stint_id')
+
+def build_stints(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Segments every game into contiguous lineup stints (one row per stint, both sides).
+    Points are score deltas across the stint; the stint ends where the next one starts (or at its last event).
+    """
+    events = pd.DataFrame({
+        'gameId': df['gameId'].to_numpy(),
+        'stint_id': df['stint_id'].to_numpy() if 'stint_id' in df.columns else assign_stint_ids(df).to_numpy(),
+        'period': df['period'].to_numpy(),
+        'elapsed_sec': elapsed_seconds(df['period'], df['seconds_remaining']),
+        'possession_id': df['possession_id'].to_numpy(),
+    })
+    for side, score_col in zip(SIDES, ['scoreHome', 'scoreAway']):
+        score = pd.Series(df[score_col].to_numpy(dtype=float))
+        # הניקוד לפני האירוע הראשון של ה-stint = הניקוד באירוע הקודם באותו משחק
+        events[f'{side}_score_before'] = score.groupby(events['gameId']).shift().fillna(0).to_numpy()
+        events[f'{side}_score_after'] = score.to_numpy()
+        fatigue_col = f'{side}_cum_fatigue'
+        if fatigue_col in df.columns:
+            events[f'{side}_fatigue'] = df[fatigue_col].to_numpy(dtype=float)
+
+    agg = {
+        'period': ('period', 'first'),
+        'start_sec': ('elapsed_sec', 'first'),
+        'last_event_sec': ('elapsed_sec', 'last'),
+        'events': ('elapsed_sec', 'size'),
+        'possessions': ('possession_id', 'nunique'),
+    }
+    for side in SIDES:
+        agg[f'{side}_score_before'] = (f'{side}_score_before', 'first')
+        agg[f'{side}_score_after'] = (f'{side}_score_after', 'last')
+        if f'{side}_fatigue' in events.columns:
+            agg[f'{side}_fatigue_end'] = (f'{side}_fatigue', 'last')
+    stints = events.groupby(STINT_KEYS, sort=False).agg(**agg).reset_index()
+
+    next_start = stints.groupby('gameId')['start_sec'].shift(-1)
+    stints['end_sec'] = next_start.fillna(stints['last_event_sec'])
+    stints['duration_sec'] = (stints['end_sec'] - stints['start_sec']).clip(lower=0)
+    stints['home_pts'] = stints['home_score_after'] - stints['home_score_before']
+    stints['away_pts'] = stints['away_score_after'] - stints['away_score_before']
+
+    # חתימות רק בשורה הראשונה של כל stint (עשרות שורות למשחק, לא מאות אלפי אירועים)
+    first_rows = pd.Series(np.arange(len(events))).groupby([events['gameId'], events['stint_id']], sort=False).first().to_numpy()
+    for side in SIDES:
+        players = df[f'{side}_lineup'].iloc[first_rows].map(_as_lineup_set)
+        stints[f'{side}_lineup'] = players.map(lineup_signature).to_numpy()
+
+    drop = ['last_event_sec'] + [f'{s}_score_{w}' for s in SIDES for w in ('before', 'after')]
+    return stints.drop(columns=drop)
+
+def stints_by_side(stints: pd.DataFrame) -> pd.DataFrame:
+    """Long format: one row per (stint, side) with points for/against from that lineup's perspective."""
+    frames = []
+    for side, other in (SIDES, SIDES[::-1]):
+        side_df = stints[[*STINT_KEYS, 'period', 'start_sec', 'end_sec', 'duration_sec', 'possessions']].copy()
+        side_df['side'] = side
+        side_df['lineup'] = stints[f'{side}_lineup']
+        side_df['pts_for'] = stints[f'{side}_pts']
+        side_df['pts_against'] = stints[f'{other}_pts']
+        side_df['fatigue_end'] = stints[f'{side}_fatigue_end'] if f'{side}_fatigue_end' in stints.columns else np.nan
+        frames.append(side_df)
+    long = pd.concat(frames, ignore_index=True)
+    long['plus_minus'] = long['pts_for'] - long['pts_against']
+    return long.sort_values([*STINT_KEYS, 'side']).reset_index(drop=True)
+
+def stint_features(stints: pd.DataFrame) -> pd.DataFrame:
+    """
+    Leakage-free per-stint features keyed by (gameId, stint_id): how the lineup on court for each side
+    had done earlier in the same game (seconds played and plus-minus before this stint started).
+    """
+    features = stints[[*STINT_KEYS, 'start_sec']].copy()
+    for side, other in (SIDES, SIDES[::-1]):
+        pm = stints[f'{side}_pts'] - stints[f'{other}_pts']
+        grp = [stints['gameId'], stints[f'{side}_lineup']]
+        # cumsum פחות הערך הנוכחי = מה שהחמישייה צברה לפני ה-stint הזה
+        features[f'{side}_lineup_prior_sec'] = (stints['duration_sec'].groupby(grp).cumsum() - stints['duration_sec']).astype('float32')
+        features[f'{side}_lineup_prior_pm'] = (pm.groupby(grp).cumsum() - pm).astype('float32')
+    return features
+
+def join_stint_features(df: pd.DataFrame, features: pd.DataFrame) -> pd.DataFrame:
+    """Adds stint features to an event frame (which already carries stint_id) with one index lookup, keeping df's index and order."""
+    keys = pd.MultiIndex.from_arrays([df['gameId'].to_numpy(), df['stint_id'].to_numpy()], names=STINT_KEYS)
+    aligned = features.set_index(STINT_KEYS).reindex(keys)
+    for col in aligned.columns:
+        if col != 'start_sec':
+            df[col] = aligned[col].to_numpy()
+    elapsed = elapsed_seconds(df['period'], df['seconds_remaining'])
+    df['stint_elapsed_sec'] = (elapsed - aligned['start_sec'].to_numpy()).astype('float32')
+    return df
+
+class LineupStintIndex:
+    """
+    Lookup structure over the stint table: positions by lineup signature and by player,
+    so on/off and "last N minutes" questions touch only the matching stints.
+    """
+
+    def __init__(self, stints: pd.DataFrame):
+        self.stints = stints
+        self.long = stints_by_side(stints)
+        self.by_lineup = self.long.groupby('lineup', sort=False).indices
+        players = self.long['lineup'].str.split('-').explode()
+        players = players[players.str.len() > 0].astype(np.int64)
+        self.by_player = {int(pid): np.unique(pos) for pid, pos in pd.Series(players.index, index=players.to_numpy()).groupby(level=0)}
+
+    @classmethod
+    def from_events(cls, df: pd.DataFrame):
+        return cls(build_stints(df))
+
+    @staticmethod
+    def _summarize(rows: pd.DataFrame) -> dict:
+        possessions = rows['possessions'].sum()
+        return {
+            'stints': len(rows),
+            'seconds': float(rows['duration_sec'].sum()),
+            'pts_for': float(rows['pts_for'].sum()),
+            'pts_against': float(rows['pts_against'].sum()),
+            'plus_minus': float(rows['plus_minus'].sum()),
+            'possessions': int(possessions),
+            'net_per_100': float(rows['plus_minus'].sum() / possessions * 100) if possessions else np.nan,
+        }
+
+    def lineup_rows(self, lineup, game_id=None) -> pd.DataFrame:
+        signature = lineup if isinstance(lineup, str) else lineup_signature(lineup)
+        rows = self.long.iloc[self.by_lineup.get(signature, [])]
+        return rows if game_id is None else rows[rows['gameId'] == int(game_id)]
+
+    def lineup_stats(self, lineup, game_id=None) -> dict:
+        return self._summarize(self.lineup_rows(lineup, game_id))
+
+    def recent(self, lineup, game_id, elapsed_sec: float, window_sec: float = RECENT_WINDOW_SEC) -> dict:
+        """Performance of a five in the window before elapsed_sec, over its stints in that game that ended by then."""
+        rows = self.lineup_rows(lineup, game_id)
+        rows = rows[(rows['end_sec'] <= elapsed_sec) & (rows['end_sec'] > elapsed_sec - window_sec)]
+        return self._summarize(rows)
+
+    def player_on_off(self, player_id: int, game_id=None) -> pd.DataFrame:
+        """On/off split for a player: his team's stints with him on court vs. the same games' stints without him."""
+        on_pos = self.by_player.get(int(player_id), np.empty(0, dtype=int))
+        on = self.long.iloc[on_pos]
+        if game_id is not None:
+            on = on[on['gameId'] == int(game_id)]
+        team_games = on[['gameId', 'side']].drop_duplicates()
+        team_rows = self.long.merge(team_games, on=['gameId', 'side'])
+        marked = team_rows.merge(on[[*STINT_KEYS, 'side']], on=[*STINT_KEYS, 'side'], how='left', indicator=True)
+        off = team_rows[(marked['_merge'] == 'left_only').to_numpy()]
+        report = pd.DataFrame([{'split': 'on', **self._summarize(on)}, {'split': 'off', **self._summarize(off)}])
+        return report.set_index('split')
+
+if __name__ == "__main__":
+    import sys
+    import time
+    sys.path.append(os.path.join(BASE_DIR, 'models'))
+    from pipeline_schema import read_csv_with_schema
+    df = read_csv_with_schema(LEVEL1_PATH)
+    df.sort_values(by=['gameId', 'period', 'seconds_remaining'], ascending=[True, True, False], inplace=True)
+    start = time.time()
+    df['stint_id'] = assign_stint_ids(df)
+    stints = build_stints(df)
+    index = LineupStintIndex(stints)
+    print(f"✅ {len(stints):,} stints across {stints['gameId'].nunique():,} games in {time.time() - start:.2f}s")
+    stints.to_csv(STINTS_PATH, index=False)
+    print(f"💾 Stint table saved to: {STINTS_PATH}")
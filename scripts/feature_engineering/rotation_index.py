@@ -0,0 +1,151 @@
+import os
+import glob
+import numpy as np
+import pandas as pd
+
+# --- Config ---
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ROTATIONS_PATTERN = os.path.join(BASE_DIR, 'data', 'pureData', 'rotations_*.csv')
+
+ROTATION_TIME_SCALE = 10.0   # IN_TIME_REAL / OUT_TIME_REAL של GameRotation הם בעשיריות שנייה (7200 = סוף רבע 1)
+GAME_STRIDE = 100_000.0      # מרווח בין משחקים במפתח הגלובלי (שניות) - גדול מכל משחק כולל הארכות
+SIDES = ('home', 'away')
+
+def elapsed_seconds(period, seconds_remaining) -> np.ndarray:
+    """Seconds since tip-off for (period, clock) pairs: 720s regulation periods, 300s overtimes."""
+    period = np.asarray(period, dtype=float)
+    remaining = np.asarray(seconds_remaining, dtype=float)
+    regulation = (period - 1) * 720 + (720 - remaining)
+    overtime = 2880 + (period - 5) * 300 + (300 - remaining)
+    return np.where(period <= 4, regulation, overtime)
+
+def load_rotations(pattern: str = ROTATIONS_PATTERN) -> pd.DataFrame:
+    files = sorted(glob.glob(pattern))
+    if not files:
+        return None
+    return pd.concat([pd.read_csv(f) for f in files], ignore_index=True)
+
+class RotationIndex:
+    """
+    Interval index over official GameRotation stints.
+
+    Per (game, side) the stint boundaries split the game into segments with a constant on-court set,
+    so the whole season becomes one sorted key array (game_rank * GAME_STRIDE + segment_start).
+    A batch of (gameId, elapsed_sec) queries is answered with a single np.searchsorted per side.
+    Stints are half-open [IN, OUT): at a substitution time the incoming player is already on court.
+    """
+
+    def __init__(self, df_rot: pd.DataFrame):
+        rot = pd.DataFrame({
+            'gameId': pd.to_numeric(df_rot['gameId'], errors='coerce'),
+            'side': df_rot['team_side'].astype(str).str.lower(),
+            'person': pd.to_numeric(df_rot['PERSON_ID'], errors='coerce'),
+            'in_sec': pd.to_numeric(df_rot['IN_TIME_REAL'], errors='coerce') / ROTATION_TIME_SCALE,
+            'out_sec': pd.to_numeric(df_rot['OUT_TIME_REAL'], errors='coerce') / ROTATION_TIME_SCALE,
+        }).dropna()
+        rot = rot[rot['side'].isin(SIDES) & (rot['out_sec'] > rot['in_sec'])]
+        # אותו stint שהגיע פעמיים (הורדה חוזרת) לא צריך להכפיל שחקן
+        rot = rot.drop_duplicates(['gameId', 'side', 'person', 'in_sec'])
+
+        self.game_ids = np.sort(rot['gameId'].unique()).astype(np.int64)
+        self.stints = rot.reset_index(drop=True)
+        self._segments = {side: self._build_segments(rot[rot['side'] == side]) for side in SIDES}
+
+    @classmethod
+    def from_files(cls, pattern: str = ROTATIONS_PATTERN):
+        df_rot = load_rotations(pattern)
+        return cls(df_rot) if df_rot is not None and not df_rot.empty else None
+
+    def _game_rank(self, game_ids) -> np.ndarray:
+        ids = pd.to_numeric(pd.Series(np.asarray(game_ids)), errors='coerce').fillna(-1).to_numpy(dtype=np.int64)
+        if len(self.game_ids) == 0:
+            return np.full(len(ids), -1)
+        rank = np.minimum(np.searchsorted(self.game_ids, ids), len(self.game_ids) - 1)
+        return np.where(self.game_ids[rank] == ids, rank, -1)
+
+    def _build_segments(self, side_rot: pd.DataFrame) -> dict:
+        keys, ranks, lineups = [], [], []
+        for gid, grp in side_rot.groupby('gameId', sort=True):
+            rank = int(np.searchsorted(self.game_ids, int(gid)))
+            starts = np.unique(np.concatenate([grp['in_sec'].values, grp['out_sec'].values]))
+            # מטריצת פעילות (גבולות x stints) - כל משחק/צד הוא רק כמה עשרות stints
+            active = (grp['in_sec'].values[None, :] <= starts[:, None]) & (starts[:, None] < grp['out_sec'].values[None, :])
+            persons = grp['person'].values.astype(np.int64)
+            keys.append(rank * GAME_STRIDE + starts)
+            ranks.append(np.full(len(starts), rank))
+            lineups.extend(tuple(sorted(set(persons[row].tolist()))) for row in active)
+
+        lineup_arr = np.empty(len(lineups), dtype=object)
+        lineup_arr[:] = lineups
+        return {
+            'keys': np.concatenate(keys) if keys else np.empty(0),
+            'ranks': np.concatenate(ranks) if ranks else np.empty(0, dtype=np.int64),
+            'lineups': lineup_arr,
+            'sizes': np.fromiter((len(l) for l in lineups), dtype=np.int64, count=len(lineups)),
+        }
+
+    def _locate(self, side: str, game_ids, elapsed_sec):
+        """(segment position, hit mask, known-game mask) for a batch of queries - one searchsorted call."""
+        seg = self._segments[side]
+        ranks = self._game_rank(game_ids)
+        known = ranks >= 0
+        if len(seg['keys']) == 0:
+            return np.zeros(len(ranks), dtype=np.int64), np.zeros(len(ranks), dtype=bool), known
+        keys = ranks * GAME_STRIDE + np.asarray(elapsed_sec, dtype=float)
+        pos = np.clip(np.searchsorted(seg['keys'], keys, side='right') - 1, 0, None)
+        # זמן לפני ה-stint הראשון של המשחק (או צד בלי נתונים) נופל על משחק אחר - לא פגיעה
+        hit = known & (seg['ranks'][pos] == ranks)
+        return pos, hit, known
+
+    def has_game(self, game_id) -> bool:
+        return bool(self._game_rank([game_id])[0] >= 0)
+
+    def _lookup(self, side: str, game_ids, elapsed_sec):
+        """(lineups, sizes) per query: lineup is None for games without rotation data, () before the first stint."""
+        pos, hit, known = self._locate(side, game_ids, elapsed_sec)
+        seg = self._segments[side]
+        lineups = np.full(len(pos), None, dtype=object)
+        sizes = np.zeros(len(pos), dtype=np.int64)
+        if hit.any():
+            lineups[hit] = seg['lineups'][pos[hit]]
+            sizes[hit] = seg['sizes'][pos[hit]]
+        for i in np.flatnonzero(known & ~hit):
+            lineups[i] = ()
+        return lineups, sizes
+
+    def lineups_at(self, game_ids, elapsed_sec, side: str) -> np.ndarray:
+        """On-court set (sorted tuple of PERSON_IDs) for every (gameId, elapsed_sec) pair; None where the game has no rotation data."""
+        return self._lookup(side, game_ids, elapsed_sec)[0]
+
+    def on_court_counts(self, game_ids, elapsed_sec) -> pd.DataFrame:
+        """Number of listed players per side at each query point (10 = complete 5v5 coverage)."""
+        home = self._lookup('home', game_ids, elapsed_sec)[1]
+        away = self._lookup('away', game_ids, elapsed_sec)[1]
+        return pd.DataFrame({'gameId': np.asarray(game_ids), 'elapsed_sec': np.asarray(elapsed_sec, dtype=float),
+                             'home': home, 'away': away, 'total': home + away})
+
+    def official_lineups(self, game_ids, elapsed_sec):
+        """
+        Returns (home, away, mask): on-court tuples per query and a boolean mask
+        of the rows where both sides have exactly five listed players.
+        """
+        home, home_sizes = self._lookup('home', game_ids, elapsed_sec)
+        away, away_sizes = self._lookup('away', game_ids, elapsed_sec)
+        return home, away, (home_sizes == 5) & (away_sizes == 5)
+
+if __name__ == "__main__":
+    import time
+    index = RotationIndex.from_files()
+    if index is None:
+        print(f"❌ No rotation files found ({ROTATIONS_PATTERN}).")
+    else:
+        # כיסוי: בכל משחק, דגימה כל 10 שניות לאורך 48 דקות
+        grid = np.arange(0, 2880, 10.0)
+        gids = np.repeat(index.game_ids, len(grid))
+        times = np.tile(grid, len(index.game_ids))
+        start = time.time()
+        counts = index.on_court_counts(gids, times)
+        elapsed = time.time() - start
+        print(f"✅ Indexed {len(index.stints):,} stints across {len(index.game_ids):,} games.")
+        print(f"⏱️ {len(counts):,} lineup queries in {elapsed:.2f}s")
+        print(f"📊 Full 5v5 coverage: {(counts['total'] == 10).mean():.1%} of sampled moments")
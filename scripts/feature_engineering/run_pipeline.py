@@ -0,0 +1,148 @@
+import os
+import sys
+import time
+import argparse
+import importlib
+import subprocess
+import pandas as pd
+
+# --- Config ---
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(os.path.dirname(CURRENT_DIR))
+MODELS_DIR = os.path.join(BASE_DIR, 'models')
+
+sys.path.append(MODELS_DIR)
+from pipeline_schema import apply_schema
+from prepare_ml_splits import MLDataPreparer, GRAINS, INPUT_PATH as SPLITS_INPUT_PATH, OUTPUT_DIR as SPLITS_OUTPUT_DIR
+
+# שמות הסקריפטים מתחילים בספרה, אז הם נטענים דרך importlib
+level1 = importlib.import_module('01_build_level1_base')
+level2 = importlib.import_module('02_build_level2_momentum')
+level3 = importlib.import_module('03_build_level3_labels')
+
+# The current workflow: four scripts, each re-parsing the CSV the previous one wrote
+STEP_BY_STEP = [
+    ('level1', os.path.join(CURRENT_DIR, '01_build_level1_base.py')),
+    ('level2', os.path.join(CURRENT_DIR, '02_build_level2_momentum.py')),
+    ('level3', os.path.join(CURRENT_DIR, '03_build_level3_labels.py')),
+    ('splits', os.path.join(MODELS_DIR, 'prepare_ml_splits.py')),
+]
+
+class InMemoryPipeline:
+    """
+    Raw play-by-play -> Level 1 -> Level 2 -> Level 3 -> train/val/test in a single process.
+    Each level hands its frame to the next by reference (lineups stay Python lists, no CSV re-parse);
+    the schema is re-applied at every handoff so each stage sees the same dtypes as when it reads from disk.
+    Every level runs its QA suite on the frame before it is handed on (or written),
+    and intermediate CSVs are written only with keep_intermediate=True.
+    """
+
+    def __init__(self, keep_intermediate: bool = False, grain: str = 'event', output_dir: str = SPLITS_OUTPUT_DIR):
+        self.keep_intermediate = keep_intermediate
+        self.grain = grain
+        self.output_dir = output_dir
+        self.timings = {}
+
+    def _timed(self, stage: str, fn):
+        start = time.time()
+        result = fn()
+        self.timings[stage] = time.time() - start
+        return result
+
+    def _keep(self, df: pd.DataFrame, path: str):
+        if self.keep_intermediate:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            df.to_csv(path, index=False)
+            print(f"💾 Intermediate saved to: {path}")
+
+    def build_level1(self) -> pd.DataFrame:
+        df = level1.get_raw_season_data()
+        if df is not None and df.empty and level1.load_blacklisted_games(level1.BAD_GAMES_FILE):
+            raise ValueError(f"All games are blacklisted in {level1.BAD_GAMES_FILE}.")
+        if df is None or df.empty:
+            raise FileNotFoundError("No raw season data found in data/pureData.")
+        df_rot = level1.get_rotation_data()
+        df = level1.build_level1(df, df_rot)
+        level1.validate_level1(df, df_rot)
+        self._keep(df, level1.OUTPUT_FILE)
+        return apply_schema(df)
+
+    def build_level2(self, df: pd.DataFrame) -> pd.DataFrame:
+        engineer = level2.Level2FeatureEngineer(level2.INPUT_PATH, level2.LOOKUP_PATH, df=df)
+        df = engineer.run_pipeline()
+        level2.validate_level2(df)
+        self._keep(df, level2.OUTPUT_PATH)
+        self._keep(engineer.stints, level2.STINTS_PATH)
+        return apply_schema(df)
+
+    def build_level3(self, df: pd.DataFrame) -> pd.DataFrame:
+        output_path = level3.OUTPUT_PATH if self.keep_intermediate else None
+        # Level3Labeler מריץ את ה-QA בעצמו לפני הכתיבה
+        df = level3.Level3Labeler(level3.INPUT_PATH, output_path, df=df).run_pipeline()
+        # טרגטים רציפים שחושבו מפיצ'רים ב-float32 חוזרים ל-float64, כמו בקריאה מ-level3_labels.csv
+        targets = [c for c in df.columns if c.startswith('target_') and pd.api.types.is_float_dtype(df[c])]
+        df[targets] = df[targets].astype('float64')
+        return apply_schema(df)
+
+    def build_splits(self, df: pd.DataFrame):
+        MLDataPreparer(SPLITS_INPUT_PATH, self.output_dir, grain=self.grain).run_pipeline(df=df)
+
+    def run(self) -> dict:
+        print("🚀 Starting In-Memory Pipeline (Level 1 -> Splits)...")
+        df = self._timed('level1', self.build_level1)
+        df = self._timed('level2', lambda: self.build_level2(df))
+        df = self._timed('level3', lambda: self.build_level3(df))
+        self._timed('splits', lambda: self.build_splits(df))
+        return self.timings
+
+def time_step_by_step() -> dict:
+    """Runs the current four-script workflow (separate processes, CSV handoff) and times each script."""
+    timings = {}
+    for stage, script in STEP_BY_STEP:
+        print(f"⏳ [step-by-step] {os.path.basename(script)}...")
+        start = time.time()
+        result = subprocess.run([sys.executable, script], cwd=os.path.dirname(script), capture_output=True, text=True)
+        timings[stage] = time.time() - start
+        if result.returncode != 0:
+            raise RuntimeError(f"{os.path.basename(script)} failed:\n{result.stdout[-2000:]}{result.stderr[-2000:]}")
+    return timings
+
+def print_timing_report(in_memory: dict, step_by_step: dict = None):
+    rows = []
+    for stage, _ in STEP_BY_STEP:
+        row = {'stage': stage, 'in_memory_sec': round(in_memory.get(stage, 0.0), 2)}
+        if step_by_step:
+            row['step_by_step_sec'] = round(step_by_step.get(stage, 0.0), 2)
+        rows.append(row)
+    report = pd.DataFrame(rows)
+
+    print("\n⏱️ Pipeline Timing")
+    print(report.to_string(index=False))
+    total_in_memory = sum(in_memory.values())
+    if step_by_step:
+        total_step = sum(step_by_step.values())
+        saved = total_step - total_in_memory
+        print(f"\n📊 Step-by-step: {total_step:.1f}s | In-memory: {total_in_memory:.1f}s | "
+              f"Saved: {saved:.1f}s ({saved / total_step:.0%})")
+    else:
+        print(f"\n📊 In-memory total: {total_in_memory:.1f}s (run with --compare to time the step-by-step workflow)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Level 1 -> Level 2 -> Level 3 -> ML splits in one process.")
+    parser.add_argument('--keep-intermediate', action='store_true',
+                        help="Also write level1_base.csv, level2_features.csv, lineup_stints.csv and level3_labels.csv.")
+    parser.add_argument('--grain', choices=GRAINS, default='event')
+    parser.add_argument('--compare', action='store_true',
+                        help="First time the current script-by-script workflow, then report the wall time saved.")
+    args = parser.parse_args()
+
+    try:
+        step_by_step = time_step_by_step() if args.compare else None
+        timings = InMemoryPipeline(keep_intermediate=args.keep_intermediate, grain=args.grain).run()
+        print_timing_report(timings, step_by_step)
+    except Exception as e:
+        print(f"❌ Critical Error in Pipeline Runner: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
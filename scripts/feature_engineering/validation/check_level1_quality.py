@@ -2,59 +2,126 @@ import pandas as pd
 import numpy as np
 import os
 import sys
-import ast
+import glob
+import time
 
 # --- Config (4 levels up to Root) ---
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 FILE_PATH = os.path.join(BASE_DIR, 'data', 'interim', 'level1_base.csv')
+GAME_FAILURES_PATH = os.path.join(BASE_DIR, 'docs', 'reports', 'level1_game_failures.csv')
+OVERLAP_CHUNK_ROWS = 500_000   # בדיקת חפיפה בשידור (rows x 5 x 5) - בחלקים כדי להגביל זיכרון
+
+sys.path.append(os.path.join(BASE_DIR, 'models'))
+sys.path.append(os.path.join(BASE_DIR, 'scripts', 'feature_engineering'))
+from pipeline_schema import read_csv_with_schema
+from rotation_index import RotationIndex, elapsed_seconds
+
+def lineup_matrix(col: pd.Series) -> np.ndarray:
+    """
+    Array-backed lineups: (rows x slots) int64 matrix of PERSON_IDs padded with -1.
+    Accepts list/tuple cells (in memory) or their CSV string form ("[1, 2, 3, 4, 5]") without literal_eval per row.
+    """
+    values = pd.Series(col.to_numpy(), dtype=object)
+    first = values.dropna()
+    if len(first) and isinstance(first.iloc[0], str):
+        # כל העמודה כמחרוזת אחת: split יחיד והמרה אחת ל-int64 במקום פענוח לכל שורה
+        text = values.fillna('').astype(str).str.replace(r'[\[\]() ]', '', regex=True)
+        lengths = np.where(text.str.len().to_numpy() > 0, text.str.count(',').to_numpy() + 1, 0)
+        non_empty = text[lengths > 0]
+        ids = np.array(','.join(non_empty).split(','), dtype=np.int64) if len(non_empty) else np.empty(0, dtype=np.int64)
+        rows = np.repeat(np.arange(len(values)), lengths)
+    else:
+        exploded = values.explode()
+        exploded = pd.to_numeric(exploded[exploded.notna()])
+        rows, ids = exploded.index.to_numpy(), exploded.to_numpy(dtype=np.int64)
+        lengths = np.bincount(rows, minlength=len(values))
+
+    # מיקום בתוך השורה = אינדקס רץ פחות תחילת השורה
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    slot = np.arange(len(ids)) - np.repeat(starts, lengths)
+    width = max(int(lengths.max()) if len(lengths) else 0, 5)
+    matrix = np.full((len(values), width), -1, dtype=np.int64)
+    matrix[rows, slot] = ids
+    return matrix
+
+def _pad(matrix: np.ndarray, width: int) -> np.ndarray:
+    if matrix.shape[1] >= width:
+        return matrix
+    return np.hstack([matrix, np.full((len(matrix), width - matrix.shape[1]), -1, dtype=np.int64)])
+
+def _sorted_lineups(matrix: np.ndarray) -> np.ndarray:
+    # -1 (ריק) ממוין לפני כל מזהה, כך שאותה חמישייה תמיד נותנת אותה שורה בלי קשר לסדר
+    return np.sort(matrix, axis=1)
 
 class Level1Validator:
     """
     Validator Suite for Hybrid Level 1.
     Includes Checks for: Completeness, Confidence, Consistency, Physics, and Lineup Turnover.
+    Runs on a file (CLI) or on the builder's in-memory frame (DataFrame or Arrow table) before it is written.
     """
 
-    def __init__(self, file_path):
+    # בדיקות שכישלון בהן חוסם כתיבה של Level 1 מה-builder (השאר הן אזהרות איכות)
+    BLOCKING_CHECKS = {"Critical Gaps", "Timeouts Inventory", "14s Rule Logic"}
+
+    def __init__(self, file_path=None, df=None, rotations: pd.DataFrame = None):
+        # file_path יכול להיות גם תבנית glob (למשל level1_base_*.csv) לבדיקת כמה עונות יחד
         self.file_path = file_path
-        self.df = None
+        self.df = df.to_pandas() if hasattr(df, 'to_pandas') else df
+        self.rotations = rotations
+        self.home = None
+        self.away = None
         self.results = []
+        self.blocking_failures = []
+        self.game_failures = {}
 
     def load_data(self):
-        """Loads data efficiently and converts string-lists back to Python objects."""
-        if not os.path.exists(self.file_path):
+        """Loads one or more Level 1 files (unless a frame was given) and builds the array-backed lineup matrices."""
+        if self.df is not None:
+            self.home = lineup_matrix(self.df['home_lineup'])
+            self.away = lineup_matrix(self.df['away_lineup'])
+            return
+
+        paths = sorted(glob.glob(self.file_path))
+        if not paths:
             print(f"❌ Critical: File not found at {self.file_path}")
             sys.exit(1)
         
         try:
-            self.df = pd.read_csv(self.file_path, low_memory=False)
-            
-            # המרת מחרוזות הרשימות בחזרה לאובייקטים
-            for col in ['home_lineup', 'away_lineup']:
-                if col in self.df.columns:
-                    self.df[col] = self.df[col].apply(
-                        lambda x: ast.literal_eval(x) if pd.notna(x) and str(x).startswith('[') else []
-                    )
-            
-            print(f"✅ Loaded Dataset: {len(self.df):,} rows.")
+            self.df = pd.concat([read_csv_with_schema(p) for p in paths], ignore_index=True)
+            self.home = lineup_matrix(self.df['home_lineup'])
+            self.away = lineup_matrix(self.df['away_lineup'])
+            print(f"✅ Loaded Dataset: {len(self.df):,} rows from {len(paths)} file(s).")
         except Exception as e:
             print(f"❌ Error loading CSV: {e}")
             sys.exit(1)
 
+    def _record_games(self, test_name, per_game: pd.Series):
+        """Keeps the per-game failure counts of a check (only games with a failure)."""
+        per_game = per_game[per_game > 0]
+        if len(per_game):
+            self.game_failures[test_name] = per_game.sort_values(ascending=False)
+
+    def _record_rows(self, test_name, bad_rows: np.ndarray):
+        self._record_games(test_name, pd.Series(bad_rows).groupby(self.df['gameId'].to_numpy()).sum())
+
     def _log(self, test_name, status, message=""):
         """Internal helper to log results."""
         icon = "✅" if status else "❌"
         print(f"{icon} [{test_name}]: {message}")
         self.results.append(status)
+        if not status and test_name in self.BLOCKING_CHECKS:
+            self.blocking_failures.append(test_name)
 
     # --- 1. Hybrid & Lineup Logic Checks ---
 
     def check_lineup_completeness(self):
         """Verifies exactly 5 players per team in every row."""
-        h_count = self.df['home_lineup'].apply(len)
-        a_count = self.df['away_lineup'].apply(len)
+        h_count = (self.home >= 0).sum(axis=1)
+        a_count = (self.away >= 0).sum(axis=1)
         
         full_house = (h_count == 5) & (a_count == 5)
         fail_count = (~full_house).sum()
+        self._record_rows("10-Player Test", ~full_house)
         
         if fail_count == 0:
             self._log("10-Player Test", True, "Perfect 5v5 coverage.")
@@ -64,12 +131,13 @@ class Level1Validator:
 
     def check_lineup_turnover(self):
         """NEW: Detects 'Stagnant Lineups' where substitutions are not being captured."""
-        # יצירת מזהה ייחודי לחמישייה (String) כדי לספור שינויים
-        self.df['lineup_sig_qa'] = self.df['home_lineup'].astype(str) + self.df['away_lineup'].astype(str)
-        
-        # ספירת חמישיות ייחודיות לכל משחק
-        lineup_counts = self.df.groupby('gameId')['lineup_sig_qa'].nunique()
+        # חמישיות ממוינות (בית + חוץ) כשורות של מטריצה - ספירת שורות ייחודיות לכל משחק ב-hash וקטורי
+        width = max(self.home.shape[1], self.away.shape[1])
+        signatures = pd.DataFrame(np.hstack([_sorted_lineups(_pad(self.home, width)), _sorted_lineups(_pad(self.away, width))]))
+        signatures['gameId'] = self.df['gameId'].to_numpy()
+        lineup_counts = signatures.drop_duplicates().groupby('gameId').size()
         stagnant_games = lineup_counts[lineup_counts <= 2] # משחק שלם עם פחות מ-2 חמישיות הוא לא הגיוני
+        self._record_games("Lineup Turnover", stagnant_games)
         
         avg_lineups = lineup_counts.mean()
         
@@ -78,8 +146,6 @@ class Level1Validator:
         else:
             pct = (len(stagnant_games) / self.df['gameId'].nunique()) * 100
             self._log("Lineup Turnover", False, f"{pct:.1f}% of games have NO or FEW substitutions detected (Stagnant).")
-        
-        self.df.drop(columns=['lineup_sig_qa'], inplace=True)
 
     def report_confidence_health(self):
         """Reports Official vs. Inferred data."""
@@ -89,13 +155,40 @@ class Level1Validator:
         official_pct = self.df['lineup_confidence'].mean() * 100
         self._log("Inference Stats", True, f"Reliability Score: {official_pct:.1f}% Official API.")
 
+    def check_official_lineup_agreement(self):
+        """Compares every event of rotation-covered games against the official on-court five (interval index lookup)."""
+        if self.rotations is not None:
+            index = RotationIndex(self.rotations) if not self.rotations.empty else None
+        else:
+            index = RotationIndex.from_files()
+        if index is None:
+            self._log("Official Lineups", True, "No rotation files - skipped.")
+            return
+        elapsed = elapsed_seconds(self.df['period'], self.df['seconds_remaining'])
+        home, away, covered = index.official_lineups(self.df['gameId'].to_numpy(), elapsed)
+        if not covered.any():
+            self._log("Official Lineups", True, "No events covered by official rotations.")
+            return
+
+        match = np.ones(len(self.df), dtype=bool)
+        for official, tracked in ((home, self.home), (away, self.away)):
+            official = lineup_matrix(pd.Series(official[covered]))
+            width = max(official.shape[1], tracked.shape[1])
+            match[covered] &= (_sorted_lineups(_pad(official, width)) == _sorted_lineups(_pad(tracked[covered], width))).all(axis=1)
+        self._record_rows("Official Lineups", covered & ~match)
+        rate = match[covered].mean() * 100
+        self._log("Official Lineups", rate >= 95, f"{rate:.1f}% of {covered.sum():,} rotation-covered events match the official five.")
+
     def check_player_team_consistency(self):
         """Ensures no player is in both lineups simultaneously."""
-        def _has_overlap(row):
-            if not row['home_lineup'] or not row['away_lineup']: return False
-            return len(set(row['home_lineup']) & set(row['away_lineup'])) > 0
+        overlap = np.zeros(len(self.df), dtype=bool)
+        for start in range(0, len(self.df), OVERLAP_CHUNK_ROWS):
+            h = self.home[start:start + OVERLAP_CHUNK_ROWS, :, None]
+            a = self.away[start:start + OVERLAP_CHUNK_ROWS, None, :]
+            overlap[start:start + OVERLAP_CHUNK_ROWS] = ((h == a) & (h >= 0)).any(axis=(1, 2))
+        self._record_rows("Team Consistency", overlap)
         
-        overlaps = self.df.apply(_has_overlap, axis=1).sum()
+        overlaps = overlap.sum()
         if overlaps == 0:
             self._log("Team Consistency", True, "No player overlaps found.")
         else:
@@ -157,15 +250,32 @@ class Level1Validator:
         missing_count = self.df[critical].isna().sum().sum()
         self._log("Critical Gaps", (missing_count == 0), f"Missing values: {missing_count}")
 
-    def run(self):
-        print(f"🕵️‍♂️ Running FULL HYBRID QA Validator on: {os.path.basename(self.file_path)}")
-        print("-" * 60)
-        self.load_data()
+    def game_failures_frame(self) -> pd.DataFrame:
+        """Long table (check, gameId, count) of every game that failed a per-game check."""
+        frames = [pd.DataFrame({'check': name, 'gameId': per_game.index, 'count': per_game.to_numpy()})
+                  for name, per_game in self.game_failures.items()]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['check', 'gameId', 'count'])
+
+    def report_game_failures(self, top: int = 5, output_path: str = GAME_FAILURES_PATH):
+        if not self.game_failures:
+            return
         print("-" * 60)
-        
+        print("🔎 Per-game failures (worst games per check):")
+        for name, per_game in self.game_failures.items():
+            worst = ', '.join(f"{gid} ({n:,})" for gid, n in per_game.head(top).items())
+            print(f"   - {name}: {len(per_game):,} game(s) | {worst}")
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        self.game_failures_frame().to_csv(output_path, index=False)
+        print(f"💾 Full per-game failure table saved to: {output_path}")
+
+    def run_checks(self) -> bool:
+        """Runs every check; True when none of the blocking checks failed."""
+        if self.home is None:
+            self.load_data()
         self.check_lineup_completeness()
         self.check_lineup_turnover()
         self.report_confidence_health()
+        self.check_official_lineup_agreement()
         self.check_player_team_consistency()
         self.check_substitution_timer_sync()
         self.check_shot_clock_14s_rule()
@@ -173,13 +283,24 @@ class Level1Validator:
         self.check_timeout_strategic_weights() # הבדיקה החדשה כאן
         self.check_cumulative_counters_monotonicity()
         self.check_critical_missing_values()
+        self.report_game_failures()
+        return not self.blocking_failures
+
+    def run(self):
+        print(f"🕵️‍♂️ Running FULL HYBRID QA Validator on: {os.path.basename(self.file_path)}")
+        print("-" * 60)
+        self.load_data()
+        print("-" * 60)
+        start = time.time()
+        self.run_checks()
         
         print("-" * 60)
+        print(f"⏱️ Checks finished in {time.time() - start:.2f}s")
         if all(self.results):
             print("🚀 STATUS: PASSED. Dataset is solid.")
         else:
             print("⚠️ STATUS: WARNINGS DETECTED. Review logs above.")
 
 if __name__ == "__main__":
-    validator = Level1Validator(FILE_PATH)
+    validator = Level1Validator(sys.argv[1] if len(sys.argv) > 1 else FILE_PATH)
     validator.run()
\ No newline at end of file
@@ -8,24 +8,34 @@ import sys
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 FILE_PATH = os.path.join(BASE_DIR, '..', '..', '..', 'data', 'interim', 'level2_features.csv')
 
+sys.path.append(os.path.join(BASE_DIR, '..', '..', '..', 'models'))
+from pipeline_schema import read_csv_with_schema
+
 class Level2Validator:
     """
     Validator Suite for Level 2 Feature Engineering (Hybrid V4).
     STRICT MODE: Enforces mathematical boundaries, logic rules, and data integrity 
     for Momentum, Usage Gravity, and Accumulated Fatigue.
+    Runs on a file (CLI) or on the builder's in-memory frame (DataFrame or Arrow table) before it is written.
     """
 
-    def __init__(self, file_path):
+    # מבנה ושלמות הפיצ'רים חוסמים כתיבה; בדיקות הסבירות הסטטיסטיות הן אזהרות
+    BLOCKING_CHECKS = {"Schema Check", "Strict Clean Data Check", "Binary Flags", "Clutch Time Logic"}
+
+    def __init__(self, file_path=None, df=None):
         self.file_path = file_path
-        self.df = None
+        self.df = df.to_pandas() if hasattr(df, 'to_pandas') else df
         self.results = []
+        self.blocking_failures = []
 
     def load_data(self):
+        if self.df is not None:
+            return
         if not os.path.exists(self.file_path):
             print(f"❌ Critical: File not found at {os.path.abspath(self.file_path)}")
             sys.exit(1)
         try:
-            self.df = pd.read_csv(self.file_path, low_memory=False)
+            self.df = read_csv_with_schema(self.file_path)
             print(f"✅ Loaded Level 2 Dataset: {len(self.df):,} rows.")
         except Exception as e:
             print(f"❌ Error loading CSV: {e}")
@@ -35,6 +45,8 @@ class Level2Validator:
         icon = "✅" if status else "❌"
         print(f"{icon} [{test_name}]: {message}")
         self.results.append(status)
+        if not status and test_name in self.BLOCKING_CHECKS:
+            self.blocking_failures.append(test_name)
 
     # --- Validation Logic Methods ---
 
@@ -148,12 +160,9 @@ class Level2Validator:
             # Assuming max fatigue for a player playing full 48 mins is 2880 seconds
             self._log("Cum Fatigue Logic", True, f"Fatigue accumulating properly (Max: {max_f:.1f} seconds).")
 
-    def run(self):
-        print(f"🕵️‍♂️ Running STRICT QA Validator on: {os.path.basename(self.file_path)}")
-        print("-" * 60)
+    def run_checks(self) -> bool:
+        """Runs every check; True when none of the blocking checks failed."""
         self.load_data()
-        print("-" * 60)
-        
         self.check_feature_existence()
         self.check_strict_clean_data()
         self.check_binary_flags()
@@ -161,6 +170,14 @@ class Level2Validator:
         self.check_momentum_sanity()
         self.check_usage_gravity_logic()
         self.check_cumulative_fatigue_logic()
+        return not self.blocking_failures
+
+    def run(self):
+        print(f"🕵️‍♂️ Running STRICT QA Validator on: {os.path.basename(self.file_path)}")
+        print("-" * 60)
+        self.load_data()
+        print("-" * 60)
+        self.run_checks()
         
         print("-" * 60)
         if all(self.results):
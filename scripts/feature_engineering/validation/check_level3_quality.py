@@ -7,13 +7,24 @@ import sys
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 FILE_PATH = os.path.join(BASE_DIR, '..', '..', '..', 'data', 'interim', 'level3_labels.csv')
 
+sys.path.append(os.path.join(BASE_DIR, '..', '..', '..', 'models'))
+from pipeline_schema import read_csv_with_schema
+
 class Level3QAValidator:
-    """Draconian QA Suite for Level 3 Labels (OOP Architecture)."""
+    """
+    Draconian QA Suite for Level 3 Labels (OOP Architecture).
+    Runs on a file (CLI) or on the labeler's in-memory frame (DataFrame or Arrow table) before it is written.
+    """
+
+    # טרגטים חסרים או קנס על פסק זמן = לייבלים שבורים, חוסם כתיבה
+    # ("Timeout Logic" נכשל גם כשאין פסקי זמן בכלל - כמו "Timeouts Inventory" ב-Level 1)
+    BLOCKING_CHECKS = {"Schema Check", "Missing Values", "Timeout Logic"}
 
-    def __init__(self, file_path):
+    def __init__(self, file_path=None, df=None):
         self.file_path = file_path
-        self.df = None
+        self.df = df.to_pandas() if hasattr(df, 'to_pandas') else df
         self.results = []
+        self.blocking_failures = []
         
         # הפרדה לוגית בין סוגי הטרגטים
         self.continuous_targets = [
@@ -27,25 +38,30 @@ class Level3QAValidator:
         icon = "✅" if status else "❌"
         print(f"{icon} [{test_name}]: {message}")
         self.results.append(status)
+        if not status and test_name in self.BLOCKING_CHECKS:
+            self.blocking_failures.append(test_name)
 
     def load_data(self):
+        if self.df is not None:
+            return
         if not os.path.exists(self.file_path):
             print(f"❌ Critical: File not found at {os.path.abspath(self.file_path)}")
             sys.exit(1)
-        self.df = pd.read_csv(self.file_path, low_memory=False)
+        self.df = read_csv_with_schema(self.file_path)
         print(f"✅ Loaded Level 3 Labels: {len(self.df):,} rows.\n")
 
     def check_missing_targets(self):
         missing_cols = [c for c in self.target_cols if c not in self.df.columns]
         if missing_cols:
             self._log("Schema Check", False, f"Missing columns: {missing_cols}")
-            return
+            return False
 
         nulls = self.df[self.target_cols].isnull().sum()
         if nulls.sum() == 0:
             self._log("Missing Values", True, "Zero NaNs in all target columns.")
         else:
             self._log("Missing Values", False, f"NaNs detected!\n{nulls[nulls > 0]}")
+        return True
 
     def check_class_balance(self):
         print("\n📊 DATA DISTRIBUTIONS:")
@@ -93,16 +109,22 @@ class Level3QAValidator:
         last_30_sec = self.df[self.df['seconds_remaining'] <= 30]
         self._log("Edge Case", True, f"Handled {len(last_30_sec):,} rows in the last 30s of periods via Lookahead Fallback.")
 
-    def run(self):
-        print("🕵️‍♂️ Starting DRACONIAN QA: Level 3 Labels")
-        print("-" * 60)
+    def run_checks(self) -> bool:
+        """Runs every check; True when none of the blocking checks failed."""
         self.load_data()
-        
-        self.check_missing_targets()
+        # בלי עמודות הטרגט אין על מה להריץ את שאר הבדיקות
+        if not self.check_missing_targets():
+            return False
         self.check_class_balance()
         self.check_timeout_logic()
         print("")
         self.check_end_of_period()
+        return not self.blocking_failures
+
+    def run(self):
+        print("🕵️‍♂️ Starting DRACONIAN QA: Level 3 Labels")
+        print("-" * 60)
+        self.run_checks()
         
         print("-" * 60)
         if all(self.results):
@@ -3,42 +3,34 @@ import numpy as np
 import os
 import matplotlib.pyplot as plt
 import seaborn as sns
+import sys
 
 # --- Config (4 levels up to Root) ---
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 ROTATIONS_PATH = os.path.join(BASE_DIR, 'data', 'pureData', 'rotations_2024_25.csv')
 OUTPUT_PLOT = os.path.join(BASE_DIR, 'data', 'reports', 'fetch_quality_heatmap.png')
 
+sys.path.append(os.path.join(BASE_DIR, 'scripts', 'feature_engineering'))
+from rotation_index import RotationIndex
+
 def analyze_fetch_quality():
     print("🏥 Starting Deep Health Check on Official Rotations (Fetch)...")
     
     if not os.path.exists(ROTATIONS_PATH):
         print("❌ Rotations file not found."); return
 
-    df = pd.read_csv(ROTATIONS_PATH)
+    index = RotationIndex(pd.read_csv(ROTATIONS_PATH))
     
     # חישוב: לכל משחק, כמה שחקנים רשומים בכל רגע?
     # אנחנו נדגום 5 נקודות זמן בכל משחק (תחילת רבעים וסוף משחק)
     check_points = [100, 800, 1500, 2200, 2800] # שניות מתחילת המשחק
-    
-    game_results = []
-    game_ids = df['gameId'].unique()
+    game_ids = index.game_ids
     
     print(f"🧐 Analyzing internal structure of {len(game_ids)} fetched games...")
 
-    for gid in game_ids:
-        game_data = df[df['gameId'] == gid]
-        snapshots = []
-        
-        for t in check_points:
-            # סופרים כמה שחקנים "על המגרש" בזמן t
-            active = game_data[(game_data['IN_TIME_REAL'] <= t) & (game_data['OUT_TIME_REAL'] > t)]
-            snapshots.append(len(active))
-        
-        game_results.append(snapshots)
-
-    # יצירת מטריצה לגרף
-    quality_matrix = np.array(game_results)
+    # כל נקודות הדגימה של כל המשחקים בשאילתה וקטורית אחת על אינדקס הרוטציות
+    counts = index.on_court_counts(np.repeat(game_ids, len(check_points)), np.tile(check_points, len(game_ids)))
+    quality_matrix = counts['total'].to_numpy().reshape(len(game_ids), len(check_points))
     
     # --- ויזואליזציה ---
     plt.figure(figsize=(12, 8))
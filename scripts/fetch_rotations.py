@@ -1,130 +1,362 @@
-import pandas as pd
 import os
+import sys
+import abc
+import json
 import time
 import random
+import argparse
+import threading
+import collections
 import concurrent.futures
-from nba_api.stats.endpoints import gamerotation
+import numpy as np
+import pandas as pd
 
 # --- Config ---
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 RAW_PBP_PATH = os.path.join(BASE_DIR, 'data', 'pureData', 'season_2024_25.csv')
 OUTPUT_PATH = os.path.join(BASE_DIR, 'data', 'pureData', 'rotations_2024_25.csv')
+STORE_DIR = os.path.join(BASE_DIR, 'data', 'pureData', 'rotations_2024_25_parts')
+MANIFEST_NAME = 'manifest.json'
+
+COLUMNS_ORDER = ['gameId', 'team_side', 'PERSON_ID', 'IN_TIME_REAL', 'OUT_TIME_REAL', 'USG_PCT']
+DEDUP_KEY = ['gameId', 'team_side', 'PERSON_ID', 'IN_TIME_REAL']
+
+# מקביליות אדפטיבית (AIMD): עולה ב-1 אחרי חלון נקי, נחתכת בחצי כשיש שגיאות או שה-latency מתארך
+MIN_WORKERS = 1
+START_WORKERS = 4
+MAX_WORKERS = 12
+WINDOW = 12                 # כמה תוצאות אחרונות נכנסות להחלטה
+MAX_ERROR_RATE = 0.15
+TARGET_LATENCY_SEC = 3.0
+REQUEST_TIMEOUT = 10
+MAX_ATTEMPTS = 3            # ניסיונות לכל משחק בסשן אחד; אחרי זה המשחק נרשם ככישלון עם הסיבה
+RETRY_BASE_SEC = 1.0
+SAVE_EVERY = 25             # כל כמה משחקים לשמור את ה-manifest
+
+# --- Sources ---
+
+class RotationSource(abc.ABC):
+    """Returns the rotation rows of one game (home and away) as a DataFrame or raises on failure."""
+    name = 'source'
 
-MAX_WORKERS = 4    
-SAVE_INTERVAL = 20 
-
-def get_existing_game_ids():
-    """בודק איזה משחקים כבר שמרנו כדי לא להוריד שוב."""
-    if not os.path.exists(OUTPUT_PATH):
-        return set()
-    try:
-        # קוראים רק את עמודת gameId כדי לחסוך זיכרון
-        df = pd.read_csv(OUTPUT_PATH, usecols=['gameId'], dtype={'gameId': str})
-        return set(df['gameId'].unique())
-    except:
-        return set()
-
-def fetch_single_game_rotation(game_id):
-    """משיכת משחק בודד."""
-    try:
-        # השהייה אקראית (Jitter)
-        time.sleep(random.uniform(0.5, 1.2))
-        
-        rot = gamerotation.GameRotation(game_id=game_id, timeout=10)
+    @abc.abstractmethod
+    def fetch(self, game_id: str) -> pd.DataFrame:
+        ...
+
+class NbaApiSource(RotationSource):
+    name = 'nba_api'
+
+    def __init__(self, timeout: int = REQUEST_TIMEOUT):
+        from nba_api.stats.endpoints import gamerotation
+        self.endpoint = gamerotation
+        self.timeout = timeout
+
+    def fetch(self, game_id):
+        rot = self.endpoint.GameRotation(game_id=game_id, timeout=self.timeout)
         frames = []
-        
-        # Home
-        if hasattr(rot, 'home_team'):
-            df = rot.home_team.get_data_frame()
+        for side in ('home', 'away'):
+            team = getattr(rot, f'{side}_team', None)
+            if team is None:
+                continue
+            df = team.get_data_frame()
             if not df.empty:
-                df['gameId'] = game_id
-                df['team_side'] = 'home'
-                frames.append(df)
-        
-        # Away
-        if hasattr(rot, 'away_team'):
-            df = rot.away_team.get_data_frame()
-            if not df.empty:
-                df['gameId'] = game_id
-                df['team_side'] = 'away'
-                frames.append(df)
-        
-        return frames if frames else None
-
-    except Exception:
-        return None
-
-def fetch_rotations_robust():
-    print(f"🚀 Starting ROBUST Rotation Fetcher...")
-    
-    # 1. טעינת רשימת המשחקים
-    if not os.path.exists(RAW_PBP_PATH):
-        print("❌ Source file missing."); return
-
-    df_source = pd.read_csv(RAW_PBP_PATH, usecols=['gameId'], low_memory=False)
-    all_game_ids = df_source['gameId'].astype(str).str.zfill(10).unique()
-    
-    # 2. סינון משחקים שכבר נעשו
-    existing_ids = get_existing_game_ids()
-    games_to_process = [gid for gid in all_game_ids if gid not in existing_ids]
-    
-    print(f"📊 Total Games: {len(all_game_ids)}")
-    print(f"✅ Already Done: {len(existing_ids)}")
-    print(f"🔄 Remaining:   {len(games_to_process)}")
-    
-    if not games_to_process:
-        print("🎉 Nothing to do! All games are fetched.")
-        return
-
-    # 3. הרצה במקביל
-    batch_data = []
-    completed_in_session = 0
-    errors_in_session = 0
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_game = {executor.submit(fetch_single_game_rotation, gid): gid for gid in games_to_process}
-        
-        for future in concurrent.futures.as_completed(future_to_game):
-            game_id = future_to_game[future]
-            completed_in_session += 1
-            
-            result = future.result()
-            if result:
-                batch_data.extend(result)
+                frames.append(df.assign(gameId=game_id, team_side=side))
+        if not frames:
+            raise ValueError("empty response (no home/away rotation rows)")
+        return pd.concat(frames, ignore_index=True)
+
+class FakeRotationSource(RotationSource):
+    """
+    Local stand-in for the stats endpoint: deterministic stints per game with simulated latency,
+    random failures and throttling (latency and error rate grow once too many requests are in flight).
+    Some responses repeat rows, as the real endpoint does when a request is retried, to exercise dedup.
+    Every attempt is seeded from (game, attempt number, seed), so a game's responses repeat across runs;
+    games in fail_ids always fail, for exercising failure recording.
+    """
+    name = 'fake'
+
+    def __init__(self, latency_sec: float = 0.05, error_rate: float = 0.05, throttle_above: int = 6,
+                 duplicate_rate: float = 0.2, seed: int = 0, fail_ids=()):
+        self.latency_sec = latency_sec
+        self.error_rate = error_rate
+        self.throttle_above = throttle_above
+        self.duplicate_rate = duplicate_rate
+        self.seed = seed
+        self.fail_ids = set(fail_ids)
+        self.attempts = collections.Counter()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _stints(self, game_id: str) -> pd.DataFrame:
+        rng = np.random.default_rng(int(game_id) + self.seed)
+        rows = []
+        for side in ('home', 'away'):
+            base_pid = 1_000 * (1 if side == 'home' else 2)
+            for slot in range(5):
+                # כל "עמדה" מתחלפת בין שני שחקנים בנקודות זמן אקראיות (בעשיריות שנייה)
+                cuts = np.sort(rng.choice(np.arange(600, 28200, 300), size=4, replace=False))
+                edges = np.concatenate([[0.0], cuts, [28800.0]])
+                for i in range(len(edges) - 1):
+                    rows.append({'gameId': game_id, 'team_side': side, 'PERSON_ID': base_pid + slot * 2 + i % 2,
+                                 'IN_TIME_REAL': edges[i], 'OUT_TIME_REAL': edges[i + 1], 'USG_PCT': round(rng.uniform(0.1, 0.35), 3)})
+        return pd.DataFrame(rows)
+
+    def fetch(self, game_id):
+        with self._lock:
+            self.calls += 1
+            self.attempts[game_id] += 1
+            attempt = self.attempts[game_id]
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            overload = max(0, self.in_flight - self.throttle_above)
+        try:
+            # hash() של tuple עם מחרוזת משתנה בין הרצות (PYTHONHASHSEED), אז הזרע מורכב חשבונית מערכים יציבים
+            rng = random.Random((int(game_id) * 1_000_003 + attempt) * 1_000_003 + self.seed)
+            time.sleep(self.latency_sec * (1 + overload) * rng.uniform(0.8, 1.2))
+            if game_id in self.fail_ids:
+                raise ConnectionError("HTTP 404 Not Found")
+            if rng.random() < self.error_rate + 0.1 * overload:
+                raise ConnectionError("HTTP 429 Too Many Requests" if overload else "Read timed out")
+            df = self._stints(game_id)
+            if rng.random() < self.duplicate_rate:
+                df = pd.concat([df, df.sample(frac=0.3, random_state=1)], ignore_index=True)
+            return df
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+# --- Store ---
+
+class RotationStore:
+    """
+    One Parquet part per game plus a manifest of finished games and recorded failures.
+    Parts and manifest are written atomically, so an interrupted session never leaves half a game behind
+    and the next session resumes from the manifest instead of re-reading a growing CSV.
+    """
+
+    def __init__(self, store_dir: str = STORE_DIR):
+        self.store_dir = store_dir
+        self.manifest_path = os.path.join(store_dir, MANIFEST_NAME)
+        self._lock = threading.Lock()
+        os.makedirs(store_dir, exist_ok=True)
+        self.manifest = {'games': {}, 'failures': {}}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding='utf-8') as f:
+                self.manifest = json.load(f)
+
+    def completed_ids(self) -> set:
+        return set(self.manifest['games'])
+
+    def failed_ids(self) -> set:
+        return set(self.manifest['failures'])
+
+    def write_part(self, game_id: str, df: pd.DataFrame) -> int:
+        df = df.copy()
+        df['gameId'] = game_id
+        df = df.drop_duplicates(subset=[c for c in DEDUP_KEY if c in df.columns], keep='last')
+        existing = [c for c in COLUMNS_ORDER if c in df.columns]
+        df = df[existing + [c for c in df.columns if c not in existing]]
+
+        file_name = f"{game_id}.parquet"
+        tmp_path = os.path.join(self.store_dir, f".{file_name}.tmp")
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, os.path.join(self.store_dir, file_name))
+        with self._lock:
+            self.manifest['games'][game_id] = {'file': file_name, 'rows': len(df), 'fetched_at': int(time.time())}
+            self.manifest['failures'].pop(game_id, None)
+        return len(df)
+
+    def record_failure(self, game_id: str, reason: str, attempts: int):
+        with self._lock:
+            previous = self.manifest['failures'].get(game_id, {})
+            self.manifest['failures'][game_id] = {'reason': reason, 'attempts': previous.get('attempts', 0) + attempts,
+                                                  'last_attempt': int(time.time())}
+
+    def save(self):
+        with self._lock:
+            tmp_path = f"{self.manifest_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.manifest, f, indent=1)
+            os.replace(tmp_path, self.manifest_path)
+
+    def import_legacy_csv(self, csv_path: str) -> int:
+        """One-time migration of the old append-mode CSV into per-game parts (deduplicated)."""
+        if not os.path.exists(csv_path) or self.manifest['games']:
+            return 0
+        df = pd.read_csv(csv_path, dtype={'gameId': str}, low_memory=False)
+        df['gameId'] = df['gameId'].str.zfill(10)
+        for gid, grp in df.groupby('gameId'):
+            self.write_part(gid, grp)
+        self.save()
+        return df['gameId'].nunique()
+
+    def load_all(self) -> pd.DataFrame:
+        paths = [os.path.join(self.store_dir, g['file']) for _, g in sorted(self.manifest['games'].items())]
+        if not paths:
+            return pd.DataFrame(columns=COLUMNS_ORDER)
+        df = pd.concat([pd.read_parquet(p) for p in paths], ignore_index=True)
+        return df.drop_duplicates(subset=DEDUP_KEY, keep='last')
+
+    def export_csv(self, csv_path: str = OUTPUT_PATH) -> int:
+        """Writes the consolidated, deduplicated rotations CSV that Level 1 and the health checks read."""
+        df = self.load_all()
+        tmp_path = f"{csv_path}.tmp"
+        df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, csv_path)
+        return len(df)
+
+# --- Adaptive concurrency ---
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit that adapts to the endpoint: additive increase after a clean window,
+    multiplicative decrease when the window's error rate or median latency crosses its threshold.
+    """
+
+    def __init__(self, start: int = START_WORKERS, minimum: int = MIN_WORKERS, maximum: int = MAX_WORKERS,
+                 window: int = WINDOW, max_error_rate: float = MAX_ERROR_RATE, target_latency: float = TARGET_LATENCY_SEC):
+        self.limit = start
+        self.minimum, self.maximum = minimum, maximum
+        self.max_error_rate, self.target_latency = max_error_rate, target_latency
+        self.window = collections.deque(maxlen=window)
+        self.in_flight = 0
+        self.history = [start]
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, ok: bool, latency: float):
+        with self._cond:
+            self.in_flight -= 1
+            self.window.append((ok, latency))
+            if len(self.window) == self.window.maxlen:
+                errors = sum(1 for success, _ in self.window if not success) / len(self.window)
+                latency_p50 = float(np.median([lat for _, lat in self.window]))
+                if errors > self.max_error_rate or latency_p50 > self.target_latency:
+                    self._set_limit(max(self.minimum, self.limit // 2))
+                elif errors == 0:
+                    self._set_limit(min(self.maximum, self.limit + 1))
+            self._cond.notify_all()
+
+    def _set_limit(self, value: int):
+        if value != self.limit:
+            self.limit = value
+            self.history.append(value)
+            # חלון חדש אחרי כל שינוי - ההחלטה הבאה מתבססת רק על תוצאות במקביליות החדשה
+            self.window.clear()
+
+# --- Fetch ---
+
+def _fetch_game(source: RotationSource, limiter: AdaptiveLimiter, game_id: str, max_attempts: int):
+    """Returns (DataFrame or None, failure reason, attempts). Each attempt holds one limiter slot."""
+    reason = None
+    for attempt in range(1, max_attempts + 1):
+        limiter.acquire()
+        start = time.time()
+        try:
+            df = source.fetch(game_id)
+            if df is None or df.empty:
+                raise ValueError("empty response (no rotation rows)")
+            limiter.release(True, time.time() - start)
+            return df, None, attempt
+        except Exception as e:
+            limiter.release(False, time.time() - start)
+            reason = f"{type(e).__name__}: {e}"
+            if attempt < max_attempts:
+                time.sleep(RETRY_BASE_SEC * 2 ** (attempt - 1) * random.uniform(0.5, 1.0))
+    return None, reason, max_attempts
+
+def fetch_rotations(source: RotationSource, store: RotationStore, game_ids, max_attempts: int = MAX_ATTEMPTS,
+                    limiter: AdaptiveLimiter = None, only_failed: bool = False) -> dict:
+    """
+    Fetches every game that is not in the store yet (or only the recorded failures) under the adaptive limiter.
+    Each finished game is written as its own part immediately; failures are recorded with the reason.
+    """
+    limiter = limiter or AdaptiveLimiter()
+    done = store.completed_ids()
+    if only_failed:
+        todo = [g for g in game_ids if g in store.failed_ids()]
+    else:
+        todo = [g for g in game_ids if g not in done]
+
+    summary = {'requested': len(todo), 'fetched': 0, 'failed': 0, 'rows': 0}
+    start = time.time()
+    # ה-pool בגודל המקסימלי; המקביליות בפועל נשלטת ע"י ה-limiter (משחק שמחכה לסלוט לא שולח בקשה)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=limiter.maximum) as executor:
+        futures = {executor.submit(_fetch_game, source, limiter, gid, max_attempts): gid for gid in todo}
+        for i, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            gid = futures[future]
+            df, reason, attempts = future.result()
+            if df is not None:
+                summary['rows'] += store.write_part(gid, df)
+                summary['fetched'] += 1
             else:
-                errors_in_session += 1
-            
-            # הדפסת סטטוס
-            print(f"   ⏳ Session Progress: {completed_in_session}/{len(games_to_process)} | Errors: {errors_in_session}", end="\r")
-            
-            # 4. שמירה אינקרמנטלית (Batch Save)
-            if len(batch_data) > 0 and completed_in_session % SAVE_INTERVAL == 0:
-                save_batch_to_csv(batch_data)
-                batch_data = [] # ריקון הזיכרון
-
-    # שמירת שאריות בסוף הריצה
-    if batch_data:
-        save_batch_to_csv(batch_data)
-
-    print("\n✅ Session Complete.")
-
-def save_batch_to_csv(data_frames):
-    """שומר רשימת דאטה-פריימים לקובץ CSV (מצב Append)."""
-    if not data_frames: return
-    
-    df_batch = pd.concat(data_frames, ignore_index=True)
-    
-    # סידור עמודות
-    cols_order = ['gameId', 'team_side', 'PERSON_ID', 'IN_TIME_REAL', 'OUT_TIME_REAL', 'USG_PCT']
-    existing = [c for c in cols_order if c in df_batch.columns]
-    others = [c for c in df_batch.columns if c not in existing]
-    df_batch = df_batch[existing + others]
-    
-    # האם הקובץ קיים? אם כן, לא כותבים כותרות (header=False)
-    file_exists = os.path.exists(OUTPUT_PATH)
-    
-    df_batch.to_csv(OUTPUT_PATH, mode='a', header=not file_exists, index=False)
-    # print(f" [Saved {len(df_batch)} rows] ", end="") # אופציונלי לדיבוג
+                store.record_failure(gid, reason, attempts)
+                summary['failed'] += 1
+            if i % SAVE_EVERY == 0:
+                store.save()
+            print(f"   ⏳ {i}/{len(todo)} | fetched {summary['fetched']} | failed {summary['failed']} | workers {limiter.limit}", end="\r")
+    store.save()
+
+    summary['elapsed_sec'] = round(time.time() - start, 2)
+    summary['final_workers'] = limiter.limit
+    summary['worker_history'] = limiter.history
+    return summary
+
+def season_game_ids(raw_path: str = RAW_PBP_PATH) -> list:
+    df_source = pd.read_csv(raw_path, usecols=['gameId'], dtype={'gameId': str})
+    return sorted(df_source['gameId'].str.zfill(10).unique())
+
+def print_summary(summary: dict, store: RotationStore):
+    print(f"\n✅ Session complete in {summary['elapsed_sec']}s: {summary['fetched']} fetched, {summary['failed']} failed, "
+          f"{summary['rows']:,} rows written.")
+    print(f"   Workers: {' -> '.join(map(str, summary['worker_history']))}")
+    failures = store.manifest['failures']
+    if failures:
+        reasons = collections.Counter(f['reason'].split(':')[0] for f in failures.values())
+        print(f"⚠️ {len(failures)} game(s) recorded as failed (rerun with --retry-failed): "
+              + ', '.join(f"{r} x{n}" for r, n in reasons.most_common()))
 
 if __name__ == "__main__":
-    fetch_rotations_robust()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Resumable GameRotation fetcher (per-game Parquet parts + manifest).")
+    parser.add_argument('--retry-failed', action='store_true', help="Only retry games recorded as failed.")
+    parser.add_argument('--no-export', action='store_true', help="Skip writing the consolidated rotations CSV.")
+    parser.add_argument('--store', default=STORE_DIR)
+    parser.add_argument('--fake', type=int, default=0, metavar='N_GAMES',
+                        help="Run against the local fake endpoint with N synthetic games (store defaults to a temp dir).")
+    parser.add_argument('--fake-error-rate', type=float, default=0.05)
+    args = parser.parse_args()
+
+    print("🚀 Starting Rotation Fetcher...")
+    if args.fake:
+        import tempfile
+        store_dir = args.store if args.store != STORE_DIR else tempfile.mkdtemp(prefix='rotations_fake_')
+        source = FakeRotationSource(error_rate=args.fake_error_rate)
+        game_ids = [f"{22400001 + i:010d}" for i in range(args.fake)]
+        csv_path = os.path.join(store_dir, 'rotations_fake.csv')
+    else:
+        if not os.path.exists(RAW_PBP_PATH):
+            print("❌ Source file missing."); sys.exit(1)
+        store_dir, source, game_ids, csv_path = args.store, NbaApiSource(), season_game_ids(), OUTPUT_PATH
+
+    store = RotationStore(store_dir)
+    migrated = store.import_legacy_csv(OUTPUT_PATH) if not args.fake else 0
+    if migrated:
+        print(f"📦 Migrated {migrated} games from the legacy CSV into {store_dir}")
+
+    print(f"📊 Total Games: {len(game_ids)} | ✅ Already Done: {len(store.completed_ids() & set(game_ids))} | "
+          f"⚠️ Recorded failures: {len(store.failed_ids())}")
+    summary = fetch_rotations(source, store, game_ids, only_failed=args.retry_failed)
+    print_summary(summary, store)
+
+    if args.fake:
+        print(f"🧪 Fake endpoint: {source.calls} calls, peak {source.peak_in_flight} in flight (throttles above {source.throttle_above})")
+    if not args.no_export:
+        rows = store.export_csv(csv_path)
+        print(f"💾 Consolidated {rows:,} deduplicated rows -> {csv_path}")
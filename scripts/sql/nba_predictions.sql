@@ -0,0 +1,23 @@
+-- Gold predictions table used by scripts/export_to_supabase.py.
+-- The export upserts with ON CONFLICT (game_id, period, seconds_remaining), which Postgres only accepts
+-- when a unique constraint or unique index covers exactly those columns. Run this once in the Supabase SQL editor.
+
+CREATE TABLE IF NOT EXISTS public.nba_predictions (
+    game_id TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    seconds_remaining INTEGER NOT NULL,
+    score_margin INTEGER,
+    predicted_stop_run_90s DOUBLE PRECISION,
+    recommendation TEXT
+);
+
+-- Tables created by the old insert-only export can hold duplicate keys; keep one row per key before indexing.
+DELETE FROM public.nba_predictions a
+USING public.nba_predictions b
+WHERE a.ctid < b.ctid
+  AND a.game_id = b.game_id
+  AND a.period = b.period
+  AND a.seconds_remaining = b.seconds_remaining;
+
+CREATE UNIQUE INDEX IF NOT EXISTS nba_predictions_natural_key
+    ON public.nba_predictions (game_id, period, seconds_remaining);
@@ -1,6 +1,7 @@
-import pandas as pd
 import os
-import glob
+import time
+import argparse
+from data_profiler import DataProfiler, GROUPINGS, missing_status, find_sources, print_profile, save_profile
 
 # --- הגדרת נתיבים ---
 # מניחים שהסקריפט רץ מתוך תיקיית scripts או תת-תיקייה שלה
@@ -9,6 +10,8 @@ CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 # ניסיון לאתר את תיקיית הדאטה (עולה למעלה עד שמוצא)
 # מותאם למבנה: project/data/pureData ו-project/scripts/...
 DATA_DIR = os.path.join(CURRENT_DIR, '..', '..','data', 'pureData')
+SEASON_PATTERNS = [os.path.join(DATA_DIR, 'season_*.csv'), os.path.join(DATA_DIR, 'season_*.parquet')]
+REPORT_PATH = os.path.join(CURRENT_DIR, '..', '..', 'docs', 'reports', 'data_completeness.csv')
 
 # רשימת העמודות הקריטיות לבדיקה (לפי מה שסיכמנו)
 COLUMNS_TO_CHECK = [
@@ -31,60 +34,47 @@ COLUMNS_TO_CHECK = [
     'foulPersonalTotal', 'turnoverTotal', 'pointsTotal'
 ]
 
-def check_completeness():
+def completeness_table(df):
+    """Missing-value status per critical column (used by the script and by the shared QA runner)."""
+    total_rows = len(df)
+    rows = []
+    for col in COLUMNS_TO_CHECK:
+        if col not in df.columns:
+            rows.append({'column': col, 'missing_count': None, 'missing_pct': 100.0, 'status': "❌ NOT FOUND"})
+            continue
+        
+        # ספירת ערכים חסרים (NaN/Null)
+        missing_count = int(df[col].isna().sum())
+        missing_pct = (missing_count / total_rows) * 100 if total_rows else 0.0
+        rows.append({'column': col, 'missing_count': missing_count, 'missing_pct': missing_pct, 'status': missing_status(missing_pct)})
+    return rows
+
+def check_completeness(by='season', paths=None):
+    """
+    Streams every raw season file in chunks (Parquet: straight from the row-group statistics)
+    instead of loading each CSV fully, and prints the completeness table per season / game / overall.
+    """
     print(f"--- Starting Data Completeness Check ---")
-    print(f"Searching for CSV files in: {os.path.abspath(DATA_DIR)}")
-    
-    csv_files = glob.glob(os.path.join(DATA_DIR, "*.csv"))
+    print(f"Searching for season files in: {os.path.abspath(DATA_DIR)}")
     
-    if not csv_files:
+    paths = paths or find_sources(SEASON_PATTERNS)
+    if not paths:
         print("❌ No CSV files found! Check the path.")
         return
 
-    for file_path in csv_files:
-        file_name = os.path.basename(file_path)
-        print(f"\n==========================================")
-        print(f"📂 Analyzing file: {file_name}")
-        print(f"==========================================")
-        
-        try:
-            df = pd.read_csv(file_path, low_memory=False)
-        except Exception as e:
-            print(f"❌ Error reading file: {e}")
-            continue
-            
-        total_rows = len(df)
-        print(f"Total Rows: {total_rows}")
-        
-        # טבלה יפה של תוצאות
-        print(f"{'Column Name':<25} | {'Missing':<10} | {'% Missing':<10} | {'Status'}")
-        print("-" * 65)
-        
-        for col in COLUMNS_TO_CHECK:
-            if col not in df.columns:
-                print(f"{col:<25} | {'MISSING COL':<10} | {'100%':<10} | ❌ NOT FOUND")
-                continue
-            
-            # ספירת ערכים חסרים (NaN/Null)
-            missing_count = df[col].isna().sum()
-            missing_pct = (missing_count / total_rows) * 100
-            
-            # קביעת סטטוס ויזואלי
-            if missing_pct == 0:
-                status = "✅ Perfect"
-            elif missing_pct < 5:
-                status = "⚠️ OK (Low)"
-            elif missing_pct < 20:
-                status = "Rx Warning"
-            else:
-                status = "❌ Critical"
-            
-            # במקרים מסוימים חוסר הוא תקין (למשל x,y לא קיימים באיבודי כדור וכו')
-            # אבל הסקריפט הזה הוא "טיפש" - הוא רק מראה את המצב.
-            
-            print(f"{col:<25} | {missing_count:<10} | {missing_pct:>6.2f}%    | {status}")
+    start = time.time()
+    # במקרים מסוימים חוסר הוא תקין (למשל x,y לא קיימים באיבודי כדור וכו')
+    # אבל הסקריפט הזה הוא "טיפש" - הוא רק מראה את המצב.
+    profile = DataProfiler(COLUMNS_TO_CHECK, by=by).profile(paths)
+    print_profile(profile)
+    print(f"\n⏱️ Profiled {len(paths)} file(s) in {time.time() - start:.2f}s")
+    save_profile(profile, REPORT_PATH)
 
     print("\n--- Check Complete ---")
+    return profile
 
 if __name__ == "__main__":
-    check_completeness()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Chunked completeness check of the critical raw columns.")
+    parser.add_argument('--by', choices=GROUPINGS, default='season', help="Breakdown: overall, per season file or per game.")
+    args = parser.parse_args()
+    check_completeness(args.by)
@@ -10,8 +10,9 @@ def check_event_context(df, event_name, text_trigger, col_substring):
     # 1. סינון השורות
     event_rows = df[df['description'].str.contains(text_trigger, case=False, na=False)]
     
+    findings = {'event': event_name, 'rows': int(len(event_rows)), 'columns': {}, 'broken_identity': []}
     if event_rows.empty:
-        print(f"   ⚠️ No events found for '{text_trigger}'."); return
+        print(f"   ⚠️ No events found for '{text_trigger}'."); return findings
 
     print(f"   Found {len(event_rows)} rows containing '{text_trigger}'.")
 
@@ -23,6 +24,7 @@ def check_event_context(df, event_name, text_trigger, col_substring):
         status = "✅ KEEP" if missing_pct < 20 else "🗑️  DROP CANDIDATE"
         if missing_pct > 99: status = "💀 DEAD (100% Empty)"
         print(f"     -> {col:<30} : {missing_pct:6.1f}% missing. {status}")
+        findings['columns'][col] = round(float(missing_pct), 2)
 
     # --- PART B: בדיקת זהות ראשית (עם חשיפת ערכים) ---
     print(f"   [B] Checking PRIMARY identity columns:")
@@ -35,21 +37,37 @@ def check_event_context(df, event_name, text_trigger, col_substring):
             
             status = "✅ PERFECT" if (missing + zeros) < 1 else "❌ BROKEN"
             print(f"     -> {col:<30} : {missing:6.1f}% NaN, {zeros:6.1f}% Zeros. {status}")
+            if (missing + zeros) >= 1:
+                findings['broken_identity'].append(col)
             
             # --- תוספת: הדפסת הערכים כדי לפתור את התעלומה ---
             if col == 'teamTricode':
                 unique_vals = event_rows[col].unique()
                 print(f"        🕵️‍♂️ VALUES FOUND: {unique_vals[:10]} {'...' if len(unique_vals)>10 else ''}")
 
+    return findings
+
+# (name, trigger, column substring) - shared with the QA runner
+EVENT_CONTEXTS = [
+    ("Assists", "Assist", "assist"),
+    ("Timeouts", "Timeout", "teamTricode"),
+    ("Turnovers", "Turnover", "teamTricode"),
+]
+
+def context_columns(columns):
+    """Projection used by the QA runner: description, identity columns and every column an event context inspects."""
+    subs = [sub.lower() for _, _, sub in EVENT_CONTEXTS]
+    cols = ['description', 'personId', 'teamTricode'] + [c for c in columns if any(sub in c.lower() for sub in subs)]
+    return list(dict.fromkeys(cols))
+
 def main():
     print(f"🕵️‍♂️ Starting QA...")
     if not os.path.exists(FILE_PATH): print("❌ File not found."); return
 
     df = pd.read_csv(FILE_PATH, low_memory=False)
     
-    check_event_context(df, "Assists", "Assist", "assist")
-    check_event_context(df, "Timeouts", "Timeout", "teamTricode") 
-    check_event_context(df, "Turnovers", "Turnover", "teamTricode")
+    for event_name, trigger, col_substring in EVENT_CONTEXTS:
+        check_event_context(df, event_name, trigger, col_substring)
 
     print("\n🏁 Analysis Complete.")
 
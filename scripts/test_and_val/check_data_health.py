@@ -1,46 +1,85 @@
 import pandas as pd
 import os
+import glob
+from data_profiler import DataProfiler
 
 # --- Config ---
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 ROTATIONS_PATH = os.path.join(BASE_DIR, 'data', 'pureData', 'rotations_2024_25.csv')
 RAW_PBP_PATH = os.path.join(BASE_DIR, 'data', 'pureData', 'season_2024_25.csv')
+# חנות ה-Parquet של fetch_rotations.py (קובץ לכל משחק) - כשהיא קיימת, הכיסוי נקרא מהסטטיסטיקות שלה
+ROTATIONS_STORE_DIR = os.path.join(BASE_DIR, 'data', 'pureData', 'rotations_2024_25_parts')
+
+def summarize_health(df_rot, source_game_ids):
+    """Rotation coverage stats vs. the raw season game list (used by the script and by the shared QA runner)."""
+    unique_fetched = df_rot['gameId'].astype(str).str.zfill(10).unique()
+    # 3. בדיקת איכות (האם יש גם בית וגם חוץ?)
+    # בדיקה מדגמית: האם למשחקים יש נתונים לשני הצדדים?
+    grouped = df_rot.groupby('gameId')['team_side'].nunique()
+    return _health_summary(unique_fetched, source_game_ids, int((grouped == 2).sum()))
+
+def summarize_health_profile(rot_profile, source_profile):
+    """
+    Same stats from two per-game DataProfiler reports (team_side on the rotations, gameId on the raw season),
+    so neither file is loaded in full. team_side only takes 'home'/'away': both sides are present when min != max.
+    """
+    sides = rot_profile[rot_profile['column'] == 'team_side']
+    both = sides['min'].notna() & (sides['min'] != sides['max'])
+    return _health_summary(sides['group'].unique(), source_profile['group'].unique(), int(both.sum()))
+
+def _health_summary(fetched_game_ids, source_game_ids, games_with_both_sides):
+    unique_fetched = pd.Series(fetched_game_ids).astype(str).str.zfill(10).unique()
+    total_games = pd.Series(source_game_ids).astype(str).str.zfill(10).nunique()
+    
+    # 2. חישוב סטטיסטיקות
+    success_rate = (len(unique_fetched) / total_games) * 100 if total_games else 0.0
+    
+    if success_rate > 85:
+        status = 'HEALTHY'
+    elif success_rate > 70:
+        status = 'ACCEPTABLE'
+    else:
+        status = 'CRITICAL'
+    
+    return {
+        'total_games': int(total_games),
+        'fetched_games': int(len(unique_fetched)),
+        'missing_games': int(total_games - len(unique_fetched)),
+        'success_rate': success_rate,
+        'games_with_both_sides': games_with_both_sides,
+        'games_partial': int(len(unique_fetched) - games_with_both_sides),
+        'status': status
+    }
+
+def rotation_sources() -> list:
+    parts = sorted(glob.glob(os.path.join(ROTATIONS_STORE_DIR, '*.parquet')))
+    return parts or ([ROTATIONS_PATH] if os.path.exists(ROTATIONS_PATH) else [])
 
 def check_health():
     print("🏥 Starting Data Health Check...")
     
-    if not os.path.exists(ROTATIONS_PATH):
+    rot_paths = rotation_sources()
+    if not rot_paths:
         print("❌ Rotations file not found."); return
 
-    # 1. טעינת נתונים
-    df_rot = pd.read_csv(ROTATIONS_PATH)
-    unique_fetched = df_rot['gameId'].astype(str).str.zfill(10).unique()
-    
-    df_source = pd.read_csv(RAW_PBP_PATH, usecols=['gameId'])
-    total_games = df_source['gameId'].astype(str).str.zfill(10).nunique()
-    
-    # 2. חישוב סטטיסטיקות
-    success_rate = (len(unique_fetched) / total_games) * 100
+    # 1. פרופיל לפי משחק בסריקה בחלקים (בלי לטעון את הקבצים במלואם)
+    rot_profile = DataProfiler(['team_side'], by='game').profile(rot_paths)
+    source_profile = DataProfiler(['gameId'], by='game').profile([RAW_PBP_PATH])
+    health = summarize_health_profile(rot_profile, source_profile)
     
     print(f"\n📊 Summary:")
-    print(f"   Total Games in Season: {total_games}")
-    print(f"   Successfully Fetched:  {len(unique_fetched)}")
-    print(f"   Missing Games:         {total_games - len(unique_fetched)}")
-    print(f"   ✅ Success Rate:       {success_rate:.1f}%")
-    
-    # 3. בדיקת איכות (האם יש גם בית וגם חוץ?)
-    # בדיקה מדגמית: האם למשחקים יש נתונים לשני הצדדים?
-    games_with_both_sides = 0
-    grouped = df_rot.groupby('gameId')['team_side'].nunique()
-    games_with_both_sides = (grouped == 2).sum()
+    print(f"   Total Games in Season: {health['total_games']}")
+    print(f"   Successfully Fetched:  {health['fetched_games']}")
+    print(f"   Missing Games:         {health['missing_games']}")
+    print(f"   ✅ Success Rate:       {health['success_rate']:.1f}%")
     
     print(f"\n🔍 Quality Check:")
-    print(f"   Games with BOTH Home/Away data: {games_with_both_sides}")
-    print(f"   Games with Partial data:        {len(unique_fetched) - games_with_both_sides}")
+    print(f"   Games with BOTH Home/Away data: {health['games_with_both_sides']}")
+    print(f"   Games with Partial data:        {health['games_partial']}")
 
-    if success_rate > 85:
+    if health['status'] == 'HEALTHY':
         print("\n✅ STATUS: HEALTHY (Ready for ML)")
-    elif success_rate > 70:
+    elif health['status'] == 'ACCEPTABLE':
         print("\n⚠️ STATUS: ACCEPTABLE (Might have some noise)")
     else:
         print("\n❌ STATUS: CRITICAL (Too much missing data)")
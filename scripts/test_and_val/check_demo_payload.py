@@ -0,0 +1,101 @@
+import os
+import sys
+import tempfile
+import numpy as np
+
+# --- Config ---
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+N_ROWS = 300
+SEED = 7
+
+sys.path.append(os.path.join(BASE_DIR, 'models'))
+from demo_payload import write_demo_payload, load_manifest, decode_game, verify_round_trip, ALIGNMENT
+
+# סכמה קטנה שמכסה כל קידוד: int חיובי ושלילי, כימות בשני צעדים (כולל offset שלילי), ומילון
+CHECK_COLUMNS = [
+    {'name': 'period', 'encoding': 'int', 'dtype': 'uint8'},
+    {'name': 'score_margin', 'encoding': 'int', 'dtype': 'int16'},
+    {'name': 'cate_score', 'encoding': 'quantized', 'step': 1e-4},
+    {'name': 'home_cum_fatigue', 'encoding': 'quantized', 'step': 1e-2},
+    {'name': 'timeout_team', 'encoding': 'dictionary'},
+    {'name': 'play_description', 'encoding': 'dictionary'},
+]
+
+def _synthetic_games(n_rows: int = N_ROWS, seed: int = SEED) -> dict:
+    rng = np.random.default_rng(seed)
+    teams = np.array(['home', 'away', None], dtype=object)
+
+    def game(n, n_descriptions):
+        return [{
+            'period': int(rng.integers(1, 5)),
+            'score_margin': int(rng.integers(-40, 41)),
+            'cate_score': round(float(rng.uniform(-0.3, 0.9)), 4),
+            'home_cum_fatigue': round(float(rng.uniform(0, 250)), 2),
+            'timeout_team': teams[rng.integers(0, 3)],
+            'play_description': f"שחקן {rng.integers(0, n_descriptions)} קולע"
+        } for _ in range(n)]
+
+    # game_wide: יותר מ-256 ערכי מילון, כך שהקודים עוברים ל-uint16; game_single: שורה אחת (טווח אפס בכל עמודה)
+    return {'game_mixed': game(n_rows, 20), 'game_wide': game(n_rows * 2, 1_000), 'game_single': game(1, 1)}
+
+def _expect_value_error(games: dict, payload_dir: str, column: str) -> str:
+    try:
+        write_demo_payload(games, payload_dir, CHECK_COLUMNS)
+    except ValueError as e:
+        assert column in str(e), f"NaN error does not name the column '{column}': {e}"
+        return str(e)
+    raise AssertionError(f"NaN in '{column}' was encoded instead of rejected")
+
+def check_demo_payload() -> dict:
+    """
+    Encodes synthetic games with every encoding, decodes them back and asserts the round trip,
+    the segment alignment and the NaN rejection. Raises AssertionError on the first broken guarantee.
+    """
+    games = _synthetic_games()
+
+    with tempfile.TemporaryDirectory(prefix='demo_payload_check_') as out_dir:
+        manifest = write_demo_payload(games, out_dir, CHECK_COLUMNS)
+        payload_dir = os.path.join(out_dir, 'chunks')
+
+        # 1. Round-trip: int וטקסט זהים, כימות בתוך חצי צעד
+        report = verify_round_trip(games, payload_dir)
+        assert set(report) == set(games), f"Round-trip skipped games: {set(games) - set(report)}"
+
+        # 2. המניפסט שנקרא מהדיסק זהה למה שנכתב, וכל מקטע מיושר ל-ALIGNMENT בשביל TypedArray
+        assert load_manifest(payload_dir) == manifest, "Manifest on disk differs from the written one"
+        encodings = set()
+        for game_key, entry in manifest['games'].items():
+            for seg in entry['columns']:
+                encodings.add(seg['encoding'])
+                assert seg['byte_offset'] % ALIGNMENT == 0, f"{game_key}.{seg['name']} starts at unaligned offset {seg['byte_offset']}"
+        assert encodings == {'int', 'quantized', 'dictionary'}, f"Encodings not covered: {encodings}"
+
+        wide = {seg['name']: seg for seg in manifest['games']['game_wide']['columns']}
+        assert wide['play_description']['dtype'] == 'uint16', "Dictionary codes did not widen past 256 values"
+
+        # 3. הפענוח מחזיר את הערכים המקוריים (כולל None -> '' במילון וערכי כימות על הרשת)
+        decoded = decode_game(payload_dir, manifest, 'game_mixed')
+        source = games['game_mixed']
+        assert decoded['score_margin'].tolist() == [r['score_margin'] for r in source], "Signed ints changed"
+        assert decoded['timeout_team'].tolist() == [r['timeout_team'] or '' for r in source], "Missing text not decoded as ''"
+        assert decoded['cate_score'].tolist() == [r['cate_score'] for r in source], "Quantized values are off the 1e-4 grid"
+
+        # 4. NaN בעמודה מספרית נדחה עם שגיאה ברורה ולא מקודד לזבל
+        errors = {}
+        for column in ('cate_score', 'score_margin'):
+            broken = {'game_nan': [dict(r) for r in source]}
+            broken['game_nan'][0][column] = float('nan')
+            errors[column] = _expect_value_error(broken, os.path.join(out_dir, 'nan'), column)
+
+    return {'games': len(games), 'rows': sum(len(r) for r in games.values()), 'report': report, 'nan_errors': errors}
+
+if __name__ == "__main__":
+    print("🕵️ Checking the demo payload round trip...")
+    try:
+        result = check_demo_payload()
+    except AssertionError as e:
+        print(f"\n❌ FAILED: {e}")
+        sys.exit(1)
+    for game_key, r in result['report'].items():
+        print(f"   {game_key}: {r['rows']} rows OK | max quantization error {r['max_quantization_error']:.6f}")
+    print(f"\n✅ int, quantized and dictionary encodings round-trip; NaN is rejected ({result['games']} games, {result['rows']:,} rows).")
@@ -0,0 +1,124 @@
+import os
+import sys
+import tempfile
+import subprocess
+
+# --- Config ---
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+N_GAMES = 10
+MAX_ATTEMPTS = 2
+N_THROTTLE_GAMES = 80
+THROTTLE_START = 8
+
+sys.path.append(os.path.join(BASE_DIR, 'scripts'))
+from fetch_rotations import RotationSource, FakeRotationSource, RotationStore, AdaptiveLimiter, fetch_rotations, DEDUP_KEY
+
+def _fake_source(fail_ids=()) -> FakeRotationSource:
+    # בלי שגיאות אקראיות ובלי throttling: התוצאה תלויה רק ב-fail_ids, וכל תשובה מכילה שורות כפולות
+    return FakeRotationSource(latency_sec=0.01, error_rate=0.0, throttle_above=10_000, duplicate_rate=1.0, fail_ids=fail_ids)
+
+def _response_digest(game_id: str, hash_seed: int) -> str:
+    """Digest of one fake response computed in a fresh interpreter with the given PYTHONHASHSEED."""
+    code = ("import sys, pandas as pd; sys.path.insert(0, sys.argv[1]); from fetch_rotations import FakeRotationSource; "
+            "df = FakeRotationSource(latency_sec=0, error_rate=0, duplicate_rate=0.5).fetch(sys.argv[2]); "
+            "print(len(df), int(pd.util.hash_pandas_object(df, index=False).sum()))")
+    env = {**os.environ, 'PYTHONHASHSEED': str(hash_seed)}
+    result = subprocess.run([sys.executable, '-c', code, os.path.join(BASE_DIR, 'scripts'), game_id],
+                            env=env, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+def _fetch(source, store, game_ids, only_failed=False) -> dict:
+    limiter = AdaptiveLimiter(start=4, maximum=4)
+    return fetch_rotations(source, store, game_ids, max_attempts=MAX_ATTEMPTS, limiter=limiter, only_failed=only_failed)
+
+def check_adaptive_limiter(n_games: int = N_THROTTLE_GAMES) -> dict:
+    """
+    Runs the fetcher against a fake endpoint that throttles above one request in flight
+    and asserts the limiter backs off under the errors and then climbs back once the window is clean.
+    """
+    game_ids = [f"{22400001 + i:010d}" for i in range(n_games)]
+    # כל בקשה מעבר לאחת במקביל מוסיפה 10% שגיאות 429; חלון קצר כדי שההחלטות יתקבלו תוך כמה בקשות
+    source = FakeRotationSource(latency_sec=0.005, error_rate=0.0, throttle_above=1, duplicate_rate=0.0)
+    limiter = AdaptiveLimiter(start=THROTTLE_START, maximum=THROTTLE_START, window=4)
+
+    with tempfile.TemporaryDirectory(prefix='rotations_throttle_') as store_dir:
+        # max_attempts=1: בלי backoff בין ניסיונות, כל שגיאה נכנסת ישר לחלון של ה-limiter
+        summary = fetch_rotations(source, RotationStore(store_dir), game_ids, max_attempts=1, limiter=limiter)
+
+    history = limiter.history
+    steps = [b - a for a, b in zip(history, history[1:])]
+    first_drop = next((i for i, step in enumerate(steps) if step < 0), None)
+    assert first_drop is not None, f"Limit never dropped under throttling: {history}"
+    assert any(step > 0 for step in steps[first_drop + 1:]), f"Limit never recovered after backing off: {history}"
+    assert source.peak_in_flight <= THROTTLE_START, f"{source.peak_in_flight} requests in flight above the limit {THROTTLE_START}"
+    return {'games': n_games, 'fetched': summary['fetched'], 'throttled': summary['failed'], 'worker_history': history}
+
+def check_rotation_fetcher(n_games: int = N_GAMES) -> dict:
+    """
+    Runs the fetcher against the fake endpoint in a temp store and asserts dedup, resume and failure recording.
+    Returns the collected facts; raises AssertionError on the first broken guarantee.
+    """
+    game_ids = [f"{22400001 + i:010d}" for i in range(n_games)]
+    bad_game = game_ids[-1]
+
+    # זרע יציב: אותו משחק ואותו ניסיון מחזירים אותה תשובה גם בתהליך אחר עם PYTHONHASHSEED אחר
+    digests = {_response_digest(gid, hash_seed) for gid in game_ids[:1] for hash_seed in (1, 2)}
+    assert len(digests) == 1, f"Fake endpoint responses depend on PYTHONHASHSEED: {digests}"
+
+    with tempfile.TemporaryDirectory(prefix='rotations_check_') as store_dir:
+        # 1. סשן ראשון: משחק אחד נכשל תמיד, כל השאר נכתבים בלי כפילויות
+        source = _fake_source(fail_ids={bad_game})
+        store = RotationStore(store_dir)
+        summary = _fetch(source, store, game_ids)
+        assert summary['fetched'] == n_games - 1 and summary['failed'] == 1, f"First session: {summary}"
+        failure = store.manifest['failures'].get(bad_game)
+        assert failure and failure['reason'].startswith('ConnectionError') and failure['attempts'] == MAX_ATTEMPTS, \
+            f"Failure not recorded with reason and attempts: {failure}"
+
+        df = store.load_all()
+        expected_rows = sum(len(source._stints(g)) for g in game_ids[:-1])
+        assert len(df) == expected_rows, f"Dedup: {len(df)} rows stored, expected {expected_rows}"
+        assert not df.duplicated(subset=DEDUP_KEY).any(), "Duplicate rotation rows survived the store"
+        for gid in game_ids[:-1]:
+            assert store.manifest['games'][gid]['rows'] == len(source._stints(gid)), f"Part {gid} was not deduplicated"
+
+        # 2. Resume: store חדש מאותה תיקייה ממשיך מה-manifest ומבקש רק את המשחק שחסר
+        source = _fake_source(fail_ids={bad_game})
+        store = RotationStore(store_dir)
+        assert store.completed_ids() == set(game_ids[:-1]), "Manifest did not survive the session"
+        summary = _fetch(source, store, game_ids)
+        assert summary['requested'] == 1 and source.calls == MAX_ATTEMPTS, \
+            f"Resume re-requested finished games: {summary['requested']} requested, {source.calls} calls"
+        assert store.manifest['failures'][bad_game]['attempts'] == 2 * MAX_ATTEMPTS, "Failure attempts did not accumulate"
+
+        # 3. --retry-failed: המשחק שנכשל מצליח, נמחק מרשימת הכישלונות, ושאר המשחקים לא נשלפים שוב
+        source = _fake_source()
+        summary = _fetch(source, store, game_ids, only_failed=True)
+        assert summary['requested'] == 1 and summary['fetched'] == 1 and source.calls == 1, f"Retry-failed: {summary}"
+        assert not store.manifest['failures'] and store.completed_ids() == set(game_ids), "Failure not cleared after retry"
+
+        csv_path = os.path.join(store_dir, 'rotations_check.csv')
+        exported = store.export_csv(csv_path)
+        expected_rows += len(source._stints(bad_game))
+        assert exported == expected_rows, f"Export: {exported} rows, expected {expected_rows}"
+
+    # RotationSource הוא מחלקה אבסטרקטית: מקור בלי fetch לא נוצר בכלל
+    try:
+        RotationSource()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("RotationSource can be instantiated without fetch()")
+
+    limiter = check_adaptive_limiter()
+    return {'games': n_games, 'rows': expected_rows, 'failed_game': bad_game, 'worker_history': limiter['worker_history']}
+
+if __name__ == "__main__":
+    print("🕵️ Checking the rotation fetcher against the fake endpoint...")
+    try:
+        result = check_rotation_fetcher()
+    except AssertionError as e:
+        print(f"\n❌ FAILED: {e}")
+        sys.exit(1)
+    print(f"\n✅ Dedup, resume and failure recording hold ({result['games']} games, {result['rows']:,} rows).")
+    print(f"✅ Adaptive limit backs off and recovers under throttling: {' -> '.join(map(str, result['worker_history']))}")
@@ -0,0 +1,411 @@
+import os
+import re
+import glob
+import json
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+# --- Config ---
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.join(CURRENT_DIR, '..', '..')
+DATA_PATTERNS = [
+    os.path.join(BASE_DIR, 'data', 'pureData', '*.csv'),
+    os.path.join(BASE_DIR, 'data', 'pureData', '*.parquet'),
+]
+REPORT_PATH = os.path.join(BASE_DIR, 'docs', 'reports', 'data_profile.csv')
+
+GROUPINGS = ('all', 'season', 'game')
+GAME_COLUMN = 'gameId'
+CHUNK_ROWS = 200_000
+SKETCH_K = 1024              # KMV: מספר ה-hash-ים הקטנים שנשמרים לכל עמודה (שגיאה יחסית ~3%)
+HIST_BINS = 10
+HIST_TOP_VALUES = 10
+HIST_MAX_TRACKED = 20_000    # מעבר לזה (למשל description) אין היסטוגרמה - רק ספירת ערכים שונים
+REPORT_COLUMNS = ['group', 'column', 'rows', 'null_count', 'null_pct', 'min', 'max', 'distinct_est', 'histogram', 'status']
+
+def missing_status(missing_pct: float) -> str:
+    """Visual status of a column's missing-value share (shared by the completeness table and the profile report)."""
+    if missing_pct == 0:
+        return "✅ Perfect"
+    if missing_pct < 5:
+        return "⚠️ OK (Low)"
+    if missing_pct < 20:
+        return "Rx Warning"
+    return "❌ Critical"
+
+def season_of(path: str) -> str:
+    """season_2024_25.csv -> 'season_2024_25'; a per-game part (rotations_2024_25_parts/<gameId>.parquet) -> its directory name."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    parent = os.path.basename(os.path.dirname(os.path.abspath(path)))
+    return parent if re.search(r'\d{4}_\d{2}', parent) and not re.search(r'\d{4}_\d{2}', stem) else stem
+
+def game_labels(values) -> np.ndarray:
+    """
+    One label type for a game in every source: the 10-digit zero-padded id ('0022400001'),
+    whether it came from a CSV string, an Arrow int column or a Parquet footer statistic.
+    """
+    raw = pd.Series(np.asarray(values, dtype=object))
+    numeric = pd.to_numeric(raw, errors='coerce')
+    labels = raw.astype(str)
+    ok = numeric.notna()
+    labels[ok] = numeric[ok].astype('int64').astype(str).str.zfill(10)
+    return labels.to_numpy(dtype=object)
+
+def _is_numeric(values) -> bool:
+    return pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values)
+
+def _group_extremes(values: pd.Series, keys) -> pd.DataFrame:
+    """Per-key min/max. Text goes through sorted categorical codes, so the reduction stays vectorized."""
+    if _is_numeric(values):
+        grouped = values.groupby(keys, sort=False)
+        return pd.DataFrame({'min': grouped.min(), 'max': grouped.max()})
+    codes, uniques = pd.factorize(values, sort=True)
+    grouped = pd.Series(codes, index=values.index).groupby(keys, sort=False)
+    uniques = np.asarray(uniques, dtype=object)
+    lo, hi = grouped.min(), grouped.max()
+    return pd.DataFrame({'min': uniques[lo.to_numpy()], 'max': uniques[hi.to_numpy()]}, index=lo.index)
+
+def _as_python(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+class DataProfiler:
+    """
+    Streaming column profile: null counts, min/max, distinct-count sketches and value histograms,
+    accumulated chunk by chunk so memory is bounded by the chunk size, not by the number of seasons.
+    - CSV sources are read in chunks of chunk_rows (only the profiled columns).
+    - Parquet sources take null counts and min/max straight from the row-group statistics;
+      data is read only for the sketches/histograms, or when a row group has no usable statistics.
+    - by='all' | 'season' | 'game' sets the breakdown; the report has the same format for every grain.
+    The game grain skips sketches and histograms by default (pass distinct/histograms=True to keep them).
+    """
+
+    def __init__(self, columns=None, by: str = 'season', chunk_rows: int = CHUNK_ROWS, sketch_k: int = SKETCH_K,
+                 distinct: bool = None, histograms: bool = None):
+        if by not in GROUPINGS:
+            raise ValueError(f"by must be one of {GROUPINGS}, got '{by}'")
+        self.columns = list(columns) if columns is not None else None
+        self.by = by
+        self.chunk_rows = chunk_rows
+        self.sketch_k = sketch_k
+        self.distinct = by != 'game' if distinct is None else distinct
+        self.histograms = by != 'game' if histograms is None else histograms
+
+        self.rows = {}          # group -> rows
+        self.nulls = {}         # (group, column) -> null count
+        self.seen = set()       # עמודות שהופיעו לפחות בקובץ אחד
+        self.kinds = {}         # column -> 'num' | 'text'
+        self.extremes = {}      # column -> DataFrame(index=group, columns=[min, max])
+        self.sketches = []      # DataFrame(group, column, hash) שנשמרים עד sketch_k לכל זוג
+        self.values = {}        # (group, column) -> Series value -> count (None אחרי גלישה)
+        self.sources = []
+
+    # --- Accumulation ---
+
+    def _normalize(self, col: str, values: pd.Series) -> pd.Series:
+        """Numbers as float64 and everything else as str, so chunks inferred differently still merge."""
+        kind = 'num' if _is_numeric(values) else 'text'
+        previous = self.kinds.setdefault(col, kind)
+        if previous != kind and previous == 'num':
+            # העמודה התגלתה כטקסט: הסטטיסטיקות שנצברו עד עכשיו עוברות למחרוזות
+            self.kinds[col] = 'text'
+            if col in self.extremes:
+                self.extremes[col] = self.extremes[col].astype(str)
+            for key, counts in self.values.items():
+                if key[1] == col and counts is not None:
+                    self.values[key] = counts.groupby(counts.index.astype(str)).sum()
+        if self.kinds[col] == 'num':
+            # + 0.0: סטטיסטיקות Parquet שומרות מינימום 0 כ-0.0-
+            return values.astype('float64') + 0.0
+        return values.astype(str)
+
+    def _merge_extremes(self, col: str, frame: pd.DataFrame):
+        if frame.empty:
+            return
+        previous = self.extremes.get(col)
+        if previous is not None:
+            frame = pd.concat([previous, frame])
+        keys = frame.index.to_numpy()
+        lows = _group_extremes(frame['min'], keys)['min']
+        highs = _group_extremes(frame['max'], keys)['max']
+        self.extremes[col] = pd.DataFrame({'min': lows, 'max': highs})
+
+    def _add_counts(self, codes: np.ndarray, labels, col: str, null_mask: np.ndarray):
+        per_group = np.bincount(codes, weights=null_mask, minlength=len(labels))
+        for group, count in zip(labels, per_group):
+            self.nulls[(group, col)] = self.nulls.get((group, col), 0) + int(count)
+
+    def _add_sketch(self, codes: np.ndarray, labels, col: str, values: pd.Series):
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        if len(labels) == 1:
+            # קבוצה אחת ל-chunk: רק k ה-hash-ים הקטנים נכנסים למצב
+            hashes = np.unique(hashes)[:self.sketch_k]
+            self.sketches.append(pd.DataFrame({'group': labels[0], 'column': col, 'hash': hashes}))
+            return
+        self.sketches.append(pd.DataFrame({'group': np.asarray(labels, dtype=object)[codes], 'column': col, 'hash': hashes}))
+
+    def _add_values(self, codes: np.ndarray, labels, col: str, values: pd.Series):
+        if len(labels) == 1:
+            per_group = [(labels[0], values.value_counts(sort=False))]
+        else:
+            counts = values.groupby([codes, values.to_numpy()], sort=False).size()
+            per_group = [(labels[code], c.droplevel(0)) for code, c in counts.groupby(level=0, sort=False)]
+        for group, group_counts in per_group:
+            key = (group, col)
+            if key in self.values and self.values[key] is None:
+                continue
+            merged = group_counts if key not in self.values else self.values[key].add(group_counts, fill_value=0)
+            self.values[key] = merged if len(merged) <= HIST_MAX_TRACKED else None
+
+    def _compact_sketches(self):
+        """Keeps only the sketch_k smallest distinct hashes per (group, column) - the KMV sketch stays mergeable and bounded."""
+        if not self.sketches:
+            return
+        sketch = pd.concat(self.sketches, ignore_index=True).drop_duplicates()
+        sketch = sketch.sort_values(['group', 'column', 'hash'])
+        self.sketches = [sketch.groupby(['group', 'column'], sort=False).head(self.sketch_k)]
+
+    def update(self, chunk: pd.DataFrame, group, counts: bool = True, sketches: bool = True):
+        """
+        Adds one chunk. group is a label for the whole chunk or an array aligned with its rows (per-game breakdown).
+        counts=False skips rows/nulls/min/max (already taken from Parquet statistics).
+        """
+        # קבוצות כקודים שלמים: bincount במקום groupby, ובלי groupby בכלל כשכל ה-chunk הוא קבוצה אחת
+        if np.ndim(group) == 0:
+            codes, labels = np.zeros(len(chunk), dtype=np.intp), [group]
+        else:
+            codes, uniques = pd.factorize(np.asarray(group))
+            labels = list(uniques)
+        columns = self.columns if self.columns is not None else list(chunk.columns)
+
+        if counts:
+            for g, n in zip(labels, np.bincount(codes, minlength=len(labels))):
+                self.rows[g] = self.rows.get(g, 0) + int(n)
+
+        for col in columns:
+            if col not in chunk.columns:
+                if counts:
+                    # עמודה שחסרה בקובץ נספרת כחסרה בכל השורות שלו
+                    self._add_counts(codes, labels, col, np.ones(len(chunk)))
+                continue
+            self.seen.add(col)
+            null_mask = chunk[col].isna().to_numpy()
+            if counts:
+                self._add_counts(codes, labels, col, null_mask)
+            present = ~null_mask
+            if not present.any():
+                continue
+            values = self._normalize(col, chunk[col][present])
+            present_codes = codes[present]
+            if counts:
+                if len(labels) == 1:
+                    extremes = pd.DataFrame({'min': [values.min()], 'max': [values.max()]}, index=labels)
+                else:
+                    extremes = _group_extremes(values, present_codes)
+                    extremes.index = [labels[c] for c in extremes.index]
+                self._merge_extremes(col, extremes)
+            if sketches and self.distinct:
+                self._add_sketch(present_codes, labels, col, values)
+            if sketches and self.histograms:
+                self._add_values(present_codes, labels, col, values)
+
+        if sketches and self.distinct:
+            self._compact_sketches()
+
+    # --- Sources ---
+
+    def _group_of(self, path: str):
+        return 'all' if self.by == 'all' else season_of(path)
+
+    def profile_csv(self, path: str):
+        with open(path, 'r', encoding='utf-8') as f:
+            header = f.readline().rstrip('\r\n').split(',')
+        wanted = header if self.columns is None else [c for c in header if c in self.columns]
+        if self.by == 'game' and GAME_COLUMN not in wanted:
+            wanted = wanted + [GAME_COLUMN]
+        # gameId נקרא כמחרוזת כדי לשמור על האפסים המובילים (0022400001)
+        dtype = {GAME_COLUMN: str} if GAME_COLUMN in header else None
+        for chunk in pd.read_csv(path, usecols=wanted, dtype=dtype, chunksize=self.chunk_rows, low_memory=False):
+            group = game_labels(chunk[GAME_COLUMN]) if self.by == 'game' else self._group_of(path)
+            self.update(chunk, group)
+
+    def _statistics_plan(self, pf: pq.ParquetFile, columns: list):
+        """
+        Per row group: (group label, rows, {column: (null_count, min, max)}) from the footer, or None
+        when some statistic is missing (or a row group spans several games at the game grain).
+        """
+        md = pf.metadata
+        names = [md.schema.column(i).name for i in range(md.num_columns)]
+        plan = []
+        for r in range(md.num_row_groups):
+            rg = md.row_group(r)
+            stats = {}
+            for col in columns:
+                if col not in names:
+                    continue
+                s = rg.column(names.index(col)).statistics
+                if s is None or not s.has_null_count:
+                    return None
+                has_values = s.null_count < rg.num_rows
+                if has_values and not s.has_min_max:
+                    return None
+                stats[col] = (s.null_count, s.min if has_values else None, s.max if has_values else None)
+            group = None
+            if self.by == 'game':
+                if GAME_COLUMN not in names:
+                    return None
+                s = rg.column(names.index(GAME_COLUMN)).statistics
+                if s is None or not s.has_min_max or s.min != s.max or s.null_count:
+                    return None
+                group = game_labels([s.min])[0]
+            plan.append((group, rg.num_rows, stats))
+        return plan
+
+    def _apply_statistics(self, path: str, plan: list, columns: list):
+        for group, n_rows, stats in plan:
+            group = self._group_of(path) if group is None else group
+            self.rows[group] = self.rows.get(group, 0) + n_rows
+            for col in columns:
+                if col not in stats:
+                    self.nulls[(group, col)] = self.nulls.get((group, col), 0) + n_rows
+                    continue
+                self.seen.add(col)
+                null_count, lo, hi = stats[col]
+                self.nulls[(group, col)] = self.nulls.get((group, col), 0) + int(null_count)
+                if lo is None:
+                    continue
+                extremes = self._normalize(col, pd.Series([lo, hi]))
+                self._merge_extremes(col, pd.DataFrame({'min': [extremes.iloc[0]], 'max': [extremes.iloc[1]]}, index=[group]))
+
+    def profile_parquet(self, path: str):
+        pf = pq.ParquetFile(path)
+        names = pf.schema_arrow.names
+        columns = names if self.columns is None else list(self.columns)
+        plan = self._statistics_plan(pf, columns)
+        if plan is not None:
+            self._apply_statistics(path, plan, columns)
+        if plan is not None and not (self.distinct or self.histograms):
+            return
+
+        read = [c for c in columns if c in names]
+        if self.by == 'game' and GAME_COLUMN in names and GAME_COLUMN not in read:
+            read.append(GAME_COLUMN)
+        for batch in pf.iter_batches(batch_size=self.chunk_rows, columns=read):
+            chunk = batch.to_pandas()
+            group = game_labels(chunk[GAME_COLUMN]) if self.by == 'game' else self._group_of(path)
+            # counts=True רק כשהסטטיסטיקות לא היו שמישות
+            self.update(chunk.reindex(columns=read), group, counts=plan is None)
+
+    def profile(self, paths) -> pd.DataFrame:
+        for path in paths:
+            start = time.time()
+            if path.endswith('.parquet'):
+                self.profile_parquet(path)
+            else:
+                self.profile_csv(path)
+            self.sources.append({'path': path, 'sec': round(time.time() - start, 3)})
+        return self.report()
+
+    # --- Report ---
+
+    def _distinct_estimates(self) -> dict:
+        if not self.sketches:
+            return {}
+        sketch = self.sketches[0]
+        estimates = {}
+        for key, hashes in sketch.groupby(['group', 'column'], sort=False)['hash']:
+            if len(hashes) < self.sketch_k:
+                estimates[key] = float(len(hashes))
+            else:
+                # KMV: ה-hash ה-k-י הקטן ביותר מתוך 2^64 משקף את צפיפות הערכים השונים
+                estimates[key] = round((self.sketch_k - 1) / (float(hashes.max()) / 2 ** 64))
+        return estimates
+
+    def _histogram(self, key, lo, hi):
+        counts = self.values.get(key)
+        if counts is None:
+            return None
+        if self.kinds.get(key[1]) == 'num':
+            edges = np.linspace(lo, hi, HIST_BINS + 1) if hi > lo else np.array([lo, lo + 1])
+            hist, edges = np.histogram(counts.index.to_numpy(dtype=float), bins=edges, weights=counts.to_numpy())
+            return {f"{edges[i]:.6g}..{edges[i + 1]:.6g}": int(hist[i]) for i in range(len(hist))}
+        # מיון יציב: שוויון בספירה נשבר לפי הערך, כך שהדו"ח לא תלוי בגודל ה-chunk
+        top = counts.sort_index().sort_values(ascending=False, kind='stable')
+        hist = {str(v): int(c) for v, c in top.head(HIST_TOP_VALUES).items()}
+        if len(top) > HIST_TOP_VALUES:
+            hist['<other>'] = int(top.iloc[HIST_TOP_VALUES:].sum())
+        return hist
+
+    def report(self) -> pd.DataFrame:
+        """One row per (group, column); columns that never appeared in any source are marked NOT FOUND."""
+        columns = self.columns if self.columns is not None else sorted(self.seen)
+        distinct = self._distinct_estimates()
+        rows = []
+        for group in sorted(self.rows, key=str):
+            n_rows = self.rows[group]
+            for col in columns:
+                null_count = self.nulls.get((group, col), n_rows)
+                null_pct = (null_count / n_rows) * 100 if n_rows else 0.0
+                extremes = self.extremes.get(col)
+                lo = hi = None
+                if extremes is not None and group in extremes.index:
+                    lo, hi = _as_python(extremes.at[group, 'min']), _as_python(extremes.at[group, 'max'])
+                histogram = self._histogram((group, col), lo, hi) if self.histograms and lo is not None else None
+                rows.append({
+                    'group': group, 'column': col, 'rows': n_rows,
+                    'null_count': null_count if col in self.seen else None,
+                    'null_pct': null_pct, 'min': lo, 'max': hi,
+                    'distinct_est': distinct.get((group, col), 0.0 if lo is None else np.nan) if self.distinct else np.nan,
+                    'histogram': json.dumps(histogram, ensure_ascii=False) if histogram else None,
+                    'status': missing_status(null_pct) if col in self.seen else "❌ NOT FOUND",
+                })
+        return pd.DataFrame(rows, columns=REPORT_COLUMNS)
+
+def find_sources(patterns=DATA_PATTERNS) -> list:
+    return sorted(p for pattern in patterns for p in glob.glob(pattern))
+
+def print_profile(report: pd.DataFrame):
+    for group, table in report.groupby('group', sort=False):
+        print(f"\n==========================================")
+        print(f"📂 Group: {group} | Total Rows: {table['rows'].iloc[0]:,}")
+        print(f"==========================================")
+        print(f"{'Column Name':<25} | {'Missing':<10} | {'% Missing':<10} | {'Distinct':>9} | {'Min':>12} | {'Max':>12} | Status")
+        print("-" * 110)
+        for row in table.itertuples(index=False):
+            if row.null_count is None or pd.isna(row.null_count):
+                print(f"{row.column:<25} | {'MISSING COL':<10} | {'100%':<10} | {'':>9} | {'':>12} | {'':>12} | {row.status}")
+                continue
+            distinct = '' if pd.isna(row.distinct_est) else f"{row.distinct_est:,.0f}"
+            lo = '' if row.min is None else str(row.min)[:12]
+            hi = '' if row.max is None else str(row.max)[:12]
+            print(f"{row.column:<25} | {int(row.null_count):<10} | {row.null_pct:>6.2f}%    | {distinct:>9} | {lo:>12} | {hi:>12} | {row.status}")
+
+def save_profile(report: pd.DataFrame, path: str = REPORT_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    report.to_csv(path, index=False)
+    print(f"\n💾 Profile saved to: {path}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chunked null/min/max/distinct/histogram profile of the raw data.")
+    parser.add_argument('paths', nargs='*', help="CSV/Parquet files or globs (default: data/pureData/*).")
+    parser.add_argument('--by', choices=GROUPINGS, default='season')
+    parser.add_argument('--columns', nargs='+', help="Profile only these columns.")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--no-sketches', action='store_true',
+                        help="Only nulls and min/max (Parquet sources are then profiled from their footers alone).")
+    parser.add_argument('--report', default=REPORT_PATH)
+    args = parser.parse_args()
+
+    paths = find_sources(args.paths) if args.paths else find_sources()
+    if not paths:
+        print("❌ No CSV/Parquet files found! Check the path.")
+    else:
+        start = time.time()
+        sketches = False if args.no_sketches else None
+        profile = DataProfiler(args.columns, by=args.by, chunk_rows=args.chunk_rows,
+                               distinct=sketches, histograms=sketches).profile(paths)
+        print_profile(profile)
+        print(f"\n⏱️ Profiled {len(paths)} file(s) in {time.time() - start:.2f}s")
+        save_profile(profile, args.report)
@@ -115,6 +115,7 @@ def generate_context_report(df):
     plt.close()
     
     print(f"[V] Contextual health report saved to: {output_path}")
+    return table_data
 
 def main():
     if not os.path.exists(INPUT_FILE):
@@ -0,0 +1,222 @@
+import os
+import io
+import sys
+import csv
+import json
+import time
+import hashlib
+import threading
+import traceback
+import concurrent.futures
+import pyarrow.csv as pa_csv
+import pyarrow.feather as feather
+
+# --- Check registry ---
+# כל בדיקה היא פונקציה רשומה שמקבלת DataFrame (רק העמודות שביקשה) ומחזירה dict עם status
+QA_CHECKS = {}
+
+STATUS_PASSED = 'passed'
+STATUS_WARNING = 'warning'
+STATUS_FAILED = 'failed'
+STATUS_ERROR = 'error'
+STATUS_SKIPPED = 'skipped'
+
+def qa_check(name: str, source: str = None, columns=None, parallel: bool = True, requires_network: bool = False):
+    """
+    Registers a QA check.
+    - source: key of a dataset in the shared store (None for checks that fetch their own data).
+    - columns: list of column names, or a callable(schema_names) -> list, projected from the source.
+    - parallel: False for checks that are not thread-safe (e.g. pyplot figures); they run serially after the pool.
+    """
+    def decorator(func):
+        QA_CHECKS[name] = {
+            'func': func,
+            'source': source,
+            'columns': columns,
+            'parallel': parallel,
+            'requires_network': requires_network
+        }
+        return func
+    return decorator
+
+class SharedDataset:
+    """
+    One column-projected load of a CSV, shared by every check that reads it.
+    The first run converts only the requested columns into an Arrow IPC cache file;
+    later runs memory-map that file, so checks slice columns without copying the raw CSV again.
+    """
+
+    def __init__(self, path: str, cache_dir: str):
+        self.path = path
+        self.cache_dir = cache_dir
+        self.table = None
+        self.load_sec = None
+
+    def read_header(self) -> list:
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            return next(csv.reader(f), [])
+
+    def _cache_path(self, columns: list) -> str:
+        stat = os.stat(self.path)
+        key = f"{os.path.abspath(self.path)}|{stat.st_size}|{stat.st_mtime_ns}|{','.join(sorted(columns))}"
+        digest = hashlib.md5(key.encode('utf-8')).hexdigest()[:12]
+        base = os.path.splitext(os.path.basename(self.path))[0]
+        return os.path.join(self.cache_dir, f"{base}.{digest}.arrow")
+
+    def load(self, columns: list):
+        start = time.time()
+        cache_path = self._cache_path(columns)
+
+        if not os.path.exists(cache_path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            table = pa_csv.read_csv(self.path, convert_options=pa_csv.ConvertOptions(include_columns=columns))
+            # Uncompressed IPC so the file can be memory-mapped directly
+            feather.write_feather(table, cache_path, compression='uncompressed')
+
+        self.table = feather.read_table(cache_path, memory_map=True)
+        self.load_sec = time.time() - start
+        return self
+
+    def frame(self, columns: list):
+        present = [c for c in columns if c in self.table.column_names]
+        return self.table.select(present).to_pandas()
+
+class _CheckOutput:
+    """Routes print() from a check into that check's own buffer, so parallel checks do not interleave on the console."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+def _resolve_columns(spec, header: list) -> list:
+    if spec is None:
+        return list(header)
+    if callable(spec):
+        spec = spec(header)
+    return [c for c in dict.fromkeys(spec) if c in header]
+
+def _run_single(name: str, check: dict, store: dict) -> dict:
+    start = time.time()
+    output = sys.stdout if isinstance(sys.stdout, _CheckOutput) else None
+    if output is not None:
+        output.local.buffer = io.StringIO()
+    try:
+        if check['source'] is None:
+            result = check['func']()
+        else:
+            dataset, columns = store[name]
+            result = check['func'](dataset.frame(columns))
+        result = result or {}
+        result.setdefault('status', STATUS_PASSED)
+    except Exception as e:
+        result = {'status': STATUS_ERROR, 'error': f"{type(e).__name__}: {e}", 'traceback': traceback.format_exc()}
+    result['duration_sec'] = round(time.time() - start, 3)
+    if output is not None:
+        result['log'] = output.local.buffer.getvalue()
+        output.local.buffer = None
+    return result
+
+def run_checks(sources: dict, cache_dir: str, names: list = None, include_network: bool = False, max_workers: int = None) -> dict:
+    """
+    Runs the registered checks against the shared datasets and returns a structured report.
+    sources maps a source key to its CSV path.
+    """
+    suite_start = time.time()
+    selected = {n: c for n, c in QA_CHECKS.items() if names is None or n in names}
+    results = {}
+
+    # 1. איחוד העמודות הנדרשות לכל מקור וטעינה אחת בלבד למקור
+    headers, needed = {}, {}
+    for name, check in selected.items():
+        if check['requires_network'] and not include_network:
+            results[name] = {'status': STATUS_SKIPPED, 'reason': 'requires network (use --network)', 'duration_sec': 0.0}
+            continue
+        src = check['source']
+        if src is None:
+            continue
+        path = sources.get(src)
+        if path is None or not os.path.exists(path):
+            results[name] = {'status': STATUS_SKIPPED, 'reason': f"source '{src}' not found: {path}", 'duration_sec': 0.0}
+            continue
+        if src not in headers:
+            headers[src] = SharedDataset(path, cache_dir).read_header()
+        needed.setdefault(src, set()).update(_resolve_columns(check['columns'], headers[src]))
+
+    datasets, load_timings = {}, {}
+    for src, cols in needed.items():
+        datasets[src] = SharedDataset(sources[src], cache_dir).load(sorted(cols))
+        load_timings[src] = round(datasets[src].load_sec, 3)
+
+    store = {}
+    runnable = [n for n in selected if n not in results]
+    for name in runnable:
+        src = selected[name]['source']
+        if src is not None:
+            store[name] = (datasets[src], _resolve_columns(selected[name]['columns'], headers[src]))
+
+    # 2. בדיקות בלתי תלויות רצות במקביל על אותה טבלה בזיכרון
+    pooled = [n for n in runnable if selected[n]['parallel']]
+    serial = [n for n in runnable if not selected[n]['parallel']]
+
+    original_stdout = sys.stdout
+    sys.stdout = _CheckOutput(original_stdout)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or min(8, max(1, len(pooled)))) as executor:
+            futures = {executor.submit(_run_single, n, selected[n], store): n for n in pooled}
+            for future in concurrent.futures.as_completed(futures):
+                results[futures[future]] = future.result()
+
+        for name in serial:
+            results[name] = _run_single(name, selected[name], store)
+    finally:
+        sys.stdout = original_stdout
+
+    counts = {}
+    for r in results.values():
+        counts[r['status']] = counts.get(r['status'], 0) + 1
+
+    return {
+        'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'total_sec': round(time.time() - suite_start, 3),
+        'load_sec': load_timings,
+        'summary': counts,
+        'checks': {n: results[n] for n in selected if n in results}
+    }
+
+def print_report(report: dict, verbose: bool = False):
+    if verbose:
+        for name, r in report['checks'].items():
+            if r.get('log'):
+                print(f"\n----- {name} -----")
+                print(r['log'].rstrip())
+
+    print("\n" + "="*70)
+    print("📊 QA SUITE REPORT")
+    print("="*70)
+    for src, sec in report['load_sec'].items():
+        print(f"   Shared load [{src}]: {sec:.2f}s")
+
+    icons = {STATUS_PASSED: '✅', STATUS_WARNING: '⚠️', STATUS_FAILED: '❌', STATUS_ERROR: '💥', STATUS_SKIPPED: '⏭️'}
+    print(f"\n{'Check':<28} | {'Status':<10} | {'Time (s)':>8} | Summary")
+    print("-" * 70)
+    for name, r in report['checks'].items():
+        summary = r.get('summary') or r.get('reason') or r.get('error') or ''
+        print(f"{name:<28} | {icons.get(r['status'], '')} {r['status']:<7} | {r['duration_sec']:>8.2f} | {summary}")
+
+    print("-" * 70)
+    counts = ' | '.join(f"{k}: {v}" for k, v in report['summary'].items())
+    print(f"Total: {report['total_sec']:.2f}s | {counts}")
+
+def save_report(report: dict, path: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # ה-traceback המלא נשמר ל-JSON בלבד
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"💾 QA report saved to: {path}")
@@ -1,58 +1,167 @@
 import os
 import sys
-import subprocess
-import glob
+import argparse
+import pandas as pd
+
+from qa_framework import qa_check, run_checks, print_report, save_report, STATUS_PASSED, STATUS_WARNING, STATUS_FAILED, STATUS_ERROR, STATUS_SKIPPED
+from Data_integrity_check_before_FE import COLUMNS_TO_CHECK, completeness_table
+from check_data_health import ROTATIONS_PATH, summarize_health
+from data_validation import generate_context_report
+from validate_game_logic import validate_season, save_blacklist, BAD_GAMES_FILE
+from check_contextual_sparsity import EVENT_CONTEXTS, check_event_context, context_columns
+from test_for_subs import SUB_COLUMNS, SAMPLE_ROWS, inspect_substitutions
+from check_rotation_fetcher import check_rotation_fetcher
+from check_demo_payload import check_demo_payload
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.join(CURRENT_DIR, '..', '..')
+
+# כל מקור נטען פעם אחת בלבד (רק העמודות שהבדיקות ביקשו) ומשותף לכל הבדיקות
+SOURCES = {
+    'raw': os.path.join(BASE_DIR, 'data', 'pureData', 'season_2024_25.csv'),
+    'level1': os.path.join(BASE_DIR, 'data', 'interim', 'level1_base.csv')
+}
+CACHE_DIR = os.path.join(BASE_DIR, 'data', 'interim', 'qa_cache')
+REPORT_PATH = os.path.join(BASE_DIR, 'docs', 'reports', 'qa_report.json')
+
+# --- Registered checks (pre-feature engineering QA suite) ---
+
+@qa_check('raw_completeness', source='raw', columns=COLUMNS_TO_CHECK)
+def raw_completeness(df):
+    rows = completeness_table(df)
+    not_found = [r['column'] for r in rows if r['missing_count'] is None]
+    critical = [r['column'] for r in rows if r['missing_count'] is not None and r['missing_pct'] >= 20]
+
+    status = STATUS_FAILED if not_found else (STATUS_WARNING if critical else STATUS_PASSED)
+    return {
+        'status': status,
+        'summary': f"{len(df):,} rows | not found: {len(not_found)} | critical: {len(critical)}",
+        'details': rows
+    }
+
+@qa_check('rotation_coverage', source='raw', columns=['gameId'])
+def rotation_coverage(df):
+    if not os.path.exists(ROTATIONS_PATH):
+        return {'status': STATUS_SKIPPED, 'summary': 'Rotations file not found.'}
+
+    df_rot = pd.read_csv(ROTATIONS_PATH, usecols=['gameId', 'team_side'])
+    health = summarize_health(df_rot, df['gameId'])
+    status = {'HEALTHY': STATUS_PASSED, 'ACCEPTABLE': STATUS_WARNING}.get(health['status'], STATUS_FAILED)
+    return {
+        'status': status,
+        'summary': f"{health['fetched_games']}/{health['total_games']} games ({health['success_rate']:.1f}%) | both sides: {health['games_with_both_sides']}",
+        'details': health
+    }
+
+# pyplot is not thread-safe, so the table figure is rendered after the parallel batch
+@qa_check('benchmark_context', source='raw', parallel=False,
+          columns=['gameId', 'actionType', 'stealPlayerName', 'blockPlayerName', 'shotDistance'])
+def benchmark_context(df):
+    table_data = generate_context_report(df)
+    flagged = [row[0] for row in table_data if row[-1] in ('MISSING', 'Suspicious') or row[-1].startswith(('LOW', 'HIGH'))]
+    return {
+        'status': STATUS_WARNING if flagged else STATUS_PASSED,
+        'summary': f"{df['gameId'].nunique()} games | flagged: {', '.join(flagged) if flagged else 'none'}",
+        'details': table_data
+    }
+
+@qa_check('game_logic', source='raw',
+          columns=['gameId', 'period', 'actionType', 'teamTricode', 'playerName', 'orderNumber', 'scoreHome', 'scoreAway', 'matchup'])
+def game_logic(df):
+    records, games_checked, valid_games = validate_season(df, os.path.basename(SOURCES['raw']))
+
+    # נכתב תמיד (גם ריק), אחרת Level 1 ממשיך לסנן משחקים לפי רשימה ישנה
+    save_blacklist(records)
+
+    invalid_games = games_checked - valid_games
+    return {
+        # משחקים פסולים הם תוצאה צפויה (הם נכנסים לרשימה השחורה), לא כישלון של הסוויטה
+        'status': STATUS_WARNING if invalid_games else STATUS_PASSED,
+        'summary': f"{games_checked} games | invalid: {invalid_games} | blacklist rows: {len(records)}",
+        'details': {'games_checked': games_checked, 'valid_games': valid_games, 'blacklist_path': BAD_GAMES_FILE}
+    }
 
-# List of test/validation scripts to run automatically in the pipeline
-TEST_SCRIPTS = [
-    "Data_integrity_check_before_FE.py",
-    "check_data_health.py",
-    "data_validation.py",
-    "validate_game_logic.py",
-    "check_contextual_sparsity.py",
-    "check_usage_test.py",
-    "test_data.py",
-    "test_for_subs.py"
-]
-
-def run_all_tests():
+@qa_check('contextual_sparsity', source='level1', columns=context_columns)
+def contextual_sparsity(df):
+    findings = [check_event_context(df, name, trigger, sub) for name, trigger, sub in EVENT_CONTEXTS]
+    broken = sorted({col for f in findings for col in f['broken_identity']})
+    return {
+        'status': STATUS_WARNING if broken else STATUS_PASSED,
+        'summary': f"{len(findings)} event contexts | broken identity cols: {', '.join(broken) if broken else 'none'}",
+        'details': findings
+    }
+
+@qa_check('substitution_mapping', source='raw', columns=SUB_COLUMNS)
+def substitution_mapping(df):
+    result = inspect_substitutions(df.head(SAMPLE_ROWS))
+    status = STATUS_PASSED if result['sub_events'] > 0 and result.get('player_in_description') else STATUS_WARNING
+    return {'status': status, 'summary': f"{result['sub_events']} substitution events in sample", 'details': result}
+
+@qa_check('rotation_fetcher')
+def rotation_fetcher():
+    # רץ מול ה-endpoint המדומה בתיקייה זמנית, בלי רשת ובלי נתוני העונה
+    try:
+        result = check_rotation_fetcher()
+    except AssertionError as e:
+        return {'status': STATUS_FAILED, 'summary': str(e)}
+    return {'status': STATUS_PASSED, 'summary': f"fake endpoint: {result['games']} games | dedup, resume, failure recording and adaptive back-off hold",
+            'details': result}
+
+@qa_check('demo_payload')
+def demo_payload():
+    # מקודד משחקים סינתטיים בכל הקידודים ומפענח חזרה בתיקייה זמנית
+    try:
+        result = check_demo_payload()
+    except AssertionError as e:
+        return {'status': STATUS_FAILED, 'summary': str(e)}
+    return {'status': STATUS_PASSED, 'summary': f"{result['games']} synthetic games | round trip holds, NaN rejected",
+            'details': result}
+
+@qa_check('usage_lookup', requires_network=True)
+def usage_lookup():
+    from check_usage_test import fetch_top_usage
+    return fetch_top_usage()
+
+@qa_check('history_availability', requires_network=True)
+def history_availability():
+    from test_data import check_history_availability
+    result = check_history_availability()
+    return {'summary': f"available seasons: {', '.join(result['available_seasons']) or 'none'}", 'details': result}
+
+def run_all_tests(checks=None, include_network=False, max_workers=None, verbose=False, report_path=REPORT_PATH):
     print("="*60)
     print("🧪 RUNNING PRE-FEATURE ENGINEERING QA & VALIDATION SUITE")
     print("="*60)
-    
-    failed_tests = []
-    passed_tests = []
-    
-    for script_name in TEST_SCRIPTS:
-        script_path = os.path.join(CURRENT_DIR, script_name)
-        if not os.path.exists(script_path):
-            print(f"⚠️ Warning: Test script not found: {script_name}")
-            continue
-            
-        print(f"\n▶️ Running Test: {script_name}...")
-        result = subprocess.run([sys.executable, script_path], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print(f"✅ PASSED: {script_name}")
-            passed_tests.append(script_name)
-        else:
-            print(f"❌ FAILED: {script_name}")
-            print(f"   Error Details:\n{result.stderr or result.stdout}")
-            failed_tests.append((script_name, result.stderr or result.stdout))
-
-    print("\n" + "="*60)
-    print(f"📊 QA SUITE SUMMARY: {len(passed_tests)} Passed | {len(failed_tests)} Failed")
-    print("="*60)
-    
-    if failed_tests:
-        print("\n🚨 CRITICAL: The following QA tests failed:")
-        for name, err in failed_tests:
-            print(f"  - {name}")
+
+    report = run_checks(SOURCES, CACHE_DIR, names=checks, include_network=include_network, max_workers=max_workers)
+    print_report(report, verbose=verbose)
+    save_report(report, report_path)
+
+    failed = [n for n, r in report['checks'].items() if r['status'] in (STATUS_FAILED, STATUS_ERROR)]
+    if failed:
+        print("\n🚨 CRITICAL: The following QA checks failed:")
+        for name in failed:
+            print(f"  - {name}: {report['checks'][name].get('error') or report['checks'][name].get('summary', '')}")
         sys.exit(1)
+
+    # בדיקה שדולגה (רשת, קובץ חסר) לא נחשבת כעוברת - מדווחים עליה במפורש
+    skipped = [n for n, r in report['checks'].items() if r['status'] == STATUS_SKIPPED]
+    if skipped:
+        print(f"\n⚠️ {len(skipped)} QA check(s) did not run, so they are NOT counted as passed:")
+        for name in skipped:
+            print(f"  - {name}: {report['checks'][name].get('reason') or report['checks'][name].get('summary', '')}")
+        print("✨ All QA & Validation checks that ran passed.")
     else:
-        print("✨ All QA & Validation tests passed successfully!")
+        print("✨ All QA & Validation checks passed successfully!")
+    return report
 
 if __name__ == "__main__":
-    run_all_tests()
+    parser = argparse.ArgumentParser(description="Parallel QA suite over one shared, column-projected data load.")
+    parser.add_argument('--checks', nargs='+', help="Run only these registered checks.")
+    parser.add_argument('--network', action='store_true', help="Include checks that call the NBA API.")
+    parser.add_argument('--workers', type=int, default=None, help="Thread pool size for parallel checks.")
+    parser.add_argument('--verbose', action='store_true', help="Print each check's captured output.")
+    parser.add_argument('--report', default=REPORT_PATH, help="Path of the JSON report.")
+    args = parser.parse_args()
+
+    run_all_tests(args.checks, args.network, args.workers, args.verbose, args.report)
@@ -7,36 +7,44 @@ from nba_api.live.nba.endpoints import playbyplay
 # כבר בדקנו את 23-24 וזה עבד, אז נתחיל מ-22
 seasons_to_check = ['2022-23', '2021-22', '2020-21', '2019-20', '2018-19', '2017-18']
 
-print("--- Checking Historical Availability ---")
+def check_history_availability():
+    print("--- Checking Historical Availability ---")
+    available = []
 
-for season in seasons_to_check:
-    print(f"\nChecking Season {season}...")
-    try:
-        # 1. מציאת משחק מייצג
-        gamefinder = leaguegamefinder.LeagueGameFinder(season_nullable=season, league_id_nullable='00')
-        games = gamefinder.get_data_frames()[0]
-        
-        if games.empty:
-            print(f"  No games found in archive for {season}. Skipping.")
-            continue
+    for season in seasons_to_check:
+        print(f"\nChecking Season {season}...")
+        try:
+            # 1. מציאת משחק מייצג
+            gamefinder = leaguegamefinder.LeagueGameFinder(season_nullable=season, league_id_nullable='00')
+            games = gamefinder.get_data_frames()[0]
             
-        # לוקחים משחק אחד לבדיקה
-        game_id = games.iloc[0]['GAME_ID']
-        
-        # 2. בדיקת Live Endpoint
-        pbp = playbyplay.PlayByPlay(game_id=game_id)
-        actions = pbp.actions.get_dict()
-        
-        if actions:
-            print(f"  [V] SUCCESS: Live data available for {season}")
-        else:
-            print(f"  [X] FAILED: Live data is EMPTY for {season}")
-            print("  --- STOPPING: Reached the limit of available history. ---")
-            break # עוצרים כשמגיעים לגבול
+            if games.empty:
+                print(f"  No games found in archive for {season}. Skipping.")
+                continue
+                
+            # לוקחים משחק אחד לבדיקה
+            game_id = games.iloc[0]['GAME_ID']
             
-    except Exception as e:
-        print(f"  [X] ERROR for {season}: {e}")
-        print("  --- STOPPING: Reached the limit. ---")
-        break
-        
-    time.sleep(1) # נימוס
\ No newline at end of file
+            # 2. בדיקת Live Endpoint
+            pbp = playbyplay.PlayByPlay(game_id=game_id)
+            actions = pbp.actions.get_dict()
+            
+            if actions:
+                print(f"  [V] SUCCESS: Live data available for {season}")
+                available.append(season)
+            else:
+                print(f"  [X] FAILED: Live data is EMPTY for {season}")
+                print("  --- STOPPING: Reached the limit of available history. ---")
+                break # עוצרים כשמגיעים לגבול
+                
+        except Exception as e:
+            print(f"  [X] ERROR for {season}: {e}")
+            print("  --- STOPPING: Reached the limit. ---")
+            break
+            
+        time.sleep(1) # נימוס
+
+    return {'available_seasons': available}
+
+if __name__ == "__main__":
+    check_history_availability()
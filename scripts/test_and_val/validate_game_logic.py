@@ -1,5 +1,6 @@
 import pandas as pd
 import os
+import time
 import numpy as np
 
 # --- הגדרות ---
@@ -7,82 +8,158 @@ CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(CURRENT_DIR, '..', '..', 'data', 'pureData')
 OUTPUT_DIR = os.path.join(CURRENT_DIR, '..', '..', 'docs', 'reports')
 BAD_GAMES_FILE = os.path.join(OUTPUT_DIR, 'invalid_games_blacklist.csv')
+BLACKLIST_COLUMNS = ['gameId', 'matchup', 'season', 'reason']
 
 # --- חוקי הסף (Thresholds) ---
 MIN_TIMEOUTS = 7       # מינימום פסקי זמן למשחק תקין
 MAX_TIMEOUTS = 14      # מקסימום (למנוע כפילויות משוגעות)
 MAX_SCORE_JUMP = 4     # מקסימום נקודות שאפשר לקלוע במהלך אחד
 
+# העמודות היחידות שהחוקים קוראים מקובץ העונה
+RULE_COLUMNS = ['gameId', 'period', 'actionType', 'teamTricode', 'playerName', 'orderNumber', 'scoreHome', 'scoreAway', 'matchup']
+
+# --- Rules engine ---
+# כל חוק מקבל טבלת צבירה (שורה לכל משחק) ומחזיר את סיבת הפסילה לכל משחק, או NaN למשחק תקין.
+# הצבירה נבנית ב-groupby אחד על כל העונה, במקום סינון בוליאני לכל משחק בנפרד.
+
+def _rule_missing_quarters(agg):
+    complete = agg[['has_q1', 'has_q2', 'has_q3', 'has_q4']].all(axis=1)
+    return pd.Series(np.where(complete, None, "Missing Quarters"), index=agg.index)
+
+def _rule_timeout_count(agg):
+    n = agg['timeouts'].astype(int).astype(str)
+    reason = np.where(agg['timeouts'] < MIN_TIMEOUTS, "Too Few Timeouts (" + n + ")",
+                      np.where(agg['timeouts'] > MAX_TIMEOUTS, "Too Many Timeouts (" + n + ")", None))
+    return pd.Series(reason, index=agg.index)
+
+def _rule_orphaned_timeouts(agg):
+    n = agg['orphaned_timeouts'].astype(int).astype(str)
+    return pd.Series(np.where(agg['orphaned_timeouts'] > 0, "Orphaned Timeouts (Missing TeamID: " + n + ")", None), index=agg.index)
+
+def _rule_broken_identity(event, label):
+    # נבדוק אם זה רוב האירועים או סתם אחד
+    def rule(agg):
+        bad, total = agg[f'bad_{event}s'], agg[f'{event}s']
+        broken = (bad > 0) & (total > 0) & (bad / total.where(total > 0, 1) > 0.5)
+        n = bad.astype(int).astype(str)
+        return pd.Series(np.where(broken, f"Broken {label} Data (" + n + " missing names)", None), index=agg.index)
+    return rule
+
+def _rule_score_jumps(agg):
+    if 'score_jumps' not in agg.columns:
+        return pd.Series(None, index=agg.index, dtype=object)
+    n = agg['score_jumps'].astype(int).astype(str)
+    reason = np.where(agg['score_jumps'] > 0, "Impossible Score Jumps (Found " + n + f" events > {MAX_SCORE_JUMP}pts)", None)
+    return pd.Series(reason, index=agg.index)
+
+# הסדר כאן הוא סדר הסיבות ברשימה השחורה
+GAME_RULES = [
+    ('missing_quarters', _rule_missing_quarters),
+    ('timeout_count', _rule_timeout_count),
+    ('orphaned_timeouts', _rule_orphaned_timeouts),
+    ('broken_steals', _rule_broken_identity('steal', 'Steal')),
+    ('broken_blocks', _rule_broken_identity('block', 'Block')),
+    ('score_jumps', _rule_score_jumps),
+]
+
+def game_aggregates(df):
+    """
+    One row per game with every quantity the rules need, from a single groupby-sum over row-level flags.
+    Games keep their order of first appearance in df.
+    """
+    df = df[df['gameId'].notna()]
+    game_order, _ = pd.factorize(df['gameId'])
+    action = df['actionType']
+    is_timeout = (action == 'timeout').to_numpy()
+    flags = {
+        'order': game_order,
+        **{f'has_q{q}': (df['period'] == q).to_numpy() for q in (1, 2, 3, 4)},
+        'timeouts': is_timeout,
+        # בדיקת שיוך קבוצה לפסק זמן
+        'orphaned_timeouts': is_timeout & df['teamTricode'].isna().to_numpy(),
+    }
+    for event in ('steal', 'block'):
+        is_event = (action == event).to_numpy()
+        flags[f'{event}s'] = is_event
+        flags[f'bad_{event}s'] = is_event & df['playerName'].isna().to_numpy()
+
+    if 'scoreHome' in df.columns and 'scoreAway' in df.columns:
+        # סדר כרונולוגי בתוך כל משחק; התוצאה ממולאת קדימה כי לא כל שורה מעדכנת תוצאה
+        ordered = pd.DataFrame({'game': game_order, 'orderNumber': df['orderNumber'].to_numpy(),
+                                'scoreHome': df['scoreHome'].to_numpy(dtype=float), 'scoreAway': df['scoreAway'].to_numpy(dtype=float)})
+        ordered = ordered.sort_values(['game', 'orderNumber'])
+        scores = ordered.groupby('game')[['scoreHome', 'scoreAway']].ffill().fillna(0)
+        total = scores['scoreHome'] + scores['scoreAway']
+        jump = total.groupby(ordered['game']).diff().fillna(0) > MAX_SCORE_JUMP
+        flags['score_jumps'] = jump.sort_index().to_numpy()
+
+    frame = pd.DataFrame(flags)
+    agg = frame.groupby('order').sum()
+    agg.index = pd.Index(pd.unique(df['gameId']), name='gameId')
+    return agg
+
+def evaluate_rules(df):
+    """All failed rules as rows (gameId, rule, reason), ordered by game and then by rule."""
+    agg = game_aggregates(df)
+    failures = []
+    for rank, (name, rule) in enumerate(GAME_RULES):
+        reasons = rule(agg).dropna()
+        failures.append(pd.DataFrame({'gameId': reasons.index, 'rule': name, 'reason': reasons.to_numpy(),
+                                      'game_rank': agg.index.get_indexer(reasons.index), 'rule_rank': rank}))
+    failures = pd.concat(failures, ignore_index=True).sort_values(['game_rank', 'rule_rank'])
+    return failures[['gameId', 'rule', 'reason']].reset_index(drop=True), agg
+
 def validate_game(df, game_id):
     """
     מקבל דאטא-פריים של משחק בודד ומחזיר רשימה של סיבות למה הוא פסול (אם בכלל)
     """
-    reasons = []
-    
-    # 1. בדיקת שלמות רבעים (Periods)
-    periods = df['period'].unique()
-    if not {1, 2, 3, 4}.issubset(periods):
-        reasons.append("Missing Quarters")
-
-    # 2. בדיקת פסקי זמן (Timeouts)
-    timeouts = df[df['actionType'] == 'timeout']
-    timeout_count = len(timeouts)
-    
-    if timeout_count < MIN_TIMEOUTS:
-        reasons.append(f"Too Few Timeouts ({timeout_count})")
-    elif timeout_count > MAX_TIMEOUTS:
-        reasons.append(f"Too Many Timeouts ({timeout_count})")
-        
-    # בדיקת שיוך קבוצה לפסק זמן
-    orphaned_timeouts = timeouts['teamTricode'].isnull().sum()
-    if orphaned_timeouts > 0:
-        reasons.append(f"Orphaned Timeouts (Missing TeamID: {orphaned_timeouts})")
-
-    # 3. בדיקת טריגרים למומנטום (Identity Check)
-    # חטיפות ללא שם שחקן
-    steals = df[df['actionType'] == 'steal']
-    bad_steals = steals['playerName'].isnull().sum()
-    if bad_steals > 0 and len(steals) > 0:
-        # נבדוק אם זה רוב החטיפות או סתם אחת
-        if (bad_steals / len(steals)) > 0.5: 
-            reasons.append(f"Broken Steal Data ({bad_steals} missing names)")
-
-    # חסימות ללא שם שחקן
-    blocks = df[df['actionType'] == 'block']
-    bad_blocks = blocks['playerName'].isnull().sum()
-    if bad_blocks > 0 and len(blocks) > 0:
-        if (bad_blocks / len(blocks)) > 0.5:
-            reasons.append(f"Broken Block Data ({bad_blocks} missing names)")
-
-    # 4. בדיקת היגיון ניקוד (Score Logic)
-    # ממיינים לפי סדר כרונולוגי
-    df = df.sort_values('orderNumber')
-    
-    # אם העמודות קיימות
-    if 'scoreHome' in df.columns and 'scoreAway' in df.columns:
-        # ממלאים ערכים חסרים בתוצאה עם הערך הקודם (Forward Fill) כי לא כל שורה מעדכנת תוצאה
-        df['scoreHome'] = df['scoreHome'].ffill().fillna(0)
-        df['scoreAway'] = df['scoreAway'].ffill().fillna(0)
-        
-        # חישוב סך הנקודות במשחק כרגע
-        total_score = df['scoreHome'] + df['scoreAway']
-        
-        # בדיקת הפרש בין שורה לשורה
-        score_diff = total_score.diff().fillna(0)
-        
-        # האם יש קפיצה של יותר מ-4 נקודות במהלך אחד?
-        impossible_jumps = score_diff[score_diff > MAX_SCORE_JUMP]
-        if not impossible_jumps.empty:
-            reasons.append(f"Impossible Score Jumps (Found {len(impossible_jumps)} events > 4pts)")
-            
-    return reasons
+    failures, _ = evaluate_rules(df)
+    return failures['reason'].tolist()
+
+def validate_season(df, season_label):
+    """
+    מריץ את כל החוקים על קובץ עונה שלם בבת אחת (צבירה אחת לכל העונה)
+    ומחזיר (רשומות לרשימה השחורה, מספר משחקים שנבדקו, מספר משחקים תקינים)
+    """
+    failures, agg = evaluate_rules(df)
+    # נשמור גם את ה-Matchup אם קיים לזיהוי קל
+    if 'matchup' in df.columns:
+        matchups = df.drop_duplicates('gameId').set_index('gameId')['matchup']
+        failures['matchup'] = failures['gameId'].map(matchups)
+    else:
+        failures['matchup'] = "Unknown"
+    failures['season'] = season_label # מאיזה קובץ זה הגיע
+
+    games_checked = len(agg)
+    valid_games = games_checked - failures['gameId'].nunique()
+    blacklist_records = failures[BLACKLIST_COLUMNS].to_dict('records')
+    return blacklist_records, games_checked, valid_games
+
+def save_blacklist(records, path=BAD_GAMES_FILE):
+    """
+    Always rewrites the blacklist (header only when every game is valid).
+    Level 1 reads this file, so a blacklist from an older run must not survive a clean one.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    blacklist_df = pd.DataFrame(records, columns=BLACKLIST_COLUMNS)
+    blacklist_df.to_csv(path, index=False)
+    return blacklist_df
+
+def load_blacklisted_games(path=BAD_GAMES_FILE):
+    """gameIds listed in the blacklist (empty when it was never generated), normalized to int like the raw loaders."""
+    if not os.path.exists(path):
+        return set()
+    game_ids = pd.read_csv(path, usecols=['gameId'])['gameId']
+    return set(pd.to_numeric(game_ids, errors='coerce').dropna().astype('int64'))
 
 def main():
     if not os.path.exists(OUTPUT_DIR):
         os.makedirs(OUTPUT_DIR)
 
-    all_files = [f for f in os.listdir(DATA_DIR) if f.endswith('.csv')]
+    # רק קבצי ה-PBP (season_*), כמו ש-Level 1 קורא; קבצי rotations הם לא play-by-play
+    all_files = [f for f in os.listdir(DATA_DIR) if f.startswith('season_') and f.endswith('.csv')]
     blacklist_records = []
+    failed_files = []
     
     total_games_checked = 0
     valid_games = 0
@@ -95,33 +172,17 @@ def main():
         print(f"Processing {file}...")
         
         try:
-            df = pd.read_csv(file_path, low_memory=False)
-            unique_games = df['gameId'].unique()
-            
-            for game_id in unique_games:
-                total_games_checked += 1
-                game_df = df[df['gameId'] == game_id].copy()
-                
-                # הרצת הלוגיקה
-                issues = validate_game(game_df, game_id)
-                
-                if issues:
-                    # אם נמצאו בעיות, מוסיפים לרשימה השחורה
-                    # נשמור גם את ה-Matchup אם קיים לזיהוי קל
-                    matchup = game_df['matchup'].iloc[0] if 'matchup' in game_df.columns else "Unknown"
-                    
-                    for issue in issues:
-                        blacklist_records.append({
-                            'gameId': game_id,
-                            'matchup': matchup,
-                            'season': file, # מאיזה קובץ זה הגיע
-                            'reason': issue
-                        })
-                else:
-                    valid_games += 1
+            start = time.time()
+            df = pd.read_csv(file_path, usecols=lambda c: c in RULE_COLUMNS, low_memory=False)
+            records, games_checked, games_valid = validate_season(df, file)
+            blacklist_records.extend(records)
+            total_games_checked += games_checked
+            valid_games += games_valid
+            print(f"   {games_checked} games in {time.time() - start:.2f}s")
                     
         except Exception as e:
             print(f"Error reading {file}: {e}")
+            failed_files.append(file)
 
     # שמירת הדוח
     print(f"\n--- VALIDATION COMPLETE ---")
@@ -129,14 +190,17 @@ def main():
     print(f"Valid Games: {valid_games}")
     print(f"Invalid Games: {len(set([x['gameId'] for x in blacklist_records]))}") # סופרים משחקים ייחודיים
     
+    blacklist_df = save_blacklist(blacklist_records)
     if blacklist_records:
-        blacklist_df = pd.DataFrame(blacklist_records)
-        blacklist_df.to_csv(BAD_GAMES_FILE, index=False)
         print(f"\n[X] Blacklist saved to: {BAD_GAMES_FILE}")
         print("Preview of bad games:")
         print(blacklist_df.head())
+    elif failed_files:
+        print(f"\n[!] No invalid games found, but {len(failed_files)} file(s) could not be validated: {failed_files}")
+        print(f"[!] Empty blacklist written to: {BAD_GAMES_FILE}")
     else:
         print("\n[V] AMAZING! No logic errors found in any game.")
+        print(f"[V] Empty blacklist written to: {BAD_GAMES_FILE}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
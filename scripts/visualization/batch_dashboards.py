@@ -0,0 +1,215 @@
+import os
+import io
+import sys
+import html
+import time
+import argparse
+import contextlib
+import concurrent.futures
+import matplotlib
+matplotlib.use('Agg')   # לפני שהסקריפטים מייבאים את pyplot: רינדור לקבצים בלבד, בלי חלונות
+import matplotlib.pyplot as plt
+import pandas as pd
+
+# --- Config ---
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(os.path.dirname(CURRENT_DIR))
+DATA_PATH = os.path.join(BASE_DIR, 'data', 'interim', 'level2_features.csv')
+GAME_INDEX_PATH = os.path.join(BASE_DIR, 'data', 'interim', 'level2_games.parquet')
+OUTPUT_DIR = os.path.join(BASE_DIR, 'reports', 'figures', 'season_dashboards')
+INDEX_HTML = 'index.html'
+MANIFEST_CSV = 'manifest.csv'
+GAMES_PER_TASK = 4          # כמה משחקים נשלחים לעובד בכל משימה
+
+sys.path.append(os.path.join(BASE_DIR, 'models'))
+sys.path.append(os.path.join(BASE_DIR, 'scripts', 'visualization'))
+from game_store import write_scored_dataset, GameIndexedParquet
+from pipeline_schema import read_csv_with_schema
+import plot_level2_dashboard as level2_dash
+import plot_game_dashboard as game_dash
+import plot_momentum_quarters as momentum_dash
+import subs_gragh as rotation_dash
+
+def _diagnostic(game_df, game_id, out_dir, template):
+    home_team, away_team = level2_dash.identify_home_away(game_df)
+    return level2_dash.create_diagnostic_dashboard(game_df, game_id, home_team, away_team, out_dir, template)
+
+def _strategic(game_df, game_id, out_dir, template):
+    home_team, away_team = level2_dash.identify_home_away(game_df)
+    return level2_dash.create_strategic_dashboard(game_df, game_id, home_team, away_team, out_dir, template)
+
+# name -> (layout of the reusable figure, renderer(game_df, game_id, out_dir, template) -> saved path)
+DASHBOARDS = {
+    'diagnostic': (level2_dash.DIAGNOSTIC_LAYOUT, _diagnostic),
+    'strategic': (level2_dash.STRATEGIC_LAYOUT, _strategic),
+    'tactical': (game_dash.TACTICAL_LAYOUT, game_dash.render_tactical_dashboard),
+    'momentum': (momentum_dash.MOMENTUM_LAYOUT, momentum_dash.render_momentum_alerts),
+    'rotation': (rotation_dash.ROTATION_LAYOUT, rotation_dash.render_rotation_map),
+}
+
+class FigureTemplate:
+    """
+    One figure and its axes grid, kept alive in a worker and cleared between games,
+    so each dashboard pays the subplots/gridspec setup once per worker instead of once per game.
+    """
+
+    def __init__(self, layout: dict):
+        self.fig, self.axes = plt.subplots(**layout)
+        self.base_axes = list(self.fig.axes)
+        self.specs = [ax.get_subplotspec() for ax in self.base_axes]
+
+    def reset(self):
+        # צירים שנוספו בזמן הציור (למשל colorbar של heatmap) מוסרים, צירי התבנית מתנקים
+        for ax in self.fig.axes:
+            if ax not in self.base_axes:
+                ax.remove()
+        # colorbar "גונב" מקום מהציר שלו (subplotspec חדש) - מחזירים את המיקום המקורי כדי שלא יתכווץ ממשחק למשחק
+        for ax, spec in zip(self.base_axes, self.specs):
+            ax.set_subplotspec(spec)
+            ax.clear()
+            ax.set_axis_on()
+        return self.fig, self.axes
+
+def build_game_index(csv_path: str = DATA_PATH, index_path: str = GAME_INDEX_PATH) -> dict:
+    """
+    Game-indexed Parquet copy of level2_features.csv (row groups cut on game boundaries, index in the footer).
+    Rebuilt only when the CSV is newer, so every later run opens single games without parsing the CSV.
+    """
+    if os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(csv_path):
+        return {'rebuilt': False}
+    start = time.time()
+    stats = write_scored_dataset(read_csv_with_schema(csv_path), index_path)
+    return {**stats, 'rebuilt': True, 'build_sec': round(time.time() - start, 2)}
+
+# --- Worker ---
+_WORKER = {}
+
+def _init_worker(index_path: str):
+    _WORKER['reader'] = GameIndexedParquet(index_path)
+    _WORKER['templates'] = {}
+
+def _template(name: str) -> FigureTemplate:
+    templates = _WORKER['templates']
+    if name not in templates:
+        templates[name] = FigureTemplate(DASHBOARDS[name][0])
+    return templates[name]
+
+def render_games(game_ids: list, dashboards: list, out_dir: str) -> list:
+    """Renders every requested dashboard for a batch of games; one record per (game, dashboard), errors included."""
+    records = []
+    for game_id in game_ids:
+        start = time.time()
+        # משחק שלא נטען (לא באינדקס, קובץ פגום) נרשם ככישלון לכל הדשבורדים שלו במקום להפיל את כל ה-batch
+        try:
+            game_df, load_error = _WORKER['reader'].read_game(game_id), None
+        except Exception as e:
+            game_df, load_error = None, f"load failed - {type(e).__name__}: {e}"
+        load_sec = time.time() - start
+        for name in dashboards:
+            start = time.time()
+            record = {'gameId': game_id, 'dashboard': name, 'path': None, 'error': load_error}
+            if load_error:
+                record.update({'render_sec': 0.0, 'load_sec': round(load_sec, 3)})
+                records.append(record)
+                continue
+            try:
+                # ההדפסות של הסקריפטים (✅ Saved ...) לא מציפות את הקונסול ב-batch
+                with contextlib.redirect_stdout(io.StringIO()):
+                    record['path'] = DASHBOARDS[name][1](game_df, game_id, out_dir, _template(name))
+            except Exception as e:
+                record['error'] = f"{type(e).__name__}: {e}"
+            record['render_sec'] = round(time.time() - start, 3)
+            record['load_sec'] = round(load_sec, 3)
+            records.append(record)
+    return records
+
+# --- Batch ---
+
+def render_season(game_ids: list, dashboards: list, out_dir: str = OUTPUT_DIR, index_path: str = GAME_INDEX_PATH,
+                  workers: int = None, games_per_task: int = GAMES_PER_TASK) -> pd.DataFrame:
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [game_ids[i:i + games_per_task] for i in range(0, len(game_ids), games_per_task)]
+    records, done = [], 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(index_path,)) as executor:
+        futures = [executor.submit(render_games, task, dashboards, out_dir) for task in tasks]
+        for future in concurrent.futures.as_completed(futures):
+            batch = future.result()
+            records.extend(batch)
+            done += len({r['gameId'] for r in batch})
+            print(f"   🖼️ {done}/{len(game_ids)} games rendered", end='\r')
+    print()
+    return pd.DataFrame(records).sort_values(['gameId', 'dashboard']).reset_index(drop=True)
+
+def write_html_index(manifest: pd.DataFrame, out_dir: str = OUTPUT_DIR, title: str = "Season Dashboards") -> str:
+    """One row per game, one thumbnail (linked to the full PNG) per dashboard; failed renders show their error."""
+    dashboards = list(dict.fromkeys(manifest['dashboard']))
+    header = ''.join(f"<th>{html.escape(d)}</th>" for d in dashboards)
+    rows = []
+    for game_id, game in manifest.groupby('gameId', sort=True):
+        by_name = game.set_index('dashboard')
+        cells = []
+        for d in dashboards:
+            if d not in by_name.index:
+                cells.append("<td></td>")
+                continue
+            r = by_name.loc[d]
+            # ב-pandas 3 עמודת path מחרוזתית שומרת None כ-NaN (שהוא truthy), לכן pd.notna ולא if r['path']
+            if pd.notna(r['path']):
+                src = html.escape(os.path.relpath(r['path'], out_dir))
+                cells.append(f'<td><a href="{src}"><img src="{src}" loading="lazy" width="240"></a></td>')
+            else:
+                cells.append(f'<td class="err">{html.escape(str(r["error"]))}</td>')
+        rows.append(f"<tr><th>{html.escape(str(game_id))}</th>{''.join(cells)}</tr>")
+
+    page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>body{{font-family:sans-serif}} table{{border-collapse:collapse}} td,th{{border:1px solid #ddd;padding:4px;vertical-align:top}} .err{{color:#c0392b;font-size:12px;max-width:240px}}</style>
+</head><body>
+<h1>{html.escape(title)}</h1>
+<p>{manifest['gameId'].nunique()} games | {manifest['path'].notna().sum()} figures | {manifest['error'].notna().sum()} failed</p>
+<table><tr><th>gameId</th>{header}</tr>
+{chr(10).join(rows)}
+</table></body></html>
+"""
+    path = os.path.join(out_dir, INDEX_HTML)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(page)
+    return path
+
+def main():
+    parser = argparse.ArgumentParser(description="Render per-game dashboards for a whole season in a process pool.")
+    parser.add_argument('--dashboards', nargs='+', choices=list(DASHBOARDS), default=list(DASHBOARDS))
+    parser.add_argument('--games', nargs='+', type=int, help="Only these gameIds (default: every game in the index).")
+    parser.add_argument('--limit', type=int, help="Render only the first N games.")
+    parser.add_argument('--workers', type=int, default=None, help="Process pool size (default: CPU count).")
+    parser.add_argument('--out-dir', default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    if not os.path.exists(DATA_PATH):
+        print(f"❌ Data file not found at {DATA_PATH}."); sys.exit(1)
+
+    build = build_game_index()
+    if build['rebuilt']:
+        print(f"📇 Game index built: {build['games']} games | {build['rows']:,} rows | {build['build_sec']}s -> {GAME_INDEX_PATH}")
+
+    game_ids = args.games or GameIndexedParquet(GAME_INDEX_PATH).game_ids()
+    if args.limit:
+        game_ids = game_ids[:args.limit]
+
+    print(f"🎨 Rendering {len(args.dashboards)} dashboard(s) for {len(game_ids)} games...")
+    start = time.time()
+    manifest = render_season(game_ids, args.dashboards, args.out_dir, workers=args.workers)
+    elapsed = time.time() - start
+
+    manifest.to_csv(os.path.join(args.out_dir, MANIFEST_CSV), index=False)
+    index_path = write_html_index(manifest, args.out_dir)
+    failed = manifest['error'].notna().sum()
+
+    print(f"✅ {manifest['path'].notna().sum()} figures in {elapsed:.1f}s | "
+          f"Throughput: {len(game_ids) / elapsed * 60:.1f} games/min | Failed: {failed}")
+    print(f"💾 HTML index: {index_path}")
+    if failed:
+        print(manifest.loc[manifest['error'].notna(), ['gameId', 'dashboard', 'error']].drop_duplicates('error').to_string(index=False))
+
+if __name__ == "__main__":
+    main()
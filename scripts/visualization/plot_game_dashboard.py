@@ -9,6 +9,7 @@ import numpy as np
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DATA_PATH = os.path.join(BASE_DIR, 'data', 'interim', 'level1_base.csv')
 FIGURES_DIR = os.path.join(BASE_DIR, 'reports', 'figures')
+TACTICAL_LAYOUT = dict(nrows=3, ncols=2, figsize=(18, 16))
 
 def identify_home_away(df):
     home_score_rows = df[df['scoreHome'].diff() > 0]
@@ -20,29 +21,18 @@ def identify_home_away(df):
     away_team = [t for t in all_teams if t != home_team][0]
     return home_team, away_team
 
-def plot_extended_dashboard():
-    if not os.path.exists(DATA_PATH):
-        print(f"❌ Data file not found at {DATA_PATH}.")
-        return
-    
-    df = pd.read_csv(DATA_PATH, low_memory=False)
-    
-    # בחירת משחק
-    game_ids = df['gameId'].unique()
-    selected_game_id = random.choice(game_ids)
-    
-    # סינון ומיון חובה כדי שהציר יהיה כרונולוגי
-    game_df = df[df['gameId'] == selected_game_id].copy()
-    game_df.sort_values(by=['period', 'seconds_remaining'], ascending=[True, False], inplace=True)
-    game_df.reset_index(drop=True, inplace=True) # קריטי לסנכרון הגרף
-    
+def render_tactical_dashboard(game_df, game_id, out_dir=FIGURES_DIR, template=None):
+    """
+    Level 1 tactical audit of one game (game_df already in chronological order with a 0..n index).
+    Draws on a reused template figure when one is given; returns the saved path.
+    """
     home_team, away_team = identify_home_away(game_df)
     conf_score = game_df['lineup_confidence'].mean() * 100
 
     print(f"🎨 Generating Dashboard v5: {home_team} vs {away_team} (Reliability: {conf_score:.1f}%)")
 
-    fig, axes = plt.subplots(3, 2, figsize=(18, 16))
-    fig.suptitle(f'Level 1 Tactical Audit: {home_team} vs {away_team}\nGame ID: {selected_game_id}', fontsize=18, weight='bold')
+    fig, axes = template.reset() if template is not None else plt.subplots(**TACTICAL_LAYOUT)
+    fig.suptitle(f'Level 1 Tactical Audit: {home_team} vs {away_team}\nGame ID: {game_id}', fontsize=18, weight='bold')
     x_axis = game_df.index
 
     # 1. Score Margin
@@ -91,12 +81,31 @@ def plot_extended_dashboard():
     axes[2, 1].axvline(14, color='red', linestyle='--')
     axes[2, 1].set_title('6. Shot Clock Distribution (14s Reset Check)')
 
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
     
-    os.makedirs(FIGURES_DIR, exist_ok=True)
-    out_path = os.path.join(FIGURES_DIR, f'dashboard_v5_tactical_{selected_game_id}.png')
-    plt.savefig(out_path, dpi=150)
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, f'dashboard_v5_tactical_{game_id}.png')
+    fig.savefig(out_path, dpi=150)
     print(f"✅ Saved Fixed Dashboard: {out_path}")
+    return out_path
+
+def plot_extended_dashboard():
+    if not os.path.exists(DATA_PATH):
+        print(f"❌ Data file not found at {DATA_PATH}.")
+        return
+    
+    df = pd.read_csv(DATA_PATH, low_memory=False)
+    
+    # בחירת משחק
+    game_ids = df['gameId'].unique()
+    selected_game_id = random.choice(game_ids)
+    
+    # סינון ומיון חובה כדי שהציר יהיה כרונולוגי
+    game_df = df[df['gameId'] == selected_game_id].copy()
+    game_df.sort_values(by=['period', 'seconds_remaining'], ascending=[True, False], inplace=True)
+    game_df.reset_index(drop=True, inplace=True) # קריטי לסנכרון הגרף
+    
+    render_tactical_dashboard(game_df, selected_game_id)
     plt.show()
 
 if __name__ == "__main__":
@@ -10,6 +10,10 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 DATA_PATH = os.path.join(BASE_DIR, 'data', 'interim', 'level2_features.csv')
 FIGURES_DIR = os.path.join(BASE_DIR, 'reports', 'figures')
 
+# פריסות הגרפים (משמשות גם כתבניות שנשמרות בין משחקים ב-batch_dashboards.py)
+DIAGNOSTIC_LAYOUT = dict(nrows=4, ncols=2, figsize=(20, 24))
+STRATEGIC_LAYOUT = dict(nrows=3, ncols=1, figsize=(18, 16), sharex=True)
+
 def identify_home_away(df):
     """Heuristic to identify team names from the data."""
     try:
@@ -26,9 +30,20 @@ def identify_home_away(df):
     except:
         return "Home", "Away"
 
-def create_diagnostic_dashboard(game_df, game_id, home_team, away_team):
-    """Generates the original 8-plot technical dashboard."""
-    fig, axes = plt.subplots(4, 2, figsize=(20, 24))
+def prepare_game(game_df):
+    """Chronological order with a fresh 0..n index (the x axis of every panel)."""
+    game_df = game_df.sort_values(by=['period', 'seconds_remaining'], ascending=[True, False])
+    return game_df.reset_index(drop=True)
+
+def _save(fig, out_path, template):
+    fig.savefig(out_path, dpi=150)
+    # תבנית ממשיכה למשחק הבא; figure רגיל נסגר
+    if template is None:
+        plt.close(fig)
+
+def create_diagnostic_dashboard(game_df, game_id, home_team, away_team, out_dir=FIGURES_DIR, template=None):
+    """Generates the original 8-plot technical dashboard (on a reused template figure when one is given)."""
+    fig, axes = template.reset() if template is not None else plt.subplots(**DIAGNOSTIC_LAYOUT)
     fig.suptitle(f'Diagnostic Dashboard: {home_team} vs {away_team} (Game {game_id})', fontsize=22, weight='bold')
     x_axis = game_df.index
 
@@ -73,16 +88,16 @@ def create_diagnostic_dashboard(game_df, game_id, home_team, away_team):
     axes[3, 0].set_title('7. Feature Correlations', fontsize=14)
 
     axes[3, 1].axis('off')
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
     
-    out_path = os.path.join(FIGURES_DIR, f'dashboard_FULL_DIAGNOSTIC_{game_id}.png')
-    plt.savefig(out_path, dpi=150)
-    plt.close()
+    out_path = os.path.join(out_dir, f'dashboard_FULL_DIAGNOSTIC_{game_id}.png')
+    _save(fig, out_path, template)
     print(f"✅ Saved FULL DIAGNOSTIC Dashboard: {out_path}")
+    return out_path
 
-def create_strategic_dashboard(game_df, game_id, home_team, away_team):
-    """Generates the 3-plot intuitive/strategic summary."""
-    fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(18, 16), sharex=True)
+def create_strategic_dashboard(game_df, game_id, home_team, away_team, out_dir=FIGURES_DIR, template=None):
+    """Generates the 3-plot intuitive/strategic summary (on a reused template figure when one is given)."""
+    fig, (ax1, ax2, ax3) = template.reset() if template is not None else plt.subplots(**STRATEGIC_LAYOUT)
     fig.suptitle(f'Strategic Insights: {home_team} vs {away_team}', fontsize=20, weight='bold')
     x_axis = game_df.index
 
@@ -117,20 +132,18 @@ def create_strategic_dashboard(game_df, game_id, home_team, away_team):
     ax3.set_title('3. Momentum Impact on Score Margin', fontsize=14)
     ax3.legend()
 
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-    out_path = os.path.join(FIGURES_DIR, f'dashboard_STRATEGIC_SUMMARY_{game_id}.png')
-    plt.savefig(out_path, dpi=150)
-    plt.close()
+    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
+    out_path = os.path.join(out_dir, f'dashboard_STRATEGIC_SUMMARY_{game_id}.png')
+    _save(fig, out_path, template)
     print(f"✅ Saved STRATEGIC SUMMARY Dashboard: {out_path}")
+    return out_path
 
 def main():
     if not os.path.exists(DATA_PATH): return
     df = pd.read_csv(DATA_PATH, low_memory=False)
     
     gid = random.choice(df['gameId'].unique())
-    game_df = df[df['gameId'] == gid].copy()
-    game_df.sort_values(by=['period', 'seconds_remaining'], ascending=[True, False], inplace=True)
-    game_df.reset_index(drop=True, inplace=True)
+    game_df = prepare_game(df[df['gameId'] == gid])
     
     h_team, a_team = identify_home_away(game_df)
     os.makedirs(FIGURES_DIR, exist_ok=True)
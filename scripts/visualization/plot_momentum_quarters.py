@@ -12,6 +12,7 @@ FIGURES_DIR = os.path.join(BASE_DIR, '..', 'reports', 'figures')
 
 # סף המומנטום להפעלה התראה (אפשר לכייל)
 ALERT_THRESHOLD = 4.0 
+MOMENTUM_LAYOUT = dict(nrows=4, ncols=1, figsize=(14, 16), sharex=False, sharey=True)
 
 def identify_home_away(df):
     """Identifies Home and Away team codes."""
@@ -32,8 +33,8 @@ def identify_home_away(df):
 def calculate_split_momentum(df, home_team, away_team):
     """Splits momentum into Home/Away tracks."""
     # 1. Split events
-    df['home_event_val'] = df.apply(lambda x: x['event_momentum_val'] if x['teamTricode'] == home_team else 0, axis=1)
-    df['away_event_val'] = df.apply(lambda x: x['event_momentum_val'] if x['teamTricode'] == away_team else 0, axis=1)
+    df['home_event_val'] = np.where(df['teamTricode'] == home_team, df['event_momentum_val'], 0)
+    df['away_event_val'] = np.where(df['teamTricode'] == away_team, df['event_momentum_val'], 0)
     
     # 2. Rolling Sum
     WINDOW = 10
@@ -42,29 +43,16 @@ def calculate_split_momentum(df, home_team, away_team):
     
     return df
 
-def plot_momentum_by_quarter():
-    # 1. Load
-    if not os.path.exists(DATA_PATH):
-        print("❌ Data file not found."); return
-    df = pd.read_csv(DATA_PATH, low_memory=False)
-    
-    # 2. Pick Game
-    game_ids = df['gameId'].unique()
-    selected_game_id = random.choice(game_ids)
-    game_df = df[df['gameId'] == selected_game_id].copy()
-    
-    # Chronological Order
-    game_df.sort_values(by=['period', 'seconds_remaining'], ascending=[True, False], inplace=True)
-    game_df.reset_index(drop=True, inplace=True)
-    
+def render_momentum_alerts(game_df, game_id, out_dir=FIGURES_DIR, template=None):
+    """Per-quarter momentum alert report for one game (chronological game_df); returns the saved path."""
     # 3. Prep Data
     home_team, away_team = identify_home_away(game_df)
-    game_df = calculate_split_momentum(game_df, home_team, away_team)
+    game_df = calculate_split_momentum(game_df.copy(), home_team, away_team)
     
     print(f"🎨 Generating Momentum Alert Report for: {home_team} vs {away_team}")
 
     # 4. Plot
-    fig, axes = plt.subplots(4, 1, figsize=(14, 16), sharex=False, sharey=True)
+    fig, axes = template.reset() if template is not None else plt.subplots(**MOMENTUM_LAYOUT)
     fig.suptitle(f'Momentum Alerts (Threshold > {ALERT_THRESHOLD}): {home_team} vs {away_team}', fontsize=16, weight='bold')
 
     periods = [1, 2, 3, 4]
@@ -107,13 +95,31 @@ def plot_momentum_by_quarter():
         if i == 0:
             ax.legend(loc='upper right')
 
-    plt.xlabel('Event Sequence')
-    plt.tight_layout(rect=[0, 0, 1, 0.96])
+    axes[-1].set_xlabel('Event Sequence')
+    fig.tight_layout(rect=[0, 0, 1, 0.96])
     
-    os.makedirs(FIGURES_DIR, exist_ok=True)
-    out_path = os.path.join(FIGURES_DIR, f'momentum_alerts_{selected_game_id}.png')
-    plt.savefig(out_path, dpi=150)
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, f'momentum_alerts_{game_id}.png')
+    fig.savefig(out_path, dpi=150)
     print(f"✅ Saved Graph: {out_path}")
+    return out_path
+
+def plot_momentum_by_quarter():
+    # 1. Load
+    if not os.path.exists(DATA_PATH):
+        print("❌ Data file not found."); return
+    df = pd.read_csv(DATA_PATH, low_memory=False)
+    
+    # 2. Pick Game
+    game_ids = df['gameId'].unique()
+    selected_game_id = random.choice(game_ids)
+    game_df = df[df['gameId'] == selected_game_id].copy()
+    
+    # Chronological Order
+    game_df.sort_values(by=['period', 'seconds_remaining'], ascending=[True, False], inplace=True)
+    game_df.reset_index(drop=True, inplace=True)
+    
+    render_momentum_alerts(game_df, selected_game_id)
     plt.show()
 
 if __name__ == "__main__":
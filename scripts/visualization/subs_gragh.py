@@ -3,46 +3,49 @@ import matplotlib.pyplot as plt
 import os
 import random
 import ast
+import numpy as np
 
 # --- Config (3 levels up to Root) ---
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DATA_PATH = os.path.join(BASE_DIR, 'data', 'interim', 'level1_base.csv')
+ROTATION_LAYOUT = dict(nrows=2, ncols=1, figsize=(20, 12), sharex=True, gridspec_kw={'height_ratios': [3, 1]})
 
-def plot_rotation_map():
-    if not os.path.exists(DATA_PATH):
-        print("❌ Data not found."); return
-    
-    df = pd.read_csv(DATA_PATH, low_memory=False)
-    
-    # בחירת משחק רנדומלי
-    gid = random.choice(df['gameId'].unique())
-    gdf = df[df['gameId'] == gid].copy()
-    gdf.sort_values(['period', 'seconds_remaining'], ascending=[True, False], inplace=True)
-    
+def _as_list(value):
+    # מחרוזת מה-CSV, מערך מ-Parquet, או חסר
+    if isinstance(value, str):
+        return ast.literal_eval(value)
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return list(value)
+    return []
+
+def on_court_positions(gdf):
+    """(event position, PERSON_ID) pairs for every player on court, from both lineups in one explode."""
+    lineups = (gdf['home_lineup'] + gdf['away_lineup']).reset_index(drop=True).explode().dropna()
+    return pd.DataFrame({'pos': lineups.index.to_numpy(), 'pid': lineups.to_numpy()})
+
+def render_rotation_map(gdf, gid, out_dir=None, template=None):
+    """
+    Rotation map + substitution timer for one game (chronological gdf).
+    Saves to out_dir when given (batch mode) and returns the path; otherwise returns None.
+    """
+    gdf = gdf.copy()
     # המרת מחרוזות לרשימות
     for col in ['home_lineup', 'away_lineup']:
-        gdf[col] = gdf[col].apply(lambda x: ast.literal_eval(x) if pd.notna(x) else [])
+        gdf[col] = gdf[col].apply(_as_list)
 
     # יצירת רשימת שחקנים ייחודית שהשתתפו
-    all_players = set()
-    for row in gdf['home_lineup'] + gdf['away_lineup']:
-        all_players.update(row)
-    all_players = sorted(list(all_players))
+    on_court = on_court_positions(gdf)
+    all_players = sorted(on_court['pid'].unique())
     player_idx = {pid: i for i, pid in enumerate(all_players)}
 
     # --- Plotting ---
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(20, 12), sharex=True, 
-                                   gridspec_kw={'height_ratios': [3, 1]})
+    fig, (ax1, ax2) = template.reset() if template is not None else plt.subplots(**ROTATION_LAYOUT)
     
     x_axis = range(len(gdf))
 
     # 1. Rotation Map (Who is on the court?)
-    for i, pid in enumerate(all_players):
-        # האם השחקן נמצא באחת החמישיות בשורה הזו?
-        is_on_court = gdf.apply(lambda r: pid in r['home_lineup'] or pid in r['away_lineup'], axis=1)
-        # צובע רק מתי שהוא על המגרש
-        ax1.scatter(np.where(is_on_court, x_axis, np.nan), [i]*len(gdf), 
-                    marker='|', s=100, color='blue', alpha=0.7)
+    # פיזור אחד לכל המגרש במקום מעבר על כל השורות לכל שחקן
+    ax1.scatter(on_court['pos'], on_court['pid'].map(player_idx), marker='|', s=100, color='blue', alpha=0.7)
 
     ax1.set_yticks(range(len(all_players)))
     ax1.set_yticklabels(all_players, fontsize=8)
@@ -57,10 +60,29 @@ def plot_rotation_map():
     ax2.set_ylabel("Seconds")
     ax2.set_xlabel("Game Timeline (Event sequence)")
 
-    plt.tight_layout()
+    fig.tight_layout()
+    if out_dir is None:
+        return None
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, f'rotation_map_{gid}.png')
+    fig.savefig(out_path, dpi=150)
+    print(f"✅ Saved Rotation Map: {out_path}")
+    return out_path
+
+def plot_rotation_map():
+    if not os.path.exists(DATA_PATH):
+        print("❌ Data not found."); return
+    
+    df = pd.read_csv(DATA_PATH, low_memory=False)
+    
+    # בחירת משחק רנדומלי
+    gid = random.choice(df['gameId'].unique())
+    gdf = df[df['gameId'] == gid].copy()
+    gdf.sort_values(['period', 'seconds_remaining'], ascending=[True, False], inplace=True)
+    
+    render_rotation_map(gdf, gid)
     plt.show()
     
 
 if __name__ == "__main__":
-    import numpy as np # הוספת numpy לחישובים
-    plot_rotation_map()
\ No newline at end of file
+    plot_rotation_map()
@@ -1,11 +1,33 @@
 import json
 import os
 import re
-import pandas as pd
+import sys
 import glob
+import time
+import argparse
+import tempfile
+import concurrent.futures
+from collections import deque
 
-def find_latest_log(game_name):
-    log_dir = 'data/demo/logs'
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models'))
+from demo_payload import load_manifest, decode_game, PAYLOAD_DIRNAME
+
+# --- Config ---
+LOG_DIR = 'data/demo/logs'
+PAYLOAD_DIR = os.path.join('data', 'demo', PAYLOAD_DIRNAME)
+REPORT_PATH = os.path.join('docs', 'reports', 'log_validation.json')
+
+NARRATIVE = 'Narrative State Machine'
+MOMENTUM = 'Logical Alarms vs. Margin Consistency'
+
+# Matches: [Q1 - P:2] IND 2 : TOR 0 | IND: Beautiful driving layup scored in transition!
+# Or: [Q4 - P:2] BOS 2 : MIA 0 | BOS: Beautiful driving layup scored in transition!
+LOG_PATTERN = re.compile(r'^\[Q(\d+) - P:(\d+)\] ([A-Z]{3}) (\d+) : ([A-Z]{3}) (\d+) \| (.*)$')
+LOG_NAME_PATTERN = re.compile(r'^simulation_log_(.+?)(?:_(\d+))?\.txt$')
+
+def find_latest_log(game_name, log_dir=LOG_DIR):
     pattern = os.path.join(log_dir, f'simulation_log_{game_name}_*.txt')
     files = glob.glob(pattern)
     if not files:
@@ -18,343 +40,564 @@ def find_latest_log(game_name):
     files.sort(key=os.path.getmtime, reverse=True)
     return files[0]
 
-def load_json_data():
-    json_path = 'data/demo/demo_data.json'
-    if not os.path.exists(json_path):
-        raise FileNotFoundError(f"JSON data file not found at {json_path}")
-    with open(json_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def parse_log_file(file_path):
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Log file not found at {file_path}")
-    
-    log_entries = {}
-    # Matches: [Q1 - P:2] IND 2 : TOR 0 | IND: Beautiful driving layup scored in transition!
-    # Or: [Q4 - P:2] BOS 2 : MIA 0 | BOS: Beautiful driving layup scored in transition!
-    pattern = re.compile(r'^\[Q(\d+) - P:(\d+)\] ([A-Z]{3}) (\d+) : ([A-Z]{3}) (\d+) \| (.*)$')
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            match = pattern.match(line)
-            if match:
-                period = int(match.group(1))
-                poss_idx = int(match.group(2))
-                home_score = int(match.group(4))
-                away_score = int(match.group(6))
-                desc = match.group(7)
-                log_entries[poss_idx] = {
-                    'period': period,
-                    'possession_index': poss_idx,
-                    'home_score': home_score,
-                    'away_score': away_score,
-                    'score_margin': home_score - away_score,
-                    'play_description': desc
-                }
-    return log_entries
-
-def merge_data(json_game_data, log_game_data):
-    # Align JSON data and Parsed Log text into a single Pandas DataFrame
-    merged_list = []
-    for idx, json_row in enumerate(json_game_data):
-        row = json_row.copy()
-        row['possession_index'] = idx
-        log_row = log_game_data.get(idx, {})
-        
-        # Override with log scores and description if present, to validate actual output
-        if log_row:
-            row['home_score'] = log_row['home_score']
-            row['away_score'] = log_row['away_score']
-            row['score_margin'] = log_row['score_margin']
-            row['play_description_log'] = log_row['play_description']
-        else:
-            row['play_description_log'] = row.get('play_description', '')
-            
-        merged_list.append(row)
-        
-    return pd.DataFrame(merged_list)
-
-def validate_game_1(df):
-    results = []
-    
-    # ----------------------------------------------------
-    # Q1: Event 1 -> Event 2 within 2 possessions.
-    # Tactical Event 2 in last minute without Event 1.
-    # ----------------------------------------------------
-    q1_df = df[df['period'] == 1]
-    
-    # Check start score
-    first_row = q1_df.iloc[0]
-    if first_row['home_score'] == 0 and first_row['away_score'] == 0:
-        results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': 'Q1 starts strictly at 0:0.'})
-    else:
-        results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Q1 started at {first_row['home_score']}:{first_row['away_score']}"})
-
-    # Event 1 in Q1 (propensity score >= 0.85)
-    e1_q1 = q1_df[q1_df['propensity_score'] >= 0.85]
-    if not e1_q1.empty:
-        e1_idx = e1_q1.index[0]
-        results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Q1 Event 1 (Green Light) triggered at P:{e1_idx}."})
-        
-        # Event 2 within 2 possessions
-        e2_candidates = q1_df.loc[e1_idx:e1_idx+2]
-        e2_row = e2_candidates[e2_candidates['timeout_team'] == 'INDIANA']
-        if not e2_row.empty:
-            results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Q1 Event 2 (Actual TO) occurred within 2 possessions at P:{e2_row.index[0]}."})
+def game_key_from_log(file_path):
+    match = LOG_NAME_PATTERN.match(os.path.basename(file_path))
+    if not match:
+        raise ValueError(f"Not a simulation log file name: {file_path}")
+    return match.group(1)
+
+# --- Rule registry ---
+# כל חוק מוצהר פעם אחת כ-dict (כמו אירועי ה-scenario engine) ומקומפל למופע עם state חסום לכל לוג
+
+LOG_RULES = {}
+
+def log_rule(name: str):
+    def decorator(cls):
+        LOG_RULES[name] = cls
+        return cls
+    return decorator
+
+class LogRule:
+    category = NARRATIVE
+
+    def __init__(self, spec: dict, ctx: dict):
+        self.spec = spec
+        self.ctx = ctx
+        self.results = []
+
+    def _emit(self, status, key, **info):
+        self.results.append({'status': status, 'category': self.spec.get('category', self.category),
+                             'rule': self.spec['rule'], 'message': self.spec['messages'][key].format(**info)})
+
+    def _period_len(self, period):
+        return self.ctx['bounds'].get(period, (0, 0))[1]
+
+    def feed(self, row: dict):
+        raise NotImplementedError
+
+    def finish(self) -> list:
+        return self.results
+
+@log_rule('period_edge')
+class PeriodEdgeRule(LogRule):
+    """Checks the first or last possession of a period."""
+
+    def __init__(self, spec, ctx):
+        super().__init__(spec, ctx)
+        self.row = None
+
+    def feed(self, row):
+        if row['period'] == self.spec['period'] and (self.spec['edge'] == 'last' or self.row is None):
+            self.row = row
+
+    def finish(self):
+        if self.row is None:
+            self._emit('FAIL', 'missing')
+        elif self.spec['check'](self.row):
+            self._emit('PASS', 'passed', **self.row)
         else:
-            results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': 'Q1 Event 2 did not occur within 2 possessions of Event 1.'})
-    else:
-        results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': 'Q1 Event 1 not found.'})
-
-    # Tactical timeout in last minute of Q1 (end of quarter spacing) without preceding Event 1
-    # We define last minute of Q1 as index in the last 20% of Q1
-    q1_len = len(q1_df)
-    last_min_q1 = q1_df.iloc[int(q1_len * 0.80):]
-    tactical_to = last_min_q1[last_min_q1['play_description_log'].str.contains('Tactical Timeout', na=False)]
-    if not tactical_to.empty:
-        tactical_idx = tactical_to.index[0]
-        # Check preceding 5 possessions for Event 1
-        preceding_5 = df.loc[max(0, tactical_idx-5):tactical_idx-1]
-        has_e1 = any(preceding_5['propensity_score'] >= 0.75)
-        if not has_e1:
-            results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Tactical Event 2 in Q1 occurred at P:{tactical_idx} without preceding Event 1."})
+            self._emit('FAIL', 'failed', **self.row)
+        return self.results
+
+@log_rule('followed_within')
+class FollowedWithinRule(LogRule):
+    """First trigger in a period must be answered by a response within N possessions (same period)."""
+
+    def __init__(self, spec, ctx):
+        super().__init__(spec, ctx)
+        self.trigger_at = None
+        self.response_at = None
+
+    def feed(self, row):
+        if row['period'] != self.spec['period']:
+            return
+        at = row['possession_index']
+        if self.trigger_at is None and self.spec['trigger'](row):
+            self.trigger_at = at
+        if self.trigger_at is not None and self.response_at is None and at <= self.trigger_at + self.spec['within'] and self.spec['response'](row):
+            self.response_at = at
+
+    def finish(self):
+        if self.trigger_at is None:
+            self._emit('FAIL', 'missing')
+            return self.results
+        self._emit('PASS', 'found', at=self.trigger_at)
+        if self.response_at is not None:
+            self._emit('PASS', 'passed', at=self.response_at)
         else:
-            results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Tactical Event 2 at P:{tactical_idx} had active Event 1 indicators in trailing window."})
-    else:
-        results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': 'Q1 Tactical Event 2 not found.'})
-
-    # ----------------------------------------------------
-    # Q2: Event 1 triggers -> Event 2 occurs within 2 possessions.
-    # ----------------------------------------------------
-    q2_df = df[df['period'] == 2]
-    e1_q2 = q2_df[q2_df['propensity_score'] >= 0.85]
-    if not e1_q2.empty:
-        e1_idx = e1_q2.index[0]
-        results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Q2 Event 1 (Propensity Alarm) triggered at P:{e1_idx}."})
-        
-        # Event 2 within 2 possessions
-        e2_candidates = q2_df.loc[e1_idx:e1_idx+2]
-        e2_row = e2_candidates[e2_candidates['timeout_team'] == 'INDIANA']
-        if not e2_row.empty:
-            results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Q2 Event 2 (Actual TO) occurred within 2 possessions at P:{e2_row.index[0]}."})
+            self._emit('FAIL', 'failed', at=self.trigger_at)
+        return self.results
+
+@log_rule('not_preceded')
+class NotPrecededRule(LogRule):
+    """First event in the tail of a period must not have the guard active in the previous `lookback` possessions."""
+
+    def __init__(self, spec, ctx):
+        super().__init__(spec, ctx)
+        self.window = deque(maxlen=spec.get('lookback', 5))
+        self.tail_start = int(self._period_len(spec['period']) * spec.get('tail', 0.8))
+        self.event_at = None
+        self.preceded = False
+
+    def feed(self, row):
+        if (self.event_at is None and row['period'] == self.spec['period']
+                and row['period_pos'] >= self.tail_start and self.spec['event'](row)):
+            self.event_at = row['possession_index']
+            self.preceded = any(self.window)
+        self.window.append(bool(self.spec['guard'](row)))
+
+    def finish(self):
+        if self.event_at is None:
+            self._emit('FAIL', 'missing')
         else:
-            results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': 'Q2 Event 2 did not occur within 2 possessions of Event 1.'})
-    else:
-        results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': 'Q2 Event 1 not found.'})
-
-    # ----------------------------------------------------
-    # Q3: Event 1 active for ~2 minutes (12 poss) -> Event 2 does NOT happen -> Event 3 triggers -> Immediately followed by a 6-possession opponent run ending at -18 margin.
-    # ----------------------------------------------------
-    q3_df = df[df['period'] == 3]
-    
-    # Track rolling window of 12 possessions where propensity >= 0.80 and no timeout
-    q3_df = q3_df.copy()
-    q3_df['e1_active'] = (q3_df['propensity_score'] >= 0.80) & (q3_df['timeout_team'] == 'NONE')
-    q3_df['rolling_e1_sum'] = q3_df['e1_active'].rolling(window=12).sum()
-    
-    streak_rows = q3_df[q3_df['rolling_e1_sum'] == 12]
-    if not streak_rows.empty:
-        end_idx = streak_rows.index[0]
-        start_idx = end_idx - 11
-        results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Q3 Event 1 active for 12+ consecutive possessions (P:{start_idx}-{end_idx}) without Event 2."})
-        
-        # Verify Event 3 triggers immediately after the ignore window
-        e3_idx = end_idx + 1
-        if e3_idx in q3_df.index:
-            e3_row = q3_df.loc[e3_idx]
-            if e3_row['target_stop_run_90s'] == 1 or e3_row['cate_score'] >= 0.95:
-                results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Q3 Event 3 (Red Alert) triggered immediately after ignore window at P:{e3_idx}."})
-                
-                # Check immediate 6-possession opponent run ending at -18 margin
-                run_rows = df.loc[e3_idx:e3_idx+5]
-                if len(run_rows) == 6:
-                     margin_start = df.loc[e3_idx - 1]['score_margin']
-                     margin_end = run_rows.iloc[-1]['score_margin']
-                     # Deficit grows (meaning margin gets more negative)
-                     if margin_end < margin_start and margin_end == -18:
-                         results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Q3 Catastrophe verified: 6-possession opponent run ending at exactly score_margin of {margin_end}."})
-                     else:
-                         results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Q3 Opponent run check failed. Margin start: {margin_start}, end: {margin_end} (expected: -18)."})
-                else:
-                    results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': 'Not enough possessions for 6-possession opponent run.'})
+            self._emit('FAIL' if self.preceded else 'PASS', 'failed' if self.preceded else 'passed', at=self.event_at)
+        return self.results
+
+@log_rule('preceded_by')
+class PrecededByRule(LogRule):
+    """Every event must have the guard active in the current or previous `lookback` possessions."""
+
+    def __init__(self, spec, ctx):
+        super().__init__(spec, ctx)
+        self.window = deque(maxlen=spec.get('lookback', 3) + 1)
+        self.violations = 0
+
+    def feed(self, row):
+        self.window.append(bool(self.spec['guard'](row)))
+        if self.spec['event'](row) and not any(self.window):
+            self.violations += 1
+            self._emit('FAIL', 'failed', at=row['possession_index'])
+
+    def finish(self):
+        if not self.violations:
+            self._emit('PASS', 'passed')
+        return self.results
+
+@log_rule('ignored_streak')
+class IgnoredStreakRule(LogRule):
+    """
+    N consecutive 'active' possessions in a period, then an alert on the next possession,
+    then an opponent run of `run` possessions that must end lower than it started and exactly at `final_margin`.
+    """
+
+    def __init__(self, spec, ctx):
+        super().__init__(spec, ctx)
+        self.stage = 'search'
+        self.count = 0
+        self.end_at = None
+
+    def feed(self, row):
+        at = row['possession_index']
+        if self.stage == 'search':
+            if row['period'] != self.spec['period']:
+                self.count = 0
+                return
+            self.count = self.count + 1 if self.spec['active'](row) else 0
+            if self.count >= self.spec['length']:
+                self.end_at, self.margin_before = at, row['score_margin']
+                self._emit('PASS', 'streak', start=at - self.spec['length'] + 1, end=at)
+                self.stage = 'alert'
+        elif self.stage == 'alert':
+            if row['period'] != self.spec['period']:
+                self._emit('FAIL', 'ended')
+                self.stage = 'done'
+            elif self.spec['alert'](row):
+                self._emit('PASS', 'alert', at=at)
+                self.run_end = at + self.spec['run'] - 1
+                self.stage = 'run'
             else:
-                results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Q3 Event 3 did not trigger at P:{e3_idx}."})
+                self._emit('FAIL', 'no_alert', at=at)
+                self.stage = 'done'
+        elif self.stage == 'run' and at == self.run_end:
+            margin_end = row['score_margin']
+            ok = margin_end < self.margin_before and margin_end == self.spec['final_margin']
+            self._emit('PASS' if ok else 'FAIL', 'run_passed' if ok else 'run_failed', start=self.margin_before, end=margin_end)
+            self.stage = 'done'
+
+    def finish(self):
+        if self.stage == 'search':
+            self._emit('FAIL', 'missing')
+        elif self.stage == 'alert':
+            self._emit('FAIL', 'ended')
+        elif self.stage == 'run':
+            self._emit('FAIL', 'short_run')
+        return self.results
+
+class _RunningMean:
+    """Streaming mean of a column over period positions [start, stop)."""
+
+    def __init__(self, start, stop, column):
+        self.start, self.stop, self.column = start, stop, column
+        self.total, self.count = 0.0, 0
+
+    def feed(self, row):
+        if self.start <= row['period_pos'] < self.stop:
+            self.total += row[self.column]
+            self.count += 1
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else float('nan')
+
+def _resolve_stop(stop, period_len):
+    return period_len + stop if stop < 0 else min(stop, period_len)
+
+@log_rule('window_mean')
+class WindowMeanRule(LogRule):
+    """Mean of a column over a positional window of a period must fall inside a range."""
+
+    def __init__(self, spec, ctx):
+        super().__init__(spec, ctx)
+        self.window = _RunningMean(spec['start'], _resolve_stop(spec['stop'], self._period_len(spec['period'])), spec['column'])
+
+    def feed(self, row):
+        if row['period'] == self.spec['period']:
+            self.window.feed(row)
+
+    def finish(self):
+        lo, hi = self.spec['range']
+        if not self.window.count:
+            self._emit('FAIL', 'empty')
+        elif lo <= self.window.mean <= hi:
+            self._emit('PASS', 'passed', mean=self.window.mean)
         else:
-            results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': 'Dataset ended immediately after ignore window.'})
-    else:
-        results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': 'Q3 ignore window of 12 consecutive possessions not found.'})
-
-    # ----------------------------------------------------
-    # Category A: Logical Alarms vs. Margin Consistency
-    # ----------------------------------------------------
-    alarms_ok = True
-    for idx in range(5, len(df)):
-        row = df.iloc[idx]
-        desc = row['play_description_log']
-        # Alarm check: CATE/Red alert triggers only
-        is_cate_alarm = "CRITICAL ALARM" in desc or row['cate_score'] >= 0.92 or row['target_stop_run_90s'] == 1
-        if is_cate_alarm:
-            margin_now = row['score_margin']
-            margin_past = df.iloc[idx - 5]['score_margin']
-            delta = margin_now - margin_past
-            # Margin delta must be negative (worse for home team)
+            self._emit('FAIL', 'failed', mean=self.window.mean)
+        return self.results
+
+@log_rule('anchored')
+class AnchoredRule(LogRule):
+    """
+    Finds the first anchor possession in a period, then checks possessions at fixed offsets from it
+    and (optionally) window means that start relative to the anchor.
+    """
+
+    def __init__(self, spec, ctx):
+        super().__init__(spec, ctx)
+        self.anchor_at = None
+        self.steps = {step['offset']: step for step in spec['steps']}
+        self.step_results = {}
+        self.windows = []
+
+    def feed(self, row):
+        if row['period'] != self.spec['period']:
+            return
+        at = row['possession_index']
+        if self.anchor_at is None:
+            if not self.spec['anchor'](row):
+                return
+            self.anchor_at = at
+            period_len = self._period_len(self.spec['period'])
+            self.windows = [(w, _RunningMean(row['period_pos'] + w['start'], _resolve_stop(w['stop'], period_len), w['column']))
+                            for w in self.spec.get('windows', [])]
+
+        step = self.steps.get(at - self.anchor_at)
+        if step is not None:
+            ok = step['check'](row)
+            self.step_results[step['offset']] = ('PASS' if ok else 'FAIL', step['passed' if ok else 'failed'], {**row, 'at': at})
+        for _, window in self.windows:
+            window.feed(row)
+
+    def finish(self):
+        if self.anchor_at is None:
+            self._emit('FAIL', 'missing')
+            return self.results
+
+        for offset, step in self.steps.items():
+            status, template, info = self.step_results.get(offset, ('FAIL', step['ended'], {}))
+            self.results.append({'status': status, 'category': self.spec.get('category', self.category),
+                                 'rule': self.spec['rule'], 'message': template.format(**info)})
+        for w, window in self.windows:
+            if window.start < window.stop:
+                lo, hi = w['range']
+                ok = lo <= window.mean <= hi
+                self.results.append({'status': 'PASS' if ok else 'FAIL', 'category': self.spec.get('category', self.category),
+                                     'rule': self.spec['rule'], 'message': w['passed' if ok else 'failed'].format(mean=window.mean)})
+        return self.results
+
+@log_rule('tail_contains')
+class TailContainsRule(LogRule):
+    """The last N possessions of a period must contain every named event."""
+
+    def __init__(self, spec, ctx):
+        super().__init__(spec, ctx)
+        self.tail_start = self._period_len(spec['period']) - spec['last']
+        self.first = {name: None for name in spec['events']}
+        self.counts = {name: 0 for name in spec['events']}
+
+    def feed(self, row):
+        if row['period'] != self.spec['period'] or row['period_pos'] < self.tail_start:
+            return
+        for name, predicate in self.spec['events'].items():
+            if predicate(row):
+                self.counts[name] += 1
+                if self.first[name] is None:
+                    self.first[name] = row['possession_index']
+
+    def finish(self):
+        info = {**self.first, **{f'{name}_count': c for name, c in self.counts.items()}}
+        self._emit('PASS' if all(self.counts.values()) else 'FAIL', 'passed' if all(self.counts.values()) else 'failed', **info)
+        return self.results
+
+@log_rule('alarm_momentum')
+class AlarmMomentumRule(LogRule):
+    """Every red alarm must fire while the home margin is dropping over the previous `lookback` possessions."""
+    category = MOMENTUM
+
+    def __init__(self, spec, ctx):
+        super().__init__(spec, ctx)
+        self.margins = deque(maxlen=spec.get('lookback', 5) + 1)
+        self.violations = 0
+
+    def feed(self, row):
+        self.margins.append(row['score_margin'])
+        if len(self.margins) == self.margins.maxlen and self.spec['alarm'](row):
+            delta = row['score_margin'] - self.margins[0]
             if delta >= 0:
-                results.append({
-                    'status': 'FAIL',
-                    'category': 'Logical Alarms vs. Margin Consistency',
-                    'message': f"Red Alert active at P:{row['possession_index']} during positive/stable momentum (Delta margin over past 5 poss: {delta} >= 0). Margin was {margin_past} -> {margin_now}."
-                })
-                alarms_ok = False
-    if alarms_ok:
-        results.append({
-            'status': 'PASS',
-            'category': 'Logical Alarms vs. Margin Consistency',
-            'message': 'All Red Alarms (Event 3) occurred strictly during negative momentum phases.'
-        })
-
-    return results
-
-def validate_game_2(df):
-    results = []
-    
-    # ----------------------------------------------------
+                self.violations += 1
+                self._emit('FAIL', 'failed', at=row['possession_index'], delta=delta, past=self.margins[0], now=row['score_margin'])
+
+    def finish(self):
+        if not self.violations:
+            self._emit('PASS', 'passed')
+        return self.results
+
+# --- Narrative declarations ---
+
+def is_red_alarm(row):
+    return "CRITICAL ALARM" in row['play_description_log'] or row['cate_score'] >= 0.92 or row['target_stop_run_90s'] == 1
+
+def alarm_momentum(detail: str) -> dict:
+    return {
+        'rule': 'alarm_momentum', 'alarm': is_red_alarm, 'lookback': 5,
+        'messages': {
+            'passed': 'All Red Alarms (Event 3) occurred strictly during negative momentum phases.',
+            'failed': "Red Alert active at P:{at} during positive/stable momentum (" + detail + ": {delta} >= 0). Margin was {past} -> {now}."
+        }
+    }
+
+def event_1_followed_by_timeout(period: int, event_1_label: str) -> dict:
+    return {
+        'rule': 'followed_within', 'period': period, 'within': 2,
+        'trigger': lambda r: r['propensity_score'] >= 0.85,
+        'response': lambda r: r['timeout_team'] == 'INDIANA',
+        'messages': {
+            'found': f"Q{period} Event 1 ({event_1_label}) triggered at P:{{at}}.",
+            'passed': f"Q{period} Event 2 (Actual TO) occurred within 2 possessions at P:{{at}}.",
+            'failed': f"Q{period} Event 2 did not occur within 2 possessions of Event 1.",
+            'missing': f"Q{period} Event 1 not found."
+        }
+    }
+
+GAME_1_RULES = [
+    alarm_momentum('Delta margin over past 5 poss'),
+    # Q1: Event 1 -> Event 2 within 2 possessions, tactical Event 2 in the last minute without Event 1
+    {'rule': 'period_edge', 'period': 1, 'edge': 'first', 'check': lambda r: r['home_score'] == 0 and r['away_score'] == 0,
+     'messages': {'passed': 'Q1 starts strictly at 0:0.', 'failed': 'Q1 started at {home_score}:{away_score}', 'missing': 'No Q1 data found.'}},
+    event_1_followed_by_timeout(1, 'Green Light'),
+    # "last minute" = last 20% of Q1; Event 1 indicators are checked over the 5 preceding possessions
+    {'rule': 'not_preceded', 'period': 1, 'tail': 0.8, 'lookback': 5,
+     'event': lambda r: 'Tactical Timeout' in r['play_description_log'],
+     'guard': lambda r: r['propensity_score'] >= 0.75,
+     'messages': {'passed': 'Tactical Event 2 in Q1 occurred at P:{at} without preceding Event 1.',
+                  'failed': 'Tactical Event 2 at P:{at} had active Event 1 indicators in trailing window.',
+                  'missing': 'Q1 Tactical Event 2 not found.'}},
+    # Q2: Event 1 triggers -> Event 2 occurs within 2 possessions
+    event_1_followed_by_timeout(2, 'Propensity Alarm'),
+    # Q3: Event 1 active for 12 possessions -> no Event 2 -> Event 3 -> 6-possession opponent run ending at -18
+    {'rule': 'ignored_streak', 'period': 3, 'length': 12, 'run': 6, 'final_margin': -18,
+     'active': lambda r: r['propensity_score'] >= 0.80 and r['timeout_team'] == 'NONE',
+     'alert': lambda r: r['target_stop_run_90s'] == 1 or r['cate_score'] >= 0.95,
+     'messages': {'streak': 'Q3 Event 1 active for 12+ consecutive possessions (P:{start}-{end}) without Event 2.',
+                  'alert': 'Q3 Event 3 (Red Alert) triggered immediately after ignore window at P:{at}.',
+                  'no_alert': 'Q3 Event 3 did not trigger at P:{at}.',
+                  'run_passed': 'Q3 Catastrophe verified: 6-possession opponent run ending at exactly score_margin of {end}.',
+                  'run_failed': 'Q3 Opponent run check failed. Margin start: {start}, end: {end} (expected: -18).',
+                  'short_run': 'Not enough possessions for 6-possession opponent run.',
+                  'ended': 'Dataset ended immediately after ignore window.',
+                  'missing': 'Q3 ignore window of 12 consecutive possessions not found.'}},
+]
+
+GAME_2_RULES = [
+    alarm_momentum('Delta margin'),
     # Q4: Boston vs Miami, trail by 4 at start, Miami run, Red Alarm, timeout, comeback, buzzer victory
-    # ----------------------------------------------------
-    q4_df = df[df['period'] == 4]
-    if q4_df.empty:
-        results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': 'No Q4 data found in Game 2.'})
-        return results
-
-    # 1. Start of Q4: keep margin around -4 (trail by 4)
-    first_row = q4_df.iloc[0]
-    if -6 <= first_row['score_margin'] <= -2:
-        results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Q4 start margin is around -4 (actually {first_row['score_margin']})."})
-    else:
-        results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Q4 start margin is {first_row['score_margin']} (expected around -4)."})
-
-    # Q4 mid-quarter stable margin (possessions 10 to 25)
-    mid_q4 = q4_df.iloc[10:25]
-    if not mid_q4.empty:
-        margin_mean = mid_q4['score_margin'].mean()
-        if -6 <= margin_mean <= -2:
-            results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Q4 mid-quarter stable margin is around -4 (mean: {margin_mean:.1f})."})
-        else:
-            results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Q4 mid-quarter margin was not stable around -4 (mean: {margin_mean:.1f})."})
-    else:
-        results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': "Not enough possessions to verify mid-quarter stable margin."})
-
-    # Propensity Alarm at -11 margin
-    prop_alarm = q4_df[q4_df['propensity_score'] >= 0.85]
-    if not prop_alarm.empty:
-        p_idx = prop_alarm.index[0]
-        p_margin = prop_alarm.iloc[0]['score_margin']
-        if p_margin == -11:
-            results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Propensity Alarm triggered at exactly -11 margin (P:{p_idx})."})
-        else:
-            results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Propensity Alarm triggered at {p_margin} margin instead of -11 (P:{p_idx})."})
-            
-        # Critical Alarm (CATE Red Alert) at -13 margin, 1 possession later
-        cate_idx = p_idx + 1
-        if cate_idx in q4_df.index:
-            cate_row = q4_df.loc[cate_idx]
-            if (cate_row['cate_score'] >= 0.92 or cate_row['target_stop_run_90s'] == 1) and cate_row['score_margin'] == -13:
-                results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Critical Alarm (CATE Red Alert) triggered 1 possession later at exactly -13 margin (P:{cate_idx})."})
-            else:
-                results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Critical Alarm did not trigger as expected at P:{cate_idx} (margin: {cate_row['score_margin']}, cate_score: {cate_row['cate_score']})."})
-        else:
-            results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': "Dataset ended immediately after Propensity Alarm."})
-            
-        # Strategic timeout by Boston at -15 margin, 1 possession after Critical Alarm
-        to_idx = p_idx + 2
-        if to_idx in q4_df.index:
-            to_row = q4_df.loc[to_idx]
-            if to_row['timeout_team'] == 'BOSTON' and to_row['timeout_strategic_weight'] == 1 and to_row['score_margin'] == -15:
-                results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Boston called a strategic timeout 1 possession after Critical Alarm at exactly -15 margin (P:{to_idx})."})
-            else:
-                results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Boston strategic timeout check failed at P:{to_idx} (team: {to_row['timeout_team']}, margin: {to_row['score_margin']})."})
-        else:
-            results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': "Dataset ended too early to verify Boston strategic timeout."})
-            
-        # Boston fast comeback run reducing deficit to -10 within 5 possessions
-        cb_idx = to_idx + 5
-        if cb_idx in q4_df.index:
-            cb_row = q4_df.loc[cb_idx]
-            if cb_row['score_margin'] == -10:
-                results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Boston comeback run successfully reduced deficit to -10 at P:{cb_idx}."})
-            else:
-                results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Boston comeback run failed to reach exactly -10 deficit at P:{cb_idx} (margin: {cb_row['score_margin']})."})
-        else:
-            results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': "Dataset ended too early to verify Boston comeback run."})
-            
-        # Miami immediately calls timeout at possession to_idx + 6 to stop the run
-        mia_to_idx = to_idx + 6
-        if mia_to_idx in q4_df.index:
-            mia_row = q4_df.loc[mia_to_idx]
-            if mia_row['timeout_team'] == 'MIAMI':
-                results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Miami immediately called a timeout to stop the run at P:{mia_to_idx}."})
-            else:
-                results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Miami timeout check failed at P:{mia_to_idx} (team: {mia_row['timeout_team']})."})
+    {'rule': 'period_edge', 'period': 4, 'edge': 'first', 'check': lambda r: -6 <= r['score_margin'] <= -2,
+     'messages': {'passed': 'Q4 start margin is around -4 (actually {score_margin}).',
+                  'failed': 'Q4 start margin is {score_margin} (expected around -4).',
+                  'missing': 'No Q4 data found in Game 2.'}},
+    {'rule': 'window_mean', 'period': 4, 'start': 10, 'stop': 25, 'column': 'score_margin', 'range': (-6, -2),
+     'messages': {'passed': 'Q4 mid-quarter stable margin is around -4 (mean: {mean:.1f}).',
+                  'failed': 'Q4 mid-quarter margin was not stable around -4 (mean: {mean:.1f}).',
+                  'empty': 'Not enough possessions to verify mid-quarter stable margin.'}},
+    {'rule': 'anchored', 'period': 4, 'anchor': lambda r: r['propensity_score'] >= 0.85,
+     'messages': {'missing': 'Propensity Alarm (Event 1) not found in Q4.'},
+     'steps': [
+         {'offset': 0, 'check': lambda r: r['score_margin'] == -11,
+          'passed': 'Propensity Alarm triggered at exactly -11 margin (P:{at}).',
+          'failed': 'Propensity Alarm triggered at {score_margin} margin instead of -11 (P:{at}).', 'ended': ''},
+         {'offset': 1, 'check': lambda r: (r['cate_score'] >= 0.92 or r['target_stop_run_90s'] == 1) and r['score_margin'] == -13,
+          'passed': 'Critical Alarm (CATE Red Alert) triggered 1 possession later at exactly -13 margin (P:{at}).',
+          'failed': 'Critical Alarm did not trigger as expected at P:{at} (margin: {score_margin}, cate_score: {cate_score}).',
+          'ended': 'Dataset ended immediately after Propensity Alarm.'},
+         {'offset': 2, 'check': lambda r: r['timeout_team'] == 'BOSTON' and r['timeout_strategic_weight'] == 1 and r['score_margin'] == -15,
+          'passed': 'Boston called a strategic timeout 1 possession after Critical Alarm at exactly -15 margin (P:{at}).',
+          'failed': 'Boston strategic timeout check failed at P:{at} (team: {timeout_team}, margin: {score_margin}).',
+          'ended': 'Dataset ended too early to verify Boston strategic timeout.'},
+         {'offset': 7, 'check': lambda r: r['score_margin'] == -10,
+          'passed': 'Boston comeback run successfully reduced deficit to -10 at P:{at}.',
+          'failed': 'Boston comeback run failed to reach exactly -10 deficit at P:{at} (margin: {score_margin}).',
+          'ended': 'Dataset ended too early to verify Boston comeback run.'},
+         {'offset': 8, 'check': lambda r: r['timeout_team'] == 'MIAMI',
+          'passed': 'Miami immediately called a timeout to stop the run at P:{at}.',
+          'failed': 'Miami timeout check failed at P:{at} (team: {timeout_team}).',
+          'ended': 'Dataset ended too early to verify Miami timeout.'},
+     ],
+     # Score stabilizes around -5 from the Miami timeout until the final minute (last 15 possessions)
+     'windows': [{'start': 9, 'stop': -15, 'column': 'score_margin', 'range': (-7, -3),
+                  'passed': 'Score stabilized around -5 post Miami timeout (mean: {mean:.1f}).',
+                  'failed': 'Score did not stabilize around -5 post Miami timeout (mean: {mean:.1f}).'}]},
+    {'rule': 'tail_contains', 'period': 4, 'last': 15,
+     'events': {'boston': lambda r: r['timeout_team'] == 'BOSTON', 'miami': lambda r: r['timeout_team'] == 'MIAMI'},
+     'messages': {'passed': 'Tactical timeouts called in final minute by Boston (P:{boston}) and Miami (P:{miami}).',
+                  'failed': 'Missing tactical timeouts in final minute (Boston TOs: {boston_count}, Miami TOs: {miami_count}).'}},
+    {'rule': 'period_edge', 'period': 4, 'edge': 'last', 'check': lambda r: r['score_margin'] == 2,
+     'messages': {'passed': 'Final buzzer check: Boston wins by exactly {score_margin}.',
+                  'failed': 'Final buzzer check failed: score margin is {score_margin} (expected: 2).',
+                  'missing': 'No Q4 data found in Game 2.'}},
+]
+
+# משחקים בלי נרטיב ייעודי (למשל משחקי load test) נבדקים רק על אינווריאנטים כלליים
+GENERIC_RULES = [
+    alarm_momentum('Delta margin'),
+    {'rule': 'preceded_by', 'lookback': 3,
+     'event': lambda r: r['timeout_strategic_weight'] == 1,
+     'guard': lambda r: r['target_stop_run_90s'] == 1 or r['propensity_score'] >= 0.85 or r['cate_score'] >= 0.92,
+     'messages': {'passed': 'Every strategic timeout was preceded by an alert.',
+                  'failed': 'Strategic timeout at P:{at} without a preceding alert in the last 3 possessions.'}},
+]
+
+NARRATIVES = {'game_1': GAME_1_RULES, 'game_2': GAME_2_RULES}
+
+def compile_rules(specs: list, ctx: dict) -> list:
+    return [LOG_RULES[spec['rule']](spec, ctx) for spec in specs]
+
+# --- Streaming evaluation ---
+
+def load_reference(payload_dir: str, game_key: str, manifest: dict = None) -> dict:
+    """The game's columns as numpy arrays (from the dashboard's chunked payload)."""
+    manifest = manifest or load_manifest(payload_dir)
+    df = decode_game(payload_dir, manifest, game_key)
+    return {col: df[col].to_numpy() for col in df.columns}
+
+def _parse_log_lines(lines):
+    for line in lines:
+        match = LOG_PATTERN.match(line.strip())
+        if match:
+            home_score, away_score = int(match.group(4)), int(match.group(6))
+            yield int(match.group(2)), home_score, away_score, match.group(7)
+
+def stream_rows(lines, reference: dict):
+    """
+    Walks the game's possessions once, merging in log lines as they arrive
+    (log lines are in possession order; when a possession is logged twice the last line wins).
+    Log scores and descriptions override the reference, exactly like the dashboard's export.
+    """
+    columns = list(reference)
+    periods = reference['period']
+    parsed = _parse_log_lines(lines)
+    pending = next(parsed, None)
+    period_pos, last_period = 0, None
+
+    for idx in range(len(periods)):
+        while pending is not None and pending[0] < idx:
+            pending = next(parsed, None)
+        logged = None
+        while pending is not None and pending[0] == idx:
+            logged, pending = pending, next(parsed, None)
+
+        row = {col: reference[col][idx].item() if isinstance(reference[col][idx], np.generic) else reference[col][idx] for col in columns}
+        row['possession_index'] = idx
+        period_pos = period_pos + 1 if row['period'] == last_period else 0
+        last_period = row['period']
+        row['period_pos'] = period_pos
+        if logged:
+            row['home_score'], row['away_score'] = logged[1], logged[2]
+            row['score_margin'] = logged[1] - logged[2]
+            row['play_description_log'] = logged[3]
         else:
-            results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': "Dataset ended too early to verify Miami timeout."})
-            
-        # Score stabilizes around -5
-        stable_start = to_idx + 7
-        stable_end = len(q4_df) - 15
-        if stable_start < stable_end:
-            stable_slice = q4_df.iloc[stable_start:stable_end]
-            stable_mean = stable_slice['score_margin'].mean()
-            if -7 <= stable_mean <= -3:
-                results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Score stabilized around -5 post Miami timeout (mean: {stable_mean:.1f})."})
-            else:
-                results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Score did not stabilize around -5 post Miami timeout (mean: {stable_mean:.1f})."})
-    else:
-        results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': "Propensity Alarm (Event 1) not found in Q4."})
-
-    # Tactical timeouts in the final minute (last 15 possessions)
-    last_15 = q4_df.iloc[-15:]
-    bos_tac = last_15[last_15['timeout_team'] == 'BOSTON']
-    mia_tac = last_15[last_15['timeout_team'] == 'MIAMI']
-    if not bos_tac.empty and not mia_tac.empty:
-        results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Tactical timeouts called in final minute by Boston (P:{bos_tac.index[0]}) and Miami (P:{mia_tac.index[0]})."})
-    else:
-        results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Missing tactical timeouts in final minute (Boston TOs: {len(bos_tac)}, Miami TOs: {len(mia_tac)})."})
+            row['play_description_log'] = row.get('play_description', '')
+        yield row
+
+def validate_log(file_path: str, reference: dict, rules: list = None, game_key: str = None) -> list:
+    """Single streaming pass over one log: every compiled rule sees each possession once."""
+    game_key = game_key or game_key_from_log(file_path)
+    periods = reference['period']
+    bounds = {int(p): (int(np.argmax(periods == p)), int((periods == p).sum())) for p in np.unique(periods)}
+    compiled = compile_rules(rules if rules is not None else NARRATIVES.get(game_key, GENERIC_RULES), {'bounds': bounds})
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for row in stream_rows(f, reference):
+            for rule in compiled:
+                rule.feed(row)
+    return [result for rule in compiled for result in rule.finish()]
+
+# --- Parallel validation of many logs ---
+
+_SHARED = {}
 
-    # Final buzzer victory by Boston of exactly +2 points
-    final_row = q4_df.iloc[-1]
-    if final_row['score_margin'] == 2:
-        results.append({'status': 'PASS', 'category': 'Narrative State Machine', 'message': f"Final buzzer check: Boston wins by exactly {final_row['score_margin']}."})
+def _init_validation_worker(payload_dir):
+    # המניפסט נטען פעם אחת לכל worker; כל chunk משחק נטען פעם אחת ונשמר (משחק משותף לאלפי לוגים)
+    _SHARED['payload_dir'] = payload_dir
+    _SHARED['manifest'] = load_manifest(payload_dir)
+    _SHARED['references'] = {}
+
+def _validate_job(file_path):
+    try:
+        game_key = game_key_from_log(file_path)
+        references = _SHARED['references']
+        if game_key not in _SHARED['manifest']['games']:
+            raise KeyError(f"Game '{game_key}' is not in the demo payload manifest")
+        if game_key not in references:
+            references[game_key] = load_reference(_SHARED['payload_dir'], game_key, _SHARED['manifest'])
+        results = validate_log(file_path, references[game_key], game_key=game_key)
+        return {'log': file_path, 'game': game_key, 'results': results}
+    except Exception as e:
+        return {'log': file_path, 'game': None, 'error': f"{type(e).__name__}: {e}", 'results': []}
+
+def validate_logs(log_paths: list, payload_dir: str = PAYLOAD_DIR, max_workers: int = None) -> dict:
+    """Validates many logs across processes and returns a structured summary."""
+    start = time.time()
+    log_paths = sorted(log_paths)
+    if max_workers == 1 or len(log_paths) <= 1:
+        _init_validation_worker(payload_dir)
+        outcomes = [_validate_job(p) for p in log_paths]
     else:
-        results.append({'status': 'FAIL', 'category': 'Narrative State Machine', 'message': f"Final buzzer check failed: score margin is {final_row['score_margin']} (expected: 2)."})
-
-    # ----------------------------------------------------
-    # Logical Alarms vs. Margin Consistency
-    # ----------------------------------------------------
-    alarms_ok = True
-    for idx in range(5, len(df)):
-        row = df.iloc[idx]
-        desc = row['play_description_log']
-        is_cate_alarm = "CRITICAL ALARM" in desc or row['cate_score'] >= 0.92 or row['target_stop_run_90s'] == 1
-        if is_cate_alarm:
-            margin_now = row['score_margin']
-            margin_past = df.iloc[idx - 5]['score_margin']
-            delta = margin_now - margin_past
-            if delta >= 0:
-                results.append({
-                    'status': 'FAIL',
-                    'category': 'Logical Alarms vs. Margin Consistency',
-                    'message': f"Red Alert active at P:{row['possession_index']} during positive/stable momentum (Delta margin: {delta} >= 0). Margin was {margin_past} -> {margin_now}."
-                })
-                alarms_ok = False
-    if alarms_ok:
-        results.append({
-            'status': 'PASS',
-            'category': 'Logical Alarms vs. Margin Consistency',
-            'message': 'All Red Alarms (Event 3) occurred strictly during negative momentum phases.'
-        })
-    return results
+        chunksize = max(1, len(log_paths) // ((max_workers or os.cpu_count() or 1) * 4))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=_init_validation_worker,
+                                                    initargs=(payload_dir,)) as pool:
+            outcomes = list(pool.map(_validate_job, log_paths, chunksize=chunksize))
+
+    for outcome in outcomes:
+        outcome['failed_checks'] = sum(r['status'] == 'FAIL' for r in outcome['results'])
+        outcome['passed_checks'] = sum(r['status'] == 'PASS' for r in outcome['results'])
+        outcome['status'] = 'ERROR' if 'error' in outcome else ('FAIL' if outcome['failed_checks'] else 'PASS')
+
+    statuses = [o['status'] for o in outcomes]
+    return {
+        'logs': len(outcomes),
+        'passed_logs': statuses.count('PASS'),
+        'failed_logs': statuses.count('FAIL'),
+        'error_logs': statuses.count('ERROR'),
+        'passed_checks': sum(o['passed_checks'] for o in outcomes),
+        'failed_checks': sum(o['failed_checks'] for o in outcomes),
+        'elapsed_sec': round(time.time() - start, 3),
+        'outcomes': outcomes
+    }
+
+def write_simulation_log(records: list, file_path: str, home_code: str, away_code: str):
+    """Writes records in the dashboard's export format (one line per possession), for load tests."""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        for idx, row in enumerate(records):
+            f.write(f"[Q{row['period']} - P:{idx}] {home_code} {row['home_score']} : {away_code} {row['away_score']} | {row['play_description']}\n")
 
 def print_category_results(category_name, check_list):
     print(f"\n[CATEGORY: {category_name}]")
@@ -370,63 +613,82 @@ def print_category_results(category_name, check_list):
         elif status == 'SKIPPED':
             print(f"  \033[94m[- SKIP]\033[0m {msg}")
 
+def print_game_results(title, results):
+    print("\n" + "=" * 50)
+    print(title)
+    print("=" * 50)
+    print_category_results(MOMENTUM, [r for r in results if r['category'] == MOMENTUM])
+    print_category_results("Narrative State Machine Transitions", [r for r in results if r['category'] == NARRATIVE])
+
+def run_synthetic_load_test(n_games: int, work_dir: str, max_workers: int = None) -> dict:
+    """Generates n scenario games + logs (models/scenario_engine.py) and validates all logs in parallel."""
+    from scenario_engine import generate_demo_games, random_scenario
+    from prepare_demo_data import NBADemoDataArchitect
+    from demo_payload import write_demo_payload
+
+    template_df = NBADemoDataArchitect(os.path.join('data', 'processed', 'test.parquet'), work_dir).load_template_game()
+    games = generate_demo_games(template_df, n_games)
+    write_demo_payload(games, work_dir)
+
+    log_dir = os.path.join(work_dir, 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    for i, (game_key, records) in enumerate(games.items()):
+        scenario = random_scenario(i)
+        write_simulation_log(records, os.path.join(log_dir, f'simulation_log_{game_key}_0.txt'), scenario['home_code'], scenario['away_code'])
+
+    return validate_logs(glob.glob(os.path.join(log_dir, '*.txt')), os.path.join(work_dir, PAYLOAD_DIRNAME), max_workers)
+
 def main():
+    parser = argparse.ArgumentParser(description="Streaming rule-based validation of SimCast simulation logs.")
+    parser.add_argument('--logs', nargs='+', help="Log files/globs to validate in parallel (default: latest game_1/game_2 logs).")
+    parser.add_argument('--payload', default=PAYLOAD_DIR, help="Chunked demo payload with the reference game data.")
+    parser.add_argument('--workers', type=int, default=None, help="Process pool size.")
+    parser.add_argument('--synthetic', type=int, default=0, help="Generate and validate N synthetic scenario games.")
+    parser.add_argument('--work-dir', default=None, help="Where --synthetic writes its payload and logs (default: a new temp dir).")
+    parser.add_argument('--report', default=None, help=f"Write the JSON summary (e.g. {REPORT_PATH}).")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("      NBA SIMCAST DSS - STATE MACHINE QA VALIDATION SUITE    ")
     print("=" * 60)
-    
-    try:
-        json_data = load_json_data()
-    except Exception as e:
-        print(f"Error loading JSON data: {e}")
-        return
-        
-    try:
-        game_1_log_path = find_latest_log('game_1')
-        print(f"Found latest Game 1 log: {game_1_log_path}")
-        game_1_logs = parse_log_file(game_1_log_path)
-    except Exception as e:
-        print(f"Error loading Game 1 logs: {e}")
-        return
 
-    try:
-        game_2_log_path = find_latest_log('game_2')
-        print(f"Found latest Game 2 log: {game_2_log_path}")
-        game_2_logs = parse_log_file(game_2_log_path)
-    except Exception as e:
-        print(f"Error loading Game 2 logs: {e}")
-        return
-    
-    # ----------------------------------------------------
-    # GAME 1
-    # ----------------------------------------------------
-    print("\n" + "=" * 50)
-    print("GAME 1: The Stubborn Coach (The Problem Scenario)")
-    print("=" * 50)
-    df_1 = merge_data(json_data.get('game_1', []), game_1_logs)
-    g1_results = validate_game_1(df_1)
-    
-    logical_g1 = [r for r in g1_results if r['category'] == 'Logical Alarms vs. Margin Consistency']
-    timeline_g1 = [r for r in g1_results if r['category'] == 'Narrative State Machine']
-    
-    print_category_results("Logical Alarms vs. Margin Consistency", logical_g1)
-    print_category_results("Narrative State Machine Transitions", timeline_g1)
-    
-    # ----------------------------------------------------
-    # GAME 2
-    # ----------------------------------------------------
-    print("\n" + "=" * 50)
-    print("GAME 2: The Strategic Coach (The ROI Scenario)")
-    print("=" * 50)
-    df_2 = merge_data(json_data.get('game_2', []), game_2_logs)
-    g2_results = validate_game_2(df_2)
-    
-    logical_g2 = [r for r in g2_results if r['category'] == 'Logical Alarms vs. Margin Consistency']
-    timeline_g2 = [r for r in g2_results if r['category'] == 'Narrative State Machine']
-    
-    print_category_results("Logical Alarms vs. Margin Consistency", logical_g2)
-    print_category_results("Narrative State Machine Transitions", timeline_g2)
-    print("\n" + "=" * 60)
+    if args.logs or args.synthetic:
+        if args.synthetic:
+            # הפלט הסינתטי לא נכתב לתוך עץ המקור
+            work_dir = args.work_dir or tempfile.mkdtemp(prefix='simcast_load_test_')
+            print(f"🧪 Synthetic payload and logs -> {work_dir}")
+            summary = run_synthetic_load_test(args.synthetic, work_dir, args.workers)
+        else:
+            summary = validate_logs(sorted({p for pattern in args.logs for p in glob.glob(pattern)}), args.payload, args.workers)
+        print(f"📋 {summary['logs']} logs | ✅ {summary['passed_logs']} passed | ❌ {summary['failed_logs']} failed | "
+              f"⚠️ {summary['error_logs']} errors | {summary['passed_checks']} / {summary['passed_checks'] + summary['failed_checks']} checks passed | {summary['elapsed_sec']}s")
+        for outcome in summary['outcomes']:
+            if outcome['status'] != 'PASS':
+                first = outcome.get('error') or next(r['message'] for r in outcome['results'] if r['status'] == 'FAIL')
+                print(f"  - {os.path.basename(outcome['log'])}: {outcome['failed_checks']} failed | {first}")
+    else:
+        try:
+            manifest = load_manifest(args.payload)
+            log_paths = {game: find_latest_log(game) for game in ('game_1', 'game_2')}
+        except Exception as e:
+            print(f"Error loading logs or demo payload: {e}")
+            return
+        for game, path in log_paths.items():
+            print(f"Found latest {game.replace('_', ' ').title()} log: {path}")
+
+        summary = {'outcomes': []}
+        for game, title in [('game_1', "GAME 1: The Stubborn Coach (The Problem Scenario)"),
+                            ('game_2', "GAME 2: The Strategic Coach (The ROI Scenario)")]:
+            results = validate_log(log_paths[game], load_reference(args.payload, game, manifest), game_key=game)
+            summary['outcomes'].append({'log': log_paths[game], 'game': game, 'results': results})
+            print_game_results(title, results)
+        print("\n" + "=" * 60)
+
+    if args.report:
+        os.makedirs(os.path.dirname(args.report) or '.', exist_ok=True)
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=4, ensure_ascii=False)
+        print(f"💾 Report saved to {args.report}")
 
 if __name__ == "__main__":
     main()